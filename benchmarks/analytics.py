@@ -0,0 +1,203 @@
+"""Compares spending reports computed with numpy over a cached columnar ledger
+with the same reports computed by looping over SQLModel objects on SQLite.
+
+One user's history over a fixed number of years is imported in batches. The
+numpy side reads the ledger into arrays once, which is what a cache miss
+costs, and then answers every report from the cached arrays. The ORM side
+loads the user's transactions as objects for every report and sums them in
+Python loops, as the reports would be written without the analytics module.
+The four reports are the spend per category, a 30 day moving average over a
+year, percentiles of monthly spend and a year over year comparison.
+
+Run from the repository root with `python -m benchmarks.analytics`."""
+import argparse
+import random
+import statistics
+import tempfile
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from time import perf_counter
+
+from sqlmodel import select
+
+from src.analytics.reports import (
+    compare_years,
+    summarize_category_spend,
+    summarize_daily_spend,
+    summarize_monthly_spend,
+)
+from src.common.settings import Settings
+from src.database.categories.category import Category
+from src.database.database import Database
+from src.database.transactions.analytics import (
+    DailySpendFilter,
+    Ledger,
+    SpendFilter,
+)
+from src.database.transactions.analytics_database_handler import (
+    AnalyticsDatabaseHandler,
+)
+from src.database.transactions.monthly_total import MonthlyTotalFilter
+from src.database.transactions.transaction import Transaction
+from src.database.transactions.transaction_database_handler import (
+    TransactionDatabaseHandler,
+)
+from src.database.users.user import User
+
+START = datetime(2016, 1, 1)
+WINDOW = 30
+
+
+def populate(
+    database: Database, user: User, rows: int, years: int, categories: int, seed: int
+) -> None:
+    generator = random.Random(seed)
+    with database.get_session() as session:
+        category_ids = []
+        for index in range(categories):
+            category = Category(name=f"Category {index}", user_id=user.id)
+            session.add(category)
+            session.flush()
+            category_ids.append(category.id)
+        session.commit()
+
+    handler = TransactionDatabaseHandler()
+    spacing = timedelta(days=years * 365) / rows
+    batch = 10000
+    for offset in range(0, rows, batch):
+        values = [
+            {
+                "category_id": generator.choice(category_ids + [None]),
+                "amount": generator.randint(-100000, 20000),
+                "occurred_at": START + index * spacing,
+                "description": "",
+                "content_hash": index.to_bytes(16, "big"),
+            }
+            for index in range(offset, min(offset + batch, rows))
+        ]
+        with database.get_session() as session:
+            handler.insert_transactions(session, user, values)
+            session.commit()
+
+
+def run_numpy_reports(ledger: Ledger, year: int) -> list:
+    start = date(year, 1, 1)
+    return [
+        summarize_category_spend(ledger, SpendFilter()),
+        summarize_daily_spend(
+            ledger, DailySpendFilter(start=start, end=date(year + 1, 1, 1)), WINDOW
+        ),
+        summarize_monthly_spend(ledger, MonthlyTotalFilter()),
+        compare_years(ledger, year),
+    ]
+
+
+def load_transactions(database: Database, user: User):
+    with database.get_session() as session:
+        statement = (
+            select(Transaction)
+            .where(Transaction.user_id == user.id)
+            .execution_options(yield_per=10000)
+        )
+        yield from session.exec(statement)
+
+
+def run_orm_reports(database: Database, user: User, year: int) -> list:
+    with database.get_session() as session:
+        names = dict(session.exec(select(Category.id, Category.name)).all())
+
+    by_category = defaultdict(lambda: [0, 0])
+    for transaction in load_transactions(database, user):
+        if transaction.amount < 0:
+            totals = by_category[names.get(transaction.category_id)]
+            totals[0] -= transaction.amount
+            totals[1] += 1
+
+    first = date(year, 1, 1) - timedelta(days=WINDOW - 1)
+    daily = defaultdict(int)
+    for transaction in load_transactions(database, user):
+        day = transaction.occurred_at.date()
+        if transaction.amount < 0 and first <= day < date(year + 1, 1, 1):
+            daily[day] -= transaction.amount
+    averages = []
+    day = date(year, 1, 1)
+    while day < date(year + 1, 1, 1):
+        window = [daily[day - timedelta(days=back)] for back in range(WINDOW)]
+        averages.append((day, daily[day], sum(window) / WINDOW))
+        day += timedelta(days=1)
+
+    monthly = defaultdict(int)
+    for transaction in load_transactions(database, user):
+        if transaction.amount < 0:
+            month = transaction.occurred_at.date().replace(day=1)
+            monthly[month] -= transaction.amount
+    quantiles = statistics.quantiles(monthly.values(), n=100, method="inclusive")
+
+    years = defaultdict(int)
+    for transaction in load_transactions(database, user):
+        occurred_at = transaction.occurred_at
+        if transaction.amount < 0 and occurred_at.year in (year - 1, year):
+            years[(occurred_at.year, occurred_at.month)] -= transaction.amount
+    return [by_category, averages, quantiles, years]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--categories", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+    year = START.year + arguments.years - 1
+
+    for rows in arguments.rows:
+        with tempfile.TemporaryDirectory() as directory:
+            database = Database(
+                Settings(database_url=f"sqlite:///{Path(directory) / 'benchmark.db'}")
+            )
+            database.create_database()
+            user = User(email="benchmark@example.com")
+            with database.get_session() as session:
+                session.add(user)
+                session.commit()
+                session.refresh(user)
+            populate(
+                database,
+                user,
+                rows,
+                arguments.years,
+                arguments.categories,
+                arguments.seed,
+            )
+
+            start = perf_counter()
+            with database.get_session() as session:
+                ledger = AnalyticsDatabaseHandler().get_ledger(session, user)
+            load = perf_counter() - start
+
+            start = perf_counter()
+            for _ in range(arguments.repeats):
+                numpy_reports = run_numpy_reports(ledger, year)
+            cached = (perf_counter() - start) / arguments.repeats
+
+            start = perf_counter()
+            orm_reports = run_orm_reports(database, user, year)
+            orm = perf_counter() - start
+
+        [category_spend, *_] = numpy_reports
+        assert {read.category: read.spend for read in category_spend} == {
+            category: totals[0] for category, totals in orm_reports[0].items()
+        }
+        size = sum(array.nbytes for array in ledger[:3])
+        print(
+            f"{rows:>9} rows: ledger load {load * 1000:>8.1f} ms "
+            f"({size / 2**20:.0f} MiB), "
+            f"four reports from cache {cached * 1000:>7.1f} ms, "
+            f"with ORM loops {orm * 1000:>9.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Compares how the sync and async database layers handle many concurrent
+authenticated requests within one process.
+
+Each mode runs in a fresh interpreter against its own SQLite database, with
+the user cache disabled so every request reaches the database. Sync routes
+are limited by the worker threadpool, async routes by the event loop, and
+the peak resident memory of each run is reported alongside throughput.
+
+Run from the repository root with `python -m benchmarks.async_database`."""
+import argparse
+import asyncio
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+
+async def run_requests(requests: int, concurrency: int) -> float:
+    from httpx import AsyncClient
+
+    from src.common.settings import Settings
+    from src.database.i_async_database import IAsyncDatabase
+    from src.database.i_database import IDatabase
+    from src.dependencies import injector_instance
+    from src.main import create_app
+
+    if injector_instance.get(Settings).async_database:
+        await injector_instance.get(IAsyncDatabase).create_database()
+    else:
+        injector_instance.get(IDatabase).create_database()
+    app = create_app(injector_instance)
+
+    async with AsyncClient(app=app, base_url="http://benchmark") as client:
+        credentials = {"username": "benchmark@example.com", "password": "password"}
+        await client.post(
+            "/auth/create-user",
+            json={"email": credentials["username"], "password": "password"},
+        )
+        response = await client.post("/auth/token", data=credentials)
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get_user() -> None:
+            async with semaphore:
+                response = await client.get("/auth/get-user", headers=headers)
+                response.raise_for_status()
+
+        start = perf_counter()
+        await asyncio.gather(*(get_user() for _ in range(requests)))
+        return perf_counter() - start
+
+
+def run_mode(async_database: bool, requests: int, concurrency: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        environment = {
+            **os.environ,
+            "DATABASE_URL": f"sqlite:///{Path(directory) / 'benchmark.db'}",
+            "AUTHENTICATION_SECRET": "benchmark-secret",
+            "ASYNC_DATABASE": str(async_database).lower(),
+            "PASSWORD_HASHING_ROUNDS": "4",
+            "USER_CACHE_SIZE": "0",
+        }
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.async_database",
+                "--worker",
+                "--requests",
+                str(requests),
+                "--concurrency",
+                str(concurrency),
+            ],
+            env=environment,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+    mode = "async" if async_database else "sync"
+    print(f"{mode:>5} concurrency {concurrency:>4}: {output.strip()}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    if arguments.worker:
+        seconds = asyncio.run(
+            run_requests(arguments.requests, arguments.concurrency[0])
+        )
+        peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(
+            f"{arguments.requests / seconds:8,.0f} requests/s, "
+            f"peak RSS {peak_memory:6.1f} MiB"
+        )
+        return
+
+    for concurrency in arguments.concurrency:
+        for async_database in (False, True):
+            run_mode(async_database, arguments.requests, concurrency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Compares a point-in-time balance read from the balance nodes with the same
+balance summed from the ledger on SQLite.
+
+One user's history over a fixed number of years is imported in batches, which
+keeps the balance nodes up to date as it goes. Summing the ledger reads every
+one of the user's transactions up to the day, so it slows down as the history
+grows, while a balance from the nodes sums at most 17 rows however many
+transactions there are. A daily balance series for a year reads the nodes
+of all its days in one query.
+
+Run from the repository root with `python -m benchmarks.balances`."""
+import argparse
+import random
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from time import perf_counter
+
+from sqlalchemy import func
+from sqlmodel import select
+
+from src.common.settings import Settings
+from src.database.database import Database
+from src.database.transactions.balance_database_handler import (
+    BalanceDatabaseHandler,
+)
+from src.database.transactions.transaction import Transaction
+from src.database.transactions.transaction_database_handler import (
+    TransactionDatabaseHandler,
+)
+from src.database.users.user import User
+
+START = datetime(2016, 1, 1)
+
+
+def populate(database: Database, user: User, rows: int, years: int, seed: int) -> None:
+    generator = random.Random(seed)
+    handler = TransactionDatabaseHandler()
+    spacing = timedelta(days=years * 365) / rows
+    batch = 10000
+    for offset in range(0, rows, batch):
+        values = [
+            {
+                "category_id": None,
+                "amount": generator.randint(-100000, 100000),
+                "occurred_at": START + index * spacing,
+                "description": "",
+                "content_hash": index.to_bytes(16, "big"),
+            }
+            for index in range(offset, min(offset + batch, rows))
+        ]
+        with database.get_session() as session:
+            handler.insert_transactions(session, user, values)
+            session.commit()
+
+
+def time_balances(
+    database: Database, user: User, years: int, queries: int, seed: int
+) -> tuple[float, float, float]:
+    generator = random.Random(seed)
+    days = [
+        START.date() + timedelta(days=generator.randrange(years * 365))
+        for _ in range(queries)
+    ]
+    handler = BalanceDatabaseHandler()
+    with database.get_session() as session:
+        start = perf_counter()
+        node_balances = [handler.get_balance(session, user, day) for day in days]
+        nodes_duration = perf_counter() - start
+
+        start = perf_counter()
+        ledger_balances = [
+            session.exec(
+                select(func.coalesce(func.sum(Transaction.amount), 0)).where(
+                    Transaction.user_id == user.id,
+                    Transaction.occurred_at
+                    < datetime.combine(day + timedelta(days=1), datetime.min.time()),
+                )
+            ).one()
+            for day in days
+        ]
+        ledger_duration = perf_counter() - start
+    assert node_balances == ledger_balances
+
+    series_start = START.date() + timedelta(days=(years - 1) * 365)
+    series_days = [series_start + timedelta(days=day) for day in range(365)]
+    with database.get_session() as session:
+        start = perf_counter()
+        handler.get_balances(session, user, series_days)
+        series_duration = perf_counter() - start
+    return nodes_duration / queries, ledger_duration / queries, series_duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    for rows in arguments.rows:
+        with tempfile.TemporaryDirectory() as directory:
+            database = Database(
+                Settings(database_url=f"sqlite:///{Path(directory) / 'benchmark.db'}")
+            )
+            database.create_database()
+            user = User(email="benchmark@example.com")
+            with database.get_session() as session:
+                session.add(user)
+                session.commit()
+                session.refresh(user)
+            populate(database, user, rows, arguments.years, arguments.seed)
+            nodes, ledger, series = time_balances(
+                database, user, arguments.years, arguments.queries, arguments.seed
+            )
+
+        print(
+            f"{rows:>9} rows: balance from nodes {nodes * 1000:>6.2f} ms, "
+            f"from ledger {ledger * 1000:>8.2f} ms, "
+            f"365 day series {series * 1000:>7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
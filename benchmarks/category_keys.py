@@ -0,0 +1,209 @@
+"""Compares index sizes and join speed of composite string category keys and
+integer surrogate category keys on SQLite.
+
+Both layouts hold the same users, categories and a table of entries that
+reference a category. With composite keys every entry carries the category
+name next to the 36 character user id, and its foreign key index covers both
+strings. With surrogate keys an entry carries one integer, and categories are
+found through their integer primary key.
+
+Run from the repository root with `python -m benchmarks.category_keys`."""
+import argparse
+import random
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    ForeignKeyConstraint,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    UniqueConstraint,
+    bindparam,
+    create_engine,
+    func,
+    select,
+    text,
+)
+from sqlalchemy.engine import Engine
+
+from src.common.utils import str_uuid4
+
+composite = MetaData()
+composite_category = Table(
+    "category",
+    composite,
+    Column("name", String, primary_key=True),
+    Column("user_id", String, primary_key=True),
+    Index("ix_category_user_id_name", "user_id", "name"),
+)
+composite_entry = Table(
+    "entry",
+    composite,
+    Column("id", Integer, primary_key=True),
+    Column("user_id", String, nullable=False),
+    Column("category_name", String, nullable=False),
+    Column("amount", Integer, nullable=False),
+    ForeignKeyConstraint(
+        ["category_name", "user_id"], ["category.name", "category.user_id"]
+    ),
+    Index("ix_entry_category", "user_id", "category_name"),
+)
+
+surrogate = MetaData()
+surrogate_category = Table(
+    "category",
+    surrogate,
+    Column("id", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("user_id", String, nullable=False),
+    UniqueConstraint("user_id", "name", name="uq_category_user_id_name"),
+)
+surrogate_entry = Table(
+    "entry",
+    surrogate,
+    Column("id", Integer, primary_key=True),
+    Column("user_id", String, nullable=False),
+    Column("category_id", Integer, ForeignKey("category.id"), nullable=False),
+    Column("amount", Integer, nullable=False),
+    Index("ix_entry_category", "category_id"),
+)
+
+
+def populate(
+    engine: Engine,
+    surrogate_keys: bool,
+    users: int,
+    categories: int,
+    entries: int,
+    seed: int,
+) -> list[str]:
+    generator = random.Random(seed)
+    user_ids = [str_uuid4() for _ in range(users)]
+    names = [f"Category {index}" for index in range(categories)]
+    category_table = surrogate_category if surrogate_keys else composite_category
+    entry_table = surrogate_entry if surrogate_keys else composite_entry
+    with engine.begin() as connection:
+        connection.execute(
+            category_table.insert(),
+            [{"name": name, "user_id": user_id}
+             for user_id in user_ids for name in names],
+        )
+        category_ids = {}
+        if surrogate_keys:
+            rows = connection.execute(
+                select(category_table.c.id, category_table.c.user_id,
+                       category_table.c.name)
+            )
+            category_ids = {
+                (user_id, name): category_id
+                for category_id, user_id, name in rows
+            }
+
+        rows = []
+        for _ in range(entries):
+            user_id = generator.choice(user_ids)
+            name = generator.choice(names)
+            row = {"user_id": user_id, "amount": generator.randint(1, 100000)}
+            if surrogate_keys:
+                row["category_id"] = category_ids[(user_id, name)]
+            else:
+                row["category_name"] = name
+            rows.append(row)
+        connection.execute(entry_table.insert(), rows)
+    return user_ids
+
+
+def index_sizes(engine: Engine) -> dict[str, int]:
+    with engine.connect() as connection:
+        connection.execute(text("ANALYZE"))
+        rows = connection.execute(text(
+            "SELECT name, SUM(pgsize) FROM dbstat "
+            "WHERE name NOT IN ('category', 'entry', 'sqlite_schema') "
+            "AND name NOT LIKE 'sqlite_stat%' "
+            "GROUP BY name ORDER BY name"
+        ))
+        return {name: size for name, size in rows}
+
+
+def time_joins(
+    engine: Engine,
+    surrogate_keys: bool,
+    user_ids: list[str],
+    queries: int,
+    seed: int,
+) -> float:
+    if surrogate_keys:
+        category, entry = surrogate_category, surrogate_entry
+        condition = entry.c.category_id == category.c.id
+    else:
+        category, entry = composite_category, composite_entry
+        condition = (entry.c.category_name == category.c.name) & (
+            entry.c.user_id == category.c.user_id
+        )
+    statement = (
+        select(category.c.name, func.sum(entry.c.amount))
+        .join(entry, condition)
+        .where(category.c.user_id == bindparam("user_id"))
+        .group_by(category.c.name)
+    )
+
+    generator = random.Random(seed)
+    with engine.connect() as connection:
+        start = perf_counter()
+        for _ in range(queries):
+            connection.execute(
+                statement, {"user_id": generator.choice(user_ids)}
+            ).all()
+        return perf_counter() - start
+
+
+def run_layout(surrogate_keys: bool, arguments: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'benchmark.db'}")
+        (surrogate if surrogate_keys else composite).create_all(engine)
+        user_ids = populate(
+            engine,
+            surrogate_keys,
+            arguments.users,
+            arguments.categories,
+            arguments.entries,
+            arguments.seed,
+        )
+        sizes = index_sizes(engine)
+        duration = time_joins(
+            engine, surrogate_keys, user_ids, arguments.queries, arguments.seed
+        )
+        engine.dispose()
+
+    layout = "surrogate" if surrogate_keys else "composite"
+    print(f"{layout} keys:")
+    for name, size in sizes.items():
+        print(f"  {name:<40} {size / 1024:>10.0f} KiB")
+    print(f"  {'total index size':<40} {sum(sizes.values()) / 1024:>10.0f} KiB")
+    print(
+        f"  {'join and group by category':<40} "
+        f"{arguments.queries / duration:>10.0f} queries/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--categories", type=int, default=20)
+    parser.add_argument("--entries", type=int, default=200000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    for surrogate_keys in (False, True):
+        run_layout(surrogate_keys, arguments)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Compares polling the user and category list endpoints with and without
+If-None-Match, through the sync and async database layers.
+
+Each mode runs in a fresh interpreter against its own SQLite database, with
+the user cache disabled so every full request authenticates against the
+database. A user with a page of categories polls each endpoint, once
+requesting the whole response every time and once sending back the ETag of
+the previous response, which the server answers with 304 Not Modified as
+long as nothing has changed. Statements sent to the database are counted
+per poll.
+
+Run from the repository root with `python -m benchmarks.conditional_get`."""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+ENDPOINTS = ["/auth/get-user", "/categories"]
+
+
+async def run_polls(polls: int, categories: int) -> None:
+    from httpx import AsyncClient
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    from src.common.settings import Settings
+    from src.database.i_async_database import IAsyncDatabase
+    from src.database.i_database import IDatabase
+    from src.dependencies import injector_instance
+    from src.main import create_app
+
+    if injector_instance.get(Settings).async_database:
+        await injector_instance.get(IAsyncDatabase).create_database()
+    else:
+        injector_instance.get(IDatabase).create_database()
+    app = create_app(injector_instance)
+    statements = 0
+
+    def count_statement(*_) -> None:
+        nonlocal statements
+        statements += 1
+
+    async with AsyncClient(app=app, base_url="http://benchmark") as client:
+        credentials = {"username": "benchmark@example.com", "password": "password"}
+        await client.post(
+            "/auth/create-user",
+            json={"email": credentials["username"], "password": "password"},
+        )
+        response = await client.post("/auth/token", data=credentials)
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        names = [f"Category {index}" for index in range(categories)]
+        await client.post("/categories/bulk", json={"names": names}, headers=headers)
+
+        event.listen(Engine, "before_cursor_execute", count_statement)
+        for endpoint in ENDPOINTS:
+            response = await client.get(endpoint, headers=headers)
+            conditional = {**headers, "If-None-Match": response.headers["ETag"]}
+            for name, request_headers in [("full", headers), ("etag", conditional)]:
+                statements = 0
+                start = perf_counter()
+                for _ in range(polls):
+                    response = await client.get(endpoint, headers=request_headers)
+                duration = perf_counter() - start
+                print(
+                    f"{endpoint:>15} {name:>4}: {response.status_code} "
+                    f"{duration / polls * 1e6:>7.0f} us/poll, "
+                    f"{statements / polls:.1f} statements/poll"
+                )
+
+
+def run_mode(async_database: bool, polls: int, categories: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        environment = {
+            **os.environ,
+            "DATABASE_URL": f"sqlite:///{Path(directory) / 'benchmark.db'}",
+            "AUTHENTICATION_SECRET": "benchmark-secret",
+            "ASYNC_DATABASE": str(async_database).lower(),
+            "PASSWORD_HASHING_ROUNDS": "4",
+            "USER_CACHE_SIZE": "0",
+        }
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.conditional_get",
+                "--worker",
+                "--polls",
+                str(polls),
+                "--categories",
+                str(categories),
+            ],
+            env=environment,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+    mode = "async" if async_database else "sync"
+    for line in output.strip().splitlines():
+        print(f"{mode:>5} {line}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polls", type=int, default=2000)
+    parser.add_argument("--categories", type=int, default=50)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    if arguments.worker:
+        asyncio.run(run_polls(arguments.polls, arguments.categories))
+        return
+
+    for async_database in (False, True):
+        run_mode(async_database, arguments.polls, arguments.categories)
+
+
+if __name__ == "__main__":
+    main()
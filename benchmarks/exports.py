@@ -0,0 +1,129 @@
+"""Compares peak memory and duration of a streamed NDJSON export of a user's
+transactions with serialising all of them at once on SQLite.
+
+One user's history is imported in batches. Serialising at once loads every
+transaction as an object, builds the read models and joins their JSON into a
+single body, so its memory grows with the history. The streamed export reads
+batches through a cursor and encodes each batch before the next one is
+fetched, so it holds one batch and the chunk made from it, however many
+transactions there are. Each export runs once to be timed and once more
+under tracemalloc to find its peak memory.
+
+Run from the repository root with `python -m benchmarks.exports`."""
+import argparse
+import random
+import tempfile
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from time import perf_counter
+from typing import Callable
+
+from src.common.exports import ExportFormat
+from src.common.settings import Settings
+from src.database.categories.category_database_handler import (
+    CategoryDatabaseHandler,
+)
+from src.database.database import Database
+from src.database.transactions.transaction import TransactionFilter
+from src.database.transactions.transaction_database_handler import (
+    TransactionDatabaseHandler,
+)
+from src.database.users.user import User
+from src.managers.export_manager import ExportManager
+from src.managers.transaction_manager import create_transaction_read
+
+START = datetime(2016, 1, 1)
+
+
+def populate(database: Database, user: User, rows: int, seed: int) -> None:
+    generator = random.Random(seed)
+    handler = TransactionDatabaseHandler()
+    spacing = timedelta(days=3650) / rows
+    batch = 10000
+    for offset in range(0, rows, batch):
+        values = [
+            {
+                "category_id": None,
+                "amount": generator.randint(-100000, 100000),
+                "occurred_at": START + index * spacing,
+                "description": f"Purchase {index}",
+                "content_hash": index.to_bytes(16, "big"),
+            }
+            for index in range(offset, min(offset + batch, rows))
+        ]
+        with database.get_session() as session:
+            handler.insert_transactions(session, user, values)
+            session.commit()
+
+
+def export_at_once(database: Database, user: User) -> int:
+    with database.get_session() as session:
+        transactions = TransactionDatabaseHandler().get_transactions(
+            session, user, TransactionFilter()
+        )
+        body = "".join(
+            create_transaction_read(transaction, category).json() + "\n"
+            for transaction, category in transactions
+        ).encode()
+    return len(body)
+
+
+def export_streamed(database: Database, user: User, batch_size: int) -> int:
+    manager = ExportManager(
+        Settings(export_batch_size=batch_size),
+        database,
+        CategoryDatabaseHandler(),
+        TransactionDatabaseHandler(),
+    )
+    chunks = manager.export_transactions(user, ExportFormat.NDJSON, False)
+    return sum(len(chunk) for chunk in chunks)
+
+
+def measure(export: Callable[[], int]) -> tuple[int, float, int]:
+    start = perf_counter()
+    size = export()
+    duration = perf_counter() - start
+    tracemalloc.start()
+    export()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, duration, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    for rows in arguments.rows:
+        with tempfile.TemporaryDirectory() as directory:
+            database = Database(
+                Settings(database_url=f"sqlite:///{Path(directory) / 'benchmark.db'}")
+            )
+            database.create_database()
+            user = User(email="benchmark@example.com")
+            with database.get_session() as session:
+                session.add(user)
+                session.commit()
+                session.refresh(user)
+            populate(database, user, rows, arguments.seed)
+
+            results = {
+                "at once": measure(lambda: export_at_once(database, user)),
+                "streamed": measure(
+                    lambda: export_streamed(database, user, arguments.batch)
+                ),
+            }
+
+        for name, (size, duration, peak) in results.items():
+            print(
+                f"{rows:>9} rows {name:>8}: {size / 2**20:>6.1f} MiB exported in "
+                f"{duration * 1000:>8.1f} ms, peak memory {peak / 2**20:>7.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Compares JwtEncoder.decode throughput with and without the verified
+token cache.
+
+Run from the repository root with `python -m benchmarks.jwt_decode`."""
+import time
+from timeit import timeit
+from unittest.mock import MagicMock
+
+from src.common.jwt_encoder import JwtEncoder
+
+ITERATIONS = 20000
+
+
+def create_encoder(token_cache_size: int) -> JwtEncoder:
+    settings = MagicMock()
+    settings.authentication_secret = "benchmark-secret"
+    settings.token_cache_size = token_cache_size
+    return JwtEncoder(settings)
+
+
+def measure(token_cache_size: int) -> float:
+    encoder = create_encoder(token_cache_size)
+    token = encoder.encode(
+        {"sub": "benchmark@example.com", "exp": int(time.time()) + 3600}
+    )
+    seconds = timeit(lambda: encoder.decode(token), number=ITERATIONS)
+    return ITERATIONS / seconds
+
+
+def main() -> None:
+    uncached = measure(0)
+    cached = measure(1024)
+    print(f"uncached: {uncached:12,.0f} decodes/s")
+    print(f"cached:   {cached:12,.0f} decodes/s ({cached / uncached:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
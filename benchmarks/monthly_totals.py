@@ -0,0 +1,134 @@
+"""Compares a monthly spend per category report read from the monthly totals
+with the same report summed from the ledger on SQLite.
+
+One user's history over a fixed number of months is imported in batches,
+which keeps the totals up to date as it goes. Summing the ledger reads every
+one of the user's transactions, so it slows down as the history grows, while
+the totals hold one row per month and category however many transactions
+there are.
+
+Run from the repository root with `python -m benchmarks.monthly_totals`."""
+import argparse
+import random
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from time import perf_counter
+
+from sqlalchemy import func
+from sqlmodel import select
+
+from src.common.settings import Settings
+from src.database.categories.category import Category
+from src.database.database import Database
+from src.database.transactions.monthly_total import MonthlyTotalFilter
+from src.database.transactions.monthly_total_database_handler import (
+    MonthlyTotalDatabaseHandler,
+)
+from src.database.transactions.transaction import Transaction
+from src.database.transactions.transaction_database_handler import (
+    TransactionDatabaseHandler,
+)
+from src.database.users.user import User
+
+
+def populate(
+    database: Database,
+    user: User,
+    rows: int,
+    months: int,
+    categories: int,
+    seed: int,
+) -> float:
+    generator = random.Random(seed)
+    with database.get_session() as session:
+        category_ids = []
+        for index in range(categories):
+            category = Category(name=f"Category {index}", user_id=user.id)
+            session.add(category)
+            session.flush()
+            category_ids.append(category.id)
+        session.commit()
+
+    handler = TransactionDatabaseHandler()
+    start = datetime(2016, 1, 1)
+    spacing = timedelta(days=months * 365 / 12) / rows
+    batch = 10000
+    started = perf_counter()
+    for offset in range(0, rows, batch):
+        values = [
+            {
+                "category_id": generator.choice(category_ids),
+                "amount": generator.randint(-100000, 100000),
+                "occurred_at": start + index * spacing,
+                "description": "",
+                "content_hash": index.to_bytes(16, "big"),
+            }
+            for index in range(offset, min(offset + batch, rows))
+        ]
+        with database.get_session() as session:
+            handler.insert_transactions(session, user, values)
+            session.commit()
+    return perf_counter() - started
+
+
+def time_reports(database: Database, user: User, reports: int) -> tuple[float, float]:
+    handler = MonthlyTotalDatabaseHandler()
+    month = func.date(Transaction.occurred_at, "start of month")
+    ledger_statement = (
+        select(month, Transaction.category_id, func.sum(Transaction.amount))
+        .where(Transaction.user_id == user.id)
+        .group_by(month, Transaction.category_id)
+    )
+    with database.get_session() as session:
+        start = perf_counter()
+        for _ in range(reports):
+            handler.get_monthly_totals(session, user, MonthlyTotalFilter())
+        totals_duration = perf_counter() - start
+
+        start = perf_counter()
+        for _ in range(reports):
+            session.exec(ledger_statement).all()
+        ledger_duration = perf_counter() - start
+    return totals_duration / reports, ledger_duration / reports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--months", type=int, default=36)
+    parser.add_argument("--categories", type=int, default=20)
+    parser.add_argument("--reports", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    for rows in arguments.rows:
+        with tempfile.TemporaryDirectory() as directory:
+            database = Database(
+                Settings(database_url=f"sqlite:///{Path(directory) / 'benchmark.db'}")
+            )
+            database.create_database()
+            user = User(email="benchmark@example.com")
+            with database.get_session() as session:
+                session.add(user)
+                session.commit()
+                session.refresh(user)
+            duration = populate(
+                database,
+                user,
+                rows,
+                arguments.months,
+                arguments.categories,
+                arguments.seed,
+            )
+            totals, ledger = time_reports(database, user, arguments.reports)
+
+        print(
+            f"{rows:>9} rows: imported at {rows / duration:>8.0f} rows/s, "
+            f"report from totals {totals * 1000:>7.2f} ms, "
+            f"from ledger {ledger * 1000:>8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Measures mixed read/write throughput against a SQLite file with and without
+the SQLite performance profile.
+
+Worker threads share one `Database` and each runs a fixed number of
+operations, a share of which insert a category while the rest read a user
+and their categories. Without the profile the database stays in
+rollback-journal mode, where writers block readers and concurrent writers
+contend for the lock. With it, WAL lets readers proceed during writes and
+the writer connection queues writes inside the process.
+
+Run from the repository root with `python -m benchmarks.sqlite_profile`."""
+import argparse
+import random
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from time import perf_counter
+
+from sqlalchemy.exc import OperationalError
+from sqlmodel import select
+
+from src.common.settings import Settings
+from src.database.categories.category import Category
+from src.database.database import Database
+from src.database.users.user import User
+
+
+def create_users(database: Database, count: int) -> list[str]:
+    users = [User(email=f"user{index}@example.com") for index in range(count)]
+    with database.get_session() as session:
+        session.add_all(users)
+        session.commit()
+        return [user.id for user in users]
+
+
+def run_worker(
+    database: Database, user_ids: list[str], operations: int, write_ratio: float,
+    seed: int
+) -> int:
+    generator = random.Random(seed)
+    errors = 0
+    for index in range(operations):
+        user_id = generator.choice(user_ids)
+        try:
+            with database.get_session() as session:
+                if generator.random() < write_ratio:
+                    session.add(Category(name=f"{seed}-{index}", user_id=user_id))
+                    session.commit()
+                else:
+                    session.get(User, user_id)
+                    session.exec(
+                        select(Category).where(Category.user_id == user_id)
+                    ).all()
+        except OperationalError:
+            errors += 1
+    return errors
+
+
+def run_mode(
+    profile: bool, threads: int, operations: int, write_ratio: float, users: int
+) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        database = Database(Settings(
+            database_url=f"sqlite:///{Path(directory) / 'benchmark.db'}",
+            database_pool_size=threads,
+            sqlite_performance_profile=profile,
+        ))
+        database.create_database()
+        user_ids = create_users(database, users)
+
+        start = perf_counter()
+        with ThreadPoolExecutor(threads) as executor:
+            errors = sum(executor.map(
+                lambda seed: run_worker(
+                    database, user_ids, operations, write_ratio, seed),
+                range(threads),
+            ))
+        duration = perf_counter() - start
+
+    total = threads * operations
+    mode = "profile" if profile else "default"
+    print(
+        f"{mode:>7} threads {threads:>3}: {total / duration:>8.0f} operations/s, "
+        f"{errors} failed"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--operations", type=int, default=2000)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument("--users", type=int, default=100)
+    arguments = parser.parse_args()
+
+    for threads in arguments.threads:
+        for profile in (False, True):
+            run_mode(
+                profile,
+                threads,
+                arguments.operations,
+                arguments.write_ratio,
+                arguments.users,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Measures the rate of importing a CSV statement into a SQLite ledger.
+
+A statement with the given number of rows is generated, parsed as an upload
+would be and imported through TransactionImportManager, which inserts every
+batch with a single executemany and commits it. The same statement is then
+imported again, which finds every row to be a duplicate through the unique
+content hash index. For comparison, the rows are also added one ORM object at
+a time in equally sized transactions.
+
+Run from the repository root with `python -m benchmarks.transaction_import`."""
+import argparse
+import io
+import random
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from time import perf_counter
+
+from src.analytics.ledger_cache import LedgerCache
+from src.common.settings import Settings
+from src.database.categories.category import Category
+from src.database.categories.category_database_handler import CategoryDatabaseHandler
+from src.database.database import Database
+from src.database.transactions.transaction import StatementFormat, Transaction
+from src.database.transactions.transaction_database_handler import (
+    TransactionDatabaseHandler,
+)
+from src.database.users.user import User
+from src.managers.transaction_import_manager import TransactionImportManager
+from src.transactions.statements import StatementRow, parse_statement
+
+CATEGORIES = ["Food", "Rent", "Car", "Travel", ""]
+
+
+def create_statement(rows: int, seed: int) -> bytes:
+    generator = random.Random(seed)
+    start = datetime(2020, 1, 1)
+    lines = ["date,amount,description,category"]
+    for index in range(rows):
+        occurred_at = start + timedelta(minutes=index * 7)
+        lines.append(
+            f"{occurred_at.isoformat()},{generator.randint(-100000, 100000) / 100},"
+            f"Purchase {generator.randint(1, 5000)},{generator.choice(CATEGORIES)}"
+        )
+    return "\n".join(lines).encode()
+
+
+def import_statement(
+    manager: TransactionImportManager, user: User, statement: bytes
+) -> tuple[float, int, int]:
+    start = perf_counter()
+    for progress in manager.import_transactions(
+        user, parse_statement(io.BytesIO(statement), StatementFormat.CSV)
+    ):
+        pass
+    return perf_counter() - start, progress.inserted, progress.duplicates
+
+
+def add_objects(
+    database: Database, user: User, statement: bytes, category_ids: dict, batch: int
+) -> float:
+    rows = [
+        row
+        for row in parse_statement(io.BytesIO(statement), StatementFormat.CSV)
+        if isinstance(row, StatementRow)
+    ]
+    start = perf_counter()
+    for offset in range(0, len(rows), batch):
+        with database.get_session() as session:
+            for row in rows[offset:offset + batch]:
+                session.add(Transaction(
+                    user_id=user.id,
+                    category_id=category_ids.get(row.category),
+                    amount=row.amount,
+                    occurred_at=row.occurred_at,
+                    description=row.description,
+                ))
+            session.commit()
+    return perf_counter() - start
+
+
+def create_user(database: Database, email: str) -> tuple[User, dict[str, int]]:
+    user = User(email=email)
+    with database.get_session() as session:
+        session.add(user)
+        categories = [
+            Category(name=name, user_id=user.id) for name in CATEGORIES if name
+        ]
+        session.add_all(categories)
+        session.commit()
+        session.refresh(user)
+        return user, {category.name: category.id for category in categories}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--batch", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    statement = create_statement(arguments.rows, arguments.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        settings = Settings(
+            database_url=f"sqlite:///{Path(directory) / 'benchmark.db'}",
+            transaction_import_batch_size=arguments.batch,
+        )
+        database = Database(settings)
+        database.create_database()
+        user, category_ids = create_user(database, "import@example.com")
+        manager = TransactionImportManager(
+            settings,
+            database,
+            LedgerCache(settings),
+            CategoryDatabaseHandler(),
+            TransactionDatabaseHandler(),
+        )
+
+        duration, inserted, _ = import_statement(manager, user, statement)
+        print(
+            f"{'import':>16}: {inserted / duration * 60:>12.0f} rows/min "
+            f"({inserted} rows in {duration:.1f} s)"
+        )
+        duration, _, duplicates = import_statement(manager, user, statement)
+        print(
+            f"{'import again':>16}: {duplicates / duration * 60:>12.0f} rows/min "
+            f"({duplicates} duplicates in {duration:.1f} s)"
+        )
+
+        other_user, other_category_ids = create_user(database, "orm@example.com")
+        duration = add_objects(
+            database, other_user, statement, other_category_ids, arguments.batch
+        )
+        print(
+            f"{'ORM objects':>16}: {arguments.rows / duration * 60:>12.0f} rows/min "
+            f"({arguments.rows} rows in {duration:.1f} s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
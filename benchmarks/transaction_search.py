@@ -0,0 +1,135 @@
+"""Compares searching transaction descriptions through the FTS5 index with a
+LIKE scan on SQLite.
+
+One user's history is imported in batches, with descriptions made of one of
+2000 merchant names and two of a few common words. The FTS5 search looks the
+words up in the index and ranks the newest matches, so its cost follows the
+number of matches. Prefixes longer than the indexed ones cost the most, as
+the words they start are merged, and all 2000 merchant names start with
+"merchant". The LIKE scan walks the user's transactions newest first and
+tests each description for every word, as the search would be written
+without the index. It stops once a page is found, so it is quick for common
+words but reads the whole ledger for rare ones, and it does not rank its
+results.
+
+Run from the repository root with `python -m benchmarks.transaction_search`."""
+import argparse
+import random
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from time import perf_counter
+
+from sqlmodel import select
+
+from src.common.settings import Settings
+from src.database.database import Database
+from src.database.transactions.transaction import (
+    Transaction,
+    TransactionSearchFilter,
+)
+from src.database.transactions.transaction_database_handler import (
+    TransactionDatabaseHandler,
+    to_search_terms,
+)
+from src.database.users.user import User
+
+START = datetime(2016, 1, 1)
+MERCHANTS = [f"Merchant{index}" for index in range(2000)]
+WORDS = ["card", "purchase", "store", "online", "payment", "market", "cafe"]
+QUERIES = [
+    "merchant17",
+    "merchant123 cafe",
+    "merch",
+    "merchant",
+    "online payment",
+    "nothing",
+]
+
+
+def populate(database: Database, user: User, rows: int, seed: int) -> None:
+    generator = random.Random(seed)
+    handler = TransactionDatabaseHandler()
+    spacing = timedelta(days=3650) / rows
+    batch = 10000
+    for offset in range(0, rows, batch):
+        values = [
+            {
+                "category_id": None,
+                "amount": generator.randint(-100000, 100000),
+                "occurred_at": START + index * spacing,
+                "description": " ".join(
+                    [generator.choice(MERCHANTS), *generator.sample(WORDS, 2)]
+                ),
+                "content_hash": index.to_bytes(16, "big"),
+            }
+            for index in range(offset, min(offset + batch, rows))
+        ]
+        with database.get_session() as session:
+            handler.insert_transactions(session, user, values)
+            session.commit()
+
+
+def search_index(database: Database, user: User, query: str, limit: int) -> int:
+    with database.get_session() as session:
+        return len(
+            TransactionDatabaseHandler().search_transactions(
+                session, user, TransactionSearchFilter(query=query), limit=limit
+            )
+        )
+
+
+def search_like(database: Database, user: User, query: str, limit: int) -> int:
+    statement = (
+        select(Transaction)
+        .where(Transaction.user_id == user.id)
+        .where(
+            *(
+                Transaction.description.icontains(term, autoescape=True)
+                for term in to_search_terms(query)
+            )
+        )
+        .order_by(Transaction.occurred_at.desc(), Transaction.id.desc())
+        .limit(limit)
+    )
+    with database.get_session() as session:
+        return len(session.exec(statement).all())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    for rows in arguments.rows:
+        with tempfile.TemporaryDirectory() as directory:
+            database = Database(
+                Settings(database_url=f"sqlite:///{Path(directory) / 'benchmark.db'}")
+            )
+            database.create_database()
+            user = User(email="benchmark@example.com")
+            with database.get_session() as session:
+                session.add(user)
+                session.commit()
+                session.refresh(user)
+            populate(database, user, rows, arguments.seed)
+
+            for query in QUERIES:
+                durations = {}
+                for name, search in [("fts5", search_index), ("like", search_like)]:
+                    start = perf_counter()
+                    for _ in range(arguments.repeats):
+                        found = search(database, user, query, arguments.limit)
+                    durations[name] = (perf_counter() - start) / arguments.repeats
+                print(
+                    f"{rows:>9} rows {query!r:>20}: {found:>3} found, "
+                    f"fts5 {durations['fts5'] * 1000:>8.1f} ms, "
+                    f"like {durations['like'] * 1000:>8.1f} ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
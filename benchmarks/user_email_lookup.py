@@ -0,0 +1,74 @@
+"""Measures the cost of looking a user up by email, with and without the
+unique index on user.email.
+
+Run from the repository root with `python -m benchmarks.user_email_lookup`."""
+import argparse
+import random
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from sqlalchemy import create_engine, insert, text
+from sqlmodel import Session, SQLModel, select
+
+import src.database
+from src.common.utils import str_uuid4
+from src.database.users.user import User
+
+BATCH_SIZE = 50000
+
+
+def populate(engine, users: int) -> None:
+    with engine.begin() as connection:
+        for start in range(0, users, BATCH_SIZE):
+            connection.execute(
+                insert(User),
+                [
+                    {"id": str_uuid4(), "email": f"user{index}@example.com"}
+                    for index in range(start, min(start + BATCH_SIZE, users))
+                ],
+            )
+
+
+def measure(engine, users: int, lookups: int) -> float:
+    emails = [f"user{random.randrange(users)}@example.com" for _ in range(lookups)]
+    with Session(engine) as session:
+        start = perf_counter()
+        for email in emails:
+            session.exec(select(User).where(User.email == email)).first()
+            session.expunge_all()
+        return (perf_counter() - start) / lookups
+
+
+def query_plan(engine) -> str:
+    with engine.connect() as connection:
+        rows = connection.execute(
+            text("EXPLAIN QUERY PLAN SELECT * FROM user WHERE email = 'x'")
+        )
+        return "; ".join(row[-1] for row in rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=1000)
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'benchmark.db'}")
+        SQLModel.metadata.create_all(engine)
+        populate(engine, arguments.users)
+
+        indexed = measure(engine, arguments.users, arguments.lookups)
+        print(f"indexed:   {indexed * 1e6:10.1f} us/lookup ({query_plan(engine)})")
+
+        with engine.begin() as connection:
+            connection.execute(text("DROP INDEX ix_user_email"))
+        engine.dispose()
+        unindexed = measure(engine, arguments.users, max(arguments.lookups // 100, 5))
+        print(f"unindexed: {unindexed * 1e6:10.1f} us/lookup ({query_plan(engine)})")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
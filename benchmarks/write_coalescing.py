@@ -0,0 +1,108 @@
+"""Compares commit-per-request writes with group commits of concurrent writes
+on SQLite.
+
+Concurrent clients keep creating transactions through AsyncTransactionManager,
+first with every write committed on its own and then with the write coalescer
+gathering writes for a short window and committing them together. SQLite lets
+one connection write at a time, so with a commit per write the clients queue
+for the writer and each commit pays for its own journal write, and with
+synchronous = FULL its own fsync.
+
+Run from the repository root with `python -m benchmarks.write_coalescing`."""
+import argparse
+import asyncio
+import statistics
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+
+from src.analytics.ledger_cache import LedgerCache
+from src.common.settings import Settings
+from src.database.async_database import AsyncDatabase
+from src.database.async_write_coalescer import AsyncWriteCoalescer
+from src.database.transactions.balance_database_handler import (
+    BalanceDatabaseHandler,
+)
+from src.database.transactions.monthly_total_database_handler import (
+    MonthlyTotalDatabaseHandler,
+)
+from src.database.transactions.transaction import TransactionCreate
+from src.database.transactions.transaction_database_handler import (
+    TransactionDatabaseHandler,
+)
+from src.database.users.user import User
+from src.managers.async_transaction_manager import AsyncTransactionManager
+
+
+async def run_clients(
+    manager: AsyncTransactionManager, user: User, clients: int, writes: int
+) -> tuple[float, list[float]]:
+    data = TransactionCreate(amount=-100, occurred_at=datetime(2026, 1, 1))
+    latencies: list[float] = []
+
+    async def client() -> None:
+        for _ in range(writes):
+            start = perf_counter()
+            await manager.create_transaction(user, data)
+            latencies.append(perf_counter() - start)
+
+    start = perf_counter()
+    await asyncio.gather(*[client() for _ in range(clients)])
+    return perf_counter() - start, latencies
+
+
+async def run_mode(
+    synchronous: str, window_ms: float, arguments: argparse.Namespace
+) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        settings = Settings(
+            database_url=f"sqlite:///{Path(directory) / 'benchmark.db'}",
+            sqlite_synchronous=synchronous,
+            write_coalescing_window_ms=window_ms,
+            write_coalescing_max_batch=arguments.max_batch,
+        )
+        database = AsyncDatabase(settings)
+        await database.create_database()
+        user = User(email="benchmark@example.com")
+        async with database.get_session() as session:
+            session.add(user)
+            await session.commit()
+        manager = AsyncTransactionManager(
+            database,
+            AsyncWriteCoalescer(settings, database),
+            LedgerCache(settings),
+            TransactionDatabaseHandler(),
+            MonthlyTotalDatabaseHandler(),
+            BalanceDatabaseHandler(),
+        )
+
+        duration, latencies = await run_clients(
+            manager, user, arguments.clients, arguments.writes
+        )
+
+    latencies.sort()
+    mode = f"window {window_ms:g} ms" if window_ms else "commit per write"
+    print(
+        f"synchronous={synchronous:<6} {mode:>16}: "
+        f"{len(latencies) / duration:>8.0f} writes/s, "
+        f"p50 {statistics.median(latencies) * 1000:>6.1f} ms, "
+        f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:>6.1f} ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--writes", type=int, default=100)
+    parser.add_argument("--window-ms", type=float, default=2)
+    parser.add_argument("--max-batch", type=int, default=64)
+    arguments = parser.parse_args()
+
+    for synchronous in ("NORMAL", "FULL"):
+        for window_ms in (0, arguments.window_ms):
+            await run_mode(synchronous, window_ms, arguments)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
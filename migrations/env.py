@@ -6,6 +6,10 @@ from sqlmodel import SQLModel
 
 from src.common.settings import Settings
 from src.database.categories.category import Category
+from src.database.transactions.balance import BalanceNode
+from src.database.transactions.monthly_total import MonthlyTotal
+from src.database.transactions.transaction import Transaction
+from src.database.users.token_revocation import TokenRevocation
 from src.database.users.user import User
 
 # this is the Alembic Config object, which provides
@@ -0,0 +1,34 @@
+"""Add unique index on user email
+
+Revision ID: 3c5a9e1f7b20
+Revises: ad04fd515974
+Create Date: 2026-10-18 10:12:41.208113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = '3c5a9e1f7b20'
+down_revision = 'ad04fd515974'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Dropping internal_id in e18983641cf5 left the table without a primary
+    # key, so ix_user_id was the only index on id. Promote id to the primary
+    # key, which makes that index redundant, and index email for lookups.
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.drop_index('ix_user_id')
+        batch_op.create_primary_key('pk_user', ['id'])
+        batch_op.create_index(batch_op.f('ix_user_email'), ['email'], unique=True)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_user_email'))
+        batch_op.drop_constraint('pk_user', type_='primary')
+        batch_op.create_index('ix_user_id', ['id'], unique=False)
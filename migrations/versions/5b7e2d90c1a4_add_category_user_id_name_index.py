@@ -0,0 +1,27 @@
+"""Add category user_id name index
+
+Revision ID: 5b7e2d90c1a4
+Revises: 8f21d6b4c9e3
+Create Date: 2026-10-18 14:12:08.318245
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = '5b7e2d90c1a4'
+down_revision = '8f21d6b4c9e3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('category', schema=None) as batch_op:
+        batch_op.create_index('ix_category_user_id_name', ['user_id', 'name'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('category', schema=None) as batch_op:
+        batch_op.drop_index('ix_category_user_id_name')
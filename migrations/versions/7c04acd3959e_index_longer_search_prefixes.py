@@ -0,0 +1,43 @@
+"""Index longer search prefixes
+
+Revision ID: 7c04acd3959e
+Revises: f4a2c6e8b913
+Create Date: 2026-10-18 23:47:05.291736
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+from src.database.transactions.transaction import SEARCH_TABLE
+
+
+# revision identifiers, used by Alembic.
+revision = '7c04acd3959e'
+down_revision = 'f4a2c6e8b913'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    recreate_search_table('2 3 4 5 6')
+
+
+def downgrade() -> None:
+    recreate_search_table('2 3')
+
+
+def recreate_search_table(prefixes: str) -> None:
+    # PostgreSQL searches through its trigram index, which has no prefixes.
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    # The triggers refer to the table by name, so they keep working once it
+    # is created again.
+    op.execute(f'DROP TABLE {SEARCH_TABLE}')
+    op.execute(
+        f'CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5(description, '
+        "content='transaction', content_rowid='id', "
+        f"tokenize='unicode61 remove_diacritics 2', prefix='{prefixes}')"
+    )
+    op.execute(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')")
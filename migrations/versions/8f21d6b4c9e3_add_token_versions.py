@@ -0,0 +1,44 @@
+"""Add token versions
+
+Revision ID: 8f21d6b4c9e3
+Revises: 3c5a9e1f7b20
+Create Date: 2026-10-18 11:03:27.551902
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = '8f21d6b4c9e3'
+down_revision = '3c5a9e1f7b20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('token_revocation',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('token_version', sa.Integer(), nullable=False),
+    sa.Column('revoked_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('token_revocation', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_token_revocation_revoked_at'), ['revoked_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_token_revocation_user_id'), ['user_id'], unique=False)
+
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.drop_column('token_version')
+
+    with op.batch_alter_table('token_revocation', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_token_revocation_user_id'))
+        batch_op.drop_index(batch_op.f('ix_token_revocation_revoked_at'))
+
+    op.drop_table('token_revocation')
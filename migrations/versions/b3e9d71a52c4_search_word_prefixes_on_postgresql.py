@@ -0,0 +1,53 @@
+"""Search word prefixes on PostgreSQL
+
+Revision ID: b3e9d71a52c4
+Revises: 7c04acd3959e
+Create Date: 2026-10-19 09:41:27.816203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3e9d71a52c4'
+down_revision = '7c04acd3959e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # SQLite already matches word prefixes without diacritics through FTS5.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS unaccent')
+    op.execute(
+        'CREATE OR REPLACE FUNCTION search_unaccent(text) RETURNS text '
+        "AS $$ SELECT public.unaccent('public.unaccent', $1) $$ "
+        'LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT'
+    )
+    op.drop_index('ix_transaction_description_trgm', table_name='transaction')
+    op.execute(
+        'CREATE INDEX ix_transaction_description_unaccent_trgm ON "transaction" '
+        'USING gin (search_unaccent(description) gin_trgm_ops)'
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index(
+        'ix_transaction_description_unaccent_trgm', table_name='transaction'
+    )
+    op.create_index(
+        'ix_transaction_description_trgm',
+        'transaction',
+        ['description'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'description': 'gin_trgm_ops'},
+    )
+    op.execute('DROP FUNCTION search_unaccent(text)')
@@ -0,0 +1,126 @@
+"""Add category surrogate id
+
+Revision ID: c4d81f2a6e57
+Revises: 5b7e2d90c1a4
+Create Date: 2026-10-18 15:03:41.902716
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4d81f2a6e57'
+down_revision = '5b7e2d90c1a4'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 10000
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        upgrade_postgresql()
+        return
+
+    # SQLite cannot change a primary key in place, so the table is copied.
+    op.create_table('category_new',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('user_id', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'name', name='uq_category_user_id_name')
+    )
+    op.execute(
+        'INSERT INTO category_new (name, user_id) '
+        'SELECT name, user_id FROM category ORDER BY user_id, name'
+    )
+    op.drop_table('category')
+    op.rename_table('category_new', 'category')
+
+
+def upgrade_postgresql() -> None:
+    # Every step either takes its lock only briefly or runs outside a
+    # transaction, so the table stays readable and writable throughout.
+    op.execute('CREATE SEQUENCE category_id_seq')
+    op.add_column('category', sa.Column('id', sa.Integer(), nullable=True))
+    op.execute("ALTER TABLE category ALTER COLUMN id SET DEFAULT nextval('category_id_seq')")
+    op.execute('ALTER SEQUENCE category_id_seq OWNED BY category.id')
+
+    with op.get_context().autocommit_block():
+        backfill_postgresql_ids()
+        op.execute('CREATE UNIQUE INDEX CONCURRENTLY category_id_idx ON category (id)')
+        op.execute(
+            'CREATE UNIQUE INDEX CONCURRENTLY uq_category_user_id_name '
+            'ON category (user_id, name)'
+        )
+        op.execute(
+            'ALTER TABLE category ADD CONSTRAINT category_id_not_null '
+            'CHECK (id IS NOT NULL) NOT VALID'
+        )
+        op.execute('ALTER TABLE category VALIDATE CONSTRAINT category_id_not_null')
+
+    op.execute('ALTER TABLE category ALTER COLUMN id SET NOT NULL')
+    op.execute('ALTER TABLE category DROP CONSTRAINT category_id_not_null')
+    op.execute(
+        'ALTER TABLE category DROP CONSTRAINT category_pkey, '
+        'ADD CONSTRAINT category_pkey PRIMARY KEY USING INDEX category_id_idx'
+    )
+    op.execute(
+        'ALTER TABLE category ADD CONSTRAINT uq_category_user_id_name '
+        'UNIQUE USING INDEX uq_category_user_id_name'
+    )
+
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY ix_category_user_id_name')
+
+
+def backfill_postgresql_ids() -> None:
+    # Rows inserted meanwhile get their id from the column default, so walking
+    # the existing rows once in key order numbers all of them.
+    connection = op.get_bind()
+    statement = sa.text(
+        "UPDATE category SET id = nextval('category_id_seq') "
+        'WHERE (user_id, name) IN ('
+        'SELECT user_id, name FROM category '
+        'WHERE (user_id, name) > (:user_id, :name) AND id IS NULL '
+        'ORDER BY user_id, name LIMIT :limit) '
+        'RETURNING user_id, name'
+    )
+    last = ('', '')
+    while True:
+        rows = connection.execute(
+            statement,
+            {'user_id': last[0], 'name': last[1], 'limit': BACKFILL_BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        last = max(tuple(row) for row in rows)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            'ALTER TABLE category DROP CONSTRAINT category_pkey, '
+            'ADD CONSTRAINT category_pkey PRIMARY KEY (name, user_id)'
+        )
+        op.drop_constraint('uq_category_user_id_name', 'category', type_='unique')
+        op.drop_column('category', 'id')
+        op.create_index('ix_category_user_id_name', 'category', ['user_id', 'name'], unique=False)
+        return
+
+    op.create_table('category_old',
+    sa.Column('name', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('user_id', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('name', 'user_id')
+    )
+    op.execute(
+        'INSERT INTO category_old (name, user_id) SELECT name, user_id FROM category'
+    )
+    op.drop_table('category')
+    op.rename_table('category_old', 'category')
+    with op.batch_alter_table('category', schema=None) as batch_op:
+        batch_op.create_index('ix_category_user_id_name', ['user_id', 'name'], unique=False)
@@ -0,0 +1,74 @@
+"""Store user ids as binary uuids
+
+Revision ID: e6f03b9d2a18
+Revises: c4d81f2a6e57
+Create Date: 2026-10-18 16:27:55.614093
+
+"""
+from uuid import UUID
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6f03b9d2a18'
+down_revision = 'c4d81f2a6e57'
+branch_labels = None
+depends_on = None
+
+USER_ID_COLUMNS = [('user', 'id'), ('category', 'user_id'), ('token_revocation', 'user_id')]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        alter_postgresql_columns(postgresql.UUID(as_uuid=False), 'uuid')
+        return
+
+    # Batch mode copies the table with a CAST to the new type, which keeps
+    # blobs as they are, so the values are converted to bytes beforehand.
+    convert_sqlite_values(lambda value: UUID(value).bytes)
+    alter_sqlite_columns(sqlmodel.sql.sqltypes.AutoString(), sa.LargeBinary(16))
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        alter_postgresql_columns(sqlmodel.sql.sqltypes.AutoString(), 'varchar')
+        return
+
+    convert_sqlite_values(lambda value: str(UUID(bytes=value)))
+    alter_sqlite_columns(sa.LargeBinary(16), sqlmodel.sql.sqltypes.AutoString())
+
+
+def alter_postgresql_columns(type_: sa.types.TypeEngine, cast: str) -> None:
+    op.drop_constraint('category_user_id_fkey', 'category', type_='foreignkey')
+    for table, column in USER_ID_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=type_,
+            existing_nullable=False,
+            postgresql_using=f'{column}::{cast}',
+        )
+    op.create_foreign_key(
+        'category_user_id_fkey', 'category', 'user', ['user_id'], ['id']
+    )
+
+
+def convert_sqlite_values(convert) -> None:
+    connection = op.get_bind().connection.driver_connection
+    connection.create_function('convert_user_id', 1, convert, deterministic=True)
+    for table, column in USER_ID_COLUMNS:
+        op.execute(f'UPDATE "{table}" SET {column} = convert_user_id({column})')
+
+
+def alter_sqlite_columns(
+    existing_type: sa.types.TypeEngine, type_: sa.types.TypeEngine
+) -> None:
+    for table, column in USER_ID_COLUMNS:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(
+                column, existing_type=existing_type, type_=type_, existing_nullable=False
+            )
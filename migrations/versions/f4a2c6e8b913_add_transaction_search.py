@@ -0,0 +1,48 @@
+"""Add transaction search
+
+Revision ID: f4a2c6e8b913
+Revises: d7f1c3a8b604
+Create Date: 2026-10-18 23:12:48.530417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+from src.database.transactions.transaction import SEARCH_TABLE, SQLITE_SEARCH_DDL
+
+
+# revision identifiers, used by Alembic.
+revision = 'f4a2c6e8b913'
+down_revision = 'd7f1c3a8b604'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.create_index(
+            'ix_transaction_description_trgm',
+            'transaction',
+            ['description'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'description': 'gin_trgm_ops'},
+        )
+        return
+
+    for statement in SQLITE_SEARCH_DDL:
+        op.execute(statement)
+    # Indexes the transactions recorded so far.
+    op.execute(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_transaction_description_trgm', table_name='transaction')
+        return
+
+    for trigger in ('insert', 'delete', 'update'):
+        op.execute(f'DROP TRIGGER {SEARCH_TABLE}_{trigger}')
+    op.execute(f'DROP TABLE {SEARCH_TABLE}')
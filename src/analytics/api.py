@@ -0,0 +1,72 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi_injector import Injected
+
+from src.authentication.current_user import get_current_user
+from src.database.transactions.analytics import (
+    MAX_SPEND_WINDOW,
+    CategorySpendRead,
+    DailySpendFilter,
+    DailySpendRead,
+    MonthlySpendRead,
+    SpendFilter,
+    YearOverYearRead,
+)
+from src.database.transactions.monthly_total import MonthlyTotalFilter
+from src.database.unit_of_work_route import UnitOfWorkRoute
+from src.database.users.user import User
+from src.managers.i_analytics_manager import IAnalyticsManager
+
+router = APIRouter(
+    prefix="/analytics",
+    tags=["Analytics"],
+    route_class=UnitOfWorkRoute,
+)
+
+
+@router.get("/category-spend", response_model=list[CategorySpendRead])
+def get_category_spend(
+    filters: SpendFilter = Depends(),
+    analytics_manager: IAnalyticsManager = Injected(IAnalyticsManager),
+    current_user: User = Depends(get_current_user),
+):
+    return analytics_manager.get_category_spend(current_user, filters)
+
+
+@router.get(
+    "/daily-spend",
+    response_model=list[DailySpendRead],
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"description": "Date range is invalid."}
+    },
+)
+def get_daily_spend(
+    filters: DailySpendFilter = Depends(),
+    window: int = Query(30, ge=1, le=MAX_SPEND_WINDOW),
+    analytics_manager: IAnalyticsManager = Injected(IAnalyticsManager),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        return analytics_manager.get_daily_spend(current_user, filters, window)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Date range is invalid.",
+        )
+
+
+@router.get("/monthly-spend", response_model=MonthlySpendRead)
+def get_monthly_spend(
+    filters: MonthlyTotalFilter = Depends(),
+    analytics_manager: IAnalyticsManager = Injected(IAnalyticsManager),
+    current_user: User = Depends(get_current_user),
+):
+    return analytics_manager.get_monthly_spend(current_user, filters)
+
+
+@router.get("/year-over-year", response_model=list[YearOverYearRead])
+def get_year_over_year(
+    year: int = Query(ge=1901, le=9998),
+    analytics_manager: IAnalyticsManager = Injected(IAnalyticsManager),
+    current_user: User = Depends(get_current_user),
+):
+    return analytics_manager.get_year_over_year(current_user, year)
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+
+from src.common.lru_cache import CacheStatistics
+from src.database.transactions.analytics import Ledger
+from src.database.users.user import User
+
+
+class ILedgerCache(ABC):
+    @abstractmethod
+    def get_ledger(self, user: User) -> Ledger | None:
+        """Returns the cached ledger of the given user, or None if it
+           is not cached or the entry has expired."""
+
+    @abstractmethod
+    def get_generation(self) -> int:
+        """Returns a number that changes whenever a ledger is
+           invalidated. Read it before loading a ledger and pass it to
+           add_ledger."""
+
+    @abstractmethod
+    def add_ledger(self, user: User, ledger: Ledger, generation: int) -> None:
+        """Caches the given user's ledger, unless a ledger has been
+           invalidated since the generation was read, in which case
+           the ledger may already be out of date."""
+
+    @abstractmethod
+    def invalidate_user(self, user: User) -> None:
+        """Removes the given user's ledger from the cache. Must be
+           called whenever the user's transactions or categories are
+           changed."""
+
+    @abstractmethod
+    def statistics(self) -> CacheStatistics:
+        """Returns hit and miss counters for the cache."""
@@ -0,0 +1,42 @@
+from threading import Lock
+
+from injector import inject
+
+from src.analytics.i_ledger_cache import ILedgerCache
+from src.common.lru_cache import CacheStatistics, LruTtlCache
+from src.common.settings import Settings
+from src.database.transactions.analytics import Ledger
+from src.database.users.user import User
+
+
+class LedgerCache(ILedgerCache):
+    @inject
+    def __init__(self, settings: Settings):
+        self.__cache: LruTtlCache[str, Ledger] = LruTtlCache(
+            settings.ledger_cache_size, settings.ledger_cache_ttl_seconds
+        )
+        self.__generation = 0
+        self.__lock = Lock()
+
+    def get_ledger(self, user: User) -> Ledger | None:
+        return self.__cache.get(user.id)
+
+    def get_generation(self) -> int:
+        return self.__generation
+
+    def add_ledger(self, user: User, ledger: Ledger, generation: int) -> None:
+        # A write committed while the ledger was being read invalidates
+        # before the ledger is added, so the generation tells that it may be
+        # missing the write. One generation is shared by all users, which
+        # only means that a busy server caches a little less eagerly.
+        with self.__lock:
+            if generation == self.__generation:
+                self.__cache.set(user.id, ledger)
+
+    def invalidate_user(self, user: User) -> None:
+        with self.__lock:
+            self.__generation += 1
+            self.__cache.delete(user.id)
+
+    def statistics(self) -> CacheStatistics:
+        return self.__cache.statistics()
@@ -0,0 +1,182 @@
+from datetime import date, timedelta
+
+import numpy as np
+
+from src.database.transactions.analytics import (
+    LEDGER_EPOCH,
+    MAX_DAILY_SPEND_DAYS,
+    MAX_SPEND_WINDOW,
+    CategorySpendRead,
+    DailySpendFilter,
+    DailySpendRead,
+    Ledger,
+    MonthlySpendRead,
+    SpendFilter,
+    YearOverYearRead,
+)
+from src.database.transactions.monthly_total import MonthlyTotalFilter
+
+PERCENTILES = (25, 50, 75, 90)
+
+
+def to_day_number(day: date) -> int:
+    return (day - LEDGER_EPOCH).days
+
+
+def to_month_number(day: date) -> int:
+    return (day.year - LEDGER_EPOCH.year) * 12 + day.month - 1
+
+
+def slice_ledger(ledger: Ledger, start: date | None, end: date | None) -> Ledger:
+    first = None if start is None else to_day_number(start)
+    last = None if end is None else to_day_number(end)
+    return _slice_days(ledger, first, last)
+
+
+def summarize_category_spend(
+    ledger: Ledger, filters: SpendFilter
+) -> list[CategorySpendRead]:
+    ledger = slice_ledger(ledger, filters.start, filters.end)
+    spending = ledger.amounts < 0
+    category_ids, spend, counts = _sum_by(
+        ledger.category_ids[spending], -ledger.amounts[spending]
+    )
+    total = spend.sum()
+    reads = [
+        CategorySpendRead(
+            category=ledger.category_names.get(category_id),
+            spend=category_spend,
+            count=count,
+            share=category_spend / total,
+        )
+        for category_id, category_spend, count in zip(
+            category_ids.tolist(), spend.tolist(), counts.tolist()
+        )
+    ]
+    return sorted(reads, key=lambda read: (-read.spend, read.category or ""))
+
+
+def check_daily_spend_filter(filters: DailySpendFilter, window: int) -> None:
+    days = (filters.end - filters.start).days
+    if days < 1 or days > MAX_DAILY_SPEND_DAYS or not 1 <= window <= MAX_SPEND_WINDOW:
+        raise ValueError("Date range is invalid.")
+
+
+def summarize_daily_spend(
+    ledger: Ledger, filters: DailySpendFilter, window: int
+) -> list[DailySpendRead]:
+    # The window reaches back before the first day, so spending is summed per
+    # day from there on, and every moving average is the difference of two
+    # running totals.
+    check_daily_spend_filter(filters, window)
+    first = to_day_number(filters.start) - window + 1
+    last = to_day_number(filters.end)
+    ledger = _slice_days(ledger, first, last)
+    daily = _sum_into(ledger.days, _spend(ledger.amounts), first, last - first)
+    running = np.concatenate(([0], np.cumsum(daily)))
+    averages = (running[window:] - running[:-window]) / window
+    return [
+        DailySpendRead(
+            day=filters.start + timedelta(days=index), spend=spend, average=average
+        )
+        for index, (spend, average) in enumerate(
+            zip(daily[window - 1:].tolist(), averages.tolist())
+        )
+    ]
+
+
+def summarize_monthly_spend(
+    ledger: Ledger, filters: MonthlyTotalFilter
+) -> MonthlySpendRead:
+    ledger = slice_ledger(ledger, filters.start, filters.end)
+    months = _to_month_numbers(ledger.days)
+    if filters.start is not None:
+        first = to_month_number(filters.start)
+    elif len(months):
+        first = int(months[0])
+    else:
+        return MonthlySpendRead(months=0)
+    if filters.end is not None:
+        last = to_month_number(filters.end)
+    elif len(months):
+        last = int(months[-1]) + 1
+    else:
+        last = first
+    if last <= first:
+        return MonthlySpendRead(months=0)
+
+    monthly = _sum_into(months, _spend(ledger.amounts), first, last - first)
+    percentiles = np.percentile(monthly, PERCENTILES).tolist()
+    return MonthlySpendRead(
+        months=len(monthly),
+        mean=monthly.mean(),
+        **{f"p{rank}": value for rank, value in zip(PERCENTILES, percentiles)},
+    )
+
+
+def compare_years(ledger: Ledger, year: int) -> list[YearOverYearRead]:
+    start = date(year - 1, 1, 1)
+    ledger = slice_ledger(ledger, start, date(year + 1, 1, 1))
+    monthly = _sum_into(
+        _to_month_numbers(ledger.days),
+        _spend(ledger.amounts),
+        to_month_number(start),
+        24,
+    )
+    return [
+        YearOverYearRead(
+            month=month,
+            spend=spend,
+            previous_spend=previous,
+            change=(spend - previous) / previous if previous else None,
+        )
+        for month, (previous, spend) in enumerate(
+            zip(monthly[:12].tolist(), monthly[12:].tolist()), start=1
+        )
+    ]
+
+
+def _slice_days(ledger: Ledger, first: int | None, last: int | None) -> Ledger:
+    # The days are sorted, so a range of days is a slice found by binary
+    # search, and the slices are views that copy nothing.
+    start = 0 if first is None else int(np.searchsorted(ledger.days, first))
+    end = len(ledger.days) if last is None else int(np.searchsorted(ledger.days, last))
+    return Ledger(
+        ledger.days[start:end],
+        ledger.amounts[start:end],
+        ledger.category_ids[start:end],
+        ledger.category_names,
+    )
+
+
+def _to_month_numbers(days: np.ndarray) -> np.ndarray:
+    return days.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+
+
+def _spend(amounts: np.ndarray) -> np.ndarray:
+    return np.where(amounts < 0, -amounts, 0)
+
+
+def _sum_by(
+    keys: np.ndarray, values: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Sorting brings equal keys together, so that every group is a run that
+    # np.add.reduceat sums exactly in integers, which np.bincount would do in
+    # floats.
+    if not len(keys):
+        return keys, values, np.zeros(0, dtype=np.int64)
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    sums = np.add.reduceat(values[order], starts)
+    counts = np.diff(np.append(starts, len(keys)))
+    return keys[starts], sums, counts
+
+
+def _sum_into(
+    keys: np.ndarray, values: np.ndarray, first: int, size: int
+) -> np.ndarray:
+    sums = np.zeros(size, dtype=np.int64)
+    keys, group_sums, _ = _sum_by(keys, values)
+    sums[keys - first] = group_sums
+    return sums
@@ -2,11 +2,17 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi_injector import Injected
 
-from src.authentication.current_user import get_current_user
+from src.authentication.current_user import (
+    check_not_modified,
+    get_current_user,
+    get_current_user_claims,
+)
 from src.authentication.i_authentication import IAuthentication
 from src.authentication.i_password_handler import IPasswordHandler
 from src.authentication.token import Token
-from src.common.exceptions import ObjectNotFoundError
+from src.common.etags import NOT_MODIFIED_RESPONSE, VersionedResource
+from src.common.exceptions import ObjectNotFoundError, PasswordHashingOverloadedError
+from src.database.unit_of_work_route import UnitOfWorkRoute
 from src.database.users.user import (
     User,
     UserCreate,
@@ -19,10 +25,25 @@ from src.managers.i_user_manager import IUserManager
 router = APIRouter(
     prefix="/auth",
     tags=["Authentication"],
+    route_class=UnitOfWorkRoute,
 )
 
+OVERLOADED_RESPONSE = {
+    status.HTTP_503_SERVICE_UNAVAILABLE: {
+        "description": "Too many password operations in progress."
+    }
+}
+
+
+def overloaded_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many password operations in progress, try again later.",
+        headers={"Retry-After": "1"},
+    )
+
 
-@router.post("/token", response_model=Token)
+@router.post("/token", response_model=Token, responses=OVERLOADED_RESPONSE)
 def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
     authentication: IAuthentication = Injected(IAuthentication),
@@ -36,6 +57,8 @@ def login_for_access_token(
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    except PasswordHashingOverloadedError as exc:
+        raise overloaded_exception() from exc
 
 
 @router.post(
@@ -45,7 +68,8 @@ def login_for_access_token(
     responses={
         status.HTTP_400_BAD_REQUEST: {
             "description": "User with that email already exists."
-        }
+        },
+        **OVERLOADED_RESPONSE,
     },
 )
 def create_user(user: UserCreate, user_manager: IUserManager = Injected(IUserManager)):
@@ -57,6 +81,8 @@ def create_user(user: UserCreate, user_manager: IUserManager = Injected(IUserMan
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User with that email already exists.",
         )
+    except PasswordHashingOverloadedError as exc:
+        raise overloaded_exception() from exc
 
 
 @router.patch(
@@ -67,7 +93,7 @@ def create_user(user: UserCreate, user_manager: IUserManager = Injected(IUserMan
 def update_user(
     user: UserUpdate,
     user_manager: IUserManager = Injected(IUserManager),
-    current_user: User = Depends(get_current_user),
+    current_user: UserRead = Depends(get_current_user_claims),
 ):
     try:
         updated_user = user_manager.update_user(current_user.id, user)
@@ -85,6 +111,7 @@ def update_user(
     responses={
         status.HTTP_400_BAD_REQUEST: {"description": "Old password is incorrect."},
         status.HTTP_404_NOT_FOUND: {"description": "User does not exist."},
+        **OVERLOADED_RESPONSE,
     },
 )
 def update_user_password(
@@ -93,14 +120,14 @@ def update_user_password(
     user_manager: IUserManager = Injected(IUserManager),
     current_user: User = Depends(get_current_user),
 ):
-    if not password_handler.verify_password(
-        passwords.old_password, current_user.hashed_password
-    ):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Old password is incorrect.",
-        )
     try:
+        if not password_handler.verify_password(
+            passwords.old_password, current_user.hashed_password
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Old password is incorrect.",
+            )
         updated_user = user_manager.update_user_password(
             current_user.id, passwords.new_password
         )
@@ -110,15 +137,23 @@ def update_user_password(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User does not exist.",
         )
+    except PasswordHashingOverloadedError as exc:
+        raise overloaded_exception() from exc
 
 
 @router.get(
     "/get-user",
     status_code=status.HTTP_200_OK,
     response_model=UserRead,
-    responses={status.HTTP_404_NOT_FOUND: {"description": "User does not exist."}},
+    responses={
+        status.HTTP_404_NOT_FOUND: {"description": "User does not exist."},
+        **NOT_MODIFIED_RESPONSE,
+    },
+    dependencies=[
+        Depends(check_not_modified(VersionedResource.USER, covers_token=True))
+    ],
 )
-def get_user(current_user: User = Depends(get_current_user)):
+def get_user(current_user: UserRead = Depends(get_current_user_claims)):
     return current_user
 
 
@@ -129,7 +164,7 @@ def get_user(current_user: User = Depends(get_current_user)):
 )
 def delete_user(
     user_manager: IUserManager = Injected(IUserManager),
-    current_user: User = Depends(get_current_user),
+    current_user: UserRead = Depends(get_current_user_claims),
 ):
     try:
         user_manager.delete_user(current_user.id)
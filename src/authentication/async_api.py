@@ -0,0 +1,162 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordRequestForm
+from fastapi_injector import Injected
+
+from src.authentication.api import OVERLOADED_RESPONSE, overloaded_exception
+from src.authentication.current_user import (
+    check_not_modified_async,
+    get_current_user_async,
+    get_current_user_claims_async,
+)
+from src.authentication.i_async_authentication import IAsyncAuthentication
+from src.authentication.i_password_handler import IPasswordHandler
+from src.authentication.token import Token
+from src.common.etags import NOT_MODIFIED_RESPONSE, VersionedResource
+from src.common.exceptions import ObjectNotFoundError, PasswordHashingOverloadedError
+from src.database.users.user import (
+    User,
+    UserCreate,
+    UserRead,
+    UserUpdate,
+    UserUpdatePassword,
+)
+from src.managers.i_async_user_manager import IAsyncUserManager
+
+router = APIRouter(
+    prefix="/auth",
+    tags=["Authentication"],
+)
+
+
+@router.post("/token", response_model=Token, responses=OVERLOADED_RESPONSE)
+async def login_for_access_token(
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    authentication: IAsyncAuthentication = Injected(IAsyncAuthentication),
+):
+    try:
+        token = await authentication.login_user(form_data.username, form_data.password)
+        return {"access_token": token, "token_type": "bearer"}
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    except PasswordHashingOverloadedError as exc:
+        raise overloaded_exception() from exc
+
+
+@router.post(
+    "/create-user",
+    response_model=UserRead,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "User with that email already exists."
+        },
+        **OVERLOADED_RESPONSE,
+    },
+)
+async def create_user(
+    user: UserCreate, user_manager: IAsyncUserManager = Injected(IAsyncUserManager)
+):
+    try:
+        new_user = await user_manager.create_user(user)
+        return new_user
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User with that email already exists.",
+        )
+    except PasswordHashingOverloadedError as exc:
+        raise overloaded_exception() from exc
+
+
+@router.patch(
+    "/update-user",
+    response_model=UserRead,
+    responses={status.HTTP_404_NOT_FOUND: {"description": "User does not exist."}},
+)
+async def update_user(
+    user: UserUpdate,
+    user_manager: IAsyncUserManager = Injected(IAsyncUserManager),
+    current_user: UserRead = Depends(get_current_user_claims_async),
+):
+    try:
+        updated_user = await user_manager.update_user(current_user.id, user)
+        return updated_user
+    except ObjectNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User does not exist.",
+        )
+
+
+@router.patch(
+    "/update-user-password",
+    response_model=UserRead,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"description": "Old password is incorrect."},
+        status.HTTP_404_NOT_FOUND: {"description": "User does not exist."},
+        **OVERLOADED_RESPONSE,
+    },
+)
+async def update_user_password(
+    passwords: UserUpdatePassword,
+    password_handler: IPasswordHandler = Injected(IPasswordHandler),
+    user_manager: IAsyncUserManager = Injected(IAsyncUserManager),
+    current_user: User = Depends(get_current_user_async),
+):
+    try:
+        if not await password_handler.verify_password_async(
+            passwords.old_password, current_user.hashed_password
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Old password is incorrect.",
+            )
+        updated_user = await user_manager.update_user_password(
+            current_user.id, passwords.new_password
+        )
+        return updated_user
+    except ObjectNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User does not exist.",
+        )
+    except PasswordHashingOverloadedError as exc:
+        raise overloaded_exception() from exc
+
+
+@router.get(
+    "/get-user",
+    status_code=status.HTTP_200_OK,
+    response_model=UserRead,
+    responses={
+        status.HTTP_404_NOT_FOUND: {"description": "User does not exist."},
+        **NOT_MODIFIED_RESPONSE,
+    },
+    dependencies=[
+        Depends(check_not_modified_async(VersionedResource.USER, covers_token=True))
+    ],
+)
+async def get_user(current_user: UserRead = Depends(get_current_user_claims_async)):
+    return current_user
+
+
+@router.delete(
+    "/delete-user",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={status.HTTP_404_NOT_FOUND: {"description": "User does not exist."}},
+)
+async def delete_user(
+    user_manager: IAsyncUserManager = Injected(IAsyncUserManager),
+    current_user: UserRead = Depends(get_current_user_claims_async),
+):
+    try:
+        await user_manager.delete_user(current_user.id)
+    except ObjectNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User does not exist.",
+        )
@@ -0,0 +1,103 @@
+from injector import inject
+from pydantic import EmailStr
+
+from src.authentication.i_async_authentication import IAsyncAuthentication
+from src.authentication.i_async_token_revocations import IAsyncTokenRevocations
+from src.authentication.i_password_handler import IPasswordHandler
+from src.authentication.i_user_cache import IUserCache
+from src.authentication.token_claims import (
+    create_access_token,
+    get_subject,
+    get_token_version,
+    get_user_claims,
+    is_email_subject,
+)
+from src.common.exceptions import ObjectNotFoundError
+from src.common.i_jwt_encoder import IJwtEncoder
+from src.common.settings import Settings
+from src.database.users.user import User, UserRead
+from src.managers.i_async_user_manager import IAsyncUserManager
+
+
+class AsyncAuthentication(IAsyncAuthentication):
+    @inject
+    def __init__(
+        self,
+        password_handler: IPasswordHandler,
+        jwt_encoder: IJwtEncoder,
+        user_manager: IAsyncUserManager,
+        user_cache: IUserCache,
+        token_revocations: IAsyncTokenRevocations,
+        settings: Settings,
+    ):
+        self.__password_handler = password_handler
+        self.__jwt_encoder = jwt_encoder
+        self.__user_manager = user_manager
+        self.__user_cache = user_cache
+        self.__token_revocations = token_revocations
+        self.__settings = settings
+
+    async def login_user(self, email: str, password: str) -> str:
+        user = await self.__validate_email_and_password(email, password)
+        return create_access_token(
+            self.__jwt_encoder, user, self.__settings.access_token_expire_hours
+        )
+
+    async def authenticate_user(self, token: str) -> User:
+        payload = self.__jwt_encoder.decode(token)
+        user = await self.__get_user(get_subject(payload))
+        if get_token_version(payload) < user.token_version:
+            raise ValueError("Token has been revoked.")
+        return user
+
+    async def authenticate_user_claims(self, token: str) -> UserRead:
+        if not self.__settings.stateless_authentication:
+            return UserRead.from_orm(await self.authenticate_user(token))
+
+        payload = self.__jwt_encoder.decode(token)
+        claims = get_user_claims(payload)
+        if claims is None:
+            return UserRead.from_orm(await self.authenticate_user(token))
+        token_version = get_token_version(payload)
+        if await self.__token_revocations.is_revoked(claims.id, token_version):
+            raise ValueError("Token has been revoked.")
+        return claims
+
+    async def get_token_user_id(self, token: str) -> str | None:
+        subject = get_subject(self.__jwt_encoder.decode(token))
+        return None if is_email_subject(subject) else subject
+
+    async def __get_user(self, subject: str) -> User:
+        if is_email_subject(subject):
+            return await self.__get_user_with_email_subject(subject)
+
+        user = self.__user_cache.get_user(subject)
+        if user is not None:
+            return user
+        user = await self.__user_manager.get_user(subject)
+        if user is None:
+            raise ObjectNotFoundError("User does not exist.")
+        self.__user_cache.add_user(user)
+        return user
+
+    async def __get_user_with_email_subject(self, email: EmailStr) -> User:
+        if not self.__settings.accept_email_token_subjects:
+            raise ValueError("Tokens identifying users by email are not accepted.")
+        user = await self.__user_manager.get_user_with_email(email)
+        if user is None:
+            raise ObjectNotFoundError("User does not exist.")
+        return user
+
+    async def __validate_email_and_password(self, email: str, password: str) -> User:
+        user = await self.__user_manager.get_user_with_email(email)
+        if user is None:
+            raise ObjectNotFoundError("User does not exist.")
+        password_handler = self.__password_handler
+        is_valid, new_hash = await password_handler.verify_and_update_password_async(
+            password, user.hashed_password
+        )
+        if not is_valid:
+            raise ValueError("Incorrect password.")
+        if new_hash is not None:
+            await self.__user_manager.update_user_hashed_password(user.id, new_hash)
+        return user
@@ -0,0 +1,60 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from injector import inject
+from sqlmodel import select
+
+from src.authentication.i_async_token_revocations import IAsyncTokenRevocations
+from src.authentication.token_revocations import (
+    REFRESH_OVERLAP,
+    drop_expired_revocations,
+    merge_revocation,
+)
+from src.common.settings import Settings
+from src.database.i_async_database import IAsyncDatabase
+from src.database.users.token_revocation import TokenRevocation
+
+
+class AsyncTokenRevocations(IAsyncTokenRevocations):
+    @inject
+    def __init__(self, database: IAsyncDatabase, settings: Settings):
+        self.__database = database
+        self.__refresh_interval = settings.token_revocation_refresh_seconds
+        self.__token_lifetime = timedelta(hours=settings.access_token_expire_hours)
+        self.__minimum_versions: dict[str, tuple[int, datetime]] = {}
+        self.__loaded_until: datetime | None = None
+        self.__next_refresh = 0.0
+        self.__lock = asyncio.Lock()
+
+    async def is_revoked(self, user_id: str, token_version: int) -> bool:
+        await self.__refresh_if_due()
+        entry = self.__minimum_versions.get(user_id)
+        return entry is not None and token_version < entry[0]
+
+    def add_revocation(self, revocation: TokenRevocation) -> None:
+        merge_revocation(self.__minimum_versions, revocation)
+
+    async def __refresh_if_due(self) -> None:
+        if time.monotonic() < self.__next_refresh:
+            return
+        async with self.__lock:
+            if time.monotonic() < self.__next_refresh:
+                return
+            now = datetime.utcnow()
+            oldest_relevant = now - self.__token_lifetime
+            since = oldest_relevant
+            if self.__loaded_until is not None:
+                since = max(since, self.__loaded_until - REFRESH_OVERLAP)
+
+            async with self.__database.get_session() as session:
+                statement = select(TokenRevocation).where(
+                    TokenRevocation.revoked_at > since
+                )
+                for revocation in await session.exec(statement):
+                    merge_revocation(self.__minimum_versions, revocation)
+            self.__loaded_until = now
+            self.__minimum_versions = drop_expired_revocations(
+                self.__minimum_versions, oldest_relevant
+            )
+            self.__next_refresh = time.monotonic() + self.__refresh_interval
@@ -1,15 +1,21 @@
-from base64 import encode
-from datetime import datetime, timedelta
-
 from injector import inject
 from pydantic import EmailStr
 
 from src.authentication.i_authentication import IAuthentication
 from src.authentication.i_password_handler import IPasswordHandler
+from src.authentication.i_token_revocations import ITokenRevocations
+from src.authentication.i_user_cache import IUserCache
+from src.authentication.token_claims import (
+    create_access_token,
+    get_subject,
+    get_token_version,
+    get_user_claims,
+    is_email_subject,
+)
 from src.common.exceptions import ObjectNotFoundError
 from src.common.i_jwt_encoder import IJwtEncoder
 from src.common.settings import Settings
-from src.database.users.user import User
+from src.database.users.user import User, UserRead
 from src.managers.i_user_manager import IUserManager
 
 
@@ -20,23 +26,62 @@ class Authentication(IAuthentication):
         password_handler: IPasswordHandler,
         jwt_encoder: IJwtEncoder,
         user_manager: IUserManager,
+        user_cache: IUserCache,
+        token_revocations: ITokenRevocations,
         settings: Settings,
     ):
         self.__password_handler = password_handler
         self.__jwt_encoder = jwt_encoder
         self.__user_manager = user_manager
+        self.__user_cache = user_cache
+        self.__token_revocations = token_revocations
         self.__settings = settings
 
     def login_user(self, email: str, password: str) -> str:
         user = self.__validate_email_and_password(email, password)
-        access_token = self.__create_access_token({"sub": user.email})
-        return access_token
+        return create_access_token(
+            self.__jwt_encoder, user, self.__settings.access_token_expire_hours
+        )
 
     def authenticate_user(self, token: str) -> User:
         payload = self.__jwt_encoder.decode(token)
-        email: EmailStr = payload.get("sub")
-        if email is None:
-            raise ValueError("Token contains no user information.")
+        user = self.__get_user(get_subject(payload))
+        if get_token_version(payload) < user.token_version:
+            raise ValueError("Token has been revoked.")
+        return user
+
+    def authenticate_user_claims(self, token: str) -> UserRead:
+        if not self.__settings.stateless_authentication:
+            return UserRead.from_orm(self.authenticate_user(token))
+
+        payload = self.__jwt_encoder.decode(token)
+        claims = get_user_claims(payload)
+        if claims is None:
+            return UserRead.from_orm(self.authenticate_user(token))
+        if self.__token_revocations.is_revoked(claims.id, get_token_version(payload)):
+            raise ValueError("Token has been revoked.")
+        return claims
+
+    def get_token_user_id(self, token: str) -> str | None:
+        subject = get_subject(self.__jwt_encoder.decode(token))
+        return None if is_email_subject(subject) else subject
+
+    def __get_user(self, subject: str) -> User:
+        if is_email_subject(subject):
+            return self.__get_user_with_email_subject(subject)
+
+        user = self.__user_cache.get_user(subject)
+        if user is not None:
+            return user
+        user = self.__user_manager.get_user(subject)
+        if user is None:
+            raise ObjectNotFoundError("User does not exist.")
+        self.__user_cache.add_user(user)
+        return user
+
+    def __get_user_with_email_subject(self, email: EmailStr) -> User:
+        if not self.__settings.accept_email_token_subjects:
+            raise ValueError("Tokens identifying users by email are not accepted.")
         user = self.__user_manager.get_user_with_email(email)
         if user is None:
             raise ObjectNotFoundError("User does not exist.")
@@ -46,15 +91,11 @@ class Authentication(IAuthentication):
         user = self.__user_manager.get_user_with_email(email)
         if user is None:
             raise ObjectNotFoundError("User does not exist.")
-        if not self.__password_handler.verify_password(password, user.hashed_password):
+        is_valid, new_hash = self.__password_handler.verify_and_update_password(
+            password, user.hashed_password
+        )
+        if not is_valid:
             raise ValueError("Incorrect password.")
+        if new_hash is not None:
+            self.__user_manager.update_user_hashed_password(user.id, new_hash)
         return user
-
-    def __create_access_token(self, data: dict):
-        to_encode = data.copy()
-        expire = datetime.utcnow() + timedelta(
-            hours=self.__settings.access_token_expire_hours
-        )
-        to_encode.update({"exp": expire})
-        encoded_jwt = self.__jwt_encoder.encode(to_encode)
-        return encoded_jwt
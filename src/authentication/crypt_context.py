@@ -0,0 +1,125 @@
+import argparse
+import math
+from time import perf_counter
+
+from injector import inject
+from passlib.context import CryptContext
+from passlib.registry import get_crypt_handler
+
+from src.common.settings import Settings
+
+SUPPORTED_SCHEMES = ["argon2", "bcrypt"]
+
+_CALIBRATION_PASSWORD = "calibration-password"
+_CALIBRATION_SAMPLES = 3
+# Calibration on hosts of one fleet can land a step apart, which is accepted.
+_CALIBRATED_ROUNDS_TOLERANCE = 1
+
+
+def create_crypt_context(
+    scheme: str, rounds: int, memory_cost: int, rounds_tolerance: int = 0
+) -> CryptContext:
+    if scheme not in SUPPORTED_SCHEMES:
+        raise ValueError(f"Unsupported password hashing scheme '{scheme}'.")
+
+    # passlib flags every hash with a cost outside min and max rounds as stale,
+    # so logins move users onto the new cost whether it was raised or lowered.
+    # A tolerance keeps hosts whose costs differ by that much from rehashing
+    # each other's hashes.
+    handler = get_crypt_handler(scheme)
+    options = {
+        f"{scheme}__default_rounds": rounds,
+        f"{scheme}__min_rounds": max(rounds - rounds_tolerance, handler.min_rounds),
+        f"{scheme}__max_rounds": min(rounds + rounds_tolerance, handler.max_rounds),
+    }
+    if scheme == "argon2":
+        options["argon2__memory_cost"] = memory_cost
+
+    other_schemes = [other for other in SUPPORTED_SCHEMES if other != scheme]
+    return CryptContext(
+        schemes=[scheme, *other_schemes], deprecated=["auto"], **options
+    )
+
+
+def calibrate_rounds(scheme: str, target_seconds: float, memory_cost: int) -> int:
+    handler = get_crypt_handler(scheme)
+    min_rounds = handler.min_rounds
+    max_rounds = handler.max_rounds
+
+    def measure(rounds: int) -> float:
+        context = create_crypt_context(scheme, rounds, memory_cost)
+        fastest = math.inf
+        for _ in range(_CALIBRATION_SAMPLES):
+            start = perf_counter()
+            context.hash(_CALIBRATION_PASSWORD)
+            fastest = min(fastest, perf_counter() - start)
+        return fastest
+
+    base_duration = max(measure(min_rounds), 1e-6)
+    ratio = max(target_seconds / base_duration, 1)
+    if handler.rounds_cost == "log2":
+        rounds = min_rounds + int(math.log2(ratio))
+    else:
+        rounds = int(min_rounds * ratio)
+    rounds = max(min_rounds, min(rounds, max_rounds))
+
+    while rounds < max_rounds and measure(rounds + 1) <= target_seconds:
+        rounds += 1
+    while rounds > min_rounds and measure(rounds) > target_seconds:
+        rounds -= 1
+    return rounds
+
+
+@inject
+def provide_crypt_context(settings: Settings) -> CryptContext:
+    if settings.password_hashing_rounds:
+        return create_crypt_context(
+            settings.password_hashing_scheme,
+            settings.password_hashing_rounds,
+            settings.password_hashing_memory_cost,
+        )
+
+    rounds = calibrate_rounds(
+        settings.password_hashing_scheme,
+        settings.password_hashing_target_ms / 1000,
+        settings.password_hashing_memory_cost,
+    )
+    return create_crypt_context(
+        settings.password_hashing_scheme,
+        rounds,
+        settings.password_hashing_memory_cost,
+        _CALIBRATED_ROUNDS_TOLERANCE,
+    )
+
+
+def main() -> None:
+    settings = Settings()
+    parser = argparse.ArgumentParser(
+        description="Benchmarks this host and prints password hashing settings "
+        "that hit the target verification time."
+    )
+    parser.add_argument(
+        "--scheme", choices=SUPPORTED_SCHEMES, default=settings.password_hashing_scheme
+    )
+    parser.add_argument(
+        "--target-ms", type=int, default=settings.password_hashing_target_ms
+    )
+    parser.add_argument(
+        "--memory-cost",
+        type=int,
+        default=settings.password_hashing_memory_cost,
+        help="Memory cost in KiB, only used by argon2.",
+    )
+    arguments = parser.parse_args()
+
+    rounds = calibrate_rounds(
+        arguments.scheme, arguments.target_ms / 1000, arguments.memory_cost
+    )
+    print(f"PASSWORD_HASHING_SCHEME={arguments.scheme}")
+    print(f"PASSWORD_HASHING_ROUNDS={rounds}")
+    if arguments.scheme == "argon2":
+        print(f"PASSWORD_HASHING_MEMORY_COST={arguments.memory_cost}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,17 @@
-from fastapi import Depends, HTTPException, status
+from contextlib import contextmanager
+from typing import Callable, Coroutine, Iterator
+
+from fastapi import Depends, Header, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordBearer
 from fastapi_injector import Injected
-from jose import ExpiredSignatureError
+from jose import JWTError
 
+from src.authentication.i_async_authentication import IAsyncAuthentication
 from src.authentication.i_authentication import IAuthentication
+from src.common.etags import VersionedResource, check_etag, create_etag
 from src.common.exceptions import ObjectNotFoundError
+from src.common.i_resource_versions import IResourceVersions
+from src.database.users.user import User, UserRead
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
@@ -12,13 +19,91 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 def get_current_user(
     token: str = Depends(oauth2_scheme),
     authentication: IAuthentication = Injected(IAuthentication)
-):
-    try:
+) -> User:
+    with authentication_errors():
         return authentication.authenticate_user(token)
+
+
+def get_current_user_claims(
+    token: str = Depends(oauth2_scheme),
+    authentication: IAuthentication = Injected(IAuthentication)
+) -> UserRead:
+    with authentication_errors():
+        return authentication.authenticate_user_claims(token)
+
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    authentication: IAsyncAuthentication = Injected(IAsyncAuthentication)
+) -> User:
+    with authentication_errors():
+        return await authentication.authenticate_user(token)
+
+
+async def get_current_user_claims_async(
+    token: str = Depends(oauth2_scheme),
+    authentication: IAsyncAuthentication = Injected(IAsyncAuthentication)
+) -> UserRead:
+    with authentication_errors():
+        return await authentication.authenticate_user_claims(token)
+
+
+# The ETag is checked before the user is authenticated, so that polling an
+# unchanged resource costs a token verification and a version lookup. A 304
+# carries nothing the client does not already have. Tokens whose user is read
+# from the token itself are covered by the tag as well.
+def check_not_modified(
+    resource: VersionedResource, covers_token: bool = False
+) -> Callable[..., None]:
+    def not_modified(
+        response: Response,
+        if_none_match: str | None = Header(None),
+        token: str = Depends(oauth2_scheme),
+        authentication: IAuthentication = Injected(IAuthentication),
+        resource_versions: IResourceVersions = Injected(IResourceVersions),
+    ) -> None:
+        try:
+            user_id = authentication.get_token_user_id(token)
+        except (JWTError, ValueError):
+            return
+        if user_id is not None:
+            version = resource_versions.get_version(resource, user_id)
+            etag = create_etag(version, token if covers_token else None)
+            check_etag(etag, if_none_match, response)
+
+    return not_modified
+
+
+def check_not_modified_async(
+    resource: VersionedResource, covers_token: bool = False
+) -> Callable[..., Coroutine[None, None, None]]:
+    async def not_modified(
+        response: Response,
+        if_none_match: str | None = Header(None),
+        token: str = Depends(oauth2_scheme),
+        authentication: IAsyncAuthentication = Injected(IAsyncAuthentication),
+        resource_versions: IResourceVersions = Injected(IResourceVersions),
+    ) -> None:
+        try:
+            user_id = await authentication.get_token_user_id(token)
+        except (JWTError, ValueError):
+            return
+        if user_id is not None:
+            version = resource_versions.get_version(resource, user_id)
+            etag = create_etag(version, token if covers_token else None)
+            check_etag(etag, if_none_match, response)
+
+    return not_modified
+
+
+@contextmanager
+def authentication_errors() -> Iterator[None]:
+    try:
+        yield
     except ObjectNotFoundError as exc:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User does not exist.",
         )
-    except ExpiredSignatureError:
+    except (JWTError, ValueError):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
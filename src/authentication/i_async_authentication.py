@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+
+from src.database.users.user import User, UserRead
+
+
+class IAsyncAuthentication(ABC):
+    @abstractmethod
+    async def login_user(self, email: str, password: str) -> str:
+        """Logs in a user with the supplied email and password,
+           assuming the user exists and is verified.
+
+           Returns a token for authenticated requests."""
+
+    @abstractmethod
+    async def authenticate_user(self, token: str) -> User:
+        """Authenticates the supplied token and returns
+           the user associated with it."""
+
+    @abstractmethod
+    async def authenticate_user_claims(self, token: str) -> UserRead:
+        """Authenticates the supplied token and returns the public
+           information of the user associated with it. With stateless
+           authentication enabled this is read from the token itself,
+           without loading the user."""
+
+    @abstractmethod
+    async def get_token_user_id(self, token: str) -> str | None:
+        """Verifies the supplied token without loading the user and
+           returns the ID of the user it was issued to, or None if the
+           token identifies the user by email. Does not tell whether
+           the token has been revoked."""
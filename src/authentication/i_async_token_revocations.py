@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+from src.database.users.token_revocation import TokenRevocation
+
+
+class IAsyncTokenRevocations(ABC):
+    @abstractmethod
+    async def is_revoked(self, user_id: str, token_version: int) -> bool:
+        """Returns whether tokens of the given version have been
+           revoked for the given user. Revocations committed by other
+           processes are picked up periodically."""
+
+    @abstractmethod
+    def add_revocation(self, revocation: TokenRevocation) -> None:
+        """Applies a revocation that was just committed, so that it
+           takes effect in this process immediately."""
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 
-from src.database.users.user import User
+from src.database.users.user import User, UserRead
 
 
 class IAuthentication(ABC):
@@ -15,3 +15,17 @@ class IAuthentication(ABC):
     def authenticate_user(self, token: str) -> User:
         """Authenticates the supplied token and returns
            the user associated with it."""
+
+    @abstractmethod
+    def authenticate_user_claims(self, token: str) -> UserRead:
+        """Authenticates the supplied token and returns the public
+           information of the user associated with it. With stateless
+           authentication enabled this is read from the token itself,
+           without loading the user."""
+
+    @abstractmethod
+    def get_token_user_id(self, token: str) -> str | None:
+        """Verifies the supplied token without loading the user and
+           returns the ID of the user it was issued to, or None if the
+           token identifies the user by email. Does not tell whether
+           the token has been revoked."""
@@ -4,8 +4,43 @@ from abc import ABC, abstractmethod
 class IPasswordHandler(ABC):
     @abstractmethod
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        """Verifies that the plain_password matches the hashed_password."""
+        """Verifies that the plain_password matches the hashed_password.
+           Raises if too many password operations are already pending."""
+
+    @abstractmethod
+    def verify_and_update_password(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """Verifies that the plain_password matches the hashed_password.
+           If it does and the hash uses an outdated scheme or cost, a new
+           hash of the plain_password is returned alongside the result.
+           Raises if too many password operations are already pending."""
 
     @abstractmethod
     def hash_password(self, plain_password: str) -> str:
-        """Hashes the supplied password and returns it."""
+        """Hashes the supplied password and returns it.
+           Raises if too many password operations are already pending."""
+
+    @abstractmethod
+    async def verify_password_async(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        """Same as verify_password, but awaits the result instead of
+           blocking the calling thread."""
+
+    @abstractmethod
+    async def verify_and_update_password_async(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """Same as verify_and_update_password, but awaits the result instead
+           of blocking the calling thread."""
+
+    @abstractmethod
+    async def hash_password_async(self, plain_password: str) -> str:
+        """Same as hash_password, but awaits the result instead of
+           blocking the calling thread."""
+
+    @abstractmethod
+    def shutdown(self) -> None:
+        """Stops the worker processes, if any have been started. They are
+           started again on the next password operation."""
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+
+from src.common.lru_cache import CacheStatistics
+from src.database.users.user import User
+
+
+class IUserCache(ABC):
+    @abstractmethod
+    def get_user(self, id: str) -> User | None:
+        """Returns a detached copy of the cached user with the given
+           ID, or None if the user is not cached or the entry has
+           expired."""
+
+    @abstractmethod
+    def add_user(self, user: User) -> None:
+        """Caches the given user, evicting the least recently used
+           user if the cache is full."""
+
+    @abstractmethod
+    def invalidate_user(self, user: User) -> None:
+        """Removes the given user from the cache. Must be called
+           whenever a user is changed or deleted."""
+
+    @abstractmethod
+    def statistics(self) -> CacheStatistics:
+        """Returns hit and miss counters for the cache."""
@@ -1,16 +1,105 @@
+import asyncio
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from threading import BoundedSemaphore, Lock
+from typing import Callable
+
 from injector import inject
 from passlib.context import CryptContext
 
 from src.authentication.i_password_handler import IPasswordHandler
+from src.common.exceptions import PasswordHashingOverloadedError
+from src.common.settings import Settings
+
+_worker_context: CryptContext | None = None
+
+
+def _initialize_worker(context_configuration: str) -> None:
+    global _worker_context
+    _worker_context = CryptContext.from_string(context_configuration)
+
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    return _worker_context.verify(plain_password, hashed_password)
+
+
+def _verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    return _worker_context.verify_and_update(plain_password, hashed_password)
+
+
+def _hash_password(plain_password: str) -> str:
+    return _worker_context.hash(plain_password)
 
 
 class PasswordHandler(IPasswordHandler):
     @inject
-    def __init__(self, crypt_context: CryptContext):
+    def __init__(self, crypt_context: CryptContext, settings: Settings):
         self.__context = crypt_context
+        self.__workers = settings.password_hashing_workers or os.cpu_count() or 1
+        self.__slots = BoundedSemaphore(
+            self.__workers + settings.password_hashing_queue_size
+        )
+        self.__executor: ProcessPoolExecutor | None = None
+        self.__executor_lock = Lock()
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        return self.__context.verify(plain_password, hashed_password)
+        return self.__submit(_verify_password, plain_password, hashed_password).result()
+
+    def verify_and_update_password(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        return self.__submit(
+            _verify_and_update_password, plain_password, hashed_password
+        ).result()
 
     def hash_password(self, plain_password: str) -> str:
-        return self.__context.hash(plain_password)
+        return self.__submit(_hash_password, plain_password).result()
+
+    async def verify_password_async(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        future = self.__submit(_verify_password, plain_password, hashed_password)
+        return await asyncio.wrap_future(future)
+
+    async def verify_and_update_password_async(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        future = self.__submit(
+            _verify_and_update_password, plain_password, hashed_password
+        )
+        return await asyncio.wrap_future(future)
+
+    async def hash_password_async(self, plain_password: str) -> str:
+        future = self.__submit(_hash_password, plain_password)
+        return await asyncio.wrap_future(future)
+
+    def __submit(self, function: Callable, *args) -> Future:
+        if not self.__slots.acquire(blocking=False):
+            raise PasswordHashingOverloadedError(
+                "Too many password operations are in progress."
+            )
+        try:
+            future = self.__get_executor().submit(function, *args)
+        except BaseException:
+            self.__slots.release()
+            raise
+        future.add_done_callback(lambda _: self.__slots.release())
+        return future
+
+    def __get_executor(self) -> ProcessPoolExecutor:
+        with self.__executor_lock:
+            if self.__executor is None:
+                self.__executor = ProcessPoolExecutor(
+                    max_workers=self.__workers,
+                    initializer=_initialize_worker,
+                    initargs=(self.__context.to_string(),),
+                )
+            return self.__executor
+
+    def shutdown(self) -> None:
+        with self.__executor_lock:
+            executor, self.__executor = self.__executor, None
+        if executor is not None:
+            executor.shutdown()
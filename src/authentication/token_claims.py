@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta
+
+from src.common.i_jwt_encoder import IJwtEncoder
+from src.database.users.user import User, UserRead
+
+
+def create_access_token(
+    jwt_encoder: IJwtEncoder, user: User, expire_hours: int
+) -> str:
+    expire = datetime.utcnow() + timedelta(hours=expire_hours)
+    return jwt_encoder.encode(
+        {
+            "sub": user.id,
+            "ver": user.token_version,
+            "email": user.email,
+            "given_name": user.first_name,
+            "family_name": user.last_name,
+            "exp": expire,
+        }
+    )
+
+
+def get_subject(payload: dict) -> str:
+    subject: str | None = payload.get("sub")
+    if subject is None:
+        raise ValueError("Token contains no user information.")
+    return subject
+
+
+def is_email_subject(subject: str) -> bool:
+    # Tokens issued before subjects became user IDs carry the email.
+    return "@" in subject
+
+
+def get_token_version(payload: dict) -> int:
+    return payload.get("ver", 0)
+
+
+def get_user_claims(payload: dict) -> UserRead | None:
+    """Returns the public user information carried by the token, or None
+    for tokens issued before it was included."""
+    subject = get_subject(payload)
+    if is_email_subject(subject) or "email" not in payload:
+        return None
+    return UserRead(
+        id=subject,
+        email=payload["email"],
+        first_name=payload.get("given_name"),
+        last_name=payload.get("family_name"),
+    )
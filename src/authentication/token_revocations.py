@@ -0,0 +1,83 @@
+import time
+from datetime import datetime, timedelta
+from threading import Lock
+
+from injector import inject
+from sqlmodel import select
+
+from src.authentication.i_token_revocations import ITokenRevocations
+from src.common.settings import Settings
+from src.database.i_database import IDatabase
+from src.database.users.token_revocation import TokenRevocation
+
+# Revocations are stamped before their transaction commits, possibly on another
+# host, so each refresh looks back a bit past the previous one.
+REFRESH_OVERLAP = timedelta(seconds=30)
+
+
+class TokenRevocations(ITokenRevocations):
+    @inject
+    def __init__(self, database: IDatabase, settings: Settings):
+        self.__database = database
+        self.__refresh_interval = settings.token_revocation_refresh_seconds
+        self.__token_lifetime = timedelta(hours=settings.access_token_expire_hours)
+        self.__minimum_versions: dict[str, tuple[int, datetime]] = {}
+        self.__loaded_until: datetime | None = None
+        self.__next_refresh = 0.0
+        self.__lock = Lock()
+
+    def is_revoked(self, user_id: str, token_version: int) -> bool:
+        self.__refresh_if_due()
+        entry = self.__minimum_versions.get(user_id)
+        return entry is not None and token_version < entry[0]
+
+    def add_revocation(self, revocation: TokenRevocation) -> None:
+        with self.__lock:
+            merge_revocation(self.__minimum_versions, revocation)
+
+    def __refresh_if_due(self) -> None:
+        if time.monotonic() < self.__next_refresh:
+            return
+        with self.__lock:
+            if time.monotonic() < self.__next_refresh:
+                return
+            now = datetime.utcnow()
+            oldest_relevant = now - self.__token_lifetime
+            since = oldest_relevant
+            if self.__loaded_until is not None:
+                since = max(since, self.__loaded_until - REFRESH_OVERLAP)
+
+            with self.__database.get_session() as session:
+                statement = select(TokenRevocation).where(
+                    TokenRevocation.revoked_at > since
+                )
+                for revocation in session.exec(statement):
+                    merge_revocation(self.__minimum_versions, revocation)
+            self.__loaded_until = now
+            self.__minimum_versions = drop_expired_revocations(
+                self.__minimum_versions, oldest_relevant
+            )
+            self.__next_refresh = time.monotonic() + self.__refresh_interval
+
+
+def merge_revocation(
+    minimum_versions: dict[str, tuple[int, datetime]], revocation: TokenRevocation
+) -> None:
+    current = minimum_versions.get(revocation.user_id)
+    if current is None or current[0] < revocation.token_version:
+        minimum_versions[revocation.user_id] = (
+            revocation.token_version,
+            revocation.revoked_at,
+        )
+
+
+def drop_expired_revocations(
+    minimum_versions: dict[str, tuple[int, datetime]], oldest_relevant: datetime
+) -> dict[str, tuple[int, datetime]]:
+    # Every token issued before a revocation has expired once the revocation is
+    # older than the token lifetime.
+    return {
+        user_id: entry
+        for user_id, entry in minimum_versions.items()
+        if entry[1] > oldest_relevant
+    }
@@ -0,0 +1,35 @@
+from injector import inject
+from sqlalchemy.orm import make_transient_to_detached
+
+from src.authentication.i_user_cache import IUserCache
+from src.common.lru_cache import CacheStatistics, LruTtlCache
+from src.common.settings import Settings
+from src.database.users.user import User
+
+
+class UserCache(IUserCache):
+    @inject
+    def __init__(self, settings: Settings):
+        self.__cache: LruTtlCache[str, User] = LruTtlCache(
+            settings.user_cache_size, settings.user_cache_ttl_seconds
+        )
+
+    def get_user(self, id: str) -> User | None:
+        user = self.__cache.get(id)
+        return self.__copy_user(user) if user is not None else None
+
+    def add_user(self, user: User) -> None:
+        self.__cache.set(user.id, self.__copy_user(user))
+
+    def invalidate_user(self, user: User) -> None:
+        self.__cache.delete(user.id)
+
+    def statistics(self) -> CacheStatistics:
+        return self.__cache.statistics()
+
+    def __copy_user(self, user: User) -> User:
+        # Users belong to the session of the request that loaded them, so every
+        # request gets its own detached copy instead of sharing one instance.
+        copy = User.from_orm(user)
+        make_transient_to_detached(copy)
+        return copy
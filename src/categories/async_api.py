@@ -0,0 +1,133 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from fastapi_injector import Injected
+
+from src.authentication.current_user import (
+    check_not_modified_async,
+    get_current_user_async,
+)
+from src.categories.api import MALFORMED_CURSOR_RESPONSE
+from src.common.etags import NOT_MODIFIED_RESPONSE, VersionedResource
+from src.common.exceptions import ObjectNotFoundError
+from src.common.exports import (
+    EXPORT_RESPONSES,
+    ExportFormat,
+    create_export_response,
+)
+from src.common.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from src.database.categories.category import (
+    CategoryBulkResult,
+    CategoryCreate,
+    CategoryNames,
+    CategoryPage,
+    CategoryRead,
+)
+from src.database.users.user import User
+from src.managers.i_async_category_manager import IAsyncCategoryManager
+from src.managers.i_async_export_manager import IAsyncExportManager
+
+router = APIRouter(
+    prefix="/categories",
+    tags=["Categories"],
+)
+
+
+@router.get(
+    "",
+    response_model=CategoryPage,
+    responses={**MALFORMED_CURSOR_RESPONSE, **NOT_MODIFIED_RESPONSE},
+    dependencies=[Depends(check_not_modified_async(VersionedResource.CATEGORIES))],
+)
+async def get_categories(
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    category_manager: IAsyncCategoryManager = Injected(IAsyncCategoryManager),
+    current_user: User = Depends(get_current_user_async),
+):
+    try:
+        return await category_manager.get_categories(current_user, cursor, limit)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor is malformed.",
+        )
+
+
+@router.get(
+    "/export", response_class=StreamingResponse, responses=EXPORT_RESPONSES
+)
+async def export_categories(
+    format: ExportFormat = ExportFormat.CSV,
+    compress: bool = False,
+    export_manager: IAsyncExportManager = Injected(IAsyncExportManager),
+    current_user: User = Depends(get_current_user_async),
+):
+    return create_export_response(
+        export_manager.export_categories(current_user, format, compress),
+        "categories",
+        format,
+        compress,
+    )
+
+
+@router.post(
+    "",
+    response_model=CategoryRead,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "Category with that name already exists."
+        }
+    },
+)
+async def create_category(
+    category: CategoryCreate,
+    category_manager: IAsyncCategoryManager = Injected(IAsyncCategoryManager),
+    current_user: User = Depends(get_current_user_async),
+):
+    try:
+        return await category_manager.create_category(current_user, category)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Category with that name already exists.",
+        )
+
+
+@router.post("/bulk", response_model=list[CategoryBulkResult])
+async def create_categories(
+    categories: CategoryNames,
+    category_manager: IAsyncCategoryManager = Injected(IAsyncCategoryManager),
+    current_user: User = Depends(get_current_user_async),
+):
+    return await category_manager.create_categories(current_user, categories.names)
+
+
+@router.post("/bulk-delete", response_model=list[CategoryBulkResult])
+async def delete_categories(
+    categories: CategoryNames,
+    category_manager: IAsyncCategoryManager = Injected(IAsyncCategoryManager),
+    current_user: User = Depends(get_current_user_async),
+):
+    return await category_manager.delete_categories(current_user, categories.names)
+
+
+@router.delete(
+    "/{name}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={
+        status.HTTP_404_NOT_FOUND: {"description": "Category does not exist."}
+    },
+)
+async def delete_category(
+    name: str,
+    category_manager: IAsyncCategoryManager = Injected(IAsyncCategoryManager),
+    current_user: User = Depends(get_current_user_async),
+):
+    try:
+        await category_manager.delete_category(current_user, name)
+    except ObjectNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Category does not exist.",
+        )
@@ -0,0 +1,38 @@
+import hashlib
+from enum import Enum
+
+from fastapi import HTTPException, Response, status
+
+NOT_MODIFIED_RESPONSE = {
+    status.HTTP_304_NOT_MODIFIED: {
+        "description": "Nothing has changed since the ETag in If-None-Match."
+    }
+}
+
+
+class VersionedResource(str, Enum):
+    USER = "user"
+    CATEGORIES = "categories"
+
+
+def create_etag(version: str, token: str | None = None) -> str:
+    if token is not None:
+        version += "-" + hashlib.blake2b(token.encode(), digest_size=8).hexdigest()
+    return f'W/"{version}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    # If-None-Match compares tags weakly, so W/ is ignored on both sides.
+    if if_none_match is None:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+def check_etag(etag: str, if_none_match: str | None, response: Response) -> None:
+    # Clients are asked to revalidate every time, so that a write is seen
+    # by their next request.
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
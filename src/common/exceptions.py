@@ -1,2 +1,6 @@
 class ObjectNotFoundError(ValueError):
     pass
+
+
+class PasswordHashingOverloadedError(RuntimeError):
+    pass
@@ -0,0 +1,89 @@
+import csv
+import io
+import json
+import zlib
+from enum import Enum
+from typing import Any, Iterable
+
+from fastapi import status
+from fastapi.responses import StreamingResponse
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+GZIP_MEDIA_TYPE = "application/gzip"
+
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: NDJSON_MEDIA_TYPE,
+}
+EXPORT_RESPONSES = {
+    status.HTTP_200_OK: {
+        "description": "The exported file, gzipped if compress is set.",
+        "content": {
+            media_type: {}
+            for media_type in [*EXPORT_MEDIA_TYPES.values(), GZIP_MEDIA_TYPE]
+        },
+    },
+}
+
+
+class ExportEncoder:
+    # Encodes an export one batch of records at a time, so that only the
+    # current batch is ever held. With compress set the output is a single
+    # gzip member, whose compressor keeps no more than its window.
+    def __init__(self, format: ExportFormat, columns: list[str], compress: bool):
+        self.__format = format
+        self.__columns = columns
+        self.__compressor = zlib.compressobj(wbits=31) if compress else None
+        self.__buffer = io.StringIO()
+        self.__writer = csv.writer(self.__buffer)
+
+    def begin(self) -> bytes:
+        if self.__format == ExportFormat.CSV:
+            self.__writer.writerow(self.__columns)
+        return self.__flush()
+
+    def encode(self, records: Iterable[tuple[Any, ...]]) -> bytes:
+        if self.__format == ExportFormat.CSV:
+            self.__writer.writerows(records)
+        else:
+            encode, columns = _JSON_ENCODER.encode, self.__columns
+            self.__buffer.write(
+                "".join(encode(dict(zip(columns, record))) + "\n" for record in records)
+            )
+        return self.__flush()
+
+    def end(self) -> bytes:
+        if self.__compressor is None:
+            return b""
+        return self.__compressor.flush()
+
+    def __flush(self) -> bytes:
+        data = self.__buffer.getvalue().encode()
+        self.__buffer.seek(0)
+        self.__buffer.truncate()
+        if self.__compressor is not None:
+            data = self.__compressor.compress(data)
+        return data
+
+
+def create_export_response(
+    chunks: Any, name: str, format: ExportFormat, compress: bool
+) -> StreamingResponse:
+    filename = f"{name}.{format.value}"
+    media_type = EXPORT_MEDIA_TYPES[format]
+    if compress:
+        filename += ".gz"
+        media_type = GZIP_MEDIA_TYPE
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
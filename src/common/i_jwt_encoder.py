@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from src.common.lru_cache import CacheStatistics
+
 
 class IJwtEncoder(ABC):
     @abstractmethod
@@ -9,3 +11,8 @@ class IJwtEncoder(ABC):
     @abstractmethod
     def decode(self, encoded_data: str) -> dict:
         """Decodes the given data using a JWT method."""
+
+    @abstractmethod
+    def statistics(self) -> CacheStatistics:
+        """Returns hit and miss counters for previously verified
+           tokens that decode could return without verifying again."""
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+
+from src.common.etags import VersionedResource
+
+
+class IResourceVersions(ABC):
+    @abstractmethod
+    def get_version(self, resource: VersionedResource, user_id: str) -> str:
+        """Returns the current version of the given user's resource,
+           handing out a new version if it has none or it has expired.
+           Read it before loading the resource, so that a write
+           committed meanwhile is never hidden behind the version."""
+
+    @abstractmethod
+    def invalidate(self, resource: VersionedResource, user_id: str) -> None:
+        """Gives the given user's resource a new version. Must be
+           called after every committed write that changes it."""
+
+    @abstractmethod
+    def invalidate_user(self, user_id: str) -> None:
+        """Gives every resource of the given user a new version. Must
+           be called whenever the user is changed or deleted."""
@@ -1,7 +1,11 @@
+import time
+from hashlib import sha256
+
 from injector import inject
 from jose import jwt
 
 from src.common.i_jwt_encoder import IJwtEncoder
+from src.common.lru_cache import CacheStatistics, LruTtlCache
 from src.common.settings import Settings
 
 
@@ -10,9 +14,26 @@ class JwtEncoder(IJwtEncoder):
     def __init__(self, settings: Settings):
         self.__secret = settings.authentication_secret
         self.__algorithm = "HS256"
+        self.__verified_tokens: LruTtlCache[bytes, dict] = LruTtlCache(
+            settings.token_cache_size, 0
+        )
 
     def encode(self, data: dict) -> str:
         return jwt.encode(data, self.__secret, algorithm=self.__algorithm)
 
     def decode(self, encoded_data: str) -> dict:
-        return jwt.decode(encoded_data, self.__secret, algorithms=[self.__algorithm])
+        key = sha256(encoded_data.encode()).digest()
+        payload = self.__verified_tokens.get(key)
+        if payload is None:
+            payload = jwt.decode(
+                encoded_data, self.__secret, algorithms=[self.__algorithm]
+            )
+            expires_at = payload.get("exp")
+            if isinstance(expires_at, (int, float)):
+                self.__verified_tokens.set(
+                    key, payload, ttl_seconds=expires_at - time.time()
+                )
+        return dict(payload)
+
+    def statistics(self) -> CacheStatistics:
+        return self.__verified_tokens.statistics()
@@ -0,0 +1,76 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Generic, Hashable, TypeVar
+
+from sqlmodel import SQLModel
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CacheStatistics(SQLModel):
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class LruTtlCache(Generic[K, V]):
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.__max_size = max_size
+        self.__ttl_seconds = ttl_seconds
+        self.__clock = clock
+        self.__entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.__lock = Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    def get(self, key: K) -> V | None:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.__misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self.__clock():
+                del self.__entries[key]
+                self.__misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return value
+
+    def set(self, key: K, value: V, ttl_seconds: float | None = None) -> None:
+        if self.__max_size <= 0:
+            return
+        ttl = self.__ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            return
+        with self.__lock:
+            self.__entries[key] = (self.__clock() + ttl, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def statistics(self) -> CacheStatistics:
+        with self.__lock:
+            return CacheStatistics(
+                hits=self.__hits,
+                misses=self.__misses,
+                size=len(self.__entries),
+                max_size=self.__max_size,
+            )
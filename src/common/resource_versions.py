@@ -0,0 +1,36 @@
+import itertools
+import secrets
+
+from injector import inject
+
+from src.common.etags import VersionedResource
+from src.common.i_resource_versions import IResourceVersions
+from src.common.lru_cache import LruTtlCache
+from src.common.settings import Settings
+
+
+class ResourceVersions(IResourceVersions):
+    @inject
+    def __init__(self, settings: Settings):
+        self.__versions: LruTtlCache[tuple[VersionedResource, str], str] = LruTtlCache(
+            settings.resource_version_cache_size, settings.resource_version_ttl_seconds
+        )
+        # Versions are drawn from one counter, so none is handed out twice,
+        # and prefixed with a random process ID, so that a version handed
+        # out by another process or before a restart never matches.
+        self.__process = secrets.token_hex(4)
+        self.__counter = itertools.count(1)
+
+    def get_version(self, resource: VersionedResource, user_id: str) -> str:
+        version = self.__versions.get((resource, user_id))
+        if version is None:
+            version = f"{self.__process}-{next(self.__counter)}"
+            self.__versions.set((resource, user_id), version)
+        return version
+
+    def invalidate(self, resource: VersionedResource, user_id: str) -> None:
+        self.__versions.delete((resource, user_id))
+
+    def invalidate_user(self, user_id: str) -> None:
+        for resource in VersionedResource:
+            self.__versions.delete((resource, user_id))
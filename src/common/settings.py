@@ -6,7 +6,40 @@ from src.common.utils import get_project_path
 class Settings(BaseSettings):
     authentication_secret: str = ''
     database_url: str = ''
+    async_database: bool = False
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    database_pool_timeout: float = 30
+    database_pool_recycle: int = -1
+    database_pool_pre_ping: bool = False
+    sqlite_performance_profile: bool = True
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 268435456
+    sqlite_cache_size: int = -65536
+    sqlite_synchronous: str = 'NORMAL'
+    write_coalescing_window_ms: float = 0
+    write_coalescing_max_batch: int = 64
+    id_scheme: str = 'uuid7'
+    transaction_import_batch_size: int = 5000
+    transaction_import_max_errors: int = 1000
+    export_batch_size: int = 1000
+    ledger_cache_size: int = 16
+    ledger_cache_ttl_seconds: int = 300
     access_token_expire_hours: int = 4
+    token_cache_size: int = 0
+    accept_email_token_subjects: bool = True
+    stateless_authentication: bool = False
+    token_revocation_refresh_seconds: int = 5
+    password_hashing_scheme: str = 'bcrypt'
+    password_hashing_rounds: int = 0
+    password_hashing_memory_cost: int = 65536
+    password_hashing_target_ms: int = 50
+    password_hashing_workers: int = 0
+    password_hashing_queue_size: int = 32
+    user_cache_size: int = 1024
+    user_cache_ttl_seconds: int = 60
+    resource_version_cache_size: int = 4096
+    resource_version_ttl_seconds: int = 60
 
     class Config:
         env_file = get_project_path('.env')
@@ -1,9 +1,36 @@
+import os
+import time
 from pathlib import Path
-from uuid import uuid4
+from typing import Callable
+from uuid import UUID, uuid4
+
+SUPPORTED_ID_SCHEMES = ["uuid4", "uuid7"]
 
 
 def get_project_path(project_path: str) -> str:
     return str((Path(__file__).parent / "../" / project_path).resolve())
 
 def str_uuid4() -> str:
-    return str(uuid4())
\ No newline at end of file
+    return str(uuid4())
+
+def str_uuid7() -> str:
+    # The Unix time in milliseconds takes the top 48 bits, so ids sort by
+    # creation time and new rows land at the end of the primary key index.
+    # The remaining bits are random apart from the version and variant.
+    value = (time.time_ns() // 1_000_000) << 80
+    value |= int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | (0x7 << 76)
+    value = value & ~(0x3 << 62) | (0x2 << 62)
+    return str(UUID(int=value))
+
+def is_uuid(value: str) -> bool:
+    try:
+        UUID(value)
+    except ValueError:
+        return False
+    return True
+
+def create_id_factory(scheme: str) -> Callable[[], str]:
+    if scheme not in SUPPORTED_ID_SCHEMES:
+        raise ValueError(f"Unsupported id scheme '{scheme}'.")
+    return str_uuid7 if scheme == "uuid7" else str_uuid4
@@ -1,4 +1,8 @@
 from src.database.categories.category import Category
+from src.database.transactions.monthly_total import MonthlyTotal
+from src.database.transactions.balance import BalanceNode
+from src.database.transactions.transaction import Transaction
+from src.database.users.token_revocation import TokenRevocation
 from src.database.users.user import User
 
 User.update_forward_refs(Category=Category)
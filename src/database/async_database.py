@@ -0,0 +1,69 @@
+from injector import inject
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.common.settings import Settings
+from src.database.i_async_database import IAsyncDatabase
+from src.database.pool import PoolMonitor, PoolStatistics, create_engine_options
+from src.database.sqlite_profile import (
+    RoutingSession,
+    apply_sqlite_pragmas,
+    create_writer_engine_options,
+    enable_sqlite_foreign_keys,
+    uses_sqlite_profile,
+)
+
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+
+def to_async_url(database_url: str) -> str:
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS or url.get_driver_name() == ASYNC_DRIVERS[backend]:
+        return database_url
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(
+        hide_password=False
+    )
+
+
+class AsyncDatabase(IAsyncDatabase):
+    @inject
+    def __init__(self, settings: Settings):
+        url = to_async_url(settings.database_url)
+        options = create_engine_options(settings, is_async=True)
+        self.__engine = create_async_engine(url, **options)
+        enable_sqlite_foreign_keys(self.__engine.sync_engine)
+        self.__writer_engine = self.__engine
+        if uses_sqlite_profile(settings):
+            self.__writer_engine = create_async_engine(
+                url, **create_writer_engine_options(options)
+            )
+            enable_sqlite_foreign_keys(self.__writer_engine.sync_engine)
+            apply_sqlite_pragmas(self.__engine.sync_engine, settings)
+            apply_sqlite_pragmas(self.__writer_engine.sync_engine, settings)
+
+        self.__pool_monitor = PoolMonitor()
+        self.__pool_monitor.attach(self.__engine.sync_engine.pool)
+        if self.__writer_engine is not self.__engine:
+            self.__pool_monitor.attach(self.__writer_engine.sync_engine.pool)
+
+    async def create_database(self) -> None:
+        async with self.__writer_engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+
+    async def delete_database(self) -> None:
+        async with self.__writer_engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.drop_all)
+
+    def get_session(self) -> AsyncSession:
+        return AsyncSession(
+            sync_session_class=RoutingSession,
+            reader=self.__engine.sync_engine,
+            writer=self.__writer_engine.sync_engine,
+            expire_on_commit=False,
+        )
+
+    def pool_statistics(self) -> PoolStatistics:
+        return self.__pool_monitor.statistics()
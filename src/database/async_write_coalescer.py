@@ -0,0 +1,89 @@
+import asyncio
+from typing import Any, Callable, NamedTuple, TypeVar
+
+from injector import inject
+from sqlmodel import Session
+
+from src.common.settings import Settings
+from src.database.i_async_database import IAsyncDatabase
+from src.database.i_async_write_coalescer import IAsyncWriteCoalescer
+
+T = TypeVar("T")
+
+
+class _Write(NamedTuple):
+    function: Callable[..., Any]
+    args: tuple[Any, ...]
+    result: asyncio.Future
+
+
+class AsyncWriteCoalescer(IAsyncWriteCoalescer):
+    @inject
+    def __init__(self, settings: Settings, database: IAsyncDatabase):
+        self.__window = settings.write_coalescing_window_ms / 1000
+        self.__max_batch = settings.write_coalescing_max_batch
+        self.__database = database
+        self.__pending: list[_Write] = []
+        self.__timer: asyncio.Task | None = None
+        self.__groups: set[asyncio.Task] = set()
+
+    async def write(self, function: Callable[..., T], *args: Any) -> T:
+        if self.__window <= 0:
+            return await self.__write_alone(function, args)
+
+        write = _Write(function, args, asyncio.get_running_loop().create_future())
+        self.__pending.append(write)
+        if len(self.__pending) >= self.__max_batch:
+            self.__start_group()
+        elif self.__timer is None:
+            self.__timer = asyncio.create_task(self.__start_group_after_window())
+        return await write.result
+
+    async def __start_group_after_window(self) -> None:
+        await asyncio.sleep(self.__window)
+        self.__timer = None
+        self.__start_group()
+
+    def __start_group(self) -> None:
+        writes, self.__pending = self.__pending, []
+        if not writes:
+            return
+        task = asyncio.create_task(self.__commit_group(writes))
+        self.__groups.add(task)
+        task.add_done_callback(self.__groups.discard)
+
+    async def __commit_group(self, writes: list[_Write]) -> None:
+        # Commits are what SQLite waits on, so the group shares one. Should
+        # any write in it fail, the group is rolled back and every write is
+        # retried alone, which hands each caller its own outcome.
+        try:
+            async with self.__database.get_session() as session:
+                results = await session.run_sync(_run_writes, writes)
+                await session.commit()
+        except Exception:
+            for write in writes:
+                await self.__retry_alone(write)
+            return
+        for write, result in zip(writes, results):
+            if not write.result.done():
+                write.result.set_result(result)
+
+    async def __retry_alone(self, write: _Write) -> None:
+        try:
+            result = await self.__write_alone(write.function, write.args)
+        except Exception as exc:
+            if not write.result.done():
+                write.result.set_exception(exc)
+        else:
+            if not write.result.done():
+                write.result.set_result(result)
+
+    async def __write_alone(self, function: Callable[..., T], args: tuple) -> T:
+        async with self.__database.get_session() as session:
+            result = await session.run_sync(function, *args)
+            await session.commit()
+            return result
+
+
+def _run_writes(session: Session, writes: list[_Write]) -> list[Any]:
+    return [write.function(session, *write.args) for write in writes]
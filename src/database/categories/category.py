@@ -1,11 +1,17 @@
+from enum import Enum
 from typing import TYPE_CHECKING
 
 from pydantic import Extra
+from sqlalchemy import UniqueConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
+from src.database.binary_uuid import BinaryUuid
+
 if TYPE_CHECKING:
     from src.database.users.user import User
 
+MAX_BULK_SIZE = 500
+
 
 class CategoryBase(SQLModel):
     name: str
@@ -19,10 +25,36 @@ class CategoryCreate(CategoryBase, extra=Extra.forbid):
     pass
 
 
-class Category(CategoryBase, table=True):
-    name: str = Field(primary_key=True)
+class CategoryPage(SQLModel):
+    items: list[CategoryRead]
+    next_cursor: str | None = None
+
+
+class CategoryNames(SQLModel, extra=Extra.forbid):
+    names: list[str] = Field(min_items=1, max_items=MAX_BULK_SIZE)
+
+
+class CategoryBulkStatus(str, Enum):
+    CREATED = "created"
+    ALREADY_EXISTS = "already_exists"
+    DELETED = "deleted"
+    NOT_FOUND = "not_found"
 
-    user_id: str = Field(primary_key=True, foreign_key="user.id")
-    user: "User" = Relationship(
-        back_populates="categories", sa_relationship_kwargs={"lazy": "joined"}
+
+class CategoryBulkResult(SQLModel):
+    name: str
+    status: CategoryBulkStatus
+
+
+class Category(CategoryBase, table=True):
+    # The unique constraint's index also serves listing a user's categories in
+    # name order.
+    __table_args__ = (
+        UniqueConstraint("user_id", "name", name="uq_category_user_id_name"),
     )
+
+    id: int | None = Field(default=None, primary_key=True)
+    name: str = Field(nullable=False)
+
+    user_id: str = Field(foreign_key="user.id", nullable=False, sa_type=BinaryUuid)
+    user: "User" = Relationship(back_populates="categories")
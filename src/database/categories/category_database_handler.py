@@ -1,35 +1,137 @@
+from typing import Iterator
+
+from sqlalchemy import and_, delete, insert
 from sqlmodel import Session, select
 
 from src.common.exceptions import ObjectNotFoundError
 from src.database.categories.category import Category
 from src.database.categories.i_category_database_handler import ICategoryDatabaseHandler
+from src.database.insert_on_conflict import INSERT_ON_CONFLICT
+from src.database.transactions.monthly_total_database_handler import (
+    move_monthly_totals,
+)
+from src.database.transactions.transaction_database_handler import (
+    clear_transaction_categories,
+)
 from src.database.users.user import User
 
 
 class CategoryDatabaseHandler(ICategoryDatabaseHandler):
     def create_category(self, session: Session, user: User, name: str) -> Category:
-        statement = select(Category).where(Category.user == user, Category.name == name)
+        statement = select(Category).where(
+            Category.user_id == user.id, Category.name == name
+        )
         results = session.exec(statement)
         db_category = results.first()
         if db_category:
             raise ValueError("Category with that name already exists")
 
-        category = Category(name=name, user=user)
+        category = Category(name=name, user_id=user.id)
         session.add(category)
         return category
 
-    def get_categories(self, session: Session, user: User) -> list[Category]:
-        statement = select(Category).where(Category.user == user)
+    def create_categories(
+        self, session: Session, user: User, names: list[str]
+    ) -> list[str]:
+        if not names:
+            return []
+        rows = [{"name": name, "user_id": user.id} for name in names]
+        insert_on_conflict = INSERT_ON_CONFLICT.get(session.get_bind().dialect.name)
+        if insert_on_conflict is None:
+            existing = set(self.__get_existing_names(session, user, names))
+            rows = [row for row in rows if row["name"] not in existing]
+            if rows:
+                session.execute(insert(Category).values(rows))
+            return [row["name"] for row in rows]
+
+        statement = (
+            insert_on_conflict(Category)
+            .values(rows)
+            .on_conflict_do_nothing()
+            .returning(Category.name)
+        )
+        return list(session.execute(statement).scalars())
+
+    def get_categories(
+        self,
+        session: Session,
+        user: User,
+        after: str | None = None,
+        limit: int | None = None,
+    ) -> list[Category]:
+        statement = (
+            select(Category)
+            .where(Category.user_id == user.id)
+            .order_by(Category.name)
+            .limit(limit)
+        )
+        if after is not None:
+            statement = statement.where(Category.name > after)
         results = session.exec(statement)
         categories = results.all()
 
         return categories
 
+    def stream_categories(
+        self, session: Session, user: User, batch_size: int
+    ) -> Iterator[list[tuple[str]]]:
+        statement = (
+            select(Category.name)
+            .where(Category.user_id == user.id)
+            .order_by(Category.name)
+            .execution_options(yield_per=batch_size)
+        )
+        return session.execute(statement).partitions()
+
+    def get_category_ids(
+        self, session: Session, user: User, names: list[str]
+    ) -> dict[str, int]:
+        if not names:
+            return {}
+        statement = select(Category.name, Category.id).where(
+            Category.user_id == user.id, Category.name.in_(names)
+        )
+        return dict(session.exec(statement).all())
+
     def delete_category(self, session: Session, user: User, name: str) -> None:
-        statement = select(Category).where(Category.user == user, Category.name == name)
+        statement = select(Category).where(
+            Category.user_id == user.id, Category.name == name
+        )
         results = session.exec(statement)
         category = results.first()
         if not category:
             raise ObjectNotFoundError("No category with that name exists.")
 
+        clear_transaction_categories(session, user.id, [category.id])
+        move_monthly_totals(session, user.id, [category.id])
         session.delete(category)
+
+    def delete_categories(
+        self, session: Session, user: User, names: list[str]
+    ) -> list[str]:
+        if not names:
+            return []
+        condition = and_(Category.user_id == user.id, Category.name.in_(names))
+        clear_transaction_categories(
+            session, user.id, select(Category.id).where(condition)
+        )
+        statement = delete(Category).where(condition)
+        if session.get_bind().dialect.delete_returning:
+            deleted = session.execute(
+                statement.returning(Category.id, Category.name)
+            ).all()
+        else:
+            deleted = session.execute(
+                select(Category.id, Category.name).where(condition)
+            ).all()
+            session.execute(statement)
+        move_monthly_totals(session, user.id, [id for id, _ in deleted])
+        return [name for _, name in deleted]
+
+    def __get_existing_names(
+        self, session: Session, user: User, names: list[str]
+    ) -> list[str]:
+        statement = select(Category.name).where(
+            Category.user_id == user.id, Category.name.in_(names)
+        )
+        return list(session.exec(statement).all())
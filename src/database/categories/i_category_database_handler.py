@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 from sqlmodel import Session
 
@@ -12,9 +13,47 @@ class ICategoryDatabaseHandler(ABC):
         """Creates a category with the given name for the given user."""
 
     @abstractmethod
-    def get_categories(self, session: Session, user: User) -> list[Category]:
-        """Retrieves a user's categories."""
+    def get_categories(
+        self,
+        session: Session,
+        user: User,
+        after: str | None = None,
+        limit: int | None = None,
+    ) -> list[Category]:
+        """Retrieves a user's categories ordered by name. If after is
+           given, only categories with a later name are returned, and
+           at most limit categories are returned if it is given."""
+
+    @abstractmethod
+    def stream_categories(
+        self, session: Session, user: User, batch_size: int
+    ) -> Iterator[list[tuple[str]]]:
+        """Streams the names of a user's categories ordered by name, in
+           batches of at most batch_size rows read through a server-side
+           cursor."""
+
+    @abstractmethod
+    def get_category_ids(
+        self, session: Session, user: User, names: list[str]
+    ) -> dict[str, int]:
+        """Looks up the IDs of a user's categories with the given names.
+           Names the user has no category for are left out."""
+
+    @abstractmethod
+    def create_categories(
+        self, session: Session, user: User, names: list[str]
+    ) -> list[str]:
+        """Creates categories with the given names for the given user
+           in a single statement, skipping names the user already has.
+           Returns the names that were created."""
 
     @abstractmethod
     def delete_category(self, session: Session, user: User, name: str) -> None:
         """Delete a user's category with the given name."""
+
+    @abstractmethod
+    def delete_categories(
+        self, session: Session, user: User, names: list[str]
+    ) -> list[str]:
+        """Deletes a user's categories with the given names in a single
+           statement. Returns the names that were deleted."""
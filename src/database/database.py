@@ -1,27 +1,49 @@
 from injector import inject
 from sqlmodel import Session, SQLModel, create_engine
 
+from src.common.settings import Settings
 from src.database.i_database import IDatabase
 from src.database.i_database_deleter import IDatabaseDeleter
-from src.common.settings import Settings
+from src.database.pool import PoolMonitor, PoolStatistics, create_engine_options
+from src.database.sqlite_profile import (
+    RoutingSession,
+    apply_sqlite_pragmas,
+    create_writer_engine_options,
+    enable_sqlite_foreign_keys,
+    uses_sqlite_profile,
+)
 
 
 class Database(IDatabase, IDatabaseDeleter):
     @inject
     def __init__(self, settings: Settings):
+        options = create_engine_options(settings, is_async=False)
         if settings.database_url.startswith("sqlite"):
-            connect_args = {"check_same_thread": False}
-            self.__engine = create_engine(
-                settings.database_url, connect_args=connect_args
+            options["connect_args"] = {"check_same_thread": False}
+        self.__engine = create_engine(settings.database_url, **options)
+        enable_sqlite_foreign_keys(self.__engine)
+        self.__writer_engine = self.__engine
+        if uses_sqlite_profile(settings):
+            self.__writer_engine = create_engine(
+                settings.database_url, **create_writer_engine_options(options)
             )
-        else:
-            self.__engine = create_engine(settings.database_url)
+            enable_sqlite_foreign_keys(self.__writer_engine)
+            apply_sqlite_pragmas(self.__engine, settings)
+            apply_sqlite_pragmas(self.__writer_engine, settings)
+
+        self.__pool_monitor = PoolMonitor()
+        self.__pool_monitor.attach(self.__engine.pool)
+        if self.__writer_engine is not self.__engine:
+            self.__pool_monitor.attach(self.__writer_engine.pool)
 
     def create_database(self) -> None:
-        SQLModel.metadata.create_all(self.__engine)
+        SQLModel.metadata.create_all(self.__writer_engine)
 
     def delete_database(self) -> None:
-        SQLModel.metadata.drop_all(self.__engine)
+        SQLModel.metadata.drop_all(self.__writer_engine)
 
     def get_session(self) -> Session:
-        return Session(self.__engine)
\ No newline at end of file
+        return RoutingSession(reader=self.__engine, writer=self.__writer_engine)
+
+    def pool_statistics(self) -> PoolStatistics:
+        return self.__pool_monitor.statistics()
\ No newline at end of file
@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.database.pool import PoolStatistics
+
+
+class IAsyncDatabase(ABC):
+    @abstractmethod
+    async def create_database(self) -> None:
+        """Creates a database according to implementation
+           specification."""
+
+    @abstractmethod
+    async def delete_database(self) -> None:
+        """Deletes a previously created database.
+        This should only be used for test purposes."""
+
+    @abstractmethod
+    def get_session(self) -> AsyncSession:
+        """Returns an async session used to query the database.
+           Objects stay loaded after commit, since they cannot be
+           lazily refreshed outside of an awaited call."""
+
+    @abstractmethod
+    def pool_statistics(self) -> PoolStatistics:
+        """Returns the current state of the connection pool
+           together with counters and checkout wait times
+           gathered since the database was created."""
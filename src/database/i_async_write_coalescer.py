@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, TypeVar
+
+from sqlmodel import Session
+
+T = TypeVar("T")
+
+
+class IAsyncWriteCoalescer(ABC):
+    @abstractmethod
+    async def write(self, function: Callable[..., T], *args: Any) -> T:
+        """Runs function with a session and the given arguments and
+           commits its changes. Writes arriving close together may be
+           committed together, but each caller gets the result of its
+           own function, or the error its write alone would raise."""
@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 
 from sqlmodel import Session
 
+from src.database.pool import PoolStatistics
+
 
 class IDatabase(ABC):
     @abstractmethod
@@ -11,3 +13,9 @@ class IDatabase(ABC):
 
     def get_session(self) -> Session:
         """Returns a session used to query the database."""
+
+    @abstractmethod
+    def pool_statistics(self) -> PoolStatistics:
+        """Returns the current state of the connection pool
+           together with counters and checkout wait times
+           gathered since the database was created."""
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+
+from sqlmodel import Session
+
+
+class IUnitOfWork(ABC):
+    @abstractmethod
+    def get_session(self) -> Session:
+        """Returns the session shared by everything taking part in
+           the unit of work. The session is opened on first use."""
+
+    @abstractmethod
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Registers a callback that runs once the unit of work has
+           been committed. Callbacks are dropped if it is closed
+           without committing."""
+
+    @abstractmethod
+    def commit(self) -> None:
+        """Commits all changes made in the unit of work and then runs
+           the registered callbacks. Does nothing if no session has
+           been opened."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Rolls back uncommitted changes and releases the session."""
@@ -0,0 +1,4 @@
+from sqlalchemy.dialects import postgresql, sqlite
+
+# Dialects whose insert supports ON CONFLICT, by dialect name.
+INSERT_ON_CONFLICT = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
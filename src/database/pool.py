@@ -0,0 +1,133 @@
+from bisect import bisect_left
+from threading import Lock
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+from sqlmodel import SQLModel
+
+from src.common.settings import Settings
+
+WAIT_TIME_BUCKETS_MS = [1, 5, 10, 50, 100, 500, 1000, 5000]
+
+
+class PoolStatistics(SQLModel):
+    pool_size: int
+    checked_out: int
+    overflow: int
+    connections_created: int
+    checkouts: int
+    timeouts: int
+    invalidations: int
+    total_wait_seconds: float
+    wait_time_histogram: dict[str, int]
+
+
+class PoolMonitor:
+    def __init__(self):
+        self.__lock = Lock()
+        self.__pools: list[Pool] = []
+        self.__connections_created = 0
+        self.__checkouts = 0
+        self.__timeouts = 0
+        self.__invalidations = 0
+        self.__total_wait_seconds = 0.0
+        self.__wait_time_counts = [0] * (len(WAIT_TIME_BUCKETS_MS) + 1)
+
+    def attach(self, pool: Pool) -> None:
+        self.__pools.append(pool)
+        if isinstance(pool, _MonitoredPoolMixin):
+            pool.monitor = self
+        event.listen(pool, "connect", self.__on_connect)
+        event.listen(pool, "checkout", self.__on_checkout)
+        event.listen(pool, "invalidate", self.__on_invalidate)
+
+    def record_wait(self, seconds: float, timed_out: bool) -> None:
+        bucket = bisect_left(WAIT_TIME_BUCKETS_MS, seconds * 1000)
+        with self.__lock:
+            self.__total_wait_seconds += seconds
+            self.__wait_time_counts[bucket] += 1
+            if timed_out:
+                self.__timeouts += 1
+
+    def statistics(self) -> PoolStatistics:
+        queue_pools = [pool for pool in self.__pools if isinstance(pool, QueuePool)]
+        with self.__lock:
+            histogram = {
+                f"<={limit}ms": count
+                for limit, count in zip(WAIT_TIME_BUCKETS_MS, self.__wait_time_counts)
+            }
+            histogram[f">{WAIT_TIME_BUCKETS_MS[-1]}ms"] = self.__wait_time_counts[-1]
+            return PoolStatistics(
+                pool_size=sum(pool.size() for pool in queue_pools),
+                checked_out=sum(pool.checkedout() for pool in queue_pools),
+                overflow=sum(max(pool.overflow(), 0) for pool in queue_pools),
+                connections_created=self.__connections_created,
+                checkouts=self.__checkouts,
+                timeouts=self.__timeouts,
+                invalidations=self.__invalidations,
+                total_wait_seconds=self.__total_wait_seconds,
+                wait_time_histogram=histogram,
+            )
+
+    def __on_connect(self, *_) -> None:
+        with self.__lock:
+            self.__connections_created += 1
+
+    def __on_checkout(self, *_) -> None:
+        with self.__lock:
+            self.__checkouts += 1
+
+    def __on_invalidate(self, *_) -> None:
+        with self.__lock:
+            self.__invalidations += 1
+
+
+class _MonitoredPoolMixin:
+    # Pools emit no event before waiting for a connection, so the time spent
+    # in connect() is measured here instead.
+    monitor: PoolMonitor | None = None
+
+    def connect(self):
+        start = perf_counter()
+        timed_out = False
+        try:
+            return super().connect()
+        except TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            if self.monitor is not None:
+                self.monitor.record_wait(perf_counter() - start, timed_out)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.monitor = self.monitor
+        return pool
+
+
+class MonitoredQueuePool(_MonitoredPoolMixin, QueuePool):
+    pass
+
+
+class MonitoredAsyncQueuePool(_MonitoredPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def create_engine_options(settings: Settings, is_async: bool) -> dict[str, Any]:
+    url = make_url(settings.database_url)
+    options: dict[str, Any] = {"pool_pre_ping": settings.database_pool_pre_ping}
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # In-memory SQLite databases only exist within a single connection.
+        return options
+    options.update(
+        poolclass=MonitoredAsyncQueuePool if is_async else MonitoredQueuePool,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_recycle=settings.database_pool_recycle,
+    )
+    return options
@@ -0,0 +1,77 @@
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.sql.dml import UpdateBase
+from sqlmodel import Session
+
+from src.common.settings import Settings
+
+
+def uses_sqlite_profile(settings: Settings) -> bool:
+    url = make_url(settings.database_url)
+    return (
+        settings.sqlite_performance_profile
+        and url.get_backend_name() == "sqlite"
+        and url.database not in (None, "", ":memory:")
+    )
+
+
+def apply_sqlite_pragmas(engine: Engine, settings: Settings) -> None:
+    # busy_timeout goes first so that switching to WAL waits for other
+    # connections instead of failing while they hold a lock.
+    pragmas = [
+        f"busy_timeout = {settings.sqlite_busy_timeout_ms}",
+        "journal_mode = WAL",
+        f"synchronous = {settings.sqlite_synchronous}",
+        f"mmap_size = {settings.sqlite_mmap_size}",
+        f"cache_size = {settings.sqlite_cache_size}",
+    ]
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, _) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(f"PRAGMA {pragma}")
+        cursor.close()
+
+
+def enable_sqlite_foreign_keys(engine: Engine) -> None:
+    # SQLite only enforces foreign keys, and their ON DELETE actions, on
+    # connections that ask for it, whether or not the profile is in use.
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_foreign_keys(dbapi_connection, _) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys = ON")
+        cursor.close()
+
+
+def create_writer_engine_options(options: dict[str, Any]) -> dict[str, Any]:
+    # SQLite allows one writer at a time, so queueing writes on a single
+    # pooled connection replaces busy-waiting on the database lock.
+    return {**options, "pool_size": 1, "max_overflow": 0}
+
+
+class RoutingSession(Session):
+    def __init__(self, reader: Engine, writer: Engine, **kwargs):
+        super().__init__(**kwargs)
+        self.__reader = reader
+        self.__writer = writer
+        self.__writing = False
+        if reader is not writer:
+            event.listen(self, "after_transaction_end", self.__on_transaction_end)
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        # Once a transaction has written, its reads stay on the writer so they
+        # see its own uncommitted changes.
+        if self.__writing or self._flushing or isinstance(clause, UpdateBase):
+            self.__writing = self.__reader is not self.__writer
+            return self.__writer
+        return self.__reader
+
+    def __on_transaction_end(self, _, transaction) -> None:
+        if transaction.parent is None:
+            self.__writing = False
@@ -0,0 +1,64 @@
+from datetime import date
+from typing import NamedTuple
+
+import numpy as np
+from sqlmodel import SQLModel
+
+# Days are counted in UTC from the epoch of numpy's datetime64, so that day
+# numbers convert to months without a lookup.
+LEDGER_EPOCH = date(1970, 1, 1)
+MAX_DAILY_SPEND_DAYS = 1000
+MAX_SPEND_WINDOW = 365
+
+
+class Ledger(NamedTuple):
+    # One user's transactions as read-only columns ordered by day, together
+    # with the names of the user's categories. Uncategorized transactions
+    # have category 0.
+    days: np.ndarray
+    amounts: np.ndarray
+    category_ids: np.ndarray
+    category_names: dict[int, str]
+
+
+class SpendFilter(SQLModel):
+    # Days from start up to but not including end.
+    start: date | None = None
+    end: date | None = None
+
+
+class DailySpendFilter(SQLModel):
+    # One point for every day from start up to but not including end.
+    start: date
+    end: date
+
+
+class CategorySpendRead(SQLModel):
+    category: str | None = None
+    spend: int
+    count: int
+    share: float
+
+
+class DailySpendRead(SQLModel):
+    day: date
+    spend: int
+    average: float
+
+
+class MonthlySpendRead(SQLModel):
+    # Percentiles over every month in the range, including months without
+    # spending. They are None if the range holds no months.
+    months: int
+    mean: float | None = None
+    p25: float | None = None
+    p50: float | None = None
+    p75: float | None = None
+    p90: float | None = None
+
+
+class YearOverYearRead(SQLModel):
+    month: int
+    spend: int
+    previous_spend: int
+    change: float | None = None
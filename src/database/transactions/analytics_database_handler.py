@@ -0,0 +1,52 @@
+import numpy as np
+from sqlalchemy import Date, Integer, cast, func, literal
+from sqlalchemy.sql import ColumnElement
+from sqlmodel import Session, select
+
+from src.database.categories.category import Category
+from src.database.transactions.analytics import LEDGER_EPOCH, Ledger
+from src.database.transactions.i_analytics_database_handler import (
+    IAnalyticsDatabaseHandler,
+)
+from src.database.transactions.monthly_total import UNCATEGORIZED
+from src.database.transactions.transaction import Transaction
+from src.database.users.user import User
+
+_LEDGER_ROW = np.dtype(
+    [("day", np.int32), ("amount", np.int64), ("category_id", np.int32)]
+)
+# The Julian day number of LEDGER_EPOCH at midnight.
+_JULIAN_EPOCH = 2440587.5
+
+
+class AnalyticsDatabaseHandler(IAnalyticsDatabaseHandler):
+    def get_ledger(self, session: Session, user: User) -> Ledger:
+        statement = (
+            select(
+                _day_number_of(session, Transaction.occurred_at),
+                Transaction.amount,
+                func.coalesce(Transaction.category_id, UNCATEGORIZED),
+            )
+            .where(Transaction.user_id == user.id)
+            .order_by(Transaction.occurred_at)
+        )
+        # The statement runs on the connection rather than the session, which
+        # skips the ORM's row processing, and the rows go straight into one
+        # array that is then split into contiguous columns.
+        result = session.connection().execute(statement)
+        rows = np.fromiter(map(tuple, result), dtype=_LEDGER_ROW)
+        columns = [np.ascontiguousarray(rows[name]) for name in _LEDGER_ROW.names]
+        for column in columns:
+            column.flags.writeable = False
+
+        category_names = session.exec(
+            select(Category.id, Category.name).where(Category.user_id == user.id)
+        ).all()
+        return Ledger(*columns, category_names=dict(category_names))
+
+
+def _day_number_of(session: Session, occurred_at: ColumnElement) -> ColumnElement:
+    if session.get_bind().dialect.name == "sqlite":
+        day = func.julianday(func.date(occurred_at)) - _JULIAN_EPOCH
+        return cast(day, Integer)
+    return cast(occurred_at, Date) - literal(LEDGER_EPOCH)
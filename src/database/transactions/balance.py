@@ -0,0 +1,60 @@
+from datetime import date
+
+from sqlalchemy import BigInteger
+from sqlmodel import Field, SQLModel
+
+from src.database.binary_uuid import BinaryUuid
+
+# Days are numbered from 1 at BALANCE_EPOCH. Transactions before it count as
+# made on its first day and ones after the last day as made on the last day.
+BALANCE_EPOCH = date(1900, 1, 1)
+BALANCE_DAYS = 2**17
+MAX_BALANCE_SERIES_DAYS = 1000
+
+
+def to_day_number(day: date) -> int:
+    return min(max((day - BALANCE_EPOCH).days + 1, 1), BALANCE_DAYS)
+
+
+def create_balance_node_changes(changes: dict[date, int]) -> dict[int, int]:
+    # The nodes form a Fenwick tree over day numbers: node n holds the sum of
+    # the days in (n - lowbit(n), n], so a day is part of at most 18 nodes and
+    # a running total is the sum of at most 17 nodes.
+    node_changes: dict[int, int] = {}
+    for day, amount in changes.items():
+        node = to_day_number(day)
+        while node <= BALANCE_DAYS:
+            node_changes[node] = node_changes.get(node, 0) + amount
+            node += node & -node
+    return {node: amount for node, amount in node_changes.items() if amount != 0}
+
+
+def get_balance_nodes(day: date) -> list[int]:
+    nodes = []
+    node = to_day_number(day)
+    while node > 0:
+        nodes.append(node)
+        node -= node & -node
+    return nodes
+
+
+class BalanceRead(SQLModel):
+    # The balance at the end of the day in UTC.
+    day: date
+    balance: int
+
+
+class BalanceSeriesFilter(SQLModel):
+    # One point for every day from start up to but not including end.
+    start: date
+    end: date
+
+
+class BalanceNode(SQLModel, table=True):
+    __tablename__ = "balance_node"
+
+    user_id: str = Field(
+        sa_type=BinaryUuid, primary_key=True, foreign_key="user.id", ondelete="CASCADE"
+    )
+    node: int = Field(primary_key=True)
+    total: int = Field(sa_type=BigInteger)
@@ -0,0 +1,81 @@
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Iterable
+
+from sqlalchemy import func, insert, update
+from sqlmodel import Session, select
+
+from src.database.insert_on_conflict import INSERT_ON_CONFLICT
+from src.database.transactions.balance import (
+    BalanceNode,
+    create_balance_node_changes,
+    get_balance_nodes,
+)
+from src.database.transactions.i_balance_database_handler import (
+    IBalanceDatabaseHandler,
+)
+from src.database.users.user import User
+
+
+class BalanceDatabaseHandler(IBalanceDatabaseHandler):
+    def get_balance(self, session: Session, user: User, day: date) -> int:
+        statement = select(func.coalesce(func.sum(BalanceNode.total), 0)).where(
+            BalanceNode.user_id == user.id, BalanceNode.node.in_(get_balance_nodes(day))
+        )
+        return session.exec(statement).one()
+
+    def get_balances(
+        self, session: Session, user: User, days: list[date]
+    ) -> list[int]:
+        # Consecutive days share most of their nodes, so a series of n days
+        # reads about n + 17 nodes.
+        nodes_per_day = [get_balance_nodes(day) for day in days]
+        nodes = {node for day_nodes in nodes_per_day for node in day_nodes}
+        statement = select(BalanceNode.node, BalanceNode.total).where(
+            BalanceNode.user_id == user.id, BalanceNode.node.in_(nodes)
+        )
+        totals = dict(session.exec(statement).all())
+        return [
+            sum(totals.get(node, 0) for node in day_nodes)
+            for day_nodes in nodes_per_day
+        ]
+
+
+def summarize_daily_changes(
+    transactions: Iterable[tuple[int | None, datetime, int]], sign: int = 1
+) -> dict[date, int]:
+    changes: dict[date, int] = defaultdict(int)
+    for _, occurred_at, amount in transactions:
+        changes[occurred_at.date()] += sign * amount
+    return changes
+
+
+def update_balances(session: Session, user_id: str, changes: dict[date, int]) -> None:
+    # Runs in the transaction of the ledger write it accounts for, and
+    # touches at most 18 nodes for every changed day.
+    rows = [
+        {"node": node, "total": total}
+        for node, total in create_balance_node_changes(changes).items()
+    ]
+    if not rows:
+        return
+    table = BalanceNode.__table__
+    insert_on_conflict = INSERT_ON_CONFLICT.get(session.get_bind().dialect.name)
+    if insert_on_conflict is None:
+        for row in rows:
+            statement = (
+                update(BalanceNode)
+                .where(BalanceNode.user_id == user_id, BalanceNode.node == row["node"])
+                .values(total=BalanceNode.total + row["total"])
+            )
+            if session.execute(statement).rowcount == 0:
+                session.execute(insert(BalanceNode).values(user_id=user_id, **row))
+        return
+
+    statement = insert_on_conflict(table).values(user_id=user_id)
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.user_id, table.c.node],
+        set_={"total": table.c.total + statement.excluded.total},
+    )
+    session.execute(statement, rows)
+
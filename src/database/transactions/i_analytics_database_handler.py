@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+
+from sqlmodel import Session
+
+from src.database.transactions.analytics import Ledger
+from src.database.users.user import User
+
+
+class IAnalyticsDatabaseHandler(ABC):
+    @abstractmethod
+    def get_ledger(self, session: Session, user: User) -> Ledger:
+        """Reads all of the user's transactions into columnar arrays
+           ordered by day, along with the names of the user's
+           categories."""
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from datetime import date
+
+from sqlmodel import Session
+
+from src.database.users.user import User
+
+
+class IBalanceDatabaseHandler(ABC):
+    @abstractmethod
+    def get_balance(self, session: Session, user: User, day: date) -> int:
+        """Returns the sum of all the user's transactions up to and
+           including the given day, read from the user's balance
+           nodes rather than the ledger."""
+
+    @abstractmethod
+    def get_balances(
+        self, session: Session, user: User, days: list[date]
+    ) -> list[int]:
+        """Returns the user's balance at the end of each of the given
+           days, in the same order. The nodes of all the days are read
+           in a single query."""
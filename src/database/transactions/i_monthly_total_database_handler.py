@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from datetime import date
+
+from sqlmodel import Session
+
+from src.database.transactions.monthly_total import MonthlyTotal, MonthlyTotalFilter
+from src.database.users.user import User
+
+
+class IMonthlyTotalDatabaseHandler(ABC):
+    @abstractmethod
+    def get_monthly_totals(
+        self, session: Session, user: User, filters: MonthlyTotalFilter
+    ) -> list[tuple[MonthlyTotal, str | None]]:
+        """Fetches the user's totals per month and category within the
+           filtered months, ordered by month, together with the name of
+           each category. The name is None for uncategorized totals."""
+
+    @abstractmethod
+    def find_stale_monthly_totals(
+        self, session: Session, user: User
+    ) -> list[tuple[date, int]]:
+        """Compares the user's stored monthly totals with totals summed
+           from the ledger, and returns the month and category ID of
+           every total that differs."""
+
+    @abstractmethod
+    def rebuild_monthly_totals(self, session: Session, user: User) -> None:
+        """Replaces the user's stored monthly totals with totals summed
+           from the ledger."""
@@ -0,0 +1,78 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Iterator
+
+from sqlmodel import Session
+
+from src.database.transactions.transaction import (
+    Transaction,
+    TransactionCreate,
+    TransactionFilter,
+    TransactionSearchFilter,
+)
+from src.database.users.user import User
+
+
+class ITransactionDatabaseHandler(ABC):
+    @abstractmethod
+    def create_transaction(
+        self, session: Session, user: User, data: TransactionCreate
+    ) -> Transaction:
+        """Creates a transaction for the given user. Raises if the
+           given category does not exist for the user."""
+
+    @abstractmethod
+    def insert_transactions(
+        self, session: Session, user: User, rows: list[dict[str, Any]]
+    ) -> int:
+        """Inserts transactions given as column values for the given
+           user with a single executemany, skipping rows whose content
+           hash the user already has. Returns the number of rows
+           inserted."""
+
+    @abstractmethod
+    def get_transactions(
+        self,
+        session: Session,
+        user: User,
+        filters: TransactionFilter,
+        after: tuple[datetime, int] | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[Transaction, str | None]]:
+        """Retrieves a user's transactions matching the filters, newest
+           first, each with the name of its category. If after is given,
+           only transactions older than that (occurred_at, id) key are
+           returned, and at most limit transactions if it is given."""
+
+    @abstractmethod
+    def search_transactions(
+        self,
+        session: Session,
+        user: User,
+        filters: TransactionSearchFilter,
+        after: tuple[int, int, int] | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[Transaction, str | None, tuple[int, int, int]]]:
+        """Searches a user's transactions matching the filters for
+           descriptions with words starting with every word of the
+           query. Matches are ranked in windows of at most
+           MAX_SEARCH_CANDIDATES, newest window first, by how many words
+           of the query are whole words of the description. Each
+           transaction comes with the name of its category and its
+           (window, score, id) key, best first and newest first among
+           equal scores. If after is given, only transactions ranked
+           after that key are returned, and at most limit transactions
+           if it is given."""
+
+    @abstractmethod
+    def stream_transactions(
+        self, session: Session, user: User, batch_size: int
+    ) -> Iterator[list[tuple[int, datetime, int, str, str | None]]]:
+        """Streams a user's transactions oldest first as (id, occurred_at,
+           amount, description, category name) rows, in batches of at
+           most batch_size rows read through a server-side cursor."""
+
+    @abstractmethod
+    def delete_transaction(self, session: Session, user: User, id: int) -> None:
+        """Deletes a user's transaction with the given ID. Raises if the
+           transaction does not exist for the user."""
@@ -0,0 +1,49 @@
+from datetime import date, datetime
+
+from pydantic import validator
+from sqlalchemy import BigInteger
+from sqlmodel import Field, SQLModel
+
+from src.database.binary_uuid import BinaryUuid
+
+# Key part standing in for transactions without a category, since a primary
+# key column cannot be null.
+UNCATEGORIZED = 0
+
+
+def to_month(value: date | datetime | None) -> date | None:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        value = value.date()
+    return value.replace(day=1)
+
+
+class MonthlyTotalRead(SQLModel):
+    month: date
+    category: str | None = None
+    total: int
+    count: int
+
+
+class MonthlyTotalFilter(SQLModel):
+    # Months are counted in UTC, and any day picks out its month.
+    start: date | None = None
+    end: date | None = None
+
+    _to_month = validator("start", "end", allow_reuse=True)(to_month)
+
+
+class MonthlyTotal(SQLModel, table=True):
+    # Kept in step with the ledger by every write to it, so reports read one
+    # row per month and category however many transactions there are. The
+    # key leads with the month, which makes a report a range scan.
+    __tablename__ = "monthly_total"
+
+    user_id: str = Field(
+        sa_type=BinaryUuid, primary_key=True, foreign_key="user.id", ondelete="CASCADE"
+    )
+    month: date = Field(primary_key=True)
+    category_id: int = Field(primary_key=True)
+    total: int = Field(sa_type=BigInteger)
+    count: int
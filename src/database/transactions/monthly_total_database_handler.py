@@ -0,0 +1,190 @@
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Iterable
+
+from sqlalchemy import Date, and_, cast, delete, func, insert, type_coerce, update
+from sqlalchemy.sql import ColumnElement, Select
+from sqlmodel import Session, select
+
+from src.database.categories.category import Category
+from src.database.insert_on_conflict import INSERT_ON_CONFLICT
+from src.database.transactions.i_monthly_total_database_handler import (
+    IMonthlyTotalDatabaseHandler,
+)
+from src.database.transactions.monthly_total import (
+    UNCATEGORIZED,
+    MonthlyTotal,
+    MonthlyTotalFilter,
+    to_month,
+)
+from src.database.transactions.transaction import Transaction
+from src.database.users.user import User
+
+# Changes to the totals keyed by month and category ID, as pairs of amount and
+# number of transactions.
+MonthlyChanges = dict[tuple[date, int], tuple[int, int]]
+
+
+class MonthlyTotalDatabaseHandler(IMonthlyTotalDatabaseHandler):
+    def get_monthly_totals(
+        self, session: Session, user: User, filters: MonthlyTotalFilter
+    ) -> list[tuple[MonthlyTotal, str | None]]:
+        statement = (
+            select(MonthlyTotal, Category.name)
+            .outerjoin(Category, MonthlyTotal.category_id == Category.id)
+            .where(MonthlyTotal.user_id == user.id)
+            .order_by(MonthlyTotal.month, MonthlyTotal.category_id)
+        )
+        if filters.start is not None:
+            statement = statement.where(MonthlyTotal.month >= filters.start)
+        if filters.end is not None:
+            statement = statement.where(MonthlyTotal.month < filters.end)
+        results = session.exec(statement)
+        totals = results.all()
+
+        return totals
+
+    def find_stale_monthly_totals(
+        self, session: Session, user: User
+    ) -> list[tuple[date, int]]:
+        stored_statement = select(
+            MonthlyTotal.month,
+            MonthlyTotal.category_id,
+            MonthlyTotal.total,
+            MonthlyTotal.count,
+        ).where(MonthlyTotal.user_id == user.id)
+        stored = {
+            (month, category_id): (total, count)
+            for month, category_id, total, count in session.exec(stored_statement)
+        }
+        ledger = {
+            (month, category_id): (total, count)
+            for _, month, category_id, total, count in session.exec(
+                self.__sum_ledger(session, user)
+            )
+        }
+        keys = stored.keys() | ledger.keys()
+        return sorted(key for key in keys if stored.get(key) != ledger.get(key))
+
+    def rebuild_monthly_totals(self, session: Session, user: User) -> None:
+        session.execute(delete(MonthlyTotal).where(MonthlyTotal.user_id == user.id))
+        session.execute(
+            insert(MonthlyTotal).from_select(
+                ["user_id", "month", "category_id", "total", "count"],
+                self.__sum_ledger(session, user),
+            )
+        )
+
+    def __sum_ledger(self, session: Session, user: User) -> Select:
+        month = _month_of(session, Transaction.occurred_at)
+        category_id = func.coalesce(Transaction.category_id, UNCATEGORIZED)
+        return (
+            select(
+                Transaction.user_id,
+                month,
+                category_id,
+                func.sum(Transaction.amount),
+                func.count(),
+            )
+            .where(Transaction.user_id == user.id)
+            .group_by(Transaction.user_id, month, category_id)
+        )
+
+
+def summarize_monthly_changes(
+    transactions: Iterable[tuple[int | None, datetime, int]], sign: int = 1
+) -> MonthlyChanges:
+    changes: dict[tuple[date, int], list[int]] = defaultdict(lambda: [0, 0])
+    for category_id, occurred_at, amount in transactions:
+        change = changes[(to_month(occurred_at), category_id or UNCATEGORIZED)]
+        change[0] += sign * amount
+        change[1] += sign
+    return {key: (total, count) for key, (total, count) in changes.items()}
+
+
+def update_monthly_totals(
+    session: Session, user_id: str, changes: MonthlyChanges
+) -> None:
+    # Runs in the transaction of the ledger write it accounts for. Totals
+    # left without transactions are removed, so that a user's totals stay
+    # bounded by the months and categories in use.
+    rows = [
+        {"month": month, "category_id": category_id, "total": total, "count": count}
+        for (month, category_id), (total, count) in changes.items()
+        if count != 0 or total != 0
+    ]
+    if not rows:
+        return
+    table = MonthlyTotal.__table__
+    insert_on_conflict = INSERT_ON_CONFLICT.get(session.get_bind().dialect.name)
+    if insert_on_conflict is None:
+        for row in rows:
+            _update_monthly_total(session, user_id, row)
+    else:
+        statement = insert_on_conflict(table).values(user_id=user_id)
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.month, table.c.category_id],
+            set_={
+                "total": table.c.total + statement.excluded.total,
+                "count": table.c.count + statement.excluded.count,
+            },
+        )
+        session.execute(statement, rows)
+
+    if any(row["count"] < 0 for row in rows):
+        session.execute(
+            delete(MonthlyTotal).where(
+                MonthlyTotal.user_id == user_id, MonthlyTotal.count == 0
+            )
+        )
+
+
+def move_monthly_totals(
+    session: Session, user_id: str, category_ids: list[int]
+) -> None:
+    # The ledger clears the category of transactions whose category is
+    # deleted, so their totals are moved to the uncategorized ones.
+    if not category_ids:
+        return
+    condition = and_(
+        MonthlyTotal.user_id == user_id, MonthlyTotal.category_id.in_(category_ids)
+    )
+    columns = (MonthlyTotal.month, MonthlyTotal.total, MonthlyTotal.count)
+    statement = delete(MonthlyTotal).where(condition)
+    if session.get_bind().dialect.delete_returning:
+        moved = session.execute(statement.returning(*columns)).all()
+    else:
+        moved = session.execute(select(*columns).where(condition)).all()
+        session.execute(statement)
+
+    changes: dict[tuple[date, int], tuple[int, int]] = {}
+    for month, total, count in moved:
+        key = (month, UNCATEGORIZED)
+        moved_total, moved_count = changes.get(key, (0, 0))
+        changes[key] = (moved_total + total, moved_count + count)
+    update_monthly_totals(session, user_id, changes)
+
+
+def _update_monthly_total(session: Session, user_id: str, row: dict) -> None:
+    key = and_(
+        MonthlyTotal.user_id == user_id,
+        MonthlyTotal.month == row["month"],
+        MonthlyTotal.category_id == row["category_id"],
+    )
+    statement = (
+        update(MonthlyTotal)
+        .where(key)
+        .values(
+            total=MonthlyTotal.total + row["total"],
+            count=MonthlyTotal.count + row["count"],
+        )
+    )
+    if session.execute(statement).rowcount == 0:
+        session.execute(insert(MonthlyTotal).values(user_id=user_id, **row))
+
+
+def _month_of(session: Session, occurred_at: ColumnElement) -> ColumnElement:
+    if session.get_bind().dialect.name == "sqlite":
+        # SQLite keeps dates as ISO strings, which is what date() returns.
+        return type_coerce(func.date(occurred_at, "start of month"), Date)
+    return cast(func.date_trunc("month", occurred_at), Date)
@@ -0,0 +1,68 @@
+import argparse
+import sys
+
+from sqlmodel import select
+
+from src.common.settings import Settings
+from src.database.database import Database
+from src.database.i_database import IDatabase
+from src.database.transactions.i_monthly_total_database_handler import (
+    IMonthlyTotalDatabaseHandler,
+)
+from src.database.transactions.monthly_total_database_handler import (
+    MonthlyTotalDatabaseHandler,
+)
+from src.database.users.user import User
+
+
+def check_monthly_totals(
+    database: IDatabase, handler: IMonthlyTotalDatabaseHandler, rebuild: bool
+) -> int:
+    # Each user is checked, and rebuilt if need be, in a transaction of its
+    # own, so the command can run next to the application. A rebuild replaces
+    # the totals with a single INSERT ... SELECT, which sees the same ledger
+    # as the DELETE before it.
+    with database.get_session() as session:
+        user_ids = session.exec(select(User.id)).all()
+
+    stale_users = 0
+    for user_id in user_ids:
+        user = User(id=user_id, email="")
+        with database.get_session() as session:
+            stale = handler.find_stale_monthly_totals(session, user)
+            if not stale:
+                continue
+            stale_users += 1
+            months = ", ".join(
+                f"{month:%Y-%m} category {category_id}" for month, category_id in stale
+            )
+            print(f"{user_id}: {len(stale)} stale totals ({months})")
+            if rebuild:
+                handler.rebuild_monthly_totals(session, user)
+                session.commit()
+    return stale_users
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Verifies the monthly totals of every user against the "
+        "ledger and rebuilds the ones that differ."
+    )
+    parser.add_argument(
+        "--verify-only",
+        action="store_true",
+        help="Only report stale totals, and exit with status 1 if any are found.",
+    )
+    arguments = parser.parse_args()
+
+    stale_users = check_monthly_totals(
+        Database(Settings()), MonthlyTotalDatabaseHandler(), not arguments.verify_only
+    )
+    action = "found" if arguments.verify_only else "rebuilt"
+    print(f"Stale monthly totals {action} for {stale_users} users.")
+    if arguments.verify_only and stale_users:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
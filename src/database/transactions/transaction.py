@@ -0,0 +1,186 @@
+from datetime import datetime, timezone
+from enum import Enum
+
+from pydantic import Extra, StrictInt, validator
+from sqlalchemy import DDL, BigInteger, Index, Integer, LargeBinary, event, func
+from sqlmodel import Field, SQLModel
+
+from src.database.binary_uuid import BinaryUuid
+
+DESCRIPTION_MAX_LENGTH = 500
+SEARCH_QUERY_MAX_LENGTH = 200
+MAX_SEARCH_TERMS = 8
+MAX_SEARCH_CANDIDATES = 1000
+SEARCH_TABLE = "transaction_search"
+
+
+def to_naive_utc(value: datetime | None) -> datetime | None:
+    # Timestamps are stored as naive UTC, like the rest of the schema.
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class TransactionBase(SQLModel):
+    # In minor units of the currency, negative for purchases and positive for
+    # income.
+    amount: int
+    occurred_at: datetime
+    description: str = Field(default="", max_length=DESCRIPTION_MAX_LENGTH)
+
+
+class TransactionCreate(TransactionBase, extra=Extra.forbid):
+    # Rejects fractional amounts rather than truncating them.
+    amount: StrictInt
+    category: str | None = None
+
+    _occurred_at_to_utc = validator("occurred_at", allow_reuse=True)(to_naive_utc)
+
+
+class TransactionRead(TransactionBase):
+    id: int
+    category: str | None = None
+
+
+class TransactionPage(SQLModel):
+    items: list[TransactionRead]
+    next_cursor: str | None = None
+
+
+class TransactionFilter(SQLModel):
+    category: str | None = None
+    start: datetime | None = None
+    end: datetime | None = None
+
+    _range_to_utc = validator("start", "end", allow_reuse=True)(to_naive_utc)
+
+
+class TransactionSearchFilter(TransactionFilter):
+    # At least one word character, since only words are searched for.
+    query: str = Field(max_length=SEARCH_QUERY_MAX_LENGTH, regex=r"\w")
+
+
+class StatementFormat(str, Enum):
+    CSV = "csv"
+    OFX = "ofx"
+
+
+class TransactionImportError(SQLModel):
+    # The line number in a CSV file, or the position among the transactions
+    # of an OFX file.
+    row: int
+    message: str
+
+
+class TransactionImportProgress(SQLModel):
+    processed: int = 0
+    inserted: int = 0
+    duplicates: int = 0
+    failed: int = 0
+    errors: list[TransactionImportError] = []
+    done: bool = False
+
+
+class Transaction(TransactionBase, table=True):
+    # Listing walks a user's transactions newest first, optionally within one
+    # category, so both indexes end in the (occurred_at, id) keyset. Category
+    # ids already belong to a single user, and leading with category_id also
+    # serves clearing the category of transactions when it is deleted.
+    __table_args__ = (
+        Index("ix_transaction_user_id_occurred_at", "user_id", "occurred_at", "id"),
+        Index(
+            "ix_transaction_category_id_occurred_at", "category_id", "occurred_at", "id"
+        ),
+        Index(
+            "ix_transaction_user_id_content_hash",
+            "user_id",
+            "content_hash",
+            unique=True,
+        ),
+    )
+
+    # SQLite only makes a plain INTEGER primary key an alias of the rowid.
+    id: int | None = Field(
+        default=None,
+        primary_key=True,
+        sa_type=BigInteger().with_variant(Integer(), "sqlite"),
+    )
+    user_id: str = Field(
+        foreign_key="user.id", ondelete="CASCADE", nullable=False, sa_type=BinaryUuid
+    )
+    category_id: int | None = Field(
+        default=None, foreign_key="category.id", ondelete="SET NULL"
+    )
+    amount: int = Field(sa_type=BigInteger)
+    # Set on imported transactions, so that importing a statement again skips
+    # the rows already recorded.
+    content_hash: bytes | None = Field(default=None, sa_type=LargeBinary(16))
+
+
+# Descriptions are searched through a trigram index on PostgreSQL, and through
+# an FTS5 index on SQLite. The FTS5 table reads its text from the transaction
+# table and is kept in step with it by triggers, which also cover rows deleted
+# along with their user. Prefixes of up to six characters are indexed on their
+# own, as short prefixes start many words and would otherwise be found by
+# merging the entries of every one of them.
+SQLITE_SEARCH_DDL = [
+    f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5(description, "
+    "content='transaction', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3 4 5 6')",
+    f'CREATE TRIGGER {SEARCH_TABLE}_insert AFTER INSERT ON "transaction" BEGIN '
+    f"INSERT INTO {SEARCH_TABLE}(rowid, description) "
+    "VALUES (new.id, new.description); END",
+    f'CREATE TRIGGER {SEARCH_TABLE}_delete AFTER DELETE ON "transaction" BEGIN '
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, description) "
+    "VALUES ('delete', old.id, old.description); END",
+    f"CREATE TRIGGER {SEARCH_TABLE}_update AFTER UPDATE OF description "
+    'ON "transaction" BEGIN '
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, description) "
+    "VALUES ('delete', old.id, old.description); "
+    f"INSERT INTO {SEARCH_TABLE}(rowid, description) "
+    "VALUES (new.id, new.description); END",
+]
+
+# PostgreSQL indexes descriptions with their diacritics removed, as the FTS5
+# tokenizer does. unaccent itself may not be used in an index, since it looks up
+# its dictionary through the search path, so it is wrapped in a function that
+# names the dictionary.
+POSTGRESQL_SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    "CREATE OR REPLACE FUNCTION search_unaccent(text) RETURNS text "
+    "AS $$ SELECT public.unaccent('public.unaccent', $1) $$ "
+    "LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT",
+]
+
+Index(
+    "ix_transaction_description_unaccent_trgm",
+    func.search_unaccent(Transaction.description).label("description_unaccent"),
+    postgresql_using="gin",
+    postgresql_ops={"description_unaccent": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+
+for statement in POSTGRESQL_SEARCH_DDL:
+    event.listen(
+        Transaction.__table__,
+        "before_create",
+        DDL(statement).execute_if(dialect="postgresql"),
+    )
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(
+        Transaction.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="sqlite"),
+    )
+event.listen(
+    Transaction.__table__,
+    "after_drop",
+    DDL(f"DROP TABLE IF EXISTS {SEARCH_TABLE}").execute_if(dialect="sqlite"),
+)
+event.listen(
+    Transaction.__table__,
+    "after_drop",
+    DDL("DROP FUNCTION IF EXISTS search_unaccent(text)").execute_if(
+        dialect="postgresql"
+    ),
+)
@@ -0,0 +1,333 @@
+import re
+import unicodedata
+from datetime import datetime
+from typing import Any, Iterator
+
+from sqlalchemy import (
+    and_,
+    column,
+    delete,
+    func,
+    insert,
+    literal_column,
+    table,
+    tuple_,
+    update,
+)
+from sqlalchemy.sql import Select
+from sqlmodel import Session, select
+
+from src.common.exceptions import ObjectNotFoundError
+from src.database.categories.category import Category
+from src.database.insert_on_conflict import INSERT_ON_CONFLICT
+from src.database.transactions.balance_database_handler import (
+    summarize_daily_changes,
+    update_balances,
+)
+from src.database.transactions.i_transaction_database_handler import (
+    ITransactionDatabaseHandler,
+)
+from src.database.transactions.monthly_total_database_handler import (
+    summarize_monthly_changes,
+    update_monthly_totals,
+)
+from src.database.transactions.transaction import (
+    MAX_SEARCH_CANDIDATES,
+    MAX_SEARCH_TERMS,
+    SEARCH_TABLE,
+    Transaction,
+    TransactionCreate,
+    TransactionFilter,
+    TransactionSearchFilter,
+)
+from src.database.users.user import User
+
+
+class TransactionDatabaseHandler(ITransactionDatabaseHandler):
+    def create_transaction(
+        self, session: Session, user: User, data: TransactionCreate
+    ) -> Transaction:
+        category_id = None
+        if data.category is not None:
+            category_id = session.exec(
+                select(Category.id).where(
+                    Category.user_id == user.id, Category.name == data.category
+                )
+            ).first()
+            if category_id is None:
+                raise ObjectNotFoundError("No category with that name exists.")
+
+        transaction = Transaction(
+            user_id=user.id,
+            category_id=category_id,
+            amount=data.amount,
+            occurred_at=data.occurred_at,
+            description=data.description,
+        )
+        session.add(transaction)
+        self.__account_for(
+            session, user, [(category_id, data.occurred_at, data.amount)]
+        )
+        return transaction
+
+    def insert_transactions(
+        self, session: Session, user: User, rows: list[dict[str, Any]]
+    ) -> int:
+        if not rows:
+            return 0
+        table = Transaction.__table__
+        columns = (table.c.category_id, table.c.occurred_at, table.c.amount)
+        insert_on_conflict = INSERT_ON_CONFLICT.get(session.get_bind().dialect.name)
+        if insert_on_conflict is None:
+            rows = self.__skip_existing_hashes(session, user, rows)
+            if rows:
+                session.execute(insert(table).values(user_id=user.id), rows)
+            inserted = [tuple(row[column.name] for column in columns) for row in rows]
+        else:
+            statement = (
+                insert_on_conflict(table)
+                .values(user_id=user.id)
+                .on_conflict_do_nothing(
+                    index_elements=[table.c.user_id, table.c.content_hash]
+                )
+                .returning(*columns)
+            )
+            inserted = session.execute(statement, rows).all()
+        self.__account_for(session, user, inserted)
+        return len(inserted)
+
+    def get_transactions(
+        self,
+        session: Session,
+        user: User,
+        filters: TransactionFilter,
+        after: tuple[datetime, int] | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[Transaction, str | None]]:
+        statement = (
+            select(Transaction, Category.name)
+            .outerjoin(Category, Transaction.category_id == Category.id)
+            .where(Transaction.user_id == user.id)
+            .order_by(Transaction.occurred_at.desc(), Transaction.id.desc())
+            .limit(limit)
+        )
+        statement = self.__apply_filters(statement, user, filters)
+        if after is not None:
+            statement = statement.where(
+                tuple_(Transaction.occurred_at, Transaction.id) < tuple_(*after)
+            )
+        results = session.exec(statement)
+        transactions = results.all()
+
+        return transactions
+
+    def search_transactions(
+        self,
+        session: Session,
+        user: User,
+        filters: TransactionSearchFilter,
+        after: tuple[int, int, int] | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[Transaction, str | None, tuple[int, int, int]]]:
+        # Matches are ranked in windows of the newest ones, which bounds the
+        # work of a query that matches most of the ledger, and later windows
+        # are reached by paging on. Each key starts with the exclusive upper
+        # bound of the ids in its window, fixed by the first page, so that
+        # windows do not shift as transactions are added. Scores depend on
+        # nothing but the description and the query, unlike bm25, which
+        # follows statistics of the whole index. Pages therefore stay in step
+        # while other users write.
+        terms = to_search_terms(filters.query)
+        candidates = select(Transaction.id, Transaction.description).where(
+            Transaction.user_id == user.id
+        )
+        if session.get_bind().dialect.name == "sqlite":
+            # Ordering by the rowid of the index lets it hand over matches
+            # newest first without sorting.
+            search = table(SEARCH_TABLE, column("rowid"))
+            position = search.c.rowid
+            candidates = candidates.join(
+                search, search.c.rowid == Transaction.id
+            ).where(
+                literal_column(SEARCH_TABLE).op("MATCH")(to_match_expression(terms))
+            )
+        else:
+            # Like the FTS5 query, each term matches the start of a word,
+            # regardless of case and diacritics. Terms are made of word
+            # characters only, so they need no escaping in the pattern.
+            position = Transaction.id
+            description = func.search_unaccent(Transaction.description)
+            candidates = candidates.where(
+                *(
+                    description.regexp_match(
+                        func.search_unaccent(rf"\m{term}"), flags="i"
+                    )
+                    for term in terms
+                )
+            )
+        candidates = self.__apply_filters(
+            candidates.order_by(position.desc()).limit(MAX_SEARCH_CANDIDATES),
+            user,
+            filters,
+        )
+
+        keys: list[tuple[int, int, int]] = []
+        before = None if after is None else after[0]
+        while limit is None or len(keys) < limit:
+            window = candidates
+            if before is not None:
+                window = window.where(position < before)
+            rows = session.exec(window).all()
+            if not rows:
+                break
+            if before is None:
+                before = rows[0][0] + 1
+            keys.extend(
+                key
+                for key in (
+                    (before, score_description(description, terms), id)
+                    for id, description in rows
+                )
+                if after is None or key < after
+            )
+            if len(rows) < MAX_SEARCH_CANDIDATES:
+                break
+            before = rows[-1][0]
+
+        keys = sorted(keys, reverse=True)[:limit]
+        if not keys:
+            return []
+        keys_by_id = {key[2]: key for key in keys}
+        statement = (
+            select(Transaction, Category.name)
+            .outerjoin(Category, Transaction.category_id == Category.id)
+            .where(Transaction.id.in_(keys_by_id))
+        )
+        return sorted(
+            (
+                (transaction, category, keys_by_id[transaction.id])
+                for transaction, category in session.exec(statement)
+            ),
+            key=lambda row: row[2],
+            reverse=True,
+        )
+
+    def stream_transactions(
+        self, session: Session, user: User, batch_size: int
+    ) -> Iterator[list[tuple[int, datetime, int, str, str | None]]]:
+        statement = (
+            select(
+                Transaction.id,
+                Transaction.occurred_at,
+                Transaction.amount,
+                Transaction.description,
+                Category.name,
+            )
+            .outerjoin(Category, Transaction.category_id == Category.id)
+            .where(Transaction.user_id == user.id)
+            .order_by(Transaction.occurred_at, Transaction.id)
+            .execution_options(yield_per=batch_size)
+        )
+        # Running on the connection skips the ORM's row processing.
+        return session.connection().execute(statement).partitions()
+
+    def delete_transaction(self, session: Session, user: User, id: int) -> None:
+        condition = and_(Transaction.user_id == user.id, Transaction.id == id)
+        columns = (
+            Transaction.category_id,
+            Transaction.occurred_at,
+            Transaction.amount,
+        )
+        statement = delete(Transaction).where(condition)
+        if session.get_bind().dialect.delete_returning:
+            deleted = session.execute(statement.returning(*columns)).all()
+        else:
+            deleted = session.execute(select(*columns).where(condition)).all()
+            session.execute(statement)
+        if not deleted:
+            raise ObjectNotFoundError("No transaction with that ID exists.")
+        self.__account_for(session, user, deleted, sign=-1)
+
+    def __account_for(
+        self,
+        session: Session,
+        user: User,
+        transactions: list[tuple[int | None, datetime, int]],
+        sign: int = 1,
+    ) -> None:
+        # Monthly totals and balances are kept in step with the ledger in the
+        # same transaction.
+        update_monthly_totals(
+            session, user.id, summarize_monthly_changes(transactions, sign)
+        )
+        update_balances(session, user.id, summarize_daily_changes(transactions, sign))
+
+    def __apply_filters(
+        self, statement: Select, user: User, filters: TransactionFilter
+    ) -> Select:
+        if filters.category is not None:
+            category_id = (
+                select(Category.id)
+                .where(Category.user_id == user.id, Category.name == filters.category)
+                .scalar_subquery()
+            )
+            statement = statement.where(Transaction.category_id == category_id)
+        if filters.start is not None:
+            statement = statement.where(Transaction.occurred_at >= filters.start)
+        if filters.end is not None:
+            statement = statement.where(Transaction.occurred_at < filters.end)
+        return statement
+
+    def __skip_existing_hashes(
+        self, session: Session, user: User, rows: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        hashes = [row["content_hash"] for row in rows]
+        statement = select(Transaction.content_hash).where(
+            Transaction.user_id == user.id, Transaction.content_hash.in_(hashes)
+        )
+        existing = set(session.exec(statement).all())
+        return [row for row in rows if row["content_hash"] not in existing]
+
+
+def clear_transaction_categories(
+    session: Session, user_id: str, category_ids: list[int] | Select
+) -> None:
+    # Run before the categories are deleted. ON DELETE SET NULL is not relied
+    # on, as SQLite only applies it on connections that enforce foreign keys,
+    # and a dangling id could later point at another user's category.
+    statement = (
+        update(Transaction)
+        .where(
+            Transaction.user_id == user_id, Transaction.category_id.in_(category_ids)
+        )
+        .values(category_id=None)
+    )
+    session.execute(statement)
+
+
+def to_search_terms(query: str) -> list[str]:
+    return re.findall(r"\w+", query.lower())[:MAX_SEARCH_TERMS]
+
+
+def to_match_expression(terms: list[str]) -> str:
+    # Terms are quoted, so that words such as AND or NEAR are not read as
+    # FTS5 operators. Each matches the words it starts, itself included.
+    return " AND ".join(f'"{term}"*' for term in terms)
+
+
+def score_description(description: str, terms: list[str]) -> int:
+    # Counts the terms that are whole words of the description, which ranks
+    # whole words above longer words they start. Diacritics are ignored, as
+    # they are by the FTS5 tokenizer.
+    words = set(re.findall(r"\w+", _remove_diacritics(description.lower())))
+    return sum(_remove_diacritics(term) in words for term in terms)
+
+
+def _remove_diacritics(text: str) -> str:
+    if text.isascii():
+        return text
+    return "".join(
+        character
+        for character in unicodedata.normalize("NFKD", text)
+        if not unicodedata.combining(character)
+    )
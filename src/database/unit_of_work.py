@@ -0,0 +1,56 @@
+from typing import Callable
+
+from injector import inject
+from sqlalchemy import event
+from sqlmodel import Session
+
+from src.database.i_database import IDatabase
+from src.database.i_unit_of_work import IUnitOfWork
+
+_LOADED_OBJECTS = "unit_of_work_loaded_objects"
+
+
+# The identity map only holds weak references. Keeping loaded objects alive
+# lets later lookups in the same unit of work, such as the user fetched during
+# authentication, skip the database.
+@event.listens_for(Session, "loaded_as_persistent")
+def _keep_loaded(session: Session, instance: object) -> None:
+    loaded = session.info.get(_LOADED_OBJECTS)
+    if loaded is not None:
+        loaded.append(instance)
+
+
+class UnitOfWork(IUnitOfWork):
+    @inject
+    def __init__(self, database: IDatabase):
+        self.__database = database
+        self.__session: Session | None = None
+        self.__callbacks: list[Callable[[], None]] = []
+        self.__loaded: list[object] = []
+
+    def get_session(self) -> Session:
+        if self.__session is None:
+            self.__session = self.__database.get_session()
+            # Commit is the last step of a unit of work, so expiring objects
+            # would only make the after-commit callbacks reload them.
+            self.__session.expire_on_commit = False
+            self.__session.info[_LOADED_OBJECTS] = self.__loaded
+        return self.__session
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        self.__callbacks.append(callback)
+
+    def commit(self) -> None:
+        if self.__session is None:
+            return
+        self.__session.commit()
+        callbacks, self.__callbacks = self.__callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def close(self) -> None:
+        self.__callbacks = []
+        self.__loaded = []
+        if self.__session is not None:
+            self.__session.close()
+            self.__session = None
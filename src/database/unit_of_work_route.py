@@ -0,0 +1,26 @@
+from typing import Callable, Coroutine
+
+from fastapi import Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.routing import APIRoute
+from fastapi_injector import get_injector_instance
+
+from src.database.i_unit_of_work import IUnitOfWork
+
+
+class UnitOfWorkRoute(APIRoute):
+    # The commit runs after the endpoint has built its response but before
+    # the response is sent, so a failed commit is never reported as success.
+    def get_route_handler(self) -> Callable[[Request], Coroutine[None, None, Response]]:
+        route_handler = super().get_route_handler()
+
+        async def unit_of_work_route_handler(request: Request) -> Response:
+            unit_of_work = get_injector_instance(request.app).get(IUnitOfWork)
+            try:
+                response = await route_handler(request)
+                await run_in_threadpool(unit_of_work.commit)
+                return response
+            finally:
+                await run_in_threadpool(unit_of_work.close)
+
+        return unit_of_work_route_handler
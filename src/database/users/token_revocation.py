@@ -0,0 +1,15 @@
+from datetime import datetime
+
+from sqlmodel import Field, SQLModel
+
+from src.database.binary_uuid import BinaryUuid
+
+
+class TokenRevocation(SQLModel, table=True):
+    __tablename__ = "token_revocation"
+
+    id: int | None = Field(default=None, primary_key=True)
+    # Not a foreign key, since deleting a user must also revoke their tokens.
+    user_id: str = Field(index=True, sa_type=BinaryUuid)
+    token_version: int
+    revoked_at: datetime = Field(default_factory=datetime.utcnow, index=True)
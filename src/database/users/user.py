@@ -3,7 +3,8 @@ from typing import TYPE_CHECKING
 from pydantic import EmailStr, Extra
 from sqlmodel import Field, Relationship, SQLModel
 
-from src.common.utils import str_uuid4
+from src.common.utils import str_uuid7
+from src.database.binary_uuid import BinaryUuid
 
 if TYPE_CHECKING:
     from src.database.categories.category import Category
@@ -35,11 +36,13 @@ class UserUpdatePassword(SQLModel):
 
 class User(UserBase, table=True):
     id: str = Field(
-        default_factory=str_uuid4, index=True, nullable=False, primary_key=True
+        default_factory=str_uuid7, nullable=False, primary_key=True, sa_type=BinaryUuid
     )
+    email: EmailStr = Field(index=True, unique=True)
     hashed_password: str | None = None
+    token_version: int = Field(default=0, nullable=False)
 
     categories: list["Category"] = Relationship(
         back_populates="user",
-        sa_relationship_kwargs={"lazy": "selectin", "cascade": "delete"},
+        sa_relationship_kwargs={"cascade": "delete"},
     )
@@ -2,17 +2,88 @@ from fastapi_injector import request_scope
 from injector import singleton
 from passlib.context import CryptContext
 
+from src.analytics.i_ledger_cache import ILedgerCache
+from src.analytics.ledger_cache import LedgerCache
+from src.authentication.async_authentication import AsyncAuthentication
+from src.authentication.async_token_revocations import AsyncTokenRevocations
 from src.authentication.authentication import Authentication
+from src.authentication.crypt_context import provide_crypt_context
+from src.authentication.i_async_authentication import IAsyncAuthentication
+from src.authentication.i_async_token_revocations import IAsyncTokenRevocations
 from src.authentication.i_authentication import IAuthentication
 from src.authentication.i_password_handler import IPasswordHandler
+from src.authentication.i_token_revocations import ITokenRevocations
+from src.authentication.i_user_cache import IUserCache
 from src.authentication.password_handler import PasswordHandler
+from src.authentication.token_revocations import TokenRevocations
+from src.authentication.user_cache import UserCache
 from src.common.i_jwt_encoder import IJwtEncoder
+from src.common.i_resource_versions import IResourceVersions
 from src.common.jwt_encoder import JwtEncoder
+from src.common.resource_versions import ResourceVersions
 from src.common.settings import Settings
+from src.database.async_database import AsyncDatabase
+from src.database.async_write_coalescer import AsyncWriteCoalescer
+from src.database.categories.category_database_handler import CategoryDatabaseHandler
+from src.database.categories.i_category_database_handler import ICategoryDatabaseHandler
 from src.database.database import Database
+from src.database.i_async_database import IAsyncDatabase
+from src.database.i_async_write_coalescer import IAsyncWriteCoalescer
 from src.database.i_database import IDatabase
 from src.database.i_database_deleter import IDatabaseDeleter
+from src.database.i_unit_of_work import IUnitOfWork
+from src.database.transactions.analytics_database_handler import (
+    AnalyticsDatabaseHandler,
+)
+from src.database.transactions.balance_database_handler import (
+    BalanceDatabaseHandler,
+)
+from src.database.transactions.i_analytics_database_handler import (
+    IAnalyticsDatabaseHandler,
+)
+from src.database.transactions.i_balance_database_handler import (
+    IBalanceDatabaseHandler,
+)
+from src.database.transactions.i_monthly_total_database_handler import (
+    IMonthlyTotalDatabaseHandler,
+)
+from src.database.transactions.i_transaction_database_handler import (
+    ITransactionDatabaseHandler,
+)
+from src.database.transactions.monthly_total_database_handler import (
+    MonthlyTotalDatabaseHandler,
+)
+from src.database.transactions.transaction_database_handler import (
+    TransactionDatabaseHandler,
+)
+from src.database.unit_of_work import UnitOfWork
+from src.managers.analytics_manager import AnalyticsManager
+from src.managers.async_analytics_manager import AsyncAnalyticsManager
+from src.managers.async_category_manager import AsyncCategoryManager
+from src.managers.async_export_manager import AsyncExportManager
+from src.managers.async_transaction_import_manager import (
+    AsyncTransactionImportManager,
+)
+from src.managers.async_transaction_manager import AsyncTransactionManager
+from src.managers.async_user_manager import AsyncUserManager
+from src.managers.category_manager import CategoryManager
+from src.managers.export_manager import ExportManager
+from src.managers.i_analytics_manager import IAnalyticsManager
+from src.managers.i_async_analytics_manager import IAsyncAnalyticsManager
+from src.managers.i_async_category_manager import IAsyncCategoryManager
+from src.managers.i_async_export_manager import IAsyncExportManager
+from src.managers.i_async_transaction_import_manager import (
+    IAsyncTransactionImportManager,
+)
+from src.managers.i_async_transaction_manager import IAsyncTransactionManager
+from src.managers.i_async_user_manager import IAsyncUserManager
+from src.managers.i_category_manager import ICategoryManager
+from src.managers.i_export_manager import IExportManager
+from src.managers.i_transaction_import_manager import ITransactionImportManager
+from src.managers.i_transaction_manager import ITransactionManager
 from src.managers.i_user_manager import IUserManager
+from src.managers.transaction_import_manager import TransactionImportManager
+from src.managers.transaction_manager import TransactionManager
 from src.managers.user_manager import UserManager
 from src.multi_injector import MultiInjector
 
@@ -20,14 +91,81 @@ injector_instance = MultiInjector()
 
 injector_instance.binder.bind(Settings, to=Settings, scope=singleton)
 injector_instance.binder.bind(IJwtEncoder, JwtEncoder, scope=singleton)
+injector_instance.binder.bind(CryptContext, to=provide_crypt_context, scope=singleton)
+# The routers use either database layer, never both, so the other one is not
+# bound and no connections are opened for it.
+if injector_instance.get(Settings).async_database:
+    injector_instance.binder.bind(IAsyncDatabase, to=AsyncDatabase, scope=singleton)
+else:
+    injector_instance.binder.bind_several(
+        [IDatabase, IDatabaseDeleter], Database, scope=singleton
+    )
+injector_instance.binder.bind(IPasswordHandler, to=PasswordHandler, scope=singleton)
+injector_instance.binder.bind(IUserCache, to=UserCache, scope=singleton)
 injector_instance.binder.bind(
-    CryptContext,
-    to=CryptContext(schemes=["bcrypt"], deprecated=["auto"]),
-    scope=singleton,
+    IResourceVersions, to=ResourceVersions, scope=singleton
 )
-injector_instance.binder.bind_several(
-    [IDatabase, IDatabaseDeleter], Database, scope=singleton
+injector_instance.binder.bind(
+    ITokenRevocations, to=TokenRevocations, scope=singleton
+)
+injector_instance.binder.bind(
+    IAsyncTokenRevocations, to=AsyncTokenRevocations, scope=singleton
+)
+injector_instance.binder.bind(IUnitOfWork, to=UnitOfWork, scope=request_scope)
+injector_instance.binder.bind(
+    IAuthentication, to=Authentication, scope=request_scope
 )
-injector_instance.binder.bind(IPasswordHandler, to=PasswordHandler, scope=singleton)
-injector_instance.binder.bind(IAuthentication, to=Authentication, scope=singleton)
 injector_instance.binder.bind(IUserManager, to=UserManager, scope=request_scope)
+injector_instance.binder.bind(
+    IAsyncWriteCoalescer, to=AsyncWriteCoalescer, scope=singleton
+)
+injector_instance.binder.bind(
+    IAsyncAuthentication, to=AsyncAuthentication, scope=request_scope
+)
+injector_instance.binder.bind(
+    IAsyncUserManager, to=AsyncUserManager, scope=request_scope
+)
+injector_instance.binder.bind(
+    ICategoryDatabaseHandler, to=CategoryDatabaseHandler, scope=singleton
+)
+injector_instance.binder.bind(
+    IAsyncCategoryManager, to=AsyncCategoryManager, scope=request_scope
+)
+injector_instance.binder.bind(
+    ICategoryManager, to=CategoryManager, scope=request_scope
+)
+injector_instance.binder.bind(
+    ITransactionDatabaseHandler, to=TransactionDatabaseHandler, scope=singleton
+)
+injector_instance.binder.bind(
+    IMonthlyTotalDatabaseHandler, to=MonthlyTotalDatabaseHandler, scope=singleton
+)
+injector_instance.binder.bind(
+    IBalanceDatabaseHandler, to=BalanceDatabaseHandler, scope=singleton
+)
+injector_instance.binder.bind(
+    IAsyncTransactionManager, to=AsyncTransactionManager, scope=request_scope
+)
+injector_instance.binder.bind(
+    ITransactionManager, to=TransactionManager, scope=request_scope
+)
+injector_instance.binder.bind(
+    ITransactionImportManager, to=TransactionImportManager, scope=singleton
+)
+injector_instance.binder.bind(
+    IAsyncTransactionImportManager, to=AsyncTransactionImportManager, scope=singleton
+)
+injector_instance.binder.bind(IExportManager, to=ExportManager, scope=singleton)
+injector_instance.binder.bind(
+    IAsyncExportManager, to=AsyncExportManager, scope=singleton
+)
+injector_instance.binder.bind(ILedgerCache, to=LedgerCache, scope=singleton)
+injector_instance.binder.bind(
+    IAnalyticsDatabaseHandler, to=AnalyticsDatabaseHandler, scope=singleton
+)
+injector_instance.binder.bind(
+    IAsyncAnalyticsManager, to=AsyncAnalyticsManager, scope=request_scope
+)
+injector_instance.binder.bind(
+    IAnalyticsManager, to=AnalyticsManager, scope=request_scope
+)
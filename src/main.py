@@ -2,16 +2,35 @@ from fastapi import FastAPI
 from fastapi_injector import InjectorMiddleware, attach_injector
 from injector import Injector
 
+from src.analytics.api import router as analytics_router
+from src.analytics.async_api import router as async_analytics_router
 from src.authentication.api import router as auth_router
+from src.authentication.async_api import router as async_auth_router
+from src.authentication.i_password_handler import IPasswordHandler
+from src.categories.api import router as categories_router
+from src.categories.async_api import router as async_categories_router
+from src.common.settings import Settings
 from src.dependencies import injector_instance
+from src.transactions.api import router as transactions_router
+from src.transactions.async_api import router as async_transactions_router
 
 
 def create_app(injector: Injector):
     created_app = FastAPI(title="Cash Backend")
     created_app.add_middleware(InjectorMiddleware, injector=injector)
     attach_injector(created_app, injector)
-    created_app.include_router(auth_router)
+    if injector.get(Settings).async_database:
+        created_app.include_router(async_auth_router)
+        created_app.include_router(async_categories_router)
+        created_app.include_router(async_transactions_router)
+        created_app.include_router(async_analytics_router)
+    else:
+        created_app.include_router(auth_router)
+        created_app.include_router(categories_router)
+        created_app.include_router(transactions_router)
+        created_app.include_router(analytics_router)
     return created_app
 
 
 app = create_app(injector_instance)
+app.add_event_handler("shutdown", injector_instance.get(IPasswordHandler).shutdown)
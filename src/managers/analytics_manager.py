@@ -0,0 +1,67 @@
+from injector import inject
+
+from src.analytics.i_ledger_cache import ILedgerCache
+from src.analytics.reports import (
+    check_daily_spend_filter,
+    compare_years,
+    summarize_category_spend,
+    summarize_daily_spend,
+    summarize_monthly_spend,
+)
+from src.database.i_unit_of_work import IUnitOfWork
+from src.database.transactions.analytics import (
+    CategorySpendRead,
+    DailySpendFilter,
+    DailySpendRead,
+    Ledger,
+    MonthlySpendRead,
+    SpendFilter,
+    YearOverYearRead,
+)
+from src.database.transactions.i_analytics_database_handler import (
+    IAnalyticsDatabaseHandler,
+)
+from src.database.transactions.monthly_total import MonthlyTotalFilter
+from src.database.users.user import User
+from src.managers.i_analytics_manager import IAnalyticsManager
+
+
+class AnalyticsManager(IAnalyticsManager):
+    @inject
+    def __init__(
+        self,
+        unit_of_work: IUnitOfWork,
+        ledger_cache: ILedgerCache,
+        analytics_handler: IAnalyticsDatabaseHandler,
+    ):
+        self.__unit_of_work = unit_of_work
+        self.__ledger_cache = ledger_cache
+        self.__analytics_handler = analytics_handler
+
+    def get_category_spend(
+        self, user: User, filters: SpendFilter
+    ) -> list[CategorySpendRead]:
+        return summarize_category_spend(self.__get_ledger(user), filters)
+
+    def get_daily_spend(
+        self, user: User, filters: DailySpendFilter, window: int
+    ) -> list[DailySpendRead]:
+        check_daily_spend_filter(filters, window)
+        return summarize_daily_spend(self.__get_ledger(user), filters, window)
+
+    def get_monthly_spend(
+        self, user: User, filters: MonthlyTotalFilter
+    ) -> MonthlySpendRead:
+        return summarize_monthly_spend(self.__get_ledger(user), filters)
+
+    def get_year_over_year(self, user: User, year: int) -> list[YearOverYearRead]:
+        return compare_years(self.__get_ledger(user), year)
+
+    def __get_ledger(self, user: User) -> Ledger:
+        ledger = self.__ledger_cache.get_ledger(user)
+        if ledger is None:
+            generation = self.__ledger_cache.get_generation()
+            session = self.__unit_of_work.get_session()
+            ledger = self.__analytics_handler.get_ledger(session, user)
+            self.__ledger_cache.add_ledger(user, ledger, generation)
+        return ledger
@@ -0,0 +1,76 @@
+from fastapi.concurrency import run_in_threadpool
+from injector import inject
+
+from src.analytics.i_ledger_cache import ILedgerCache
+from src.analytics.reports import (
+    check_daily_spend_filter,
+    compare_years,
+    summarize_category_spend,
+    summarize_daily_spend,
+    summarize_monthly_spend,
+)
+from src.database.i_async_database import IAsyncDatabase
+from src.database.transactions.analytics import (
+    CategorySpendRead,
+    DailySpendFilter,
+    DailySpendRead,
+    Ledger,
+    MonthlySpendRead,
+    SpendFilter,
+    YearOverYearRead,
+)
+from src.database.transactions.i_analytics_database_handler import (
+    IAnalyticsDatabaseHandler,
+)
+from src.database.transactions.monthly_total import MonthlyTotalFilter
+from src.database.users.user import User
+from src.managers.i_async_analytics_manager import IAsyncAnalyticsManager
+
+
+class AsyncAnalyticsManager(IAsyncAnalyticsManager):
+    @inject
+    def __init__(
+        self,
+        database: IAsyncDatabase,
+        ledger_cache: ILedgerCache,
+        analytics_handler: IAnalyticsDatabaseHandler,
+    ):
+        self.__database = database
+        self.__ledger_cache = ledger_cache
+        self.__analytics_handler = analytics_handler
+
+    async def get_category_spend(
+        self, user: User, filters: SpendFilter
+    ) -> list[CategorySpendRead]:
+        # Reports are computed off the event loop, since a long history takes
+        # numpy a noticeable time to sort and sum.
+        ledger = await self.__get_ledger(user)
+        return await run_in_threadpool(summarize_category_spend, ledger, filters)
+
+    async def get_daily_spend(
+        self, user: User, filters: DailySpendFilter, window: int
+    ) -> list[DailySpendRead]:
+        check_daily_spend_filter(filters, window)
+        ledger = await self.__get_ledger(user)
+        return await run_in_threadpool(summarize_daily_spend, ledger, filters, window)
+
+    async def get_monthly_spend(
+        self, user: User, filters: MonthlyTotalFilter
+    ) -> MonthlySpendRead:
+        ledger = await self.__get_ledger(user)
+        return await run_in_threadpool(summarize_monthly_spend, ledger, filters)
+
+    async def get_year_over_year(self, user: User, year: int) -> list[YearOverYearRead]:
+        ledger = await self.__get_ledger(user)
+        return await run_in_threadpool(compare_years, ledger, year)
+
+    async def __get_ledger(self, user: User) -> Ledger:
+        ledger = self.__ledger_cache.get_ledger(user)
+        if ledger is None:
+            generation = self.__ledger_cache.get_generation()
+            async with self.__database.get_session() as session:
+                ledger = await session.run_sync(
+                    self.__analytics_handler.get_ledger, user
+                )
+            self.__ledger_cache.add_ledger(user, ledger, generation)
+        return ledger
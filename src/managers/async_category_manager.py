@@ -0,0 +1,104 @@
+from injector import inject
+from sqlalchemy.exc import IntegrityError
+
+from src.analytics.i_ledger_cache import ILedgerCache
+from src.common.etags import VersionedResource
+from src.common.i_resource_versions import IResourceVersions
+from src.common.pagination import DEFAULT_PAGE_SIZE
+from src.database.categories.category import (
+    Category,
+    CategoryBulkResult,
+    CategoryBulkStatus,
+    CategoryCreate,
+    CategoryPage,
+)
+from src.database.categories.i_category_database_handler import ICategoryDatabaseHandler
+from src.database.i_async_database import IAsyncDatabase
+from src.database.i_async_write_coalescer import IAsyncWriteCoalescer
+from src.database.users.user import User
+from src.managers.category_manager import (
+    create_bulk_results,
+    create_category_page,
+    decode_category_cursor,
+)
+from src.managers.i_async_category_manager import IAsyncCategoryManager
+
+
+class AsyncCategoryManager(IAsyncCategoryManager):
+    """Runs the synchronous category handler through AsyncSession.run_sync,
+    so queries are shared with CategoryManager while IO stays async."""
+
+    @inject
+    def __init__(
+        self,
+        database: IAsyncDatabase,
+        write_coalescer: IAsyncWriteCoalescer,
+        ledger_cache: ILedgerCache,
+        resource_versions: IResourceVersions,
+        category_handler: ICategoryDatabaseHandler,
+    ):
+        self.__database = database
+        self.__write_coalescer = write_coalescer
+        self.__ledger_cache = ledger_cache
+        self.__resource_versions = resource_versions
+        self.__category_handler = category_handler
+
+    async def create_category(self, user: User, data: CategoryCreate) -> Category:
+        try:
+            category = await self.__write_coalescer.write(
+                self.__category_handler.create_category, user, data.name
+            )
+        except IntegrityError as exc:
+            raise ValueError("Category with that name already exists") from exc
+        self.__resource_versions.invalidate(VersionedResource.CATEGORIES, user.id)
+        return category
+
+    async def create_categories(
+        self, user: User, names: list[str]
+    ) -> list[CategoryBulkResult]:
+        names = list(dict.fromkeys(names))
+        async with self.__database.get_session() as session:
+            created = await session.run_sync(
+                self.__category_handler.create_categories, user, names
+            )
+            await session.commit()
+        self.__resource_versions.invalidate(VersionedResource.CATEGORIES, user.id)
+        return create_bulk_results(
+            names,
+            created,
+            CategoryBulkStatus.CREATED,
+            CategoryBulkStatus.ALREADY_EXISTS,
+        )
+
+    async def get_categories(
+        self, user: User, cursor: str | None = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> CategoryPage:
+        after = decode_category_cursor(cursor)
+        async with self.__database.get_session() as session:
+            categories = await session.run_sync(
+                self.__category_handler.get_categories, user, after, limit + 1
+            )
+            return create_category_page(categories, limit)
+
+    async def delete_category(self, user: User, name: str) -> None:
+        async with self.__database.get_session() as session:
+            await session.run_sync(self.__category_handler.delete_category, user, name)
+            await session.commit()
+        self.__resource_versions.invalidate(VersionedResource.CATEGORIES, user.id)
+        # Transactions of deleted categories become uncategorized.
+        self.__ledger_cache.invalidate_user(user)
+
+    async def delete_categories(
+        self, user: User, names: list[str]
+    ) -> list[CategoryBulkResult]:
+        names = list(dict.fromkeys(names))
+        async with self.__database.get_session() as session:
+            deleted = await session.run_sync(
+                self.__category_handler.delete_categories, user, names
+            )
+            await session.commit()
+        self.__resource_versions.invalidate(VersionedResource.CATEGORIES, user.id)
+        self.__ledger_cache.invalidate_user(user)
+        return create_bulk_results(
+            names, deleted, CategoryBulkStatus.DELETED, CategoryBulkStatus.NOT_FOUND
+        )
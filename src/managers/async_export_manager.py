@@ -0,0 +1,76 @@
+from functools import partial
+from typing import AsyncIterator, Callable, Iterator
+
+from fastapi.concurrency import run_in_threadpool
+from injector import inject
+from sqlmodel import Session
+
+from src.common.exports import ExportEncoder, ExportFormat
+from src.common.settings import Settings
+from src.database.categories.i_category_database_handler import ICategoryDatabaseHandler
+from src.database.i_async_database import IAsyncDatabase
+from src.database.transactions.i_transaction_database_handler import (
+    ITransactionDatabaseHandler,
+)
+from src.database.users.user import User
+from src.managers.export_manager import (
+    CATEGORY_COLUMNS,
+    create_transaction_encoder,
+    encode_transactions,
+)
+from src.managers.i_async_export_manager import IAsyncExportManager
+
+
+class AsyncExportManager(IAsyncExportManager):
+    @inject
+    def __init__(
+        self,
+        settings: Settings,
+        database: IAsyncDatabase,
+        category_handler: ICategoryDatabaseHandler,
+        transaction_handler: ITransactionDatabaseHandler,
+    ):
+        self.__batch_size = settings.export_batch_size
+        self.__database = database
+        self.__category_handler = category_handler
+        self.__transaction_handler = transaction_handler
+
+    def export_categories(
+        self, user: User, format: ExportFormat, compress: bool
+    ) -> AsyncIterator[bytes]:
+        encoder = ExportEncoder(format, CATEGORY_COLUMNS, compress)
+        return self.__export(
+            user, encoder, self.__category_handler.stream_categories, encoder.encode
+        )
+
+    def export_transactions(
+        self, user: User, format: ExportFormat, compress: bool
+    ) -> AsyncIterator[bytes]:
+        encoder = create_transaction_encoder(format, compress)
+        return self.__export(
+            user,
+            encoder,
+            self.__transaction_handler.stream_transactions,
+            partial(encode_transactions, encoder, format),
+        )
+
+    async def __export(
+        self,
+        user: User,
+        encoder: ExportEncoder,
+        stream: Callable,
+        encode: Callable[[list[tuple]], bytes],
+    ) -> AsyncIterator[bytes]:
+        # The cursor can only be read inside run_sync, so every batch is
+        # fetched by a call of its own, and encoded off the event loop.
+        yield encoder.begin()
+        async with self.__database.get_session() as session:
+            batches = await session.run_sync(stream, user, self.__batch_size)
+            while (rows := await session.run_sync(next_batch, batches)) is not None:
+                if chunk := await run_in_threadpool(encode, rows):
+                    yield chunk
+        yield encoder.end()
+
+
+def next_batch(session: Session, batches: Iterator[list[tuple]]) -> list[tuple] | None:
+    return next(batches, None)
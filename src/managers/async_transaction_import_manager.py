@@ -0,0 +1,63 @@
+from itertools import islice
+from typing import AsyncIterator, Iterable
+
+from fastapi.concurrency import run_in_threadpool
+from injector import inject
+
+from src.analytics.i_ledger_cache import ILedgerCache
+from src.common.settings import Settings
+from src.database.categories.i_category_database_handler import ICategoryDatabaseHandler
+from src.database.i_async_database import IAsyncDatabase
+from src.database.transactions.i_transaction_database_handler import (
+    ITransactionDatabaseHandler,
+)
+from src.database.transactions.transaction import (
+    TransactionImportError,
+    TransactionImportProgress,
+)
+from src.database.users.user import User
+from src.managers.i_async_transaction_import_manager import (
+    IAsyncTransactionImportManager,
+)
+from src.managers.transaction_import_manager import import_batch, update_progress
+from src.transactions.statements import StatementRow
+
+
+class AsyncTransactionImportManager(IAsyncTransactionImportManager):
+    @inject
+    def __init__(
+        self,
+        settings: Settings,
+        database: IAsyncDatabase,
+        ledger_cache: ILedgerCache,
+        category_handler: ICategoryDatabaseHandler,
+        transaction_handler: ITransactionDatabaseHandler,
+    ):
+        self.__batch_size = settings.transaction_import_batch_size
+        self.__max_errors = settings.transaction_import_max_errors
+        self.__database = database
+        self.__ledger_cache = ledger_cache
+        self.__category_handler = category_handler
+        self.__transaction_handler = transaction_handler
+
+    async def import_transactions(
+        self, user: User, rows: Iterable[StatementRow | TransactionImportError]
+    ) -> AsyncIterator[TransactionImportProgress]:
+        # Parsing reads the uploaded file, so batches are read off the event
+        # loop.
+        progress = TransactionImportProgress()
+        rows = iter(rows)
+        while batch := await run_in_threadpool(list, islice(rows, self.__batch_size)):
+            async with self.__database.get_session() as session:
+                inserted, errors = await session.run_sync(
+                    import_batch,
+                    user,
+                    batch,
+                    self.__category_handler,
+                    self.__transaction_handler,
+                )
+                await session.commit()
+            self.__ledger_cache.invalidate_user(user)
+            yield update_progress(progress, batch, inserted, errors, self.__max_errors)
+        progress.done = True
+        yield progress
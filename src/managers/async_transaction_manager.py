@@ -0,0 +1,139 @@
+from datetime import date
+
+from injector import inject
+
+from src.analytics.i_ledger_cache import ILedgerCache
+from src.common.pagination import DEFAULT_PAGE_SIZE
+from src.database.i_async_database import IAsyncDatabase
+from src.database.i_async_write_coalescer import IAsyncWriteCoalescer
+from src.database.transactions.balance import BalanceRead, BalanceSeriesFilter
+from src.database.transactions.i_balance_database_handler import (
+    IBalanceDatabaseHandler,
+)
+from src.database.transactions.i_monthly_total_database_handler import (
+    IMonthlyTotalDatabaseHandler,
+)
+from src.database.transactions.i_transaction_database_handler import (
+    ITransactionDatabaseHandler,
+)
+from src.database.transactions.monthly_total import (
+    MonthlyTotalFilter,
+    MonthlyTotalRead,
+)
+from src.database.transactions.transaction import (
+    TransactionCreate,
+    TransactionFilter,
+    TransactionPage,
+    TransactionRead,
+    TransactionSearchFilter,
+)
+from src.database.users.user import User
+from src.managers.i_async_transaction_manager import IAsyncTransactionManager
+from src.managers.transaction_manager import (
+    create_balance_reads,
+    create_monthly_total_reads,
+    create_search_page,
+    create_transaction_page,
+    create_transaction_read,
+    decode_search_cursor,
+    decode_transaction_cursor,
+    get_balance_series_days,
+)
+
+
+class AsyncTransactionManager(IAsyncTransactionManager):
+    @inject
+    def __init__(
+        self,
+        database: IAsyncDatabase,
+        write_coalescer: IAsyncWriteCoalescer,
+        ledger_cache: ILedgerCache,
+        transaction_handler: ITransactionDatabaseHandler,
+        monthly_total_handler: IMonthlyTotalDatabaseHandler,
+        balance_handler: IBalanceDatabaseHandler,
+    ):
+        self.__database = database
+        self.__write_coalescer = write_coalescer
+        self.__ledger_cache = ledger_cache
+        self.__transaction_handler = transaction_handler
+        self.__monthly_total_handler = monthly_total_handler
+        self.__balance_handler = balance_handler
+
+    async def create_transaction(
+        self, user: User, data: TransactionCreate
+    ) -> TransactionRead:
+        transaction = await self.__write_coalescer.write(
+            self.__transaction_handler.create_transaction, user, data
+        )
+        self.__ledger_cache.invalidate_user(user)
+        return create_transaction_read(transaction, data.category)
+
+    async def get_transactions(
+        self,
+        user: User,
+        filters: TransactionFilter,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> TransactionPage:
+        after = decode_transaction_cursor(cursor)
+        async with self.__database.get_session() as session:
+            transactions = await session.run_sync(
+                self.__transaction_handler.get_transactions,
+                user,
+                filters,
+                after,
+                limit + 1,
+            )
+            return create_transaction_page(transactions, limit)
+
+    async def search_transactions(
+        self,
+        user: User,
+        filters: TransactionSearchFilter,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> TransactionPage:
+        after = decode_search_cursor(cursor)
+        async with self.__database.get_session() as session:
+            transactions = await session.run_sync(
+                self.__transaction_handler.search_transactions,
+                user,
+                filters,
+                after,
+                limit + 1,
+            )
+            return create_search_page(transactions, limit)
+
+    async def get_monthly_totals(
+        self, user: User, filters: MonthlyTotalFilter
+    ) -> list[MonthlyTotalRead]:
+        async with self.__database.get_session() as session:
+            totals = await session.run_sync(
+                self.__monthly_total_handler.get_monthly_totals, user, filters
+            )
+            return create_monthly_total_reads(totals)
+
+    async def get_balance(self, user: User, day: date) -> BalanceRead:
+        async with self.__database.get_session() as session:
+            balance = await session.run_sync(
+                self.__balance_handler.get_balance, user, day
+            )
+            return BalanceRead(day=day, balance=balance)
+
+    async def get_balance_series(
+        self, user: User, filters: BalanceSeriesFilter
+    ) -> list[BalanceRead]:
+        days = get_balance_series_days(filters)
+        async with self.__database.get_session() as session:
+            balances = await session.run_sync(
+                self.__balance_handler.get_balances, user, days
+            )
+            return create_balance_reads(days, balances)
+
+    async def delete_transaction(self, user: User, id: int) -> None:
+        async with self.__database.get_session() as session:
+            await session.run_sync(
+                self.__transaction_handler.delete_transaction, user, id
+            )
+            await session.commit()
+        self.__ledger_cache.invalidate_user(user)
@@ -0,0 +1,124 @@
+from injector import inject
+from pydantic import EmailStr
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+
+from src.authentication.i_async_token_revocations import IAsyncTokenRevocations
+from src.authentication.i_password_handler import IPasswordHandler
+from src.authentication.i_user_cache import IUserCache
+from src.common.exceptions import ObjectNotFoundError
+from src.common.i_resource_versions import IResourceVersions
+from src.common.settings import Settings
+from src.common.utils import create_id_factory, is_uuid
+from src.database.i_async_database import IAsyncDatabase
+from src.database.i_async_write_coalescer import IAsyncWriteCoalescer
+from src.database.users.token_revocation import TokenRevocation
+from src.database.users.user import User, UserCreate, UserUpdate
+from src.managers.i_async_user_manager import IAsyncUserManager
+from src.managers.user_manager import create_token_revocation
+
+
+class AsyncUserManager(IAsyncUserManager):
+    @inject
+    def __init__(
+        self,
+        database: IAsyncDatabase,
+        write_coalescer: IAsyncWriteCoalescer,
+        password_handler: IPasswordHandler,
+        user_cache: IUserCache,
+        token_revocations: IAsyncTokenRevocations,
+        resource_versions: IResourceVersions,
+        settings: Settings,
+    ):
+        self.__database = database
+        self.__write_coalescer = write_coalescer
+        self.__password_handler = password_handler
+        self.__user_cache = user_cache
+        self.__token_revocations = token_revocations
+        self.__resource_versions = resource_versions
+        self.__create_id = create_id_factory(settings.id_scheme)
+
+    async def create_user(self, user: UserCreate) -> User:
+        hashed_password = await self.__password_handler.hash_password_async(
+            user.password
+        )
+        db_user = User.from_orm(user)
+        db_user.id = self.__create_id()
+        db_user.hashed_password = hashed_password
+
+        try:
+            await self.__write_coalescer.write(Session.add, db_user)
+        except IntegrityError as exc:
+            raise ValueError("User with that email already exists") from exc
+        return db_user
+
+    async def get_user(self, id: str) -> User | None:
+        async with self.__database.get_session() as session:
+            user = await session.get(User, id) if is_uuid(id) else None
+            return user
+
+    async def get_user_with_email(self, email: EmailStr) -> User | None:
+        async with self.__database.get_session() as session:
+            statement = select(User).where(User.email == email)
+            results = await session.exec(statement)
+            user = results.first()
+            return user
+
+    async def update_user(self, id: str, user: UserUpdate) -> User:
+        async with self.__database.get_session() as session:
+            db_user = await session.get(User, id) if is_uuid(id) else None
+            if not db_user:
+                raise ObjectNotFoundError("No user with that ID exists.")
+            user_data = user.dict(exclude_unset=True)
+            for key, value in user_data.items():
+                setattr(db_user, key, value)
+            session.add(db_user)
+            await session.commit()
+            self.__user_cache.invalidate_user(db_user)
+            self.__resource_versions.invalidate_user(db_user.id)
+            return db_user
+
+    async def update_user_password(self, id: str, password: str) -> User:
+        hashed_password = await self.__password_handler.hash_password_async(password)
+        return await self.__store_hashed_password(
+            id, hashed_password, revoke_tokens=True
+        )
+
+    async def update_user_hashed_password(
+        self, id: str, hashed_password: str
+    ) -> User:
+        return await self.__store_hashed_password(
+            id, hashed_password, revoke_tokens=False
+        )
+
+    async def delete_user(self, id: str) -> None:
+        async with self.__database.get_session() as session:
+            db_user = await session.get(User, id) if is_uuid(id) else None
+            if not db_user:
+                raise ObjectNotFoundError("No user with that ID exists.")
+
+            revocation = await session.run_sync(create_token_revocation, db_user)
+            await session.delete(db_user)
+            await session.commit()
+            self.__user_cache.invalidate_user(db_user)
+            self.__resource_versions.invalidate_user(db_user.id)
+            self.__token_revocations.add_revocation(revocation)
+
+    async def __store_hashed_password(
+        self, id: str, hashed_password: str, revoke_tokens: bool
+    ) -> User:
+        async with self.__database.get_session() as session:
+            db_user = await session.get(User, id) if is_uuid(id) else None
+            if not db_user:
+                raise ObjectNotFoundError("No user with that ID exists.")
+            db_user.hashed_password = hashed_password
+            revocation = None
+            if revoke_tokens:
+                revocation = await session.run_sync(create_token_revocation, db_user)
+            session.add(db_user)
+            await session.commit()
+            self.__user_cache.invalidate_user(db_user)
+            self.__resource_versions.invalidate_user(db_user.id)
+            if revocation is not None:
+                self.__token_revocations.add_revocation(revocation)
+            return db_user
@@ -1,30 +1,133 @@
 from injector import inject
+from sqlalchemy.exc import IntegrityError
 
-from src.database.categories.category import Category, CategoryCreate
+from src.analytics.i_ledger_cache import ILedgerCache
+from src.common.etags import VersionedResource
+from src.common.i_resource_versions import IResourceVersions
+from src.common.pagination import DEFAULT_PAGE_SIZE, decode_cursor, encode_cursor
+from src.database.categories.category import (
+    Category,
+    CategoryBulkResult,
+    CategoryBulkStatus,
+    CategoryCreate,
+    CategoryPage,
+)
 from src.database.categories.i_category_database_handler import ICategoryDatabaseHandler
-from src.database.i_database import IDatabase
+from src.database.i_unit_of_work import IUnitOfWork
 from src.database.users.user import User
 from src.managers.i_category_manager import ICategoryManager
 
 
 class CategoryManager(ICategoryManager):
     @inject
-    def __init__(self, database: IDatabase, category_handler: ICategoryDatabaseHandler):
-        self.__database = database
+    def __init__(
+        self,
+        unit_of_work: IUnitOfWork,
+        ledger_cache: ILedgerCache,
+        resource_versions: IResourceVersions,
+        category_handler: ICategoryDatabaseHandler,
+    ):
+        self.__unit_of_work = unit_of_work
+        self.__ledger_cache = ledger_cache
+        self.__resource_versions = resource_versions
         self.__category_handler = category_handler
 
     def create_category(self, user: User, data: CategoryCreate) -> Category:
-        with self.__database.get_session() as session:
-            category = self.__category_handler.create_category(session, user, data.name)
-            session.commit()
-            session.refresh(category)
-            return category
+        session = self.__unit_of_work.get_session()
+        category = self.__category_handler.create_category(session, user, data.name)
+        try:
+            session.flush()
+        except IntegrityError as exc:
+            session.rollback()
+            raise ValueError("Category with that name already exists") from exc
+        self.__invalidate_categories(user)
+        return category
 
-    def get_categories(self, user: User) -> list[Category]:
-        with self.__database.get_session() as session:
-            categories = self.__category_handler.get_categories(session, user)
-            return categories
+    def create_categories(
+        self, user: User, names: list[str]
+    ) -> list[CategoryBulkResult]:
+        names = list(dict.fromkeys(names))
+        session = self.__unit_of_work.get_session()
+        created = self.__category_handler.create_categories(session, user, names)
+        self.__invalidate_categories(user)
+        return create_bulk_results(
+            names,
+            created,
+            CategoryBulkStatus.CREATED,
+            CategoryBulkStatus.ALREADY_EXISTS,
+        )
+
+    def get_categories(
+        self, user: User, cursor: str | None = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> CategoryPage:
+        after = decode_category_cursor(cursor)
+        session = self.__unit_of_work.get_session()
+        categories = self.__category_handler.get_categories(
+            session, user, after, limit + 1
+        )
+        return create_category_page(categories, limit)
 
     def delete_category(self, user: User, name: str) -> None:
-        with self.__database.get_session() as session:
-            self.__category_handler.delete_category(session, user, name)
+        session = self.__unit_of_work.get_session()
+        self.__category_handler.delete_category(session, user, name)
+        session.flush()
+        self.__invalidate_categories(user)
+        self.__invalidate_ledger(user)
+
+    def delete_categories(
+        self, user: User, names: list[str]
+    ) -> list[CategoryBulkResult]:
+        names = list(dict.fromkeys(names))
+        session = self.__unit_of_work.get_session()
+        deleted = self.__category_handler.delete_categories(session, user, names)
+        self.__invalidate_categories(user)
+        self.__invalidate_ledger(user)
+        return create_bulk_results(
+            names, deleted, CategoryBulkStatus.DELETED, CategoryBulkStatus.NOT_FOUND
+        )
+
+    def __invalidate_categories(self, user: User) -> None:
+        self.__unit_of_work.after_commit(
+            lambda: self.__resource_versions.invalidate(
+                VersionedResource.CATEGORIES, user.id
+            )
+        )
+
+    def __invalidate_ledger(self, user: User) -> None:
+        # Transactions of deleted categories become uncategorized.
+        self.__unit_of_work.after_commit(
+            lambda: self.__ledger_cache.invalidate_user(user)
+        )
+
+
+def decode_category_cursor(cursor: str | None) -> str | None:
+    if cursor is None:
+        return None
+    [name] = decode_cursor(cursor, 1)
+    if not isinstance(name, str):
+        raise ValueError("Malformed cursor.")
+    return name
+
+
+def create_category_page(categories: list[Category], limit: int) -> CategoryPage:
+    # One row past the limit is fetched to tell whether another page exists.
+    items = categories[:limit]
+    next_cursor = None
+    if len(categories) > limit:
+        next_cursor = encode_cursor([items[-1].name])
+    return CategoryPage(items=items, next_cursor=next_cursor)
+
+
+def create_bulk_results(
+    names: list[str],
+    affected: list[str],
+    status: CategoryBulkStatus,
+    otherwise: CategoryBulkStatus,
+) -> list[CategoryBulkResult]:
+    affected_names = set(affected)
+    return [
+        CategoryBulkResult(
+            name=name, status=status if name in affected_names else otherwise
+        )
+        for name in names
+    ]
@@ -0,0 +1,95 @@
+from decimal import Decimal
+from functools import partial
+from typing import Callable, Iterator
+
+from injector import inject
+
+from src.common.exports import ExportEncoder, ExportFormat
+from src.common.settings import Settings
+from src.database.categories.i_category_database_handler import ICategoryDatabaseHandler
+from src.database.i_database import IDatabase
+from src.database.transactions.i_transaction_database_handler import (
+    ITransactionDatabaseHandler,
+)
+from src.database.users.user import User
+from src.managers.i_export_manager import IExportManager
+
+CATEGORY_COLUMNS = ["name"]
+TRANSACTION_CSV_COLUMNS = ["id", "date", "amount", "description", "category"]
+TRANSACTION_NDJSON_COLUMNS = ["id", "occurred_at", "amount", "description", "category"]
+
+
+class ExportManager(IExportManager):
+    @inject
+    def __init__(
+        self,
+        settings: Settings,
+        database: IDatabase,
+        category_handler: ICategoryDatabaseHandler,
+        transaction_handler: ITransactionDatabaseHandler,
+    ):
+        self.__batch_size = settings.export_batch_size
+        self.__database = database
+        self.__category_handler = category_handler
+        self.__transaction_handler = transaction_handler
+
+    def export_categories(
+        self, user: User, format: ExportFormat, compress: bool
+    ) -> Iterator[bytes]:
+        encoder = ExportEncoder(format, CATEGORY_COLUMNS, compress)
+        return self.__export(
+            user, encoder, self.__category_handler.stream_categories, encoder.encode
+        )
+
+    def export_transactions(
+        self, user: User, format: ExportFormat, compress: bool
+    ) -> Iterator[bytes]:
+        encoder = create_transaction_encoder(format, compress)
+        return self.__export(
+            user,
+            encoder,
+            self.__transaction_handler.stream_transactions,
+            partial(encode_transactions, encoder, format),
+        )
+
+    def __export(
+        self,
+        user: User,
+        encoder: ExportEncoder,
+        stream: Callable,
+        encode: Callable[[list[tuple]], bytes],
+    ) -> Iterator[bytes]:
+        # An export outlives the request's unit of work, so it is read in a
+        # session of its own. Reading it in one transaction keeps the file a
+        # consistent snapshot however long the download takes.
+        yield encoder.begin()
+        with self.__database.get_session() as session:
+            for rows in stream(session, user, self.__batch_size):
+                if chunk := encode(rows):
+                    yield chunk
+        yield encoder.end()
+
+
+def create_transaction_encoder(format: ExportFormat, compress: bool) -> ExportEncoder:
+    if format == ExportFormat.CSV:
+        return ExportEncoder(format, TRANSACTION_CSV_COLUMNS, compress)
+    return ExportEncoder(format, TRANSACTION_NDJSON_COLUMNS, compress)
+
+
+def encode_transactions(
+    encoder: ExportEncoder, format: ExportFormat, rows: list[tuple]
+) -> bytes:
+    if format == ExportFormat.CSV:
+        return encoder.encode(
+            (id, occurred_at.isoformat(), format_amount(amount), description, category)
+            for id, occurred_at, amount, description, category in rows
+        )
+    return encoder.encode(
+        (id, occurred_at.isoformat(), amount, description, category)
+        for id, occurred_at, amount, description, category in rows
+    )
+
+
+def format_amount(amount: int) -> str:
+    # Major units with two decimals, as statement imports read them.
+    return str(Decimal(amount).scaleb(-2))
@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+
+from src.database.transactions.analytics import (
+    CategorySpendRead,
+    DailySpendFilter,
+    DailySpendRead,
+    MonthlySpendRead,
+    SpendFilter,
+    YearOverYearRead,
+)
+from src.database.transactions.monthly_total import MonthlyTotalFilter
+from src.database.users.user import User
+
+
+class IAnalyticsManager(ABC):
+    @abstractmethod
+    def get_category_spend(
+        self, user: User, filters: SpendFilter
+    ) -> list[CategorySpendRead]:
+        """Fetches how much a user spent per category in the filtered
+        days, with each category's share of the spending, ordered by
+        spending."""
+
+    @abstractmethod
+    def get_daily_spend(
+        self, user: User, filters: DailySpendFilter, window: int
+    ) -> list[DailySpendRead]:
+        """Fetches how much a user spent on every day in the filtered
+        range, along with the average daily spending over the window of
+        days ending on it. Raises if the range or window is empty or
+        too long."""
+
+    @abstractmethod
+    def get_monthly_spend(
+        self, user: User, filters: MonthlyTotalFilter
+    ) -> MonthlySpendRead:
+        """Fetches the mean and percentiles of a user's spending per
+        month within the filtered months."""
+
+    @abstractmethod
+    def get_year_over_year(self, user: User, year: int) -> list[YearOverYearRead]:
+        """Fetches a user's spending in every month of the given year
+        next to the same month of the year before."""
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+from src.common.exports import ExportFormat
+from src.database.users.user import User
+
+
+class IAsyncExportManager(ABC):
+    @abstractmethod
+    def export_categories(
+        self, user: User, format: ExportFormat, compress: bool
+    ) -> AsyncIterator[bytes]:
+        """Exports the names of a user's categories as a CSV or NDJSON
+        file, gzipped if compress is set. Yields the file in chunks
+        while the categories are read in batches of bounded size."""
+
+    @abstractmethod
+    def export_transactions(
+        self, user: User, format: ExportFormat, compress: bool
+    ) -> AsyncIterator[bytes]:
+        """Exports a user's transactions oldest first as a CSV or NDJSON
+        file, gzipped if compress is set. The CSV file has the columns
+        of a statement import with amounts in major units, while NDJSON
+        lines match the transactions listing. Yields the file in chunks
+        while the transactions are read in batches of bounded size."""
@@ -1,6 +1,12 @@
 from abc import ABC, abstractmethod
 
-from src.database.categories.category import Category, CategoryCreate
+from src.common.pagination import DEFAULT_PAGE_SIZE
+from src.database.categories.category import (
+    Category,
+    CategoryBulkResult,
+    CategoryCreate,
+    CategoryPage,
+)
 from src.database.users.user import User
 
 
@@ -13,10 +19,33 @@ class ICategoryManager(ABC):
         Returns the newly created category."""
 
     @abstractmethod
-    def get_categories(self, user: User) -> list[Category]:
-        """Fetches a user's categories."""
+    def create_categories(
+        self, user: User, names: list[str]
+    ) -> list[CategoryBulkResult]:
+        """Creates categories with the given names for the given user
+        in one statement. Names the user already has are skipped.
+
+        Returns one result per distinct name, in the given order."""
+
+    @abstractmethod
+    def get_categories(
+        self, user: User, cursor: str | None = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> CategoryPage:
+        """Fetches at most limit of a user's categories ordered by
+        name, continuing after the given cursor. The page holds a
+        cursor for the next page if there are more categories.
+        Raises if the cursor is malformed."""
 
     @abstractmethod
     def delete_category(self, user: User, name: str) -> None:
         """Deletes a category for the given user in the database.
         Raises if the category does not exist for the user."""
+
+    @abstractmethod
+    def delete_categories(
+        self, user: User, names: list[str]
+    ) -> list[CategoryBulkResult]:
+        """Deletes the given user's categories with the given names in
+        one statement.
+
+        Returns one result per distinct name, in the given order."""
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator
+
+from src.database.transactions.transaction import (
+    TransactionImportError,
+    TransactionImportProgress,
+)
+from src.database.users.user import User
+from src.transactions.statements import StatementRow
+
+
+class ITransactionImportManager(ABC):
+    @abstractmethod
+    def import_transactions(
+        self, user: User, rows: Iterable[StatementRow | TransactionImportError]
+    ) -> Iterator[TransactionImportProgress]:
+        """Records parsed statement rows as transactions for the given
+        user, committing them in batches of bounded size. Rows already
+        imported are skipped, and rows naming a category the user does
+        not have are reported as errors.
+
+        Yields the running totals after each batch, and a last time
+        with done set once all rows are imported."""
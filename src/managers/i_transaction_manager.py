@@ -0,0 +1,80 @@
+from abc import ABC, abstractmethod
+from datetime import date
+
+from src.common.pagination import DEFAULT_PAGE_SIZE
+from src.database.transactions.balance import BalanceRead, BalanceSeriesFilter
+from src.database.transactions.monthly_total import (
+    MonthlyTotalFilter,
+    MonthlyTotalRead,
+)
+from src.database.transactions.transaction import (
+    TransactionCreate,
+    TransactionFilter,
+    TransactionPage,
+    TransactionRead,
+    TransactionSearchFilter,
+)
+from src.database.users.user import User
+
+
+class ITransactionManager(ABC):
+    @abstractmethod
+    def create_transaction(
+        self, user: User, data: TransactionCreate
+    ) -> TransactionRead:
+        """Records a new transaction for the given user in the database.
+        Raises if the given category does not exist for the user.
+
+        Returns the newly created transaction."""
+
+    @abstractmethod
+    def get_transactions(
+        self,
+        user: User,
+        filters: TransactionFilter,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> TransactionPage:
+        """Fetches at most limit of a user's transactions matching the
+        filters, newest first, continuing after the given cursor. The
+        page holds a cursor for the next page if there are more
+        transactions. Raises if the cursor is malformed."""
+
+    @abstractmethod
+    def search_transactions(
+        self,
+        user: User,
+        filters: TransactionSearchFilter,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> TransactionPage:
+        """Searches at most limit of a user's transactions matching the
+        filters for descriptions with words starting with every word of
+        the query, best matches first, continuing after the given
+        cursor. The page holds a cursor for the next page if there are
+        more matches. Raises if the cursor is malformed."""
+
+    @abstractmethod
+    def get_monthly_totals(
+        self, user: User, filters: MonthlyTotalFilter
+    ) -> list[MonthlyTotalRead]:
+        """Fetches the sum and number of a user's transactions per month
+        and category within the filtered months, ordered by month."""
+
+    @abstractmethod
+    def get_balance(self, user: User, day: date) -> BalanceRead:
+        """Fetches the sum of all of a user's transactions up to and
+        including the given day."""
+
+    @abstractmethod
+    def get_balance_series(
+        self, user: User, filters: BalanceSeriesFilter
+    ) -> list[BalanceRead]:
+        """Fetches a user's balance at the end of every day in the
+        filtered range. Raises if the range is empty or longer than
+        the maximum number of days."""
+
+    @abstractmethod
+    def delete_transaction(self, user: User, id: int) -> None:
+        """Deletes a transaction for the given user in the database.
+        Raises if the transaction does not exist for the user."""
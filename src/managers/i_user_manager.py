@@ -33,6 +33,12 @@ class IUserManager(ABC):
         """Updates the password of the user with the given ID.
            Raises an exception if the user does not exist."""
 
+    @abstractmethod
+    def update_user_hashed_password(self, id: str, hashed_password: str) -> User:
+        """Replaces the stored password hash of the user with the given ID
+           with an already computed hash. Raises an exception if the user
+           does not exist."""
+
     @abstractmethod
     def delete_user(self, id: str) -> None:
         """Deletes the user with the given ID. Raises if the user
@@ -0,0 +1,113 @@
+from itertools import islice
+from typing import Iterable, Iterator
+
+from injector import inject
+from sqlmodel import Session
+
+from src.analytics.i_ledger_cache import ILedgerCache
+from src.common.settings import Settings
+from src.database.categories.i_category_database_handler import ICategoryDatabaseHandler
+from src.database.i_database import IDatabase
+from src.database.transactions.i_transaction_database_handler import (
+    ITransactionDatabaseHandler,
+)
+from src.database.transactions.transaction import (
+    TransactionImportError,
+    TransactionImportProgress,
+)
+from src.database.users.user import User
+from src.managers.i_transaction_import_manager import ITransactionImportManager
+from src.transactions.statements import StatementRow
+
+
+class TransactionImportManager(ITransactionImportManager):
+    @inject
+    def __init__(
+        self,
+        settings: Settings,
+        database: IDatabase,
+        ledger_cache: ILedgerCache,
+        category_handler: ICategoryDatabaseHandler,
+        transaction_handler: ITransactionDatabaseHandler,
+    ):
+        self.__batch_size = settings.transaction_import_batch_size
+        self.__max_errors = settings.transaction_import_max_errors
+        self.__database = database
+        self.__ledger_cache = ledger_cache
+        self.__category_handler = category_handler
+        self.__transaction_handler = transaction_handler
+
+    def import_transactions(
+        self, user: User, rows: Iterable[StatementRow | TransactionImportError]
+    ) -> Iterator[TransactionImportProgress]:
+        # An import outlives the request's unit of work, so every batch is
+        # committed in a session of its own. That keeps write transactions
+        # short and lets a failed import be resumed, since committed rows are
+        # skipped as duplicates the next time.
+        progress = TransactionImportProgress()
+        rows = iter(rows)
+        while batch := list(islice(rows, self.__batch_size)):
+            with self.__database.get_session() as session:
+                inserted, errors = import_batch(
+                    session,
+                    user,
+                    batch,
+                    self.__category_handler,
+                    self.__transaction_handler,
+                )
+                session.commit()
+            self.__ledger_cache.invalidate_user(user)
+            yield update_progress(progress, batch, inserted, errors, self.__max_errors)
+        progress.done = True
+        yield progress
+
+
+def import_batch(
+    session: Session,
+    user: User,
+    batch: list[StatementRow | TransactionImportError],
+    category_handler: ICategoryDatabaseHandler,
+    transaction_handler: ITransactionDatabaseHandler,
+) -> tuple[int, list[TransactionImportError]]:
+    errors = [row for row in batch if isinstance(row, TransactionImportError)]
+    rows = [row for row in batch if isinstance(row, StatementRow)]
+    names = list({row.category for row in rows if row.category is not None})
+    category_ids = category_handler.get_category_ids(session, user, names)
+
+    values = []
+    for row in rows:
+        category_id = None
+        if row.category is not None:
+            category_id = category_ids.get(row.category)
+            if category_id is None:
+                errors.append(TransactionImportError(
+                    row=row.row, message="Category does not exist."
+                ))
+                continue
+        values.append({
+            "category_id": category_id,
+            "amount": row.amount,
+            "occurred_at": row.occurred_at,
+            "description": row.description,
+            "content_hash": row.content_hash,
+        })
+    return transaction_handler.insert_transactions(session, user, values), errors
+
+
+def update_progress(
+    progress: TransactionImportProgress,
+    batch: list[StatementRow | TransactionImportError],
+    inserted: int,
+    errors: list[TransactionImportError],
+    max_errors: int,
+) -> TransactionImportProgress:
+    # Each update only lists the errors of its own batch, and only the first
+    # errors of an import are listed at all, so that a file in the wrong
+    # layout does not report every one of its rows.
+    progress.processed += len(batch)
+    progress.inserted += inserted
+    progress.duplicates += len(batch) - len(errors) - inserted
+    listed = max(max_errors - progress.failed, 0)
+    progress.failed += len(errors)
+    errors = sorted(errors, key=lambda error: error.row)[:listed]
+    return progress.copy(update={"errors": errors})
@@ -0,0 +1,207 @@
+from datetime import date, datetime, timedelta
+
+from injector import inject
+
+from src.analytics.i_ledger_cache import ILedgerCache
+from src.common.pagination import DEFAULT_PAGE_SIZE, decode_cursor, encode_cursor
+from src.database.i_unit_of_work import IUnitOfWork
+from src.database.transactions.balance import (
+    MAX_BALANCE_SERIES_DAYS,
+    BalanceRead,
+    BalanceSeriesFilter,
+)
+from src.database.transactions.i_balance_database_handler import (
+    IBalanceDatabaseHandler,
+)
+from src.database.transactions.i_monthly_total_database_handler import (
+    IMonthlyTotalDatabaseHandler,
+)
+from src.database.transactions.i_transaction_database_handler import (
+    ITransactionDatabaseHandler,
+)
+from src.database.transactions.monthly_total import (
+    MonthlyTotal,
+    MonthlyTotalFilter,
+    MonthlyTotalRead,
+)
+from src.database.transactions.transaction import (
+    Transaction,
+    TransactionCreate,
+    TransactionFilter,
+    TransactionPage,
+    TransactionRead,
+    TransactionSearchFilter,
+)
+from src.database.users.user import User
+from src.managers.i_transaction_manager import ITransactionManager
+
+
+class TransactionManager(ITransactionManager):
+    @inject
+    def __init__(
+        self,
+        unit_of_work: IUnitOfWork,
+        ledger_cache: ILedgerCache,
+        transaction_handler: ITransactionDatabaseHandler,
+        monthly_total_handler: IMonthlyTotalDatabaseHandler,
+        balance_handler: IBalanceDatabaseHandler,
+    ):
+        self.__unit_of_work = unit_of_work
+        self.__ledger_cache = ledger_cache
+        self.__transaction_handler = transaction_handler
+        self.__monthly_total_handler = monthly_total_handler
+        self.__balance_handler = balance_handler
+
+    def create_transaction(
+        self, user: User, data: TransactionCreate
+    ) -> TransactionRead:
+        session = self.__unit_of_work.get_session()
+        transaction = self.__transaction_handler.create_transaction(
+            session, user, data
+        )
+        session.flush()
+        self.__invalidate_ledger(user)
+        return create_transaction_read(transaction, data.category)
+
+    def get_transactions(
+        self,
+        user: User,
+        filters: TransactionFilter,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> TransactionPage:
+        after = decode_transaction_cursor(cursor)
+        session = self.__unit_of_work.get_session()
+        transactions = self.__transaction_handler.get_transactions(
+            session, user, filters, after, limit + 1
+        )
+        return create_transaction_page(transactions, limit)
+
+    def search_transactions(
+        self,
+        user: User,
+        filters: TransactionSearchFilter,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> TransactionPage:
+        after = decode_search_cursor(cursor)
+        session = self.__unit_of_work.get_session()
+        transactions = self.__transaction_handler.search_transactions(
+            session, user, filters, after, limit + 1
+        )
+        return create_search_page(transactions, limit)
+
+    def get_monthly_totals(
+        self, user: User, filters: MonthlyTotalFilter
+    ) -> list[MonthlyTotalRead]:
+        session = self.__unit_of_work.get_session()
+        totals = self.__monthly_total_handler.get_monthly_totals(
+            session, user, filters
+        )
+        return create_monthly_total_reads(totals)
+
+    def get_balance(self, user: User, day: date) -> BalanceRead:
+        session = self.__unit_of_work.get_session()
+        balance = self.__balance_handler.get_balance(session, user, day)
+        return BalanceRead(day=day, balance=balance)
+
+    def get_balance_series(
+        self, user: User, filters: BalanceSeriesFilter
+    ) -> list[BalanceRead]:
+        days = get_balance_series_days(filters)
+        session = self.__unit_of_work.get_session()
+        balances = self.__balance_handler.get_balances(session, user, days)
+        return create_balance_reads(days, balances)
+
+    def delete_transaction(self, user: User, id: int) -> None:
+        session = self.__unit_of_work.get_session()
+        self.__transaction_handler.delete_transaction(session, user, id)
+        self.__invalidate_ledger(user)
+
+    def __invalidate_ledger(self, user: User) -> None:
+        self.__unit_of_work.after_commit(
+            lambda: self.__ledger_cache.invalidate_user(user)
+        )
+
+
+def create_transaction_read(
+    transaction: Transaction, category: str | None
+) -> TransactionRead:
+    return TransactionRead(
+        id=transaction.id,
+        amount=transaction.amount,
+        occurred_at=transaction.occurred_at,
+        description=transaction.description,
+        category=category,
+    )
+
+
+def decode_transaction_cursor(cursor: str | None) -> tuple[datetime, int] | None:
+    if cursor is None:
+        return None
+    occurred_at, id = decode_cursor(cursor, 2)
+    if not isinstance(occurred_at, str) or type(id) is not int:
+        raise ValueError("Malformed cursor.")
+    return datetime.fromisoformat(occurred_at), id
+
+
+def create_transaction_page(
+    transactions: list[tuple[Transaction, str | None]], limit: int
+) -> TransactionPage:
+    # One row past the limit is fetched to tell whether another page exists.
+    items = [
+        create_transaction_read(transaction, category)
+        for transaction, category in transactions[:limit]
+    ]
+    next_cursor = None
+    if len(transactions) > limit:
+        next_cursor = encode_cursor([items[-1].occurred_at.isoformat(), items[-1].id])
+    return TransactionPage(items=items, next_cursor=next_cursor)
+
+
+def decode_search_cursor(cursor: str | None) -> tuple[int, int, int] | None:
+    if cursor is None:
+        return None
+    before, score, id = decode_cursor(cursor, 3)
+    if type(before) is not int or type(score) is not int or type(id) is not int:
+        raise ValueError("Malformed cursor.")
+    return before, score, id
+
+
+def create_search_page(
+    transactions: list[tuple[Transaction, str | None, tuple[int, int, int]]],
+    limit: int,
+) -> TransactionPage:
+    items = [
+        create_transaction_read(transaction, category)
+        for transaction, category, _ in transactions[:limit]
+    ]
+    next_cursor = None
+    if len(transactions) > limit:
+        _, _, key = transactions[limit - 1]
+        next_cursor = encode_cursor(list(key))
+    return TransactionPage(items=items, next_cursor=next_cursor)
+
+
+def create_monthly_total_reads(
+    totals: list[tuple[MonthlyTotal, str | None]]
+) -> list[MonthlyTotalRead]:
+    return [
+        MonthlyTotalRead(
+            month=total.month, category=category, total=total.total, count=total.count
+        )
+        for total, category in totals
+    ]
+
+
+def get_balance_series_days(filters: BalanceSeriesFilter) -> list[date]:
+    days = (filters.end - filters.start).days
+    if days < 1 or days > MAX_BALANCE_SERIES_DAYS:
+        raise ValueError("Date range is invalid.")
+    return [filters.start + timedelta(days=day) for day in range(days)]
+
+
+def create_balance_reads(days: list[date], balances: list[int]) -> list[BalanceRead]:
+    return [
+        BalanceRead(day=day, balance=balance) for day, balance in zip(days, balances)
+    ]
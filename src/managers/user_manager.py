@@ -1,76 +1,144 @@
 from injector import inject
 from pydantic import EmailStr
-from sqlmodel import select
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import Session, select
 
 from src.authentication.i_password_handler import IPasswordHandler
+from src.authentication.i_token_revocations import ITokenRevocations
+from src.authentication.i_user_cache import IUserCache
 from src.common.exceptions import ObjectNotFoundError
-from src.database.i_database import IDatabase
+from src.common.i_resource_versions import IResourceVersions
+from src.common.settings import Settings
+from src.common.utils import create_id_factory, is_uuid
+from src.database.i_unit_of_work import IUnitOfWork
+from src.database.users.token_revocation import TokenRevocation
 from src.database.users.user import User, UserCreate, UserUpdate
 from src.managers.i_user_manager import IUserManager
 
 
 class UserManager(IUserManager):
     @inject
-    def __init__(self, database: IDatabase, password_handler: IPasswordHandler):
-        self.__database = database
+    def __init__(
+        self,
+        unit_of_work: IUnitOfWork,
+        password_handler: IPasswordHandler,
+        user_cache: IUserCache,
+        token_revocations: ITokenRevocations,
+        resource_versions: IResourceVersions,
+        settings: Settings,
+    ):
+        self.__unit_of_work = unit_of_work
         self.__password_handler = password_handler
+        self.__user_cache = user_cache
+        self.__token_revocations = token_revocations
+        self.__resource_versions = resource_versions
+        self.__create_id = create_id_factory(settings.id_scheme)
 
     def create_user(self, user: UserCreate) -> User:
-        if self.get_user_with_email(user.email):
-            raise ValueError("User with that email already exists")
-
         hashed_password = self.__password_handler.hash_password(user.password)
         db_user = User.from_orm(user)
+        db_user.id = self.__create_id()
         db_user.hashed_password = hashed_password
 
-        with self.__database.get_session() as session:
-            session.add(db_user)
-            session.commit()
-            session.refresh(db_user)
-            return db_user
+        session = self.__unit_of_work.get_session()
+        session.add(db_user)
+        try:
+            session.flush()
+        except IntegrityError as exc:
+            session.rollback()
+            raise ValueError("User with that email already exists") from exc
+        return db_user
 
     def get_user(self, id: str) -> User | None:
-        with self.__database.get_session() as session:
-            user = session.get(User, id)
-            return user
+        session = self.__unit_of_work.get_session()
+        return session.get(User, id) if is_uuid(id) else None
 
     def get_user_with_email(self, email: EmailStr) -> User | None:
-        with self.__database.get_session() as session:
-            statement = select(User).where(User.email == email)
-            results = session.exec(statement)
-            user = results.first()
-            return user
+        session = self.__unit_of_work.get_session()
+        statement = select(User).where(User.email == email)
+        results = session.exec(statement)
+        user = results.first()
+        return user
 
     def update_user(self, id: str, user: UserUpdate) -> User:
-        with self.__database.get_session() as session:
-            db_user = session.get(User, id)
-            if not db_user:
-                raise ObjectNotFoundError("No user with that ID exists.")
-            user_data = user.dict(exclude_unset=True)
-            for key, value in user_data.items():
-                setattr(db_user, key, value)
-            session.add(db_user)
-            session.commit()
-            session.refresh(db_user)
-            return db_user
+        session = self.__unit_of_work.get_session()
+        db_user = session.get(User, id) if is_uuid(id) else None
+        if not db_user:
+            raise ObjectNotFoundError("No user with that ID exists.")
+        user_data = user.dict(exclude_unset=True)
+        for key, value in user_data.items():
+            setattr(db_user, key, value)
+        session.add(db_user)
+        session.flush()
+        self.__after_commit(db_user, None)
+        return db_user
 
     def update_user_password(self, id: str, password: str) -> User:
-        with self.__database.get_session() as session:
-            db_user = session.get(User, id)
-            if not db_user:
-                raise ObjectNotFoundError("No user with that ID exists.")
-            hashed_password = self.__password_handler.hash_password(password)
-            db_user.hashed_password = hashed_password
-            session.add(db_user)
-            session.commit()
-            session.refresh(db_user)
-            return db_user
+        hashed_password = self.__password_handler.hash_password(password)
+        return self.__store_hashed_password(id, hashed_password, revoke_tokens=True)
+
+    def update_user_hashed_password(self, id: str, hashed_password: str) -> User:
+        return self.__store_hashed_password(id, hashed_password, revoke_tokens=False)
 
     def delete_user(self, id: str) -> None:
-        with self.__database.get_session() as session:
-            db_user = session.get(User, id)
-            if not db_user:
-                raise ObjectNotFoundError("No user with that ID exists.")
+        session = self.__unit_of_work.get_session()
+        db_user = session.get(User, id) if is_uuid(id) else None
+        if not db_user:
+            raise ObjectNotFoundError("No user with that ID exists.")
+
+        revocation = create_token_revocation(session, db_user)
+        session.delete(db_user)
+        session.flush()
+        self.__after_commit(db_user, revocation)
+
+    def __store_hashed_password(
+        self, id: str, hashed_password: str, revoke_tokens: bool
+    ) -> User:
+        session = self.__unit_of_work.get_session()
+        db_user = session.get(User, id) if is_uuid(id) else None
+        if not db_user:
+            raise ObjectNotFoundError("No user with that ID exists.")
+        db_user.hashed_password = hashed_password
+        revocation = None
+        if revoke_tokens:
+            revocation = create_token_revocation(session, db_user)
+        session.add(db_user)
+        session.flush()
+        self.__after_commit(db_user, revocation)
+        return db_user
+
+    def __after_commit(self, db_user: User, revocation: TokenRevocation | None) -> None:
+        def invalidate() -> None:
+            self.__user_cache.invalidate_user(db_user)
+            self.__resource_versions.invalidate_user(db_user.id)
+            if revocation is not None:
+                self.__token_revocations.add_revocation(revocation)
+
+        self.__unit_of_work.after_commit(invalidate)
+
 
-            session.delete(db_user)
-            session.commit()
+def create_token_revocation(session: Session, db_user: User) -> TokenRevocation:
+    # The version is bumped in the database, as the user may have been read
+    # before this transaction took the write lock, and a concurrent bump of a
+    # stale copy would hand out the same version twice.
+    statement = (
+        update(User)
+        .where(User.id == db_user.id)
+        .values(token_version=User.token_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if session.get_bind().dialect.update_returning:
+        token_version = session.execute(
+            statement.returning(User.token_version)
+        ).scalar_one()
+    else:
+        session.execute(statement)
+        token_version = session.execute(
+            select(User.token_version).where(User.id == db_user.id)
+        ).scalar_one()
+    set_committed_value(db_user, "token_version", token_version)
+    revocation = TokenRevocation(user_id=db_user.id, token_version=token_version)
+    session.add(revocation)
+    return revocation
@@ -0,0 +1,146 @@
+from datetime import date
+from unittest import TestCase
+from unittest.mock import create_autospec
+
+from fastapi import status
+from fastapi.testclient import TestClient
+from injector import Injector, singleton
+
+from src.authentication.i_authentication import IAuthentication
+from src.database.i_unit_of_work import IUnitOfWork
+from src.database.transactions.analytics import (
+    CategorySpendRead,
+    DailySpendFilter,
+    DailySpendRead,
+    MonthlySpendRead,
+    SpendFilter,
+    YearOverYearRead,
+)
+from src.database.transactions.monthly_total import MonthlyTotalFilter
+from src.database.users.user import User
+from src.main import create_app
+from src.managers.i_analytics_manager import IAnalyticsManager
+
+
+class TestAnalyticsApi(TestCase):
+    def setUp(self):
+        self.__user = User(email="fredrik@omstedt.com")
+        self.__authentication = create_autospec(IAuthentication)
+        self.__authentication.authenticate_user.return_value = self.__user
+        self.__analytics_manager = create_autospec(IAnalyticsManager)
+        self.__unit_of_work = create_autospec(IUnitOfWork)
+
+        self.__injector = Injector()
+        self.__injector.binder.bind(
+            IAuthentication, to=self.__authentication, scope=singleton
+        )
+        self.__injector.binder.bind(
+            IAnalyticsManager, to=self.__analytics_manager, scope=singleton
+        )
+        self.__injector.binder.bind(
+            IUnitOfWork, to=self.__unit_of_work, scope=singleton
+        )
+
+        app = create_app(self.__injector)
+        self.__client = TestClient(app)
+        self.__headers = {"Authorization": "Bearer blabla"}
+
+    def test_get_category_spend_unauthorized(self):
+        response = self.__client.get("/analytics/category-spend")
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_get_category_spend_returns_spend(self):
+        self.__analytics_manager.get_category_spend.return_value = [
+            CategorySpendRead(category="Food", spend=150, count=2, share=1)
+        ]
+
+        response = self.__client.get(
+            "/analytics/category-spend",
+            params={"start": "2026-01-01"},
+            headers=self.__headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.__analytics_manager.get_category_spend.assert_called_once_with(
+            self.__user, SpendFilter(start=date(2026, 1, 1))
+        )
+        self.assertEqual(
+            response.json(),
+            [{"category": "Food", "spend": 150, "count": 2, "share": 1.0}],
+        )
+
+    def test_get_daily_spend_returns_spend(self):
+        self.__analytics_manager.get_daily_spend.return_value = [
+            DailySpendRead(day=date(2026, 1, 1), spend=100, average=50)
+        ]
+
+        response = self.__client.get(
+            "/analytics/daily-spend",
+            params={"start": "2026-01-01", "end": "2026-01-02", "window": 2},
+            headers=self.__headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.__analytics_manager.get_daily_spend.assert_called_once_with(
+            self.__user,
+            DailySpendFilter(start=date(2026, 1, 1), end=date(2026, 1, 2)),
+            2,
+        )
+        self.assertEqual(
+            response.json(), [{"day": "2026-01-01", "spend": 100, "average": 50.0}]
+        )
+
+    def test_get_daily_spend_invalid_range(self):
+        self.__analytics_manager.get_daily_spend.side_effect = ValueError()
+
+        response = self.__client.get(
+            "/analytics/daily-spend",
+            params={"start": "2026-01-02", "end": "2026-01-01"},
+            headers=self.__headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_get_monthly_spend_returns_percentiles(self):
+        self.__analytics_manager.get_monthly_spend.return_value = MonthlySpendRead(
+            months=2, mean=150, p25=125, p50=150, p75=175, p90=190
+        )
+
+        response = self.__client.get(
+            "/analytics/monthly-spend",
+            params={"start": "2026-01-15"},
+            headers=self.__headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.__analytics_manager.get_monthly_spend.assert_called_once_with(
+            self.__user, MonthlyTotalFilter(start=date(2026, 1, 1))
+        )
+        self.assertEqual(response.json()["p50"], 150)
+
+    def test_get_year_over_year_returns_months(self):
+        self.__analytics_manager.get_year_over_year.return_value = [
+            YearOverYearRead(month=1, spend=150, previous_spend=100, change=0.5)
+        ]
+
+        response = self.__client.get(
+            "/analytics/year-over-year", params={"year": 2026}, headers=self.__headers
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.__analytics_manager.get_year_over_year.assert_called_once_with(
+            self.__user, 2026
+        )
+        self.assertEqual(
+            response.json(),
+            [{"month": 1, "spend": 150, "previous_spend": 100, "change": 0.5}],
+        )
+
+    def test_get_year_over_year_requires_year(self):
+        response = self.__client.get(
+            "/analytics/year-over-year", headers=self.__headers
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.__analytics_manager.get_year_over_year.assert_not_called()
@@ -0,0 +1,79 @@
+from datetime import date, datetime
+from unittest import TestCase
+
+from src.analytics.reports import to_day_number
+from src.database.categories.category import Category
+from src.database.i_database import IDatabase
+from src.database.i_database_deleter import IDatabaseDeleter
+from src.database.transactions.analytics_database_handler import (
+    AnalyticsDatabaseHandler,
+)
+from src.database.transactions.transaction import TransactionCreate
+from src.database.transactions.transaction_database_handler import (
+    TransactionDatabaseHandler,
+)
+from src.database.users.user import User
+from src.tests.test_utils import create_injector_with_database
+
+
+class TestAnalyticsDatabaseHandler(TestCase):
+    def setUp(self):
+        self.__injector = create_injector_with_database()
+
+        database = self.__injector.get(IDatabase)
+        database.create_database()
+        self.__user = User(email="fredrik@omstedt.com")
+        self.__other_user = User(email="other@omstedt.com")
+        with database.get_session() as session:
+            session.add(self.__user)
+            session.add(self.__other_user)
+            session.add(Category(name="Food", user_id=self.__user.id))
+            session.commit()
+            session.refresh(self.__user)
+            session.refresh(self.__other_user)
+
+    def tearDown(self) -> None:
+        database_deleter = self.__injector.get(IDatabaseDeleter)
+        database_deleter.delete_database()
+
+    def test_get_ledger_reads_columns_ordered_by_day(self):
+        self.__create(self.__user, 300, datetime(2026, 1, 2, 23, 59))
+        self.__create(self.__user, -100, datetime(1969, 12, 31, 12), "Food")
+        self.__create(self.__other_user, -50, datetime(2026, 1, 1))
+
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(AnalyticsDatabaseHandler)
+        with database.get_session() as session:
+            ledger = handler.get_ledger(session, self.__user)
+
+        [food_id] = ledger.category_names
+        self.assertEqual(ledger.days.tolist(), [-1, to_day_number(date(2026, 1, 2))])
+        self.assertEqual(ledger.amounts.tolist(), [-100, 300])
+        self.assertEqual(ledger.category_ids.tolist(), [food_id, 0])
+        self.assertEqual(ledger.category_names, {food_id: "Food"})
+        self.assertFalse(ledger.amounts.flags.writeable)
+
+    def test_get_ledger_without_transactions(self):
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(AnalyticsDatabaseHandler)
+        with database.get_session() as session:
+            ledger = handler.get_ledger(session, self.__other_user)
+
+        self.assertEqual(len(ledger.days), 0)
+        self.assertEqual(ledger.category_names, {})
+
+    def __create(
+        self,
+        user: User,
+        amount: int,
+        occurred_at: datetime,
+        category: str | None = None,
+    ) -> None:
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+        data = TransactionCreate(
+            amount=amount, occurred_at=occurred_at, category=category
+        )
+        with database.get_session() as session:
+            handler.create_transaction(session, user, data)
+            session.commit()
@@ -0,0 +1,84 @@
+from datetime import date
+from unittest import TestCase
+from unittest.mock import create_autospec
+
+import numpy as np
+from injector import singleton
+
+from src.analytics.i_ledger_cache import ILedgerCache
+from src.database.i_unit_of_work import IUnitOfWork
+from src.database.transactions.analytics import (
+    CategorySpendRead,
+    DailySpendFilter,
+    Ledger,
+    SpendFilter,
+)
+from src.database.transactions.i_analytics_database_handler import (
+    IAnalyticsDatabaseHandler,
+)
+from src.database.users.user import User
+from src.managers.analytics_manager import AnalyticsManager
+from src.multi_injector import MultiInjector
+
+LEDGER = Ledger(
+    np.array([20454], dtype=np.int32),
+    np.array([-100], dtype=np.int64),
+    np.array([1], dtype=np.int32),
+    {1: "Food"},
+)
+
+
+class TestAnalyticsManager(TestCase):
+    def setUp(self):
+        self.__unit_of_work = create_autospec(IUnitOfWork)
+        self.__session = self.__unit_of_work.get_session.return_value
+        self.__ledger_cache = create_autospec(ILedgerCache)
+        self.__analytics_handler = create_autospec(IAnalyticsDatabaseHandler)
+        self.__user = User(email="fredrik@omstedt.com")
+
+        self.__injector = MultiInjector()
+        self.__injector.binder.bind(
+            IUnitOfWork, to=self.__unit_of_work, scope=singleton
+        )
+        self.__injector.binder.bind(
+            ILedgerCache, to=self.__ledger_cache, scope=singleton
+        )
+        self.__injector.binder.bind(
+            IAnalyticsDatabaseHandler, to=self.__analytics_handler, scope=singleton
+        )
+
+    def test_get_category_spend_loads_and_caches_ledger(self):
+        manager = self.__injector.get(AnalyticsManager)
+        self.__ledger_cache.get_ledger.return_value = None
+        self.__ledger_cache.get_generation.return_value = 3
+        self.__analytics_handler.get_ledger.return_value = LEDGER
+
+        spend = manager.get_category_spend(self.__user, SpendFilter())
+
+        self.__analytics_handler.get_ledger.assert_called_once_with(
+            self.__session, self.__user
+        )
+        self.__ledger_cache.add_ledger.assert_called_once_with(
+            self.__user, LEDGER, 3
+        )
+        self.assertEqual(
+            spend, [CategorySpendRead(category="Food", spend=100, count=1, share=1)]
+        )
+
+    def test_get_category_spend_uses_cached_ledger(self):
+        manager = self.__injector.get(AnalyticsManager)
+        self.__ledger_cache.get_ledger.return_value = LEDGER
+
+        spend = manager.get_category_spend(self.__user, SpendFilter())
+
+        self.__analytics_handler.get_ledger.assert_not_called()
+        self.__ledger_cache.add_ledger.assert_not_called()
+        self.assertEqual(len(spend), 1)
+
+    def test_get_daily_spend_raises_on_invalid_range_before_loading(self):
+        manager = self.__injector.get(AnalyticsManager)
+        filters = DailySpendFilter(start=date(2026, 1, 1), end=date(2030, 1, 1))
+
+        with self.assertRaises(ValueError):
+            manager.get_daily_spend(self.__user, filters, 30)
+        self.__ledger_cache.get_ledger.assert_not_called()
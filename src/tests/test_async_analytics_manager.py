@@ -0,0 +1,105 @@
+from datetime import datetime
+from unittest import IsolatedAsyncioTestCase
+
+from injector import singleton
+
+from src.analytics.i_ledger_cache import ILedgerCache
+from src.database.categories.category import Category
+from src.database.categories.category_database_handler import CategoryDatabaseHandler
+from src.database.categories.i_category_database_handler import ICategoryDatabaseHandler
+from src.database.i_async_database import IAsyncDatabase
+from src.database.transactions.analytics import SpendFilter
+from src.database.transactions.analytics_database_handler import (
+    AnalyticsDatabaseHandler,
+)
+from src.database.transactions.balance_database_handler import (
+    BalanceDatabaseHandler,
+)
+from src.database.transactions.i_analytics_database_handler import (
+    IAnalyticsDatabaseHandler,
+)
+from src.database.transactions.i_balance_database_handler import (
+    IBalanceDatabaseHandler,
+)
+from src.database.transactions.i_monthly_total_database_handler import (
+    IMonthlyTotalDatabaseHandler,
+)
+from src.database.transactions.i_transaction_database_handler import (
+    ITransactionDatabaseHandler,
+)
+from src.database.transactions.monthly_total_database_handler import (
+    MonthlyTotalDatabaseHandler,
+)
+from src.database.transactions.transaction import TransactionCreate
+from src.database.transactions.transaction_database_handler import (
+    TransactionDatabaseHandler,
+)
+from src.database.users.user import User
+from src.managers.async_analytics_manager import AsyncAnalyticsManager
+from src.managers.async_category_manager import AsyncCategoryManager
+from src.managers.async_transaction_manager import AsyncTransactionManager
+from src.tests.test_utils import create_injector_with_async_database
+
+OCCURRED_AT = datetime(2026, 1, 1, 12)
+
+
+class TestAsyncAnalyticsManager(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.__injector = create_injector_with_async_database()
+        for interface, handler in [
+            (IAnalyticsDatabaseHandler, AnalyticsDatabaseHandler),
+            (ICategoryDatabaseHandler, CategoryDatabaseHandler),
+            (ITransactionDatabaseHandler, TransactionDatabaseHandler),
+            (IMonthlyTotalDatabaseHandler, MonthlyTotalDatabaseHandler),
+            (IBalanceDatabaseHandler, BalanceDatabaseHandler),
+        ]:
+            self.__injector.binder.bind(interface, to=handler, scope=singleton)
+
+        self.__database = self.__injector.get(IAsyncDatabase)
+        await self.__database.create_database()
+        self.__user = User(email="fredrik@omstedt.com")
+        async with self.__database.get_session() as session:
+            session.add(self.__user)
+            session.add(Category(name="Food", user_id=self.__user.id))
+            await session.commit()
+
+    async def asyncTearDown(self) -> None:
+        await self.__database.delete_database()
+
+    async def test_reports_follow_ledger_writes(self):
+        manager = self.__injector.get(AsyncAnalyticsManager)
+        await self.__create(-100, "Food")
+
+        before = await manager.get_category_spend(self.__user, SpendFilter())
+        cached = self.__injector.get(ILedgerCache).get_ledger(self.__user)
+        await self.__create(-300)
+        after = await manager.get_category_spend(self.__user, SpendFilter())
+
+        self.assertIsNotNone(cached)
+        self.assertEqual(
+            [(read.category, read.spend) for read in before], [("Food", 100)]
+        )
+        self.assertEqual(
+            [(read.category, read.spend) for read in after],
+            [(None, 300), ("Food", 100)],
+        )
+
+    async def test_deleting_category_invalidates_ledger(self):
+        manager = self.__injector.get(AsyncAnalyticsManager)
+        category_manager = self.__injector.get(AsyncCategoryManager)
+        await self.__create(-100, "Food")
+        await manager.get_category_spend(self.__user, SpendFilter())
+
+        await category_manager.delete_category(self.__user, "Food")
+        spend = await manager.get_category_spend(self.__user, SpendFilter())
+
+        self.assertEqual([(read.category, read.spend) for read in spend], [(None, 100)])
+
+    async def __create(self, amount: int, category: str | None = None) -> None:
+        transaction_manager = self.__injector.get(AsyncTransactionManager)
+        await transaction_manager.create_transaction(
+            self.__user,
+            TransactionCreate(
+                amount=amount, occurred_at=OCCURRED_AT, category=category
+            ),
+        )
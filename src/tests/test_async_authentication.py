@@ -0,0 +1,145 @@
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import create_autospec
+
+from injector import Injector, singleton
+
+from src.authentication.async_authentication import AsyncAuthentication
+from src.authentication.i_async_token_revocations import IAsyncTokenRevocations
+from src.authentication.i_password_handler import IPasswordHandler
+from src.authentication.i_user_cache import IUserCache
+from src.common.exceptions import ObjectNotFoundError
+from src.common.i_jwt_encoder import IJwtEncoder
+from src.common.settings import Settings
+from src.database.users.user import User, UserRead
+from src.managers.i_async_user_manager import IAsyncUserManager
+
+
+class TestAsyncAuthentication(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.__password_handler = create_autospec(IPasswordHandler)
+        self.__jwt_encoder = create_autospec(IJwtEncoder)
+        self.__user_manager = create_autospec(IAsyncUserManager)
+        self.__user_cache = create_autospec(IUserCache)
+        self.__user_cache.get_user.return_value = None
+        self.__token_revocations = create_autospec(IAsyncTokenRevocations)
+        self.__token_revocations.is_revoked.return_value = False
+
+        self.__injector = Injector()
+        self.__injector.binder.bind(
+            IPasswordHandler, to=self.__password_handler, scope=singleton
+        )
+        self.__injector.binder.bind(IJwtEncoder, to=self.__jwt_encoder, scope=singleton)
+        self.__injector.binder.bind(
+            IAsyncUserManager, to=self.__user_manager, scope=singleton
+        )
+        self.__injector.binder.bind(IUserCache, to=self.__user_cache, scope=singleton)
+        self.__injector.binder.bind(
+            IAsyncTokenRevocations, to=self.__token_revocations, scope=singleton
+        )
+        self.__injector.binder.bind(Settings, to=Settings(), scope=singleton)
+
+    async def test_authenticate_user_raises_on_user_not_existing(self):
+        self.__jwt_encoder.decode.return_value = {"sub": "invalid-id"}
+        self.__user_manager.get_user.return_value = None
+
+        authentication = self.__injector.get(AsyncAuthentication)
+
+        with self.assertRaises(ObjectNotFoundError):
+            await authentication.authenticate_user("token")
+
+    async def test_authenticate_user_returns_user(self):
+        user = User(email="test@email.com")
+        self.__jwt_encoder.decode.return_value = {"sub": user.id}
+        self.__user_manager.get_user.return_value = user
+
+        authentication = self.__injector.get(AsyncAuthentication)
+        returned_user = await authentication.authenticate_user("token")
+
+        self.__user_manager.get_user.assert_awaited_once_with(user.id)
+        self.__user_cache.add_user.assert_called_once_with(user)
+        self.assertEqual(returned_user, user)
+
+    async def test_authenticate_user_raises_on_revoked_token(self):
+        user = User(email="test@email.com", token_version=1)
+        self.__jwt_encoder.decode.return_value = {"sub": user.id, "ver": 0}
+        self.__user_cache.get_user.return_value = user
+
+        authentication = self.__injector.get(AsyncAuthentication)
+
+        with self.assertRaises(ValueError):
+            await authentication.authenticate_user("token")
+
+    async def test_authenticate_user_claims_reads_token_when_stateless(self):
+        self.__injector.binder.bind(
+            Settings, to=Settings(stateless_authentication=True), scope=singleton
+        )
+        self.__jwt_encoder.decode.return_value = {
+            "sub": "id",
+            "ver": 0,
+            "email": "test@email.com",
+        }
+
+        authentication = self.__injector.get(AsyncAuthentication)
+        claims = await authentication.authenticate_user_claims("token")
+
+        self.__token_revocations.is_revoked.assert_awaited_once_with("id", 0)
+        self.__user_manager.get_user.assert_not_called()
+        self.assertEqual(claims, UserRead(id="id", email="test@email.com"))
+
+    async def test_authenticate_user_claims_raises_on_revoked_token_when_stateless(
+        self,
+    ):
+        self.__injector.binder.bind(
+            Settings, to=Settings(stateless_authentication=True), scope=singleton
+        )
+        self.__jwt_encoder.decode.return_value = {
+            "sub": "id",
+            "ver": 0,
+            "email": "test@email.com",
+        }
+        self.__token_revocations.is_revoked.return_value = True
+
+        authentication = self.__injector.get(AsyncAuthentication)
+
+        with self.assertRaises(ValueError):
+            await authentication.authenticate_user_claims("token")
+
+    async def test_get_token_user_id_skips_loading_user(self):
+        self.__jwt_encoder.decode.return_value = {"sub": "id"}
+
+        authentication = self.__injector.get(AsyncAuthentication)
+        user_id = await authentication.get_token_user_id("token")
+
+        self.assertEqual(user_id, "id")
+        self.__user_manager.get_user.assert_not_called()
+
+    async def test_login_user_raises_on_invalid_password(self):
+        self.__user_manager.get_user_with_email.return_value = User(
+            email="test@email.com"
+        )
+        self.__password_handler.verify_and_update_password_async.return_value = (
+            False,
+            None,
+        )
+
+        authentication = self.__injector.get(AsyncAuthentication)
+
+        with self.assertRaises(ValueError):
+            await authentication.login_user("test@email.com", "password")
+
+    async def test_login_user_rehashes_and_returns_encoded_token(self):
+        user = User(email="test@email.com", hashed_password="old-hash")
+        self.__user_manager.get_user_with_email.return_value = user
+        self.__password_handler.verify_and_update_password_async.return_value = (
+            True,
+            "new-hash",
+        )
+        self.__jwt_encoder.encode.return_value = "encoded-token"
+
+        authentication = self.__injector.get(AsyncAuthentication)
+        token = await authentication.login_user("test@email.com", "password")
+
+        self.assertEqual(token, "encoded-token")
+        self.__user_manager.update_user_hashed_password.assert_awaited_once_with(
+            user.id, "new-hash"
+        )
@@ -0,0 +1,273 @@
+from unittest import TestCase
+from unittest.mock import create_autospec
+
+from fastapi import status
+from fastapi.testclient import TestClient
+from injector import Injector, singleton
+
+from src.authentication.i_async_authentication import IAsyncAuthentication
+from src.authentication.i_password_handler import IPasswordHandler
+from src.common.exceptions import ObjectNotFoundError, PasswordHashingOverloadedError
+from src.common.i_resource_versions import IResourceVersions
+from src.common.resource_versions import ResourceVersions
+from src.common.settings import Settings
+from src.database.users.user import User, UserRead
+from src.main import create_app
+from src.managers.i_async_user_manager import IAsyncUserManager
+
+
+class TestAsyncApi(TestCase):
+    def setUp(self):
+        self.__authentication = create_autospec(IAsyncAuthentication)
+        self.__password_handler = create_autospec(IPasswordHandler)
+        self.__user_manager = create_autospec(IAsyncUserManager)
+
+        self.__injector = Injector()
+        self.__injector.binder.bind(
+            IAsyncAuthentication, to=self.__authentication, scope=singleton
+        )
+        self.__injector.binder.bind(
+            IPasswordHandler, to=self.__password_handler, scope=singleton
+        )
+        self.__injector.binder.bind(
+            IAsyncUserManager, to=self.__user_manager, scope=singleton
+        )
+        self.__injector.binder.bind(
+            Settings, to=Settings(async_database=True), scope=singleton
+        )
+        self.__injector.binder.bind(
+            IResourceVersions, to=ResourceVersions, scope=singleton
+        )
+
+        app = create_app(self.__injector)
+        self.__client = TestClient(app)
+
+    def test_login_for_access_token_unauthorized(self):
+        self.__authentication.login_user.side_effect = ValueError()
+
+        response = self.__client.post(
+            "/auth/token", data={"username": "bla", "password": "bla"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_login_for_access_token_overloaded(self):
+        self.__authentication.login_user.side_effect = PasswordHashingOverloadedError()
+
+        response = self.__client.post(
+            "/auth/token", data={"username": "bla", "password": "bla"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertIn("Retry-After", response.headers)
+
+    def test_login_for_access_token_returns_token_and_type(self):
+        token = "i-am-a-token"
+        username = "bla"
+        password = "blabla"
+        self.__authentication.login_user.return_value = token
+
+        response = self.__client.post(
+            "/auth/token", data={"username": username, "password": password}
+        )
+
+        self.__authentication.login_user.assert_awaited_once_with(username, password)
+        token_data = response.json()
+        self.assertIn("token_type", token_data)
+        self.assertEqual("bearer", token_data["token_type"])
+        self.assertIn("access_token", token_data)
+        self.assertEqual(token, token_data["access_token"])
+
+    def test_create_user_bad_request(self):
+        self.__user_manager.create_user.side_effect = ValueError()
+
+        response = self.__client.post(
+            "/auth/create-user",
+            json={"email": "fredrik@omstedt.com", "password": "password"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_create_user_overloaded(self):
+        self.__user_manager.create_user.side_effect = PasswordHashingOverloadedError()
+
+        response = self.__client.post(
+            "/auth/create-user",
+            json={"email": "fredrik@omstedt.com", "password": "password"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+
+    def test_create_user_returns_user_read(self):
+        email = "fredrik@omstedt.com"
+        first_name = "Fredrik"
+        last_name = "Omstedt"
+        self.__user_manager.create_user.return_value = User(
+            email=email, first_name=first_name, last_name=last_name
+        )
+
+        response = self.__client.post(
+            "/auth/create-user", json={"email": email, "password": "password"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        user = response.json()
+        self.assertNotIn("hashed_password", user)
+        self.assertEqual(first_name, user["first_name"])
+        self.assertEqual(last_name, user["last_name"])
+        self.assertEqual(email, user["email"])
+
+    def test_get_user_unauthorized(self):
+        response = self.__client.get("/auth/get-user")
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_get_user_success(self):
+        email = "fredrik@omstedt.com"
+        first_name = "Fredrik"
+        last_name = "Omstedt"
+        self.__authentication.authenticate_user_claims.return_value = UserRead(
+            id="id", email=email, first_name=first_name, last_name=last_name
+        )
+
+        response = self.__client.get(
+            "/auth/get-user", headers={"Authorization": "Bearer blabla"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        user = response.json()
+        self.assertNotIn("hashed_password", user)
+        self.assertEqual(first_name, user["first_name"])
+        self.assertEqual(last_name, user["last_name"])
+        self.assertEqual(email, user["email"])
+
+    def test_get_user_not_modified_if_etag_matches(self):
+        self.__authentication.get_token_user_id.return_value = "id"
+        self.__authentication.authenticate_user_claims.return_value = UserRead(
+            id="id", email="fredrik@omstedt.com"
+        )
+        headers = {"Authorization": "Bearer blabla"}
+
+        first = self.__client.get("/auth/get-user", headers=headers)
+        second = self.__client.get(
+            "/auth/get-user",
+            headers={**headers, "If-None-Match": first.headers["ETag"]},
+        )
+
+        self.assertEqual(second.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.__authentication.authenticate_user_claims.assert_called_once()
+
+    def test_update_user_unauthorized(self):
+        response = self.__client.patch("/auth/update-user", json={})
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_update_user_not_found(self):
+        self.__user_manager.update_user.side_effect = ObjectNotFoundError()
+
+        response = self.__client.patch(
+            "/auth/update-user", json={}, headers={"Authorization": "Bearer blabla"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_update_user_returns_user_read(self):
+        email = "fredrik@omstedt.com"
+        first_name = "Fredrik"
+        last_name = "Omstedt"
+        self.__user_manager.update_user.return_value = User(
+            email=email, first_name=first_name, last_name=last_name
+        )
+
+        response = self.__client.patch(
+            "/auth/update-user", json={}, headers={"Authorization": "Bearer blabla"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        user = response.json()
+        self.assertNotIn("hashed_password", user)
+        self.assertEqual(first_name, user["first_name"])
+        self.assertEqual(last_name, user["last_name"])
+        self.assertEqual(email, user["email"])
+
+    def test_update_user_password_unauthorized(self):
+        response = self.__client.patch("/auth/update-user-password", json={})
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_update_user_password_wrong_password(self):
+        self.__password_handler.verify_password_async.return_value = False
+
+        response = self.__client.patch(
+            "/auth/update-user-password",
+            json={"old_password": "bla", "new_password": "blabla"},
+            headers={"Authorization": "Bearer blabla"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_update_user_password_not_found(self):
+        self.__password_handler.verify_password_async.return_value = True
+        self.__user_manager.update_user_password.side_effect = ObjectNotFoundError()
+
+        response = self.__client.patch(
+            "/auth/update-user-password",
+            json={"old_password": "bla", "new_password": "blabla"},
+            headers={"Authorization": "Bearer blabla"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_update_user_password_overloaded(self):
+        self.__password_handler.verify_password_async.side_effect = (
+            PasswordHashingOverloadedError()
+        )
+
+        response = self.__client.patch(
+            "/auth/update-user-password",
+            json={"old_password": "bla", "new_password": "blabla"},
+            headers={"Authorization": "Bearer blabla"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+
+    def test_update_user_password_returns_user_read(self):
+        email = "fredrik@omstedt.com"
+        first_name = "Fredrik"
+        last_name = "Omstedt"
+        self.__user_manager.update_user_password.return_value = User(
+            email=email, first_name=first_name, last_name=last_name
+        )
+
+        self.__password_handler.verify_password_async.return_value = True
+        response = self.__client.patch(
+            "/auth/update-user-password",
+            json={"old_password": "bla", "new_password": "blabla"},
+            headers={"Authorization": "Bearer blabla"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        user = response.json()
+        self.assertNotIn("hashed_password", user)
+        self.assertEqual(first_name, user["first_name"])
+        self.assertEqual(last_name, user["last_name"])
+        self.assertEqual(email, user["email"])
+
+    def test_delete_user_unauthorized(self):
+        response = self.__client.delete("/auth/delete-user")
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_delete_user_not_found(self):
+        self.__user_manager.delete_user.side_effect = ObjectNotFoundError()
+
+        response = self.__client.delete(
+            "/auth/delete-user", headers={"Authorization": "Bearer blabla"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_delete_user_success(self):
+        response = self.__client.delete(
+            "/auth/delete-user", headers={"Authorization": "Bearer blabla"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.__user_manager.delete_user.assert_awaited_once()
@@ -0,0 +1,124 @@
+from unittest import IsolatedAsyncioTestCase
+
+from injector import singleton
+from sqlmodel import select
+
+from src.common.etags import VersionedResource
+from src.common.exceptions import ObjectNotFoundError
+from src.common.i_resource_versions import IResourceVersions
+from src.database.categories.category import (
+    Category,
+    CategoryBulkStatus,
+    CategoryCreate,
+)
+from src.database.categories.category_database_handler import CategoryDatabaseHandler
+from src.database.categories.i_category_database_handler import ICategoryDatabaseHandler
+from src.database.i_async_database import IAsyncDatabase
+from src.database.users.user import User
+from src.managers.async_category_manager import AsyncCategoryManager
+from src.tests.test_utils import create_injector_with_async_database
+
+
+class TestAsyncCategoryManager(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.__injector = create_injector_with_async_database()
+        self.__injector.binder.bind(
+            ICategoryDatabaseHandler, to=CategoryDatabaseHandler, scope=singleton
+        )
+
+        self.__database = self.__injector.get(IAsyncDatabase)
+        await self.__database.create_database()
+        self.__user = User(email="fredrik@omstedt.com")
+        async with self.__database.get_session() as session:
+            session.add(self.__user)
+            await session.commit()
+
+    async def asyncTearDown(self) -> None:
+        await self.__database.delete_database()
+
+    async def test_create_category_creates_category(self):
+        manager = self.__injector.get(AsyncCategoryManager)
+
+        category = await manager.create_category(self.__user, CategoryCreate(name="Food"))
+
+        self.assertEqual(category.name, "Food")
+        async with self.__database.get_session() as session:
+            db_category = await session.get(Category, category.id)
+            self.assertIsNotNone(db_category)
+
+    async def test_create_category_raises_if_already_exists(self):
+        manager = self.__injector.get(AsyncCategoryManager)
+        await manager.create_category(self.__user, CategoryCreate(name="Food"))
+
+        with self.assertRaises(ValueError):
+            await manager.create_category(self.__user, CategoryCreate(name="Food"))
+
+    async def test_get_categories_returns_categories(self):
+        manager = self.__injector.get(AsyncCategoryManager)
+        await manager.create_category(self.__user, CategoryCreate(name="Food"))
+        await manager.create_category(self.__user, CategoryCreate(name="Car"))
+
+        page = await manager.get_categories(self.__user)
+
+        self.assertEqual([category.name for category in page.items], ["Car", "Food"])
+        self.assertIsNone(page.next_cursor)
+
+    async def test_get_categories_pages_through_categories(self):
+        manager = self.__injector.get(AsyncCategoryManager)
+        for name in ["Food", "Car", "Rent"]:
+            await manager.create_category(self.__user, CategoryCreate(name=name))
+
+        first_page = await manager.get_categories(self.__user, limit=2)
+        second_page = await manager.get_categories(
+            self.__user, cursor=first_page.next_cursor, limit=2
+        )
+
+        self.assertEqual([item.name for item in first_page.items], ["Car", "Food"])
+        self.assertEqual([item.name for item in second_page.items], ["Rent"])
+        self.assertIsNone(second_page.next_cursor)
+
+    async def test_delete_category_deletes_category(self):
+        manager = self.__injector.get(AsyncCategoryManager)
+        await manager.create_category(self.__user, CategoryCreate(name="Food"))
+
+        await manager.delete_category(self.__user, "Food")
+
+        async with self.__database.get_session() as session:
+            results = await session.exec(select(Category))
+            self.assertIsNone(results.first())
+
+    async def test_delete_category_raises_if_not_existing(self):
+        manager = self.__injector.get(AsyncCategoryManager)
+
+        with self.assertRaises(ObjectNotFoundError):
+            await manager.delete_category(self.__user, "Food")
+
+    async def test_create_and_delete_categories_in_bulk(self):
+        manager = self.__injector.get(AsyncCategoryManager)
+        await manager.create_category(self.__user, CategoryCreate(name="Car"))
+
+        created = await manager.create_categories(self.__user, ["Car", "Food"])
+        deleted = await manager.delete_categories(self.__user, ["Food", "Rent"])
+
+        self.assertEqual(
+            [result.status for result in created],
+            [CategoryBulkStatus.ALREADY_EXISTS, CategoryBulkStatus.CREATED],
+        )
+        self.assertEqual(
+            [result.status for result in deleted],
+            [CategoryBulkStatus.DELETED, CategoryBulkStatus.NOT_FOUND],
+        )
+        page = await manager.get_categories(self.__user)
+        self.assertEqual([category.name for category in page.items], ["Car"])
+
+    async def test_writes_give_categories_new_version(self):
+        manager = self.__injector.get(AsyncCategoryManager)
+        versions = self.__injector.get(IResourceVersions)
+        version = versions.get_version(VersionedResource.CATEGORIES, self.__user.id)
+
+        await manager.create_category(self.__user, CategoryCreate(name="Food"))
+
+        self.assertNotEqual(
+            versions.get_version(VersionedResource.CATEGORIES, self.__user.id),
+            version,
+        )
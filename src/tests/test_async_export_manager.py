@@ -0,0 +1,89 @@
+from datetime import datetime
+from unittest import IsolatedAsyncioTestCase
+
+from injector import singleton
+
+from src.common.exports import ExportFormat
+from src.common.settings import Settings
+from src.database.categories.category import Category
+from src.database.categories.category_database_handler import CategoryDatabaseHandler
+from src.database.categories.i_category_database_handler import ICategoryDatabaseHandler
+from src.database.i_async_database import IAsyncDatabase
+from src.database.transactions.i_transaction_database_handler import (
+    ITransactionDatabaseHandler,
+)
+from src.database.transactions.transaction import Transaction
+from src.database.transactions.transaction_database_handler import (
+    TransactionDatabaseHandler,
+)
+from src.database.users.user import User
+from src.managers.async_export_manager import AsyncExportManager
+from src.tests.test_utils import create_injector_with_async_database
+
+
+class TestAsyncExportManager(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.__injector = create_injector_with_async_database()
+        self.__injector.binder.bind(
+            Settings,
+            to=Settings(database_url="sqlite:///test_database.db", export_batch_size=2),
+            scope=singleton,
+        )
+        self.__injector.binder.bind(
+            ICategoryDatabaseHandler, to=CategoryDatabaseHandler, scope=singleton
+        )
+        self.__injector.binder.bind(
+            ITransactionDatabaseHandler,
+            to=TransactionDatabaseHandler,
+            scope=singleton,
+        )
+
+        self.__database = self.__injector.get(IAsyncDatabase)
+        await self.__database.create_database()
+        self.__user = User(email="fredrik@omstedt.com")
+        async with self.__database.get_session() as session:
+            session.add(self.__user)
+            food = Category(name="Food", user_id=self.__user.id)
+            session.add(food)
+            await session.flush()
+            session.add_all([
+                Transaction(
+                    user_id=self.__user.id,
+                    category_id=food.id if index % 2 else None,
+                    amount=-100 * index,
+                    occurred_at=datetime(2026, 1, 1 + index),
+                    description=f"Purchase {index}",
+                )
+                for index in range(5)
+            ])
+            await session.commit()
+
+    async def asyncTearDown(self) -> None:
+        await self.__database.delete_database()
+
+    async def test_export_transactions_streams_every_batch(self):
+        manager = self.__injector.get(AsyncExportManager)
+
+        data = b"".join([
+            chunk
+            async for chunk in manager.export_transactions(
+                self.__user, ExportFormat.CSV, False
+            )
+        ])
+
+        lines = data.decode().splitlines()
+        self.assertEqual(lines[0], "id,date,amount,description,category")
+        self.assertEqual(lines[2], "2,2026-01-02T00:00:00,-1.00,Purchase 1,Food")
+        self.assertEqual(len(lines), 6)
+
+    async def test_export_categories_writes_names(self):
+        manager = self.__injector.get(AsyncExportManager)
+
+        data = b"".join([
+            chunk
+            async for chunk in manager.export_categories(
+                self.__user, ExportFormat.CSV, False
+            )
+        ])
+
+        self.assertEqual(data, b"name\r\nFood\r\n")
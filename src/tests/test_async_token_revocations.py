@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+from unittest import IsolatedAsyncioTestCase
+
+from src.authentication.async_token_revocations import AsyncTokenRevocations
+from src.common.settings import Settings
+from src.database.i_async_database import IAsyncDatabase
+from src.database.users.token_revocation import TokenRevocation
+from src.tests.test_utils import create_injector_with_async_database
+
+USER_ID = "0192a5d4-7c3e-7b21-9f4a-3d8e2c1b5a60"
+OTHER_USER_ID = "0192a5d4-7c3e-7b21-9f4a-3d8e2c1b5a61"
+
+
+class TestAsyncTokenRevocations(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.__injector = create_injector_with_async_database()
+        settings = self.__injector.get(Settings)
+        settings.token_revocation_refresh_seconds = 0
+        settings.access_token_expire_hours = 4
+
+        self.__database = self.__injector.get(IAsyncDatabase)
+        await self.__database.create_database()
+
+    async def asyncTearDown(self) -> None:
+        await self.__database.delete_database()
+
+    async def test_is_revoked_returns_false_without_revocations(self):
+        revocations = self.__injector.get(AsyncTokenRevocations)
+
+        self.assertFalse(await revocations.is_revoked(USER_ID, 0))
+
+    async def test_is_revoked_picks_up_committed_revocations(self):
+        revocations = self.__injector.get(AsyncTokenRevocations)
+        await revocations.is_revoked(USER_ID, 0)
+        await self.__add_to_database(TokenRevocation(user_id=USER_ID, token_version=2))
+
+        self.assertTrue(await revocations.is_revoked(USER_ID, 1))
+        self.assertFalse(await revocations.is_revoked(USER_ID, 2))
+        self.assertFalse(await revocations.is_revoked(OTHER_USER_ID, 0))
+
+    async def test_is_revoked_ignores_revocations_older_than_token_lifetime(self):
+        await self.__add_to_database(
+            TokenRevocation(
+                user_id=USER_ID,
+                token_version=1,
+                revoked_at=datetime.utcnow() - timedelta(hours=5),
+            )
+        )
+        revocations = self.__injector.get(AsyncTokenRevocations)
+
+        self.assertFalse(await revocations.is_revoked(USER_ID, 0))
+
+    async def test_add_revocation_applies_immediately(self):
+        self.__injector.get(Settings).token_revocation_refresh_seconds = 60
+        revocations = self.__injector.get(AsyncTokenRevocations)
+        await revocations.is_revoked(USER_ID, 0)
+
+        revocations.add_revocation(TokenRevocation(user_id=USER_ID, token_version=1))
+
+        self.assertTrue(await revocations.is_revoked(USER_ID, 0))
+
+    async def __add_to_database(self, revocation: TokenRevocation) -> None:
+        async with self.__database.get_session() as session:
+            session.add(revocation)
+            await session.commit()
@@ -0,0 +1,93 @@
+from io import BytesIO
+from unittest import IsolatedAsyncioTestCase
+
+from injector import singleton
+from sqlmodel import func, select
+
+from src.database.categories.category import Category
+from src.database.categories.category_database_handler import CategoryDatabaseHandler
+from src.database.categories.i_category_database_handler import ICategoryDatabaseHandler
+from src.database.i_async_database import IAsyncDatabase
+from src.database.transactions.i_transaction_database_handler import (
+    ITransactionDatabaseHandler,
+)
+from src.database.transactions.transaction import (
+    StatementFormat,
+    Transaction,
+    TransactionImportError,
+)
+from src.database.transactions.transaction_database_handler import (
+    TransactionDatabaseHandler,
+)
+from src.database.users.user import User
+from src.managers.async_transaction_import_manager import (
+    AsyncTransactionImportManager,
+)
+from src.tests.test_utils import create_injector_with_async_database
+from src.transactions.statements import parse_statement
+
+CSV = b"""date,amount,category
+2026-01-01,-45.50,Food
+2026-01-01,-45.50,Food
+2026-01-02,-12,Car
+"""
+
+
+class TestAsyncTransactionImportManager(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.__injector = create_injector_with_async_database()
+        self.__injector.binder.bind(
+            ICategoryDatabaseHandler, to=CategoryDatabaseHandler, scope=singleton
+        )
+        self.__injector.binder.bind(
+            ITransactionDatabaseHandler,
+            to=TransactionDatabaseHandler,
+            scope=singleton,
+        )
+
+        self.__database = self.__injector.get(IAsyncDatabase)
+        await self.__database.create_database()
+        self.__user = User(email="fredrik@omstedt.com")
+        async with self.__database.get_session() as session:
+            session.add(self.__user)
+            session.add(Category(name="Food", user_id=self.__user.id))
+            await session.commit()
+
+    async def asyncTearDown(self) -> None:
+        await self.__database.delete_database()
+
+    async def test_import_transactions_records_transactions(self):
+        manager = self.__injector.get(AsyncTransactionImportManager)
+
+        progress = [
+            update
+            async for update in manager.import_transactions(self.__user, self.__parse())
+        ]
+
+        self.assertEqual(progress[0].inserted, 2)
+        self.assertEqual(
+            progress[0].errors,
+            [TransactionImportError(row=4, message="Category does not exist.")],
+        )
+        self.assertTrue(progress[-1].done)
+        async with self.__database.get_session() as session:
+            count = await session.exec(
+                select(func.count()).where(Transaction.user_id == self.__user.id)
+            )
+            self.assertEqual(count.one(), 2)
+
+    async def test_import_transactions_skips_imported_rows(self):
+        manager = self.__injector.get(AsyncTransactionImportManager)
+        async for _ in manager.import_transactions(self.__user, self.__parse()):
+            pass
+
+        progress = [
+            update
+            async for update in manager.import_transactions(self.__user, self.__parse())
+        ]
+
+        self.assertEqual(progress[-1].inserted, 0)
+        self.assertEqual(progress[-1].duplicates, 2)
+
+    def __parse(self):
+        return parse_statement(BytesIO(CSV), StatementFormat.CSV)
@@ -0,0 +1,176 @@
+from datetime import date, datetime, timedelta
+from unittest import IsolatedAsyncioTestCase
+
+from injector import singleton
+
+from src.common.exceptions import ObjectNotFoundError
+from src.database.categories.category import Category
+from src.database.i_async_database import IAsyncDatabase
+from src.database.transactions.balance import BalanceRead, BalanceSeriesFilter
+from src.database.transactions.balance_database_handler import (
+    BalanceDatabaseHandler,
+)
+from src.database.transactions.i_balance_database_handler import (
+    IBalanceDatabaseHandler,
+)
+from src.database.transactions.i_monthly_total_database_handler import (
+    IMonthlyTotalDatabaseHandler,
+)
+from src.database.transactions.i_transaction_database_handler import (
+    ITransactionDatabaseHandler,
+)
+from src.database.transactions.monthly_total import (
+    MonthlyTotalFilter,
+    MonthlyTotalRead,
+)
+from src.database.transactions.monthly_total_database_handler import (
+    MonthlyTotalDatabaseHandler,
+)
+from src.database.transactions.transaction import (
+    Transaction,
+    TransactionCreate,
+    TransactionFilter,
+    TransactionSearchFilter,
+)
+from src.database.transactions.transaction_database_handler import (
+    TransactionDatabaseHandler,
+)
+from src.database.users.user import User
+from src.managers.async_transaction_manager import AsyncTransactionManager
+from src.tests.test_utils import create_injector_with_async_database
+
+START = datetime(2026, 1, 1)
+
+
+class TestAsyncTransactionManager(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.__injector = create_injector_with_async_database()
+        self.__injector.binder.bind(
+            ITransactionDatabaseHandler,
+            to=TransactionDatabaseHandler,
+            scope=singleton,
+        )
+        self.__injector.binder.bind(
+            IMonthlyTotalDatabaseHandler,
+            to=MonthlyTotalDatabaseHandler,
+            scope=singleton,
+        )
+        self.__injector.binder.bind(
+            IBalanceDatabaseHandler, to=BalanceDatabaseHandler, scope=singleton
+        )
+
+        self.__database = self.__injector.get(IAsyncDatabase)
+        await self.__database.create_database()
+        self.__user = User(email="fredrik@omstedt.com")
+        async with self.__database.get_session() as session:
+            session.add(self.__user)
+            session.add(Category(name="Food", user_id=self.__user.id))
+            await session.commit()
+
+    async def asyncTearDown(self) -> None:
+        await self.__database.delete_database()
+
+    async def test_create_transaction_creates_transaction(self):
+        manager = self.__injector.get(AsyncTransactionManager)
+        data = TransactionCreate(amount=-100, occurred_at=START, category="Food")
+
+        transaction = await manager.create_transaction(self.__user, data)
+
+        self.assertEqual(transaction.category, "Food")
+        async with self.__database.get_session() as session:
+            db_transaction = await session.get(Transaction, transaction.id)
+            self.assertEqual(db_transaction.amount, -100)
+
+    async def test_create_transaction_raises_if_category_not_existing(self):
+        manager = self.__injector.get(AsyncTransactionManager)
+        data = TransactionCreate(amount=-100, occurred_at=START, category="Car")
+
+        with self.assertRaises(ObjectNotFoundError):
+            await manager.create_transaction(self.__user, data)
+
+    async def test_get_transactions_pages_through_transactions(self):
+        manager = self.__injector.get(AsyncTransactionManager)
+        for index in range(3):
+            await manager.create_transaction(
+                self.__user,
+                TransactionCreate(
+                    amount=index, occurred_at=START + timedelta(days=index)
+                ),
+            )
+
+        first = await manager.get_transactions(
+            self.__user, TransactionFilter(), limit=2
+        )
+        second = await manager.get_transactions(
+            self.__user, TransactionFilter(), first.next_cursor, limit=2
+        )
+
+        self.assertEqual([transaction.amount for transaction in first.items], [2, 1])
+        self.assertEqual([transaction.amount for transaction in second.items], [0])
+        self.assertIsNone(second.next_cursor)
+
+    async def test_search_transactions_pages_through_matches(self):
+        manager = self.__injector.get(AsyncTransactionManager)
+        for description in ["Taxi", "Taxi home", "Train", "Taxi"]:
+            await manager.create_transaction(
+                self.__user,
+                TransactionCreate(
+                    amount=-100, occurred_at=START, description=description
+                ),
+            )
+        filters = TransactionSearchFilter(query="taxi")
+
+        first = await manager.search_transactions(self.__user, filters, limit=2)
+        second = await manager.search_transactions(
+            self.__user, filters, first.next_cursor, limit=2
+        )
+
+        descriptions = [
+            transaction.description for transaction in first.items + second.items
+        ]
+        self.assertEqual(sorted(descriptions), ["Taxi", "Taxi", "Taxi home"])
+        self.assertIsNone(second.next_cursor)
+
+    async def test_get_monthly_totals_follows_ledger_writes(self):
+        manager = self.__injector.get(AsyncTransactionManager)
+        for amount, category in [(-100, "Food"), (-50, "Food"), (300, None)]:
+            transaction = await manager.create_transaction(
+                self.__user,
+                TransactionCreate(amount=amount, occurred_at=START, category=category),
+            )
+        await manager.delete_transaction(self.__user, transaction.id)
+
+        totals = await manager.get_monthly_totals(self.__user, MonthlyTotalFilter())
+
+        self.assertEqual(
+            totals,
+            [
+                MonthlyTotalRead(
+                    month=date(2026, 1, 1), category="Food", total=-150, count=2
+                )
+            ],
+        )
+
+    async def test_get_balance_series_follows_ledger_writes(self):
+        manager = self.__injector.get(AsyncTransactionManager)
+        for amount, day in [(500, 1), (-100, 3), (-50, 3), (20, 5)]:
+            transaction = await manager.create_transaction(
+                self.__user,
+                TransactionCreate(
+                    amount=amount, occurred_at=START + timedelta(days=day)
+                ),
+            )
+        await manager.delete_transaction(self.__user, transaction.id)
+
+        balance = await manager.get_balance(self.__user, date(2026, 1, 4))
+        filters = BalanceSeriesFilter(start=date(2026, 1, 3), end=date(2026, 1, 7))
+        series = await manager.get_balance_series(self.__user, filters)
+
+        self.assertEqual(balance, BalanceRead(day=date(2026, 1, 4), balance=350))
+        self.assertEqual([point.balance for point in series], [500, 350, 350, 350])
+
+    async def test_delete_transaction_raises_if_not_existing(self):
+        manager = self.__injector.get(AsyncTransactionManager)
+
+        with self.assertRaises(ObjectNotFoundError):
+            await manager.delete_transaction(self.__user, 1)
@@ -0,0 +1,160 @@
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import create_autospec
+
+from injector import singleton
+from sqlmodel import select
+
+from src.authentication.i_async_token_revocations import IAsyncTokenRevocations
+from src.authentication.i_password_handler import IPasswordHandler
+from src.authentication.i_user_cache import IUserCache
+from src.common.exceptions import ObjectNotFoundError
+from src.common.i_resource_versions import IResourceVersions
+from src.database.i_async_database import IAsyncDatabase
+from src.database.users.token_revocation import TokenRevocation
+from src.database.users.user import User, UserCreate, UserUpdate
+from src.managers.async_user_manager import AsyncUserManager
+from src.tests.test_utils import create_injector_with_async_database
+
+
+class TestAsyncUserManager(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.__password_handler = create_autospec(IPasswordHandler)
+        self.__user_cache = create_autospec(IUserCache)
+        self.__token_revocations = create_autospec(IAsyncTokenRevocations)
+        self.__resource_versions = create_autospec(IResourceVersions)
+        self.__injector = create_injector_with_async_database()
+        self.__injector.binder.bind(
+            IPasswordHandler, to=self.__password_handler, scope=singleton
+        )
+        self.__injector.binder.bind(IUserCache, to=self.__user_cache, scope=singleton)
+        self.__injector.binder.bind(
+            IAsyncTokenRevocations, to=self.__token_revocations, scope=singleton
+        )
+        self.__injector.binder.bind(
+            IResourceVersions, to=self.__resource_versions, scope=singleton
+        )
+
+        self.__database = self.__injector.get(IAsyncDatabase)
+        await self.__database.create_database()
+
+    async def asyncTearDown(self) -> None:
+        await self.__database.delete_database()
+
+    async def test_create_user_raises_if_user_with_email_exists(self):
+        email = "fredrik@omstedt.com"
+        self.__password_handler.hash_password_async.return_value = "420password"
+        await self.__add_user(User(email=email))
+
+        manager = self.__injector.get(AsyncUserManager)
+        with self.assertRaises(ValueError):
+            await manager.create_user(UserCreate(email=email, password="password"))
+
+    async def test_create_user_stores_with_hashed_password(self):
+        email = "fredrik@omstedt.com"
+        password = "password"
+        hashed_password = "420password"
+        self.__password_handler.hash_password_async.return_value = hashed_password
+
+        manager = self.__injector.get(AsyncUserManager)
+        user = await manager.create_user(UserCreate(email=email, password=password))
+
+        self.__password_handler.hash_password_async.assert_awaited_once_with(password)
+        self.assertEqual(user.email, email)
+        async with self.__database.get_session() as session:
+            db_user = await session.get(User, user.id)
+            self.assertEqual(hashed_password, db_user.hashed_password)
+
+    async def test_get_user_returns_none_if_user_not_existing(self):
+        manager = self.__injector.get(AsyncUserManager)
+        self.assertIsNone(await manager.get_user("invalid-id"))
+
+    async def test_get_user_returns_user(self):
+        user_id = await self.__add_user(User(email="fredrik@omstedt.com"))
+
+        manager = self.__injector.get(AsyncUserManager)
+        db_user = await manager.get_user(user_id)
+        self.assertEqual(db_user.email, "fredrik@omstedt.com")
+
+    async def test_get_user_with_email_returns_user(self):
+        email = "fredrik@omstedt.com"
+        await self.__add_user(User(email=email))
+
+        manager = self.__injector.get(AsyncUserManager)
+        db_user = await manager.get_user_with_email(email)
+        self.assertEqual(db_user.email, email)
+        self.assertIsNone(await manager.get_user_with_email("invalid-email"))
+
+    async def test_update_user_raises_if_user_not_existing(self):
+        manager = self.__injector.get(AsyncUserManager)
+        with self.assertRaises(ObjectNotFoundError):
+            await manager.update_user("invalid-id", UserUpdate())
+
+    async def test_update_user_updates_user(self):
+        user_id = await self.__add_user(
+            User(email="fredrik@omstedt.com", first_name="Fredrik")
+        )
+
+        manager = self.__injector.get(AsyncUserManager)
+        updated_user = await manager.update_user(
+            user_id, UserUpdate(first_name="Tiburtius")
+        )
+
+        self.assertEqual(updated_user.first_name, "Tiburtius")
+        self.__user_cache.invalidate_user.assert_called_once()
+        self.__resource_versions.invalidate_user.assert_called_once_with(user_id)
+        async with self.__database.get_session() as session:
+            db_user = await session.get(User, user_id)
+            self.assertEqual(db_user.first_name, "Tiburtius")
+
+    async def test_update_user_password_revokes_tokens(self):
+        self.__password_handler.hash_password_async.return_value = "new-hash"
+        user_id = await self.__add_user(
+            User(email="fredrik@omstedt.com", hashed_password="old-hash")
+        )
+
+        manager = self.__injector.get(AsyncUserManager)
+        await manager.update_user_password(user_id, "password")
+
+        self.__token_revocations.add_revocation.assert_called_once()
+        async with self.__database.get_session() as session:
+            db_user = await session.get(User, user_id)
+            self.assertEqual(db_user.hashed_password, "new-hash")
+            self.assertEqual(db_user.token_version, 1)
+            revocations = (await session.exec(select(TokenRevocation))).all()
+            self.assertEqual(len(revocations), 1)
+
+    async def test_update_user_hashed_password_keeps_tokens(self):
+        user_id = await self.__add_user(
+            User(email="fredrik@omstedt.com", hashed_password="old-hash")
+        )
+
+        manager = self.__injector.get(AsyncUserManager)
+        await manager.update_user_hashed_password(user_id, "new-hash")
+
+        self.__token_revocations.add_revocation.assert_not_called()
+        async with self.__database.get_session() as session:
+            db_user = await session.get(User, user_id)
+            self.assertEqual(db_user.hashed_password, "new-hash")
+            self.assertEqual(db_user.token_version, 0)
+
+    async def test_delete_user_raises_if_user_not_existing(self):
+        manager = self.__injector.get(AsyncUserManager)
+        with self.assertRaises(ObjectNotFoundError):
+            await manager.delete_user("invalid-id")
+
+    async def test_delete_user_deletes_user(self):
+        user_id = await self.__add_user(User(email="fredrik@omstedt.com"))
+
+        manager = self.__injector.get(AsyncUserManager)
+        await manager.delete_user(user_id)
+
+        self.__user_cache.invalidate_user.assert_called_once()
+        self.__token_revocations.add_revocation.assert_called_once()
+        async with self.__database.get_session() as session:
+            self.assertIsNone(await session.get(User, user_id))
+
+    async def __add_user(self, user: User) -> str:
+        async with self.__database.get_session() as session:
+            session.add(user)
+            await session.commit()
+            return user.id
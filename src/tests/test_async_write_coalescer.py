@@ -0,0 +1,97 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from injector import singleton
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, func, select
+
+from src.common.settings import Settings
+from src.database.async_write_coalescer import AsyncWriteCoalescer
+from src.database.i_async_database import IAsyncDatabase
+from src.database.users.user import User
+from src.tests.test_utils import create_injector_with_async_database
+
+
+class TestAsyncWriteCoalescer(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.__injector = create_injector_with_async_database()
+        self.__settings = Settings(
+            database_url="sqlite:///test_database.db",
+            write_coalescing_window_ms=5,
+            write_coalescing_max_batch=3,
+        )
+        self.__injector.binder.bind(Settings, to=self.__settings, scope=singleton)
+
+        self.__database = self.__injector.get(IAsyncDatabase)
+        await self.__database.create_database()
+        self.__commits = 0
+        event.listen(Session, "after_commit", self.__count_commit)
+
+    async def asyncTearDown(self) -> None:
+        event.remove(Session, "after_commit", self.__count_commit)
+        await self.__database.delete_database()
+
+    async def test_write_commits_concurrent_writes_together(self):
+        coalescer = self.__injector.get(AsyncWriteCoalescer)
+
+        results = await asyncio.gather(
+            coalescer.write(add_user, "a@omstedt.com"),
+            coalescer.write(add_user, "b@omstedt.com"),
+        )
+
+        self.assertEqual(
+            [user.email for user in results], ["a@omstedt.com", "b@omstedt.com"]
+        )
+        self.assertEqual(self.__commits, 1)
+        self.assertEqual(await self.__count_users(), 2)
+
+    async def test_write_commits_full_batch_without_waiting(self):
+        coalescer = self.__injector.get(AsyncWriteCoalescer)
+
+        await asyncio.gather(
+            *[coalescer.write(add_user, f"{index}@omstedt.com") for index in range(4)]
+        )
+
+        self.assertEqual(self.__commits, 2)
+        self.assertEqual(await self.__count_users(), 4)
+
+    async def test_write_raises_only_for_failing_write(self):
+        coalescer = self.__injector.get(AsyncWriteCoalescer)
+
+        results = await asyncio.gather(
+            coalescer.write(add_user, "a@omstedt.com"),
+            coalescer.write(add_user, "a@omstedt.com"),
+            coalescer.write(add_user, "b@omstedt.com"),
+            return_exceptions=True,
+        )
+
+        self.assertEqual(results[0].email, "a@omstedt.com")
+        self.assertIsInstance(results[1], IntegrityError)
+        self.assertEqual(results[2].email, "b@omstedt.com")
+        self.assertEqual(await self.__count_users(), 2)
+
+    async def test_write_commits_alone_without_window(self):
+        self.__settings.write_coalescing_window_ms = 0
+        coalescer = self.__injector.get(AsyncWriteCoalescer)
+
+        await asyncio.gather(
+            coalescer.write(add_user, "a@omstedt.com"),
+            coalescer.write(add_user, "b@omstedt.com"),
+        )
+
+        self.assertEqual(self.__commits, 2)
+
+    async def __count_users(self) -> int:
+        async with self.__database.get_session() as session:
+            result = await session.exec(select(func.count()).select_from(User))
+            return result.one()
+
+    def __count_commit(self, _) -> None:
+        self.__commits += 1
+
+
+def add_user(session: Session, email: str) -> User:
+    user = User(email=email)
+    session.add(user)
+    return user
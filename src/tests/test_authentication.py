@@ -5,9 +5,12 @@ from injector import Injector, singleton
 
 from src.authentication.authentication import Authentication
 from src.authentication.i_password_handler import IPasswordHandler
+from src.authentication.i_token_revocations import ITokenRevocations
+from src.authentication.i_user_cache import IUserCache
 from src.common.exceptions import ObjectNotFoundError
 from src.common.i_jwt_encoder import IJwtEncoder
-from src.database.users.user import User
+from src.common.settings import Settings
+from src.database.users.user import User, UserRead
 from src.managers.i_user_manager import IUserManager
 
 
@@ -16,6 +19,8 @@ class TestAuthentication(TestCase):
         self.__password_handler = create_autospec(IPasswordHandler)
         self.__jwt_encoder = create_autospec(IJwtEncoder)
         self.__user_manager = create_autospec(IUserManager)
+        self.__user_cache = create_autospec(IUserCache)
+        self.__user_cache.get_user.return_value = None
 
         self.__injector = Injector()
         self.__injector.binder.bind(
@@ -25,6 +30,13 @@ class TestAuthentication(TestCase):
         self.__injector.binder.bind(
             IUserManager, to=self.__user_manager, scope=singleton
         )
+        self.__injector.binder.bind(IUserCache, to=self.__user_cache, scope=singleton)
+        self.__token_revocations = create_autospec(ITokenRevocations)
+        self.__token_revocations.is_revoked.return_value = False
+        self.__injector.binder.bind(
+            ITokenRevocations, to=self.__token_revocations, scope=singleton
+        )
+        self.__injector.binder.bind(Settings, to=Settings(), scope=singleton)
 
     def test_authenticate_user_raises_on_no_user_information(self):
         self.__jwt_encoder.decode.return_value = {}
@@ -35,8 +47,8 @@ class TestAuthentication(TestCase):
             authentication.authenticate_user("token")
 
     def test_authenticate_user_raises_on_user_not_existing(self):
-        self.__jwt_encoder.decode.return_value = {"sub": "test@email.com"}
-        self.__user_manager.get_user_with_email.return_value = None
+        self.__jwt_encoder.decode.return_value = {"sub": "invalid-id"}
+        self.__user_manager.get_user.return_value = None
 
         authentication = self.__injector.get(Authentication)
 
@@ -45,18 +57,142 @@ class TestAuthentication(TestCase):
 
     def test_authenticate_user_returns_user(self):
         token = "token"
+        user = User(email="test@email.com")
+        self.__jwt_encoder.decode.return_value = {"sub": user.id}
+        self.__user_manager.get_user.return_value = user
+
+        authentication = self.__injector.get(Authentication)
+        returned_user = authentication.authenticate_user(token)
+
+        self.__jwt_encoder.decode.assert_called_once_with(token)
+        self.__user_manager.get_user.assert_called_once_with(user.id)
+        self.__user_manager.get_user_with_email.assert_not_called()
+        self.__user_cache.add_user.assert_called_once_with(user)
+        self.assertEqual(returned_user, user)
+
+    def test_authenticate_user_returns_cached_user(self):
+        user = User(email="test@email.com")
+        self.__jwt_encoder.decode.return_value = {"sub": user.id}
+        self.__user_cache.get_user.return_value = user
+
+        authentication = self.__injector.get(Authentication)
+        returned_user = authentication.authenticate_user("token")
+
+        self.__user_cache.get_user.assert_called_once_with(user.id)
+        self.__user_manager.get_user.assert_not_called()
+        self.assertEqual(returned_user, user)
+
+    def test_authenticate_user_accepts_email_subject(self):
         test_email = "test@email.com"
         user = User(email=test_email)
         self.__jwt_encoder.decode.return_value = {"sub": test_email}
         self.__user_manager.get_user_with_email.return_value = user
 
         authentication = self.__injector.get(Authentication)
-        returned_user = authentication.authenticate_user(token)
+        returned_user = authentication.authenticate_user("token")
 
-        self.__jwt_encoder.decode.assert_called_once_with(token)
         self.__user_manager.get_user_with_email.assert_called_once_with(test_email)
         self.assertEqual(returned_user, user)
 
+    def test_authenticate_user_raises_on_email_subject_not_existing(self):
+        self.__jwt_encoder.decode.return_value = {"sub": "test@email.com"}
+        self.__user_manager.get_user_with_email.return_value = None
+
+        authentication = self.__injector.get(Authentication)
+
+        with self.assertRaises(ObjectNotFoundError):
+            authentication.authenticate_user("token")
+
+    def test_authenticate_user_rejects_email_subject_when_disabled(self):
+        self.__bind_settings(accept_email_token_subjects=False)
+        self.__jwt_encoder.decode.return_value = {"sub": "test@email.com"}
+
+        authentication = self.__injector.get(Authentication)
+
+        with self.assertRaises(ValueError):
+            authentication.authenticate_user("token")
+        self.__user_manager.get_user_with_email.assert_not_called()
+
+    def test_authenticate_user_raises_on_revoked_token(self):
+        user = User(email="test@email.com", token_version=2)
+        self.__jwt_encoder.decode.return_value = {"sub": user.id, "ver": 1}
+        self.__user_cache.get_user.return_value = user
+
+        authentication = self.__injector.get(Authentication)
+
+        with self.assertRaises(ValueError):
+            authentication.authenticate_user("token")
+
+    def test_authenticate_user_claims_loads_user_when_stateful(self):
+        user = User(email="test@email.com", first_name="Test")
+        self.__jwt_encoder.decode.return_value = {"sub": user.id}
+        self.__user_manager.get_user.return_value = user
+
+        authentication = self.__injector.get(Authentication)
+        claims = authentication.authenticate_user_claims("token")
+
+        self.__user_manager.get_user.assert_called_once_with(user.id)
+        self.assertEqual(claims, UserRead.from_orm(user))
+
+    def test_authenticate_user_claims_reads_token_when_stateless(self):
+        self.__bind_settings(stateless_authentication=True)
+        self.__jwt_encoder.decode.return_value = {
+            "sub": "id",
+            "ver": 3,
+            "email": "test@email.com",
+            "given_name": "Test",
+            "family_name": None,
+        }
+
+        authentication = self.__injector.get(Authentication)
+        claims = authentication.authenticate_user_claims("token")
+
+        self.__token_revocations.is_revoked.assert_called_once_with("id", 3)
+        self.__user_manager.get_user.assert_not_called()
+        self.__user_cache.get_user.assert_not_called()
+        self.assertEqual(
+            claims, UserRead(id="id", email="test@email.com", first_name="Test")
+        )
+
+    def test_authenticate_user_claims_raises_on_revoked_token_when_stateless(self):
+        self.__bind_settings(stateless_authentication=True)
+        self.__jwt_encoder.decode.return_value = {
+            "sub": "id",
+            "ver": 0,
+            "email": "test@email.com",
+        }
+        self.__token_revocations.is_revoked.return_value = True
+
+        authentication = self.__injector.get(Authentication)
+
+        with self.assertRaises(ValueError):
+            authentication.authenticate_user_claims("token")
+
+    def test_authenticate_user_claims_loads_user_for_tokens_without_claims(self):
+        self.__bind_settings(stateless_authentication=True)
+        user = User(email="test@email.com")
+        self.__jwt_encoder.decode.return_value = {"sub": user.id}
+        self.__user_manager.get_user.return_value = user
+
+        authentication = self.__injector.get(Authentication)
+        claims = authentication.authenticate_user_claims("token")
+
+        self.__user_manager.get_user.assert_called_once_with(user.id)
+        self.assertEqual(claims.email, user.email)
+
+    def test_get_token_user_id_skips_loading_user(self):
+        authentication = self.__injector.get(Authentication)
+
+        self.__jwt_encoder.decode.return_value = {"sub": "id", "ver": 1}
+        user_id = authentication.get_token_user_id("token")
+        self.__jwt_encoder.decode.return_value = {"sub": "test@email.com"}
+        email_user_id = authentication.get_token_user_id("token")
+
+        self.assertEqual(user_id, "id")
+        self.assertIsNone(email_user_id)
+        self.__user_manager.get_user.assert_not_called()
+        self.__user_manager.get_user_with_email.assert_not_called()
+
     def test_login_user_raises_on_user_not_existing(self):
         self.__user_manager.get_user_with_email.return_value = None
 
@@ -69,7 +205,7 @@ class TestAuthentication(TestCase):
         self.__user_manager.get_user_with_email.return_value = User(
             email="test@email.com"
         )
-        self.__password_handler.verify_password.return_value = False
+        self.__password_handler.verify_and_update_password.return_value = (False, None)
 
         authentication = self.__injector.get(Authentication)
 
@@ -81,7 +217,7 @@ class TestAuthentication(TestCase):
         password = "password"
         encoded_token = "encoded-token"
         self.__user_manager.get_user_with_email.return_value = User(email=test_email)
-        self.__password_handler.verify_password.return_value = True
+        self.__password_handler.verify_and_update_password.return_value = (True, None)
         self.__jwt_encoder.encode.return_value = encoded_token
 
         authentication = self.__injector.get(Authentication)
@@ -89,3 +225,30 @@ class TestAuthentication(TestCase):
 
         self.assertEqual(token, encoded_token)
         self.__jwt_encoder.encode.assert_called_once()
+        user = self.__user_manager.get_user_with_email.return_value
+        claims = self.__jwt_encoder.encode.call_args.args[0]
+        self.assertEqual(claims["sub"], user.id)
+        self.assertEqual(claims["ver"], user.token_version)
+        self.assertEqual(claims["email"], user.email)
+        self.__user_manager.update_user_hashed_password.assert_not_called()
+
+    def test_login_user_rehashes_outdated_password_hash(self):
+        user = User(email="test@email.com", hashed_password="old-hash")
+        self.__user_manager.get_user_with_email.return_value = user
+        self.__password_handler.verify_and_update_password.return_value = (
+            True,
+            "new-hash",
+        )
+
+        authentication = self.__injector.get(Authentication)
+        authentication.login_user("test@email.com", "password")
+
+        self.__password_handler.verify_and_update_password.assert_called_once_with(
+            "password", "old-hash"
+        )
+        self.__user_manager.update_user_hashed_password.assert_called_once_with(
+            user.id, "new-hash"
+        )
+
+    def __bind_settings(self, **values):
+        self.__injector.binder.bind(Settings, to=Settings(**values), scope=singleton)
@@ -7,8 +7,12 @@ from injector import Injector, singleton
 
 from src.authentication.i_authentication import IAuthentication
 from src.authentication.i_password_handler import IPasswordHandler
-from src.common.exceptions import ObjectNotFoundError
-from src.database.users.user import User
+from src.common.etags import VersionedResource
+from src.common.exceptions import ObjectNotFoundError, PasswordHashingOverloadedError
+from src.common.i_resource_versions import IResourceVersions
+from src.common.resource_versions import ResourceVersions
+from src.database.i_unit_of_work import IUnitOfWork
+from src.database.users.user import User, UserRead
 from src.main import create_app
 from src.managers.i_user_manager import IUserManager
 
@@ -18,6 +22,7 @@ class TestApi(TestCase):
         self.__authentication = create_autospec(IAuthentication)
         self.__password_handler = create_autospec(IPasswordHandler)
         self.__user_manager = create_autospec(IUserManager)
+        self.__unit_of_work = create_autospec(IUnitOfWork)
 
         self.__injector = Injector()
         self.__injector.binder.bind(
@@ -29,6 +34,12 @@ class TestApi(TestCase):
         self.__injector.binder.bind(
             IUserManager, to=self.__user_manager, scope=singleton
         )
+        self.__injector.binder.bind(
+            IUnitOfWork, to=self.__unit_of_work, scope=singleton
+        )
+        self.__injector.binder.bind(
+            IResourceVersions, to=ResourceVersions, scope=singleton
+        )
 
         app = create_app(self.__injector)
         self.__client = TestClient(app)
@@ -42,6 +53,16 @@ class TestApi(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
+    def test_login_for_access_token_overloaded(self):
+        self.__authentication.login_user.side_effect = PasswordHashingOverloadedError()
+
+        response = self.__client.post(
+            "/auth/token", data={"username": "bla", "password": "bla"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertIn("Retry-After", response.headers)
+
     def test_login_for_access_token_returns_token_and_type(self):
         token = "i-am-a-token"
         username = "bla"
@@ -67,6 +88,17 @@ class TestApi(TestCase):
             json={"email": "fredrik@omstedt.com", "password": "password"},
         )
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.__unit_of_work.commit.assert_not_called()
+        self.__unit_of_work.close.assert_called_once()
+
+    def test_create_user_overloaded(self):
+        self.__user_manager.create_user.side_effect = PasswordHashingOverloadedError()
+
+        response = self.__client.post(
+            "/auth/create-user",
+            json={"email": "fredrik@omstedt.com", "password": "password"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
 
     def test_create_user_returns_user_read(self):
         email = "fredrik@omstedt.com"
@@ -80,6 +112,8 @@ class TestApi(TestCase):
             "/auth/create-user", json={"email": email, "password": "password"}
         )
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.__unit_of_work.commit.assert_called_once()
+        self.__unit_of_work.close.assert_called_once()
         user = response.json()
         self.assertNotIn("hashed_password", user)
         self.assertEqual(first_name, user["first_name"])
@@ -95,8 +129,8 @@ class TestApi(TestCase):
         email = "fredrik@omstedt.com"
         first_name = "Fredrik"
         last_name = "Omstedt"
-        self.__authentication.authenticate_user.return_value = User(
-            email=email, first_name=first_name, last_name=last_name
+        self.__authentication.authenticate_user_claims.return_value = UserRead(
+            id="id", email=email, first_name=first_name, last_name=last_name
         )
 
         response = self.__client.get(
@@ -110,6 +144,46 @@ class TestApi(TestCase):
         self.assertEqual(last_name, user["last_name"])
         self.assertEqual(email, user["email"])
 
+    def test_get_user_not_modified_until_user_changes(self):
+        self.__authentication.get_token_user_id.return_value = "id"
+        self.__authentication.authenticate_user_claims.return_value = UserRead(
+            id="id", email="fredrik@omstedt.com"
+        )
+        headers = {"Authorization": "Bearer blabla"}
+
+        first = self.__client.get("/auth/get-user", headers=headers)
+        headers["If-None-Match"] = first.headers["ETag"]
+        unchanged = self.__client.get("/auth/get-user", headers=headers)
+        self.__injector.get(IResourceVersions).invalidate(VersionedResource.USER, "id")
+        changed = self.__client.get("/auth/get-user", headers=headers)
+
+        self.assertTrue(first.headers["ETag"].startswith('W/"'))
+        self.assertEqual(unchanged.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(unchanged.headers["ETag"], first.headers["ETag"])
+        self.assertEqual(unchanged.content, b"")
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(changed.headers["ETag"], first.headers["ETag"])
+        self.assertEqual(self.__authentication.authenticate_user_claims.call_count, 2)
+
+    def test_get_user_etag_covers_token(self):
+        self.__authentication.get_token_user_id.return_value = "id"
+        self.__authentication.authenticate_user_claims.return_value = UserRead(
+            id="id", email="fredrik@omstedt.com"
+        )
+
+        first = self.__client.get(
+            "/auth/get-user", headers={"Authorization": "Bearer blabla"}
+        )
+        second = self.__client.get(
+            "/auth/get-user",
+            headers={
+                "Authorization": "Bearer other",
+                "If-None-Match": first.headers["ETag"],
+            },
+        )
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+
     def test_update_user_unauthorized(self):
         response = self.__client.patch("/auth/update-user", json={})
 
@@ -171,6 +245,19 @@ class TestApi(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_update_user_password_overloaded(self):
+        self.__password_handler.verify_password.side_effect = (
+            PasswordHashingOverloadedError()
+        )
+
+        response = self.__client.patch(
+            "/auth/update-user-password",
+            json={"old_password": "bla", "new_password": "blabla"},
+            headers={"Authorization": "Bearer blabla"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+
     def test_update_user_password_returns_user_read(self):
         email = "fredrik@omstedt.com"
         first_name = "Fredrik"
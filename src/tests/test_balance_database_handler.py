@@ -0,0 +1,150 @@
+from datetime import date, datetime, timedelta
+from unittest import TestCase
+
+from src.database.i_database import IDatabase
+from src.database.i_database_deleter import IDatabaseDeleter
+from src.database.transactions.balance import (
+    BALANCE_DAYS,
+    BALANCE_EPOCH,
+    create_balance_node_changes,
+    get_balance_nodes,
+)
+from src.database.transactions.balance_database_handler import (
+    BalanceDatabaseHandler,
+)
+from src.database.transactions.transaction import TransactionCreate
+from src.database.transactions.transaction_database_handler import (
+    TransactionDatabaseHandler,
+)
+from src.database.users.user import User
+from src.tests.test_utils import create_injector_with_database
+
+
+class TestBalanceNodes(TestCase):
+    def test_balance_nodes_sum_to_running_total(self):
+        nodes = create_balance_node_changes(
+            {date(2026, 1, 5): -100, date(2026, 1, 31): -50, date(2026, 2, 1): 300}
+        )
+
+        for day, expected in [
+            (date(2026, 1, 4), 0),
+            (date(2026, 1, 5), -100),
+            (date(2026, 1, 30), -100),
+            (date(2026, 1, 31), -150),
+            (date(2026, 6, 1), 150),
+        ]:
+            balance = sum(nodes.get(node, 0) for node in get_balance_nodes(day))
+            self.assertEqual(balance, expected)
+
+    def test_balance_nodes_are_logarithmic(self):
+        self.assertEqual(get_balance_nodes(BALANCE_EPOCH), [1])
+        self.assertLessEqual(len(get_balance_nodes(date(2026, 10, 18))), 17)
+        self.assertEqual(len(create_balance_node_changes({BALANCE_EPOCH: 1})), 18)
+
+    def test_unchanged_days_leave_no_nodes(self):
+        nodes = create_balance_node_changes({date(2026, 1, 5): 0})
+
+        self.assertEqual(nodes, {})
+
+    def test_days_outside_range_are_clamped(self):
+        nodes = create_balance_node_changes({date(1800, 1, 1): 10})
+
+        self.assertEqual(get_balance_nodes(date(1850, 1, 1)), [1])
+        self.assertEqual(nodes[BALANCE_DAYS], 10)
+
+
+class TestBalanceDatabaseHandler(TestCase):
+    def setUp(self):
+        self.__injector = create_injector_with_database()
+
+        database = self.__injector.get(IDatabase)
+        database.create_database()
+        self.__user = User(email="fredrik@omstedt.com")
+        with database.get_session() as session:
+            session.add(self.__user)
+            session.commit()
+            session.refresh(self.__user)
+
+    def tearDown(self) -> None:
+        database_deleter = self.__injector.get(IDatabaseDeleter)
+        database_deleter.delete_database()
+
+    def test_ledger_writes_update_balances(self):
+        self.__create(-100, datetime(2026, 1, 5))
+        id = self.__create(-50, datetime(2026, 1, 31, 23))
+        self.__create(300, datetime(2026, 2, 1))
+        self.__import([(-20, datetime(2026, 2, 3)), (-5, datetime(2026, 2, 3))])
+        self.__delete(id)
+
+        self.assertEqual(
+            [
+                self.__get_balance(day)
+                for day in [
+                    date(2026, 1, 4),
+                    date(2026, 1, 5),
+                    date(2026, 1, 31),
+                    date(2026, 2, 1),
+                    date(2026, 2, 3),
+                    date(2030, 1, 1),
+                ]
+            ],
+            [0, -100, -100, 200, 175, 175],
+        )
+
+    def test_get_balance_is_zero_without_transactions(self):
+        self.assertEqual(self.__get_balance(date(2026, 1, 1)), 0)
+
+    def test_get_balances_matches_get_balance(self):
+        self.__create(-100, datetime(2026, 1, 4, 23, 59))
+        self.__create(-100, datetime(2026, 1, 5))
+        self.__create(-50, datetime(2026, 1, 5, 18))
+        self.__create(300, datetime(2026, 1, 7))
+        days = [date(2026, 1, 3) + timedelta(days=day) for day in range(40)]
+
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(BalanceDatabaseHandler)
+        with database.get_session() as session:
+            balances = handler.get_balances(session, self.__user, days)
+
+        self.assertEqual(balances[:6], [0, -100, -250, -250, 50, 50])
+        self.assertEqual(balances, [self.__get_balance(day) for day in days])
+
+    def __create(self, amount: int, occurred_at: datetime) -> int:
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+        data = TransactionCreate(amount=amount, occurred_at=occurred_at)
+        with database.get_session() as session:
+            transaction = handler.create_transaction(session, self.__user, data)
+            session.commit()
+            return transaction.id
+
+    def __import(self, rows: list[tuple[int, datetime]]) -> None:
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+        values = [
+            {
+                "category_id": None,
+                "amount": amount,
+                "occurred_at": occurred_at,
+                "description": "",
+                "content_hash": bytes([index]) * 16,
+            }
+            for index, (amount, occurred_at) in enumerate(rows)
+        ]
+        with database.get_session() as session:
+            handler.insert_transactions(session, self.__user, values)
+            handler.insert_transactions(session, self.__user, values)
+            session.commit()
+
+    def __delete(self, id: int) -> None:
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+        with database.get_session() as session:
+            handler.delete_transaction(session, self.__user, id)
+            session.commit()
+
+    def __get_balance(self, day: date) -> int:
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(BalanceDatabaseHandler)
+        with database.get_session() as session:
+            return handler.get_balance(session, self.__user, day)
@@ -0,0 +1,56 @@
+from unittest import TestCase
+from uuid import UUID
+
+from sqlalchemy import text
+
+from src.common.utils import create_id_factory, is_uuid, str_uuid4, str_uuid7
+from src.database.i_database import IDatabase
+from src.database.i_database_deleter import IDatabaseDeleter
+from src.database.users.user import User
+from src.tests.test_utils import create_injector_with_database
+
+
+class TestStrUuid7(TestCase):
+    def test_str_uuid7_returns_version_7_uuid(self):
+        uuid = UUID(str_uuid7())
+
+        self.assertEqual(uuid.version, 7)
+        self.assertEqual(uuid.variant, "specified in RFC 4122")
+
+    def test_str_uuid7_sorts_by_creation_time(self):
+        ids = [str_uuid7() for _ in range(100)]
+
+        # Ids made within the same millisecond share only their time prefix.
+        self.assertEqual([id[:13] for id in ids], sorted(id[:13] for id in ids))
+
+    def test_create_id_factory_raises_on_unknown_scheme(self):
+        self.assertIs(create_id_factory("uuid4"), str_uuid4)
+        with self.assertRaises(ValueError):
+            create_id_factory("uuid1")
+
+    def test_is_uuid_rejects_malformed_ids(self):
+        self.assertTrue(is_uuid(str_uuid7()))
+        self.assertFalse(is_uuid("invalid-id"))
+
+
+class TestBinaryUuid(TestCase):
+    def setUp(self):
+        self.__injector = create_injector_with_database()
+        self.__database = self.__injector.get(IDatabase)
+        self.__database.create_database()
+
+    def tearDown(self) -> None:
+        self.__injector.get(IDatabaseDeleter).delete_database()
+
+    def test_stores_16_bytes_and_reads_canonical_string(self):
+        id = str_uuid4()
+        with self.__database.get_session() as session:
+            session.add(User(id=id, email="fredrik@omstedt.com"))
+            session.commit()
+
+        with self.__database.get_session() as session:
+            stored = session.execute(text('SELECT id FROM "user"')).scalar_one()
+            user = session.get(User, id)
+
+        self.assertEqual(stored, UUID(id).bytes)
+        self.assertEqual(user.id, id)
@@ -0,0 +1,223 @@
+from unittest import TestCase
+from unittest.mock import create_autospec
+
+from fastapi import status
+from fastapi.testclient import TestClient
+from injector import Injector, singleton
+
+from src.authentication.i_authentication import IAuthentication
+from src.common.etags import VersionedResource
+from src.common.exceptions import ObjectNotFoundError
+from src.common.exports import ExportFormat
+from src.common.i_resource_versions import IResourceVersions
+from src.common.pagination import MAX_PAGE_SIZE
+from src.common.resource_versions import ResourceVersions
+from src.database.categories.category import (
+    MAX_BULK_SIZE,
+    Category,
+    CategoryBulkResult,
+    CategoryBulkStatus,
+    CategoryCreate,
+    CategoryPage,
+)
+from src.database.i_unit_of_work import IUnitOfWork
+from src.database.users.user import User
+from src.main import create_app
+from src.managers.i_category_manager import ICategoryManager
+from src.managers.i_export_manager import IExportManager
+
+
+class TestCategoriesApi(TestCase):
+    def setUp(self):
+        self.__user = User(email="fredrik@omstedt.com")
+        self.__authentication = create_autospec(IAuthentication)
+        self.__authentication.authenticate_user.return_value = self.__user
+        self.__authentication.get_token_user_id.return_value = self.__user.id
+        self.__category_manager = create_autospec(ICategoryManager)
+        self.__export_manager = create_autospec(IExportManager)
+        self.__unit_of_work = create_autospec(IUnitOfWork)
+
+        self.__injector = Injector()
+        self.__injector.binder.bind(
+            IAuthentication, to=self.__authentication, scope=singleton
+        )
+        self.__injector.binder.bind(
+            ICategoryManager, to=self.__category_manager, scope=singleton
+        )
+        self.__injector.binder.bind(
+            IExportManager, to=self.__export_manager, scope=singleton
+        )
+        self.__injector.binder.bind(
+            IUnitOfWork, to=self.__unit_of_work, scope=singleton
+        )
+        self.__injector.binder.bind(
+            IResourceVersions, to=ResourceVersions, scope=singleton
+        )
+
+        app = create_app(self.__injector)
+        self.__client = TestClient(app)
+        self.__headers = {"Authorization": "Bearer blabla"}
+
+    def test_get_categories_unauthorized(self):
+        response = self.__client.get("/categories")
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_export_categories_streams_file(self):
+        self.__export_manager.export_categories.return_value = iter(
+            [b'{"name":"Car"}\n', b'{"name":"Food"}\n']
+        )
+
+        response = self.__client.get(
+            "/categories/export", params={"format": "ndjson"}, headers=self.__headers
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.headers["content-type"], "application/x-ndjson")
+        self.assertEqual(
+            response.headers["content-disposition"],
+            'attachment; filename="categories.ndjson"',
+        )
+        self.assertEqual(response.content, b'{"name":"Car"}\n{"name":"Food"}\n')
+        self.__export_manager.export_categories.assert_called_once_with(
+            self.__user, ExportFormat.NDJSON, False
+        )
+
+    def test_get_categories_returns_page(self):
+        self.__category_manager.get_categories.return_value = CategoryPage(
+            items=[Category(name="Car"), Category(name="Food")], next_cursor="next"
+        )
+
+        response = self.__client.get(
+            "/categories",
+            params={"cursor": "cursor", "limit": 2},
+            headers=self.__headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.__category_manager.get_categories.assert_called_once_with(
+            self.__user, "cursor", 2
+        )
+        self.assertEqual(
+            response.json(),
+            {"items": [{"name": "Car"}, {"name": "Food"}], "next_cursor": "next"},
+        )
+
+    def test_get_categories_not_modified_until_categories_change(self):
+        self.__category_manager.get_categories.return_value = CategoryPage(
+            items=[Category(name="Car")]
+        )
+
+        first = self.__client.get("/categories", headers=self.__headers)
+        headers = {**self.__headers, "If-None-Match": first.headers["ETag"]}
+        unchanged = self.__client.get("/categories", headers=headers)
+        self.__injector.get(IResourceVersions).invalidate(
+            VersionedResource.CATEGORIES, self.__user.id
+        )
+        changed = self.__client.get("/categories", headers=headers)
+
+        self.assertEqual(unchanged.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.__category_manager.get_categories.call_count, 2)
+        self.assertEqual(self.__authentication.authenticate_user.call_count, 2)
+
+    def test_get_categories_bad_request_on_malformed_cursor(self):
+        self.__category_manager.get_categories.side_effect = ValueError()
+
+        response = self.__client.get(
+            "/categories", params={"cursor": "bla"}, headers=self.__headers
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_get_categories_rejects_limit_above_maximum(self):
+        response = self.__client.get(
+            "/categories", params={"limit": MAX_PAGE_SIZE + 1}, headers=self.__headers
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.__category_manager.get_categories.assert_not_called()
+
+    def test_create_category_bad_request(self):
+        self.__category_manager.create_category.side_effect = ValueError()
+
+        response = self.__client.post(
+            "/categories", json={"name": "Food"}, headers=self.__headers
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.__unit_of_work.commit.assert_not_called()
+
+    def test_create_category_returns_category_read(self):
+        self.__category_manager.create_category.return_value = Category(
+            name="Food", user_id=self.__user.id
+        )
+
+        response = self.__client.post(
+            "/categories", json={"name": "Food"}, headers=self.__headers
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.__category_manager.create_category.assert_called_once_with(
+            self.__user, CategoryCreate(name="Food")
+        )
+        self.__unit_of_work.commit.assert_called_once()
+        self.assertEqual(response.json(), {"name": "Food"})
+
+    def test_create_categories_returns_results(self):
+        self.__category_manager.create_categories.return_value = [
+            CategoryBulkResult(name="Food", status=CategoryBulkStatus.CREATED)
+        ]
+
+        response = self.__client.post(
+            "/categories/bulk", json={"names": ["Food"]}, headers=self.__headers
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.__category_manager.create_categories.assert_called_once_with(
+            self.__user, ["Food"]
+        )
+        self.__unit_of_work.commit.assert_called_once()
+        self.assertEqual(response.json(), [{"name": "Food", "status": "created"}])
+
+    def test_create_categories_rejects_too_many_names(self):
+        names = [str(index) for index in range(MAX_BULK_SIZE + 1)]
+
+        response = self.__client.post(
+            "/categories/bulk", json={"names": names}, headers=self.__headers
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.__category_manager.create_categories.assert_not_called()
+
+    def test_delete_categories_returns_results(self):
+        self.__category_manager.delete_categories.return_value = [
+            CategoryBulkResult(name="Food", status=CategoryBulkStatus.NOT_FOUND)
+        ]
+
+        response = self.__client.post(
+            "/categories/bulk-delete", json={"names": ["Food"]}, headers=self.__headers
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.__category_manager.delete_categories.assert_called_once_with(
+            self.__user, ["Food"]
+        )
+        self.__unit_of_work.commit.assert_called_once()
+        self.assertEqual(response.json(), [{"name": "Food", "status": "not_found"}])
+
+    def test_delete_category_not_found(self):
+        self.__category_manager.delete_category.side_effect = ObjectNotFoundError()
+
+        response = self.__client.delete("/categories/Food", headers=self.__headers)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_delete_category_success(self):
+        response = self.__client.delete("/categories/Food", headers=self.__headers)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.__category_manager.delete_category.assert_called_once_with(
+            self.__user, "Food"
+        )
+        self.__unit_of_work.commit.assert_called_once()
@@ -1,12 +1,14 @@
+from datetime import datetime
 from unittest import TestCase
 
-from sqlmodel import select
+from sqlmodel import Session, SQLModel, create_engine, select
 
 from src.common.exceptions import ObjectNotFoundError
 from src.database.categories.category import Category
 from src.database.categories.category_database_handler import CategoryDatabaseHandler
 from src.database.i_database import IDatabase
 from src.database.i_database_deleter import IDatabaseDeleter
+from src.database.transactions.transaction import Transaction
 from src.database.users.user import User
 from src.tests.test_utils import create_injector_with_database
 
@@ -32,7 +34,7 @@ class TestCategoryDatabaseHandler(TestCase):
         name = "Car"
         database = self.__injector.get(IDatabase)
         with database.get_session() as session:
-            category = Category(name=name, user=self.__user)
+            category = Category(name=name, user_id=self.__user.id)
             session.add(category)
             session.commit()
             session.refresh(category)
@@ -72,9 +74,9 @@ class TestCategoryDatabaseHandler(TestCase):
             session.refresh(category)
 
         with database.get_session() as session:
-            db_category = session.get(Category, (name, self.__user.id))
+            db_category = session.get(Category, category.id)
             self.assertEqual(db_category.name, category.name)
-            self.assertEqual(db_category.user, category.user)
+            self.assertEqual(db_category.user_id, self.__user.id)
 
     def test_get_categories_returns_empty_if_no_categories(self):
         database = self.__injector.get(IDatabase)
@@ -87,8 +89,8 @@ class TestCategoryDatabaseHandler(TestCase):
         database = self.__injector.get(IDatabase)
         handler = self.__injector.get(CategoryDatabaseHandler)
         with database.get_session() as session:
-            category = Category(name="Car", user=self.__user)
-            category2 = Category(name="Savings", user=self.__user)
+            category = Category(name="Car", user_id=self.__user.id)
+            category2 = Category(name="Savings", user_id=self.__user.id)
             session.add(category)
             session.add(category2)
             session.commit()
@@ -99,6 +101,76 @@ class TestCategoryDatabaseHandler(TestCase):
             categories = handler.get_categories(session, self.__user)
             self.assertEqual(len(categories), 2)
 
+    def test_get_categories_returns_page_after_name(self):
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(CategoryDatabaseHandler)
+        with database.get_session() as session:
+            for name in ["Savings", "Car", "Food", "Rent"]:
+                session.add(Category(name=name, user_id=self.__user.id))
+            session.commit()
+
+        with database.get_session() as session:
+            categories = handler.get_categories(session, self.__user, "Car", 2)
+            self.assertEqual(
+                [category.name for category in categories], ["Food", "Rent"]
+            )
+
+    def test_stream_categories_yields_names_in_batches(self):
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(CategoryDatabaseHandler)
+        with database.get_session() as session:
+            for name in ["Savings", "Car", "Food"]:
+                session.add(Category(name=name, user_id=self.__user.id))
+            session.commit()
+
+        with database.get_session() as session:
+            batches = list(handler.stream_categories(session, self.__user, 2))
+
+        self.assertEqual(
+            [[tuple(row) for row in batch] for batch in batches],
+            [[("Car",), ("Food",)], [("Savings",)]],
+        )
+
+    def test_get_category_ids_returns_ids_of_existing_categories(self):
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(CategoryDatabaseHandler)
+        with database.get_session() as session:
+            category = Category(name="Car", user_id=self.__user.id)
+            session.add(category)
+            session.commit()
+            session.refresh(category)
+
+        with database.get_session() as session:
+            ids = handler.get_category_ids(session, self.__user, ["Car", "Food"])
+
+        self.assertEqual(ids, {"Car": category.id})
+
+    def test_create_categories_skips_existing_categories(self):
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(CategoryDatabaseHandler)
+        with database.get_session() as session:
+            session.add(Category(name="Car", user_id=self.__user.id))
+            session.commit()
+
+        with database.get_session() as session:
+            created = handler.create_categories(
+                session, self.__user, ["Food", "Car", "Rent"]
+            )
+            session.commit()
+
+        self.assertEqual(set(created), {"Food", "Rent"})
+        with database.get_session() as session:
+            categories = handler.get_categories(session, self.__user)
+            self.assertEqual(
+                [category.name for category in categories], ["Car", "Food", "Rent"]
+            )
+
+    def test_create_categories_does_nothing_without_names(self):
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(CategoryDatabaseHandler)
+        with database.get_session() as session:
+            self.assertEqual(handler.create_categories(session, self.__user, []), [])
+
     def test_delete_category_raises_if_category_not_existing(self):
         database = self.__injector.get(IDatabase)
         handler = self.__injector.get(CategoryDatabaseHandler)
@@ -110,7 +182,7 @@ class TestCategoryDatabaseHandler(TestCase):
         name = "Car"
         database = self.__injector.get(IDatabase)
         with database.get_session() as session:
-            category = Category(name=name, user=self.__user)
+            category = Category(name=name, user_id=self.__user.id)
             session.add(category)
             session.commit()
             session.refresh(category)
@@ -125,3 +197,74 @@ class TestCategoryDatabaseHandler(TestCase):
             results = session.exec(statement)
             db_user = results.first()
             self.assertIsNone(db_user)
+
+    def test_delete_categories_deletes_existing_categories(self):
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(CategoryDatabaseHandler)
+        with database.get_session() as session:
+            for name in ["Car", "Food", "Rent"]:
+                session.add(Category(name=name, user_id=self.__user.id))
+            session.commit()
+
+        with database.get_session() as session:
+            deleted = handler.delete_categories(
+                session, self.__user, ["Car", "Savings", "Rent"]
+            )
+            session.commit()
+
+        self.assertEqual(set(deleted), {"Car", "Rent"})
+        with database.get_session() as session:
+            categories = handler.get_categories(session, self.__user)
+            self.assertEqual([category.name for category in categories], ["Food"])
+
+
+class TestCategoryDatabaseHandlerWithoutForeignKeys(TestCase):
+    # A plain SQLite engine does not enforce foreign keys, so deleting a
+    # category must clear it from the ledger without ON DELETE SET NULL.
+    def setUp(self):
+        self.__engine = create_engine("sqlite://")
+        SQLModel.metadata.create_all(self.__engine)
+        self.__handler = CategoryDatabaseHandler()
+        self.__user = User(email="fredrik@omstedt.com")
+        self.__other_user = User(email="tiburtius@omstedt.com")
+        with Session(self.__engine) as session:
+            session.add(self.__user)
+            session.add(self.__other_user)
+            session.flush()
+            category = Category(name="Car", user_id=self.__user.id)
+            session.add(category)
+            session.flush()
+            self.__category_id = category.id
+            session.add(Transaction(
+                amount=-100,
+                occurred_at=datetime(2026, 1, 1),
+                user_id=self.__user.id,
+                category_id=category.id,
+            ))
+            session.commit()
+            session.refresh(self.__user)
+            session.refresh(self.__other_user)
+
+    def test_delete_category_clears_category_of_transactions(self):
+        with Session(self.__engine) as session:
+            self.__handler.delete_category(session, self.__user, "Car")
+            session.commit()
+
+        self.assertIsNone(self.__reuse_category_id())
+
+    def test_delete_categories_clears_category_of_transactions(self):
+        with Session(self.__engine) as session:
+            self.__handler.delete_categories(session, self.__user, ["Car"])
+            session.commit()
+
+        self.assertIsNone(self.__reuse_category_id())
+
+    def __reuse_category_id(self) -> int | None:
+        # SQLite hands the freed id to the next category, here another user's.
+        with Session(self.__engine) as session:
+            category = Category(name="Food", user_id=self.__other_user.id)
+            session.add(category)
+            session.commit()
+            self.assertEqual(category.id, self.__category_id)
+
+            return session.exec(select(Transaction.category_id)).one()
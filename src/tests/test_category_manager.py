@@ -1,13 +1,21 @@
 from unittest import TestCase
-from unittest.mock import ANY, create_autospec
+from unittest.mock import create_autospec
 
 from injector import singleton
 from sqlmodel import select
 
+from src.analytics.i_ledger_cache import ILedgerCache
+from src.common.etags import VersionedResource
 from src.common.exceptions import ObjectNotFoundError
-from src.database.categories.category import Category, CategoryCreate
+from src.common.i_resource_versions import IResourceVersions
+from src.database.categories.category import (
+    Category,
+    CategoryBulkResult,
+    CategoryBulkStatus,
+    CategoryCreate,
+)
 from src.database.categories.i_category_database_handler import ICategoryDatabaseHandler
-from src.database.i_database import IDatabase
+from src.database.i_unit_of_work import IUnitOfWork
 from src.database.users.user import User, UserCreate, UserUpdate
 from src.managers.category_manager import CategoryManager
 from src.managers.user_manager import UserManager
@@ -16,15 +24,26 @@ from src.multi_injector import MultiInjector
 
 class TestUserManager(TestCase):
     def setUp(self):
-        self.__database = create_autospec(IDatabase)
+        self.__unit_of_work = create_autospec(IUnitOfWork)
+        self.__session = self.__unit_of_work.get_session.return_value
         self.__category_handler = create_autospec(ICategoryDatabaseHandler)
+        self.__ledger_cache = create_autospec(ILedgerCache)
+        self.__resource_versions = create_autospec(IResourceVersions)
         self.__user = User(email="fredrik@omstedt.com")
 
         self.__injector = MultiInjector()
-        self.__injector.binder.bind(IDatabase, to=self.__database, scope=singleton)
+        self.__injector.binder.bind(
+            IUnitOfWork, to=self.__unit_of_work, scope=singleton
+        )
         self.__injector.binder.bind(
             ICategoryDatabaseHandler, to=self.__category_handler, scope=singleton
         )
+        self.__injector.binder.bind(
+            ILedgerCache, to=self.__ledger_cache, scope=singleton
+        )
+        self.__injector.binder.bind(
+            IResourceVersions, to=self.__resource_versions, scope=singleton
+        )
 
     def test_create_category(self):
         manager = self.__injector.get(CategoryManager)
@@ -32,9 +51,16 @@ class TestUserManager(TestCase):
 
         manager.create_category(self.__user, data)
 
-        self.__database.get_session.assert_called_once()
+        self.__unit_of_work.get_session.assert_called_once()
         self.__category_handler.create_category.assert_called_once_with(
-            ANY, self.__user, data.name
+            self.__session, self.__user, data.name
+        )
+        self.__session.flush.assert_called_once()
+        self.__resource_versions.invalidate.assert_not_called()
+        [invalidate], _ = self.__unit_of_work.after_commit.call_args
+        invalidate()
+        self.__resource_versions.invalidate.assert_called_once_with(
+            VersionedResource.CATEGORIES, self.__user.id
         )
 
     def test_get_categories(self):
@@ -42,11 +68,35 @@ class TestUserManager(TestCase):
         categories = [Category(name="Food"), Category(name="Car")]
         self.__category_handler.get_categories.return_value = categories
 
-        returned_categories = manager.get_categories(self.__user)
+        page = manager.get_categories(self.__user, limit=2)
 
-        self.__database.get_session.assert_called_once()
-        self.__category_handler.get_categories.assert_called_once_with(ANY, self.__user)
-        self.assertEqual(categories, returned_categories)
+        self.__unit_of_work.get_session.assert_called_once()
+        self.__category_handler.get_categories.assert_called_once_with(
+            self.__session, self.__user, None, 3
+        )
+        self.assertEqual(
+            ["Food", "Car"], [category.name for category in page.items]
+        )
+        self.assertIsNone(page.next_cursor)
+
+    def test_get_categories_returns_cursor_if_more_categories(self):
+        manager = self.__injector.get(CategoryManager)
+        categories = [Category(name="Car"), Category(name="Food")]
+        self.__category_handler.get_categories.return_value = categories
+
+        page = manager.get_categories(self.__user, limit=1)
+        manager.get_categories(self.__user, cursor=page.next_cursor, limit=1)
+
+        self.assertEqual(["Car"], [category.name for category in page.items])
+        self.__category_handler.get_categories.assert_called_with(
+            self.__session, self.__user, "Car", 2
+        )
+
+    def test_get_categories_raises_on_malformed_cursor(self):
+        manager = self.__injector.get(CategoryManager)
+
+        with self.assertRaises(ValueError):
+            manager.get_categories(self.__user, cursor="not-a-cursor")
 
     def test_delete_category(self):
         manager = self.__injector.get(CategoryManager)
@@ -54,7 +104,43 @@ class TestUserManager(TestCase):
 
         manager.delete_category(self.__user, name)
 
-        self.__database.get_session.assert_called_once()
+        self.__unit_of_work.get_session.assert_called_once()
         self.__category_handler.delete_category.assert_called_once_with(
-            ANY, self.__user, name
+            self.__session, self.__user, name
+        )
+        self.__session.flush.assert_called_once()
+        self.__ledger_cache.invalidate_user.assert_not_called()
+        for (invalidate,), _ in self.__unit_of_work.after_commit.call_args_list:
+            invalidate()
+        self.__ledger_cache.invalidate_user.assert_called_once_with(self.__user)
+        self.__resource_versions.invalidate.assert_called_once_with(
+            VersionedResource.CATEGORIES, self.__user.id
+        )
+
+    def test_create_categories_reports_result_per_name(self):
+        manager = self.__injector.get(CategoryManager)
+        self.__category_handler.create_categories.return_value = ["Food"]
+
+        results = manager.create_categories(self.__user, ["Food", "Car", "Food"])
+
+        self.__category_handler.create_categories.assert_called_once_with(
+            self.__session, self.__user, ["Food", "Car"]
+        )
+        self.assertEqual(results, [
+            CategoryBulkResult(name="Food", status=CategoryBulkStatus.CREATED),
+            CategoryBulkResult(name="Car", status=CategoryBulkStatus.ALREADY_EXISTS),
+        ])
+
+    def test_delete_categories_reports_result_per_name(self):
+        manager = self.__injector.get(CategoryManager)
+        self.__category_handler.delete_categories.return_value = ["Car"]
+
+        results = manager.delete_categories(self.__user, ["Food", "Car"])
+
+        self.__category_handler.delete_categories.assert_called_once_with(
+            self.__session, self.__user, ["Food", "Car"]
         )
+        self.assertEqual(results, [
+            CategoryBulkResult(name="Food", status=CategoryBulkStatus.NOT_FOUND),
+            CategoryBulkResult(name="Car", status=CategoryBulkStatus.DELETED),
+        ])
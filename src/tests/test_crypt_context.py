@@ -0,0 +1,86 @@
+from unittest import TestCase
+
+from src.authentication.crypt_context import (
+    calibrate_rounds,
+    create_crypt_context,
+    provide_crypt_context,
+)
+from src.common.settings import Settings
+
+
+class TestCryptContext(TestCase):
+    def test_create_crypt_context_uses_scheme_and_rounds(self):
+        context = create_crypt_context("argon2", 2, 1024)
+
+        hashed_password = context.hash("password")
+
+        self.assertTrue(hashed_password.startswith("$argon2"))
+        self.assertIn("m=1024,t=2", hashed_password)
+        self.assertFalse(context.needs_update(hashed_password))
+
+    def test_create_crypt_context_flags_different_cost_as_stale(self):
+        lower_cost_hash = create_crypt_context("argon2", 1, 1024).hash("password")
+        higher_cost_hash = create_crypt_context("argon2", 3, 1024).hash("password")
+
+        context = create_crypt_context("argon2", 2, 1024)
+
+        self.assertTrue(context.needs_update(lower_cost_hash))
+        self.assertTrue(context.needs_update(higher_cost_hash))
+
+    def test_create_crypt_context_accepts_costs_within_tolerance(self):
+        hashes = {
+            rounds: create_crypt_context("argon2", rounds, 1024).hash("password")
+            for rounds in [1, 2, 3, 4, 5]
+        }
+
+        context = create_crypt_context("argon2", 3, 1024, rounds_tolerance=1)
+
+        self.assertTrue(context.needs_update(hashes[1]))
+        self.assertFalse(context.needs_update(hashes[2]))
+        self.assertFalse(context.needs_update(hashes[3]))
+        self.assertFalse(context.needs_update(hashes[4]))
+        self.assertTrue(context.needs_update(hashes[5]))
+        self.assertIn("t=3", context.hash("password"))
+
+    def test_provide_crypt_context_pins_configured_rounds(self):
+        settings = Settings(password_hashing_scheme="bcrypt", password_hashing_rounds=5)
+        lower_cost_hash = create_crypt_context("bcrypt", 4, 0).hash("password")
+
+        context = provide_crypt_context(settings)
+
+        self.assertTrue(context.needs_update(lower_cost_hash))
+        self.assertTrue(context.hash("password").startswith("$2b$05$"))
+
+    def test_provide_crypt_context_accepts_neighbouring_calibrated_rounds(self):
+        settings = Settings(
+            password_hashing_scheme="bcrypt",
+            password_hashing_rounds=0,
+            password_hashing_target_ms=0,
+        )
+        neighbour_hash = create_crypt_context("bcrypt", 5, 0).hash("password")
+        distant_hash = create_crypt_context("bcrypt", 6, 0).hash("password")
+
+        context = provide_crypt_context(settings)
+
+        self.assertFalse(context.needs_update(neighbour_hash))
+        self.assertTrue(context.needs_update(distant_hash))
+
+    def test_create_crypt_context_flags_other_scheme_as_stale(self):
+        bcrypt_hash = create_crypt_context("bcrypt", 4, 0).hash("password")
+
+        context = create_crypt_context("argon2", 1, 1024)
+
+        self.assertTrue(context.verify("password", bcrypt_hash))
+        self.assertTrue(context.needs_update(bcrypt_hash))
+
+    def test_create_crypt_context_raises_on_unsupported_scheme(self):
+        with self.assertRaises(ValueError):
+            create_crypt_context("md5_crypt", 1, 0)
+
+    def test_calibrate_rounds_returns_minimum_for_tiny_target(self):
+        self.assertEqual(calibrate_rounds("bcrypt", 0, 0), 4)
+
+    def test_calibrate_rounds_increases_with_target(self):
+        rounds = calibrate_rounds("argon2", 0.01, 1024)
+
+        self.assertGreater(rounds, 1)
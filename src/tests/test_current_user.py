@@ -1,8 +1,8 @@
 from unittest import TestCase
 from unittest.mock import create_autospec
 
-from fastapi import HTTPException
-from jose import ExpiredSignatureError
+from fastapi import HTTPException, status
+from jose import ExpiredSignatureError, JWTError
 
 from src.authentication.current_user import get_current_user
 from src.authentication.i_authentication import IAuthentication
@@ -31,5 +31,20 @@ class TestCurrentUser(TestCase):
     def test_get_current_user_raises_unauthorized(self):
         self.__authentication.authenticate_user.side_effect = ExpiredSignatureError()
 
-        with self.assertRaises(HTTPException):
+        with self.assertRaises(HTTPException) as context:
+            get_current_user("Blabla", self.__authentication)
+        self.assertEqual(context.exception.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_get_current_user_raises_unauthorized_on_invalid_token(self):
+        self.__authentication.authenticate_user.side_effect = JWTError()
+
+        with self.assertRaises(HTTPException) as context:
+            get_current_user("Blabla", self.__authentication)
+        self.assertEqual(context.exception.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_get_current_user_raises_unauthorized_on_rejected_token(self):
+        self.__authentication.authenticate_user.side_effect = ValueError()
+
+        with self.assertRaises(HTTPException) as context:
             get_current_user("Blabla", self.__authentication)
+        self.assertEqual(context.exception.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,89 @@
+from unittest import TestCase
+
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError
+
+from src.common.settings import Settings
+from src.database.database import Database
+from src.database.pool import MonitoredQueuePool, create_engine_options
+
+
+class TestDatabasePool(TestCase):
+    def setUp(self):
+        self.__database = Database(Settings(
+            database_url="sqlite:///test_database.db",
+            database_pool_size=1,
+            database_max_overflow=1,
+            database_pool_timeout=0.05,
+            sqlite_performance_profile=False,
+        ))
+
+    def test_pool_statistics_counts_checked_out_connections(self):
+        with self.__database.get_session() as session:
+            session.exec(text("SELECT 1"))
+            statistics = self.__database.pool_statistics()
+
+        self.assertEqual(statistics.pool_size, 1)
+        self.assertEqual(statistics.checked_out, 1)
+        self.assertEqual(statistics.connections_created, 1)
+        self.assertEqual(statistics.checkouts, 1)
+        self.assertEqual(self.__database.pool_statistics().checked_out, 0)
+
+    def test_pool_statistics_counts_overflow(self):
+        with self.__database.get_session() as first, \
+                self.__database.get_session() as second:
+            first.exec(text("SELECT 1"))
+            second.exec(text("SELECT 1"))
+            statistics = self.__database.pool_statistics()
+
+        self.assertEqual(statistics.checked_out, 2)
+        self.assertEqual(statistics.overflow, 1)
+
+    def test_pool_statistics_records_wait_times(self):
+        for _ in range(3):
+            with self.__database.get_session() as session:
+                session.exec(text("SELECT 1"))
+
+        statistics = self.__database.pool_statistics()
+
+        self.assertEqual(sum(statistics.wait_time_histogram.values()), 3)
+        self.assertGreater(statistics.total_wait_seconds, 0)
+
+    def test_pool_statistics_counts_timeouts(self):
+        sessions = [self.__database.get_session() for _ in range(3)]
+        sessions[0].exec(text("SELECT 1"))
+        sessions[1].exec(text("SELECT 1"))
+
+        with self.assertRaises(TimeoutError):
+            sessions[2].exec(text("SELECT 1"))
+        for session in sessions:
+            session.close()
+
+        statistics = self.__database.pool_statistics()
+        self.assertEqual(statistics.timeouts, 1)
+        self.assertEqual(sum(statistics.wait_time_histogram.values()), 3)
+
+    def test_create_engine_options_uses_settings(self):
+        options = create_engine_options(Settings(
+            database_url="postgresql://localhost/cash",
+            database_pool_size=20,
+            database_max_overflow=5,
+            database_pool_timeout=2,
+            database_pool_recycle=1800,
+            database_pool_pre_ping=True,
+        ), is_async=False)
+
+        self.assertEqual(options, {
+            "poolclass": MonitoredQueuePool,
+            "pool_size": 20,
+            "max_overflow": 5,
+            "pool_timeout": 2,
+            "pool_recycle": 1800,
+            "pool_pre_ping": True,
+        })
+
+    def test_create_engine_options_skips_pool_for_in_memory_sqlite(self):
+        options = create_engine_options(
+            Settings(database_url="sqlite://"), is_async=False)
+
+        self.assertEqual(options, {"pool_pre_ping": False})
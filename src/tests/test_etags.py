@@ -0,0 +1,37 @@
+from unittest import TestCase
+
+from fastapi import HTTPException, Response, status
+
+from src.common.etags import check_etag, create_etag, etag_matches
+
+
+class TestEtags(TestCase):
+    def test_create_etag_is_weak_and_covers_token(self):
+        etag = create_etag("a-1")
+
+        self.assertEqual(etag, 'W/"a-1"')
+        self.assertNotEqual(create_etag("a-1", "token"), etag)
+        self.assertNotEqual(create_etag("a-1", "token"), create_etag("a-1", "other"))
+
+    def test_etag_matches_compares_weakly_against_every_tag(self):
+        etag = create_etag("a-1")
+
+        self.assertTrue(etag_matches('W/"a-1"', etag))
+        self.assertTrue(etag_matches('"a-1"', etag))
+        self.assertTrue(etag_matches('W/"a-0", W/"a-1"', etag))
+        self.assertTrue(etag_matches("*", etag))
+        self.assertFalse(etag_matches('W/"a-2"', etag))
+        self.assertFalse(etag_matches(None, etag))
+
+    def test_check_etag_raises_not_modified_if_etag_matches(self):
+        etag = create_etag("a-1")
+        response = Response()
+
+        with self.assertRaises(HTTPException) as context:
+            check_etag(etag, etag, response)
+        check_etag(etag, None, response)
+
+        self.assertEqual(context.exception.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(context.exception.headers["ETag"], etag)
+        self.assertEqual(response.headers["ETag"], etag)
+        self.assertEqual(response.headers["Cache-Control"], "private, no-cache")
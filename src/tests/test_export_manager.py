@@ -0,0 +1,129 @@
+import gzip
+import json
+from datetime import datetime
+from io import BytesIO
+from unittest import TestCase
+
+from injector import singleton
+
+from src.common.exports import ExportFormat
+from src.common.settings import Settings
+from src.database.categories.category import Category
+from src.database.categories.category_database_handler import CategoryDatabaseHandler
+from src.database.categories.i_category_database_handler import ICategoryDatabaseHandler
+from src.database.i_database import IDatabase
+from src.database.i_database_deleter import IDatabaseDeleter
+from src.database.transactions.i_transaction_database_handler import (
+    ITransactionDatabaseHandler,
+)
+from src.database.transactions.transaction import Transaction
+from src.database.transactions.transaction_database_handler import (
+    TransactionDatabaseHandler,
+)
+from src.database.users.user import User
+from src.managers.export_manager import ExportManager
+from src.tests.test_utils import create_injector_with_database
+from src.transactions.statements import parse_csv
+
+
+class TestExportManager(TestCase):
+    def setUp(self):
+        self.__injector = create_injector_with_database()
+        self.__injector.binder.bind(
+            Settings,
+            to=Settings(database_url="sqlite:///test_database.db", export_batch_size=2),
+            scope=singleton,
+        )
+        self.__injector.binder.bind(
+            ICategoryDatabaseHandler, to=CategoryDatabaseHandler, scope=singleton
+        )
+        self.__injector.binder.bind(
+            ITransactionDatabaseHandler,
+            to=TransactionDatabaseHandler,
+            scope=singleton,
+        )
+
+        database = self.__injector.get(IDatabase)
+        database.create_database()
+        self.__user = User(email="fredrik@omstedt.com")
+        with database.get_session() as session:
+            session.add(self.__user)
+            food = Category(name="Food", user_id=self.__user.id)
+            session.add(food)
+            session.add(Category(name="Car", user_id=self.__user.id))
+            session.flush()
+            session.add_all([
+                Transaction(
+                    user_id=self.__user.id,
+                    category_id=food.id,
+                    amount=-4550,
+                    occurred_at=datetime(2026, 1, 2, 12),
+                    description="Groceries, weekly",
+                ),
+                Transaction(
+                    user_id=self.__user.id,
+                    amount=120000,
+                    occurred_at=datetime(2026, 1, 1),
+                    description="Salary",
+                ),
+                Transaction(
+                    user_id=self.__user.id,
+                    amount=-5,
+                    occurred_at=datetime(2026, 1, 3),
+                ),
+            ])
+            session.commit()
+            session.refresh(self.__user)
+
+    def tearDown(self) -> None:
+        database_deleter = self.__injector.get(IDatabaseDeleter)
+        database_deleter.delete_database()
+
+    def test_export_transactions_writes_importable_csv(self):
+        manager = self.__injector.get(ExportManager)
+
+        data = b"".join(
+            manager.export_transactions(self.__user, ExportFormat.CSV, False)
+        )
+
+        rows = list(parse_csv(BytesIO(data)))
+        self.assertEqual(
+            [(row.occurred_at, row.amount, row.description, row.category)
+             for row in rows],
+            [
+                (datetime(2026, 1, 1), 120000, "Salary", None),
+                (datetime(2026, 1, 2, 12), -4550, "Groceries, weekly", "Food"),
+                (datetime(2026, 1, 3), -5, "", None),
+            ],
+        )
+        self.assertIn(b"\r\n3,2026-01-03T00:00:00,-0.05,,\r\n", data)
+
+    def test_export_transactions_writes_compressed_ndjson(self):
+        manager = self.__injector.get(ExportManager)
+
+        chunks = list(
+            manager.export_transactions(self.__user, ExportFormat.NDJSON, True)
+        )
+
+        lines = gzip.decompress(b"".join(chunks)).decode().splitlines()
+        self.assertEqual(
+            json.loads(lines[1]),
+            {
+                "id": 1,
+                "occurred_at": "2026-01-02T12:00:00",
+                "amount": -4550,
+                "description": "Groceries, weekly",
+                "category": "Food",
+            },
+        )
+        self.assertEqual(len(lines), 3)
+
+    def test_export_categories_writes_names(self):
+        manager = self.__injector.get(ExportManager)
+
+        data = b"".join(
+            manager.export_categories(self.__user, ExportFormat.NDJSON, False)
+        )
+
+        self.assertEqual(data, b'{"name":"Car"}\n{"name":"Food"}\n')
+
@@ -0,0 +1,39 @@
+import gzip
+import json
+from unittest import TestCase
+
+from src.common.exports import ExportEncoder, ExportFormat
+
+
+class TestExports(TestCase):
+    def test_encode_writes_csv_with_header(self):
+        encoder = ExportEncoder(ExportFormat.CSV, ["name", "note"], False)
+
+        data = encoder.begin() + encoder.encode([("Food", 'a, "b"'), ("Car", None)])
+
+        self.assertEqual(data, b'name,note\r\nFood,"a, ""b"""\r\nCar,\r\n')
+        self.assertEqual(encoder.end(), b"")
+
+    def test_encode_writes_one_json_object_per_line(self):
+        encoder = ExportEncoder(ExportFormat.NDJSON, ["name", "count"], False)
+
+        data = encoder.begin() + encoder.encode([("Food", 1)])
+        data += encoder.encode([("Car", None)]) + encoder.end()
+
+        self.assertEqual(
+            [json.loads(line) for line in data.splitlines()],
+            [{"name": "Food", "count": 1}, {"name": "Car", "count": None}],
+        )
+
+    def test_encode_compresses_batches_into_one_gzip_member(self):
+        encoder = ExportEncoder(ExportFormat.CSV, ["name"], True)
+
+        data = encoder.begin()
+        for index in range(3):
+            data += encoder.encode([(f"Category {index}",)])
+        data += encoder.end()
+
+        self.assertEqual(
+            gzip.decompress(data),
+            b"name\r\nCategory 0\r\nCategory 1\r\nCategory 2\r\n",
+        )
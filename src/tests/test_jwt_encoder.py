@@ -0,0 +1,67 @@
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from jose import jwt
+
+from src.common.jwt_encoder import JwtEncoder
+
+
+class TestJwtEncoder(TestCase):
+    def setUp(self):
+        self.__settings = MagicMock()
+        self.__settings.authentication_secret = "secret"
+        self.__settings.token_cache_size = 2
+
+    def test_decode_returns_encoded_data(self):
+        encoder = JwtEncoder(self.__settings)
+        data = {"sub": "test@email.com", "exp": int(time.time()) + 60}
+
+        self.assertEqual(encoder.decode(encoder.encode(data)), data)
+
+    def test_decode_verifies_token_once_when_cached(self):
+        encoder = JwtEncoder(self.__settings)
+        token = encoder.encode({"sub": "test@email.com", "exp": time.time() + 60})
+
+        with patch("src.common.jwt_encoder.jwt.decode", wraps=jwt.decode) as decode:
+            first = encoder.decode(token)
+            second = encoder.decode(token)
+
+        decode.assert_called_once()
+        self.assertEqual(first, second)
+        statistics = encoder.statistics()
+        self.assertEqual(statistics.hits, 1)
+        self.assertEqual(statistics.misses, 1)
+
+    def test_decode_returns_copy_of_cached_payload(self):
+        encoder = JwtEncoder(self.__settings)
+        token = encoder.encode({"sub": "test@email.com", "exp": time.time() + 60})
+
+        encoder.decode(token)["sub"] = "changed"
+
+        self.assertEqual(encoder.decode(token)["sub"], "test@email.com")
+
+    def test_decode_verifies_token_again_after_expiry(self):
+        encoder = JwtEncoder(self.__settings)
+        token = encoder.encode({"sub": "test@email.com", "exp": time.time() + 0.5})
+        encoder.decode(token)
+
+        time.sleep(0.6)
+
+        with patch("src.common.jwt_encoder.jwt.decode", return_value={}) as decode:
+            encoder.decode(token)
+
+        decode.assert_called_once()
+        self.assertEqual(encoder.statistics().misses, 2)
+
+    def test_decode_does_not_cache_when_disabled(self):
+        self.__settings.token_cache_size = 0
+        encoder = JwtEncoder(self.__settings)
+        token = encoder.encode({"sub": "test@email.com", "exp": time.time() + 60})
+
+        with patch("src.common.jwt_encoder.jwt.decode", wraps=jwt.decode) as decode:
+            encoder.decode(token)
+            encoder.decode(token)
+
+        self.assertEqual(decode.call_count, 2)
+        self.assertEqual(encoder.statistics().hits, 0)
@@ -0,0 +1,36 @@
+from unittest import TestCase
+
+import numpy as np
+
+from src.analytics.ledger_cache import LedgerCache
+from src.common.settings import Settings
+from src.database.transactions.analytics import Ledger
+from src.database.users.user import User
+
+LEDGER = Ledger(np.zeros(0), np.zeros(0), np.zeros(0), {})
+
+
+class TestLedgerCache(TestCase):
+    def setUp(self):
+        self.__cache = LedgerCache(Settings(ledger_cache_size=2))
+        self.__user = User(email="fredrik@omstedt.com")
+
+    def test_add_ledger_caches_ledger(self):
+        self.__cache.add_ledger(self.__user, LEDGER, self.__cache.get_generation())
+
+        self.assertIs(self.__cache.get_ledger(self.__user), LEDGER)
+
+    def test_invalidate_user_removes_ledger(self):
+        self.__cache.add_ledger(self.__user, LEDGER, self.__cache.get_generation())
+
+        self.__cache.invalidate_user(self.__user)
+
+        self.assertIsNone(self.__cache.get_ledger(self.__user))
+
+    def test_add_ledger_skips_ledger_read_before_invalidation(self):
+        generation = self.__cache.get_generation()
+        self.__cache.invalidate_user(self.__user)
+
+        self.__cache.add_ledger(self.__user, LEDGER, generation)
+
+        self.assertIsNone(self.__cache.get_ledger(self.__user))
@@ -0,0 +1,74 @@
+from unittest import TestCase
+
+from src.common.lru_cache import LruTtlCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLruTtlCache(TestCase):
+    def setUp(self):
+        self.__clock = FakeClock()
+
+    def test_get_returns_none_and_counts_miss_if_not_cached(self):
+        cache = LruTtlCache(2, 10, clock=self.__clock)
+
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.statistics().misses, 1)
+        self.assertEqual(cache.statistics().hits, 0)
+
+    def test_get_returns_value_and_counts_hit(self):
+        cache = LruTtlCache(2, 10, clock=self.__clock)
+        cache.set("key", "value")
+
+        self.assertEqual(cache.get("key"), "value")
+        self.assertEqual(cache.statistics().hits, 1)
+
+    def test_get_returns_none_after_ttl(self):
+        cache = LruTtlCache(2, 10, clock=self.__clock)
+        cache.set("key", "value")
+
+        self.__clock.now = 10
+
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.statistics().size, 0)
+
+    def test_set_respects_ttl_override(self):
+        cache = LruTtlCache(2, 10, clock=self.__clock)
+        cache.set("key", "value", ttl_seconds=1)
+
+        self.__clock.now = 2
+
+        self.assertIsNone(cache.get("key"))
+
+    def test_set_evicts_least_recently_used(self):
+        cache = LruTtlCache(2, 10, clock=self.__clock)
+        cache.set("first", 1)
+        cache.set("second", 2)
+        cache.get("first")
+
+        cache.set("third", 3)
+
+        self.assertEqual(cache.get("first"), 1)
+        self.assertIsNone(cache.get("second"))
+        self.assertEqual(cache.get("third"), 3)
+
+    def test_set_does_nothing_if_disabled(self):
+        cache = LruTtlCache(0, 10, clock=self.__clock)
+        cache.set("key", "value")
+
+        self.assertIsNone(cache.get("key"))
+
+    def test_delete_removes_value(self):
+        cache = LruTtlCache(2, 10, clock=self.__clock)
+        cache.set("key", "value")
+
+        cache.delete("key")
+        cache.delete("missing")
+
+        self.assertIsNone(cache.get("key"))
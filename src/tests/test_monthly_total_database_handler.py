@@ -0,0 +1,180 @@
+from datetime import date, datetime
+from unittest import TestCase
+
+from sqlmodel import select
+
+from src.database.categories.category import Category
+from src.database.categories.category_database_handler import CategoryDatabaseHandler
+from src.database.i_database import IDatabase
+from src.database.i_database_deleter import IDatabaseDeleter
+from src.database.transactions.monthly_total import (
+    UNCATEGORIZED,
+    MonthlyTotal,
+    MonthlyTotalFilter,
+)
+from src.database.transactions.monthly_total_database_handler import (
+    MonthlyTotalDatabaseHandler,
+)
+from src.database.transactions.transaction import TransactionCreate
+from src.database.transactions.transaction_database_handler import (
+    TransactionDatabaseHandler,
+)
+from src.database.users.user import User
+from src.tests.test_utils import create_injector_with_database
+
+JANUARY = date(2026, 1, 1)
+FEBRUARY = date(2026, 2, 1)
+
+
+class TestMonthlyTotalDatabaseHandler(TestCase):
+    def setUp(self):
+        self.__injector = create_injector_with_database()
+
+        database = self.__injector.get(IDatabase)
+        database.create_database()
+        self.__user = User(email="fredrik@omstedt.com")
+        with database.get_session() as session:
+            session.add(self.__user)
+            session.add(Category(name="Food", user_id=self.__user.id))
+            session.add(Category(name="Car", user_id=self.__user.id))
+            session.commit()
+            session.refresh(self.__user)
+            self.__category_ids = dict(
+                session.exec(select(Category.name, Category.id)).all()
+            )
+
+    def tearDown(self) -> None:
+        database_deleter = self.__injector.get(IDatabaseDeleter)
+        database_deleter.delete_database()
+
+    def test_ledger_writes_update_totals(self):
+        self.__create(-100, datetime(2026, 1, 5), "Food")
+        id = self.__create(-50, datetime(2026, 1, 31, 23), "Food")
+        self.__create(300, datetime(2026, 2, 1))
+        self.__import([(-20, datetime(2026, 2, 3), "Food"), (-5, datetime(2026, 2, 3))])
+        self.__delete(id)
+
+        self.assertEqual(
+            self.__get_totals(),
+            [
+                (JANUARY, "Food", -100, 1),
+                (FEBRUARY, None, 295, 2),
+                (FEBRUARY, "Food", -20, 1),
+            ],
+        )
+
+    def test_deleting_last_transaction_removes_total(self):
+        id = self.__create(-100, datetime(2026, 1, 5), "Food")
+        self.__delete(id)
+
+        self.assertEqual(self.__get_totals(), [])
+
+    def test_deleting_categories_moves_totals_to_uncategorized(self):
+        self.__create(-100, datetime(2026, 1, 5), "Food")
+        self.__create(-50, datetime(2026, 1, 6), "Car")
+        self.__create(10, datetime(2026, 1, 7))
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(CategoryDatabaseHandler)
+        with database.get_session() as session:
+            handler.delete_category(session, self.__user, "Food")
+            handler.delete_categories(session, self.__user, ["Car"])
+            session.commit()
+
+        self.assertEqual(self.__get_totals(), [(JANUARY, None, -140, 3)])
+
+    def test_get_monthly_totals_applies_filters(self):
+        self.__create(-100, datetime(2025, 12, 31), "Food")
+        self.__create(-50, datetime(2026, 1, 1), "Food")
+        self.__create(300, datetime(2026, 2, 1))
+
+        totals = self.__get_totals(
+            MonthlyTotalFilter(start=date(2026, 1, 20), end=date(2026, 2, 10))
+        )
+
+        self.assertEqual(totals, [(JANUARY, "Food", -50, 1)])
+
+    def test_rebuild_monthly_totals_repairs_stale_totals(self):
+        self.__create(-100, datetime(2026, 1, 5), "Food")
+        self.__create(300, datetime(2026, 2, 1))
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(MonthlyTotalDatabaseHandler)
+        with database.get_session() as session:
+            total = session.get(MonthlyTotal, (self.__user.id, FEBRUARY, UNCATEGORIZED))
+            total.total = 0
+            session.add(
+                MonthlyTotal(
+                    user_id=self.__user.id,
+                    month=JANUARY,
+                    category_id=self.__category_ids["Car"],
+                    total=1,
+                    count=1,
+                )
+            )
+            session.commit()
+
+        with database.get_session() as session:
+            stale = handler.find_stale_monthly_totals(session, self.__user)
+            handler.rebuild_monthly_totals(session, self.__user)
+            session.commit()
+        with database.get_session() as session:
+            rebuilt = handler.find_stale_monthly_totals(session, self.__user)
+
+        self.assertEqual(
+            stale,
+            [(JANUARY, self.__category_ids["Car"]), (FEBRUARY, UNCATEGORIZED)],
+        )
+        self.assertEqual(rebuilt, [])
+        self.assertEqual(
+            self.__get_totals(),
+            [(JANUARY, "Food", -100, 1), (FEBRUARY, None, 300, 1)],
+        )
+
+    def __create(
+        self, amount: int, occurred_at: datetime, category: str | None = None
+    ) -> int:
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+        data = TransactionCreate(
+            amount=amount, occurred_at=occurred_at, category=category
+        )
+        with database.get_session() as session:
+            transaction = handler.create_transaction(session, self.__user, data)
+            session.commit()
+            return transaction.id
+
+    def __import(self, rows: list[tuple]) -> None:
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+        values = [
+            {
+                "category_id": self.__category_ids.get(row[2]) if row[2:] else None,
+                "amount": row[0],
+                "occurred_at": row[1],
+                "description": "",
+                "content_hash": bytes([index]) * 16,
+            }
+            for index, row in enumerate(rows)
+        ]
+        with database.get_session() as session:
+            handler.insert_transactions(session, self.__user, values)
+            handler.insert_transactions(session, self.__user, values)
+            session.commit()
+
+    def __delete(self, id: int) -> None:
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+        with database.get_session() as session:
+            handler.delete_transaction(session, self.__user, id)
+            session.commit()
+
+    def __get_totals(
+        self, filters: MonthlyTotalFilter = MonthlyTotalFilter()
+    ) -> list[tuple[date, str | None, int, int]]:
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(MonthlyTotalDatabaseHandler)
+        with database.get_session() as session:
+            totals = handler.get_monthly_totals(session, self.__user, filters)
+        return [
+            (total.month, category, total.total, total.count)
+            for total, category in totals
+        ]
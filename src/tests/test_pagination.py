@@ -0,0 +1,26 @@
+from unittest import TestCase
+
+from src.common.pagination import decode_cursor, encode_cursor
+
+
+class TestPagination(TestCase):
+    def test_decode_cursor_returns_encoded_values(self):
+        values = ["Food", 12, None]
+
+        cursor = encode_cursor(values)
+
+        self.assertEqual(decode_cursor(cursor, 3), values)
+
+    def test_encode_cursor_is_url_safe(self):
+        cursor = encode_cursor(["?/&=+ Ö"])
+
+        self.assertRegex(cursor, r"^[A-Za-z0-9_-]+$")
+
+    def test_decode_cursor_raises_on_malformed_cursor(self):
+        for cursor in ["", "not-a-cursor", "!!!", encode_cursor({"a": 1})]:
+            with self.assertRaises(ValueError):
+                decode_cursor(cursor, 1)
+
+    def test_decode_cursor_raises_on_wrong_length(self):
+        with self.assertRaises(ValueError):
+            decode_cursor(encode_cursor(["Food", "Car"]), 1)
@@ -0,0 +1,83 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock
+
+from passlib.context import CryptContext
+
+from src.authentication.password_handler import PasswordHandler
+from src.common.exceptions import PasswordHashingOverloadedError
+
+
+class TestPasswordHandler(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.__context = CryptContext(
+            schemes=["sha256_crypt"], sha256_crypt__default_rounds=1000
+        )
+        self.__settings = MagicMock()
+        self.__settings.password_hashing_workers = 1
+        self.__settings.password_hashing_queue_size = 1
+
+    def test_hash_password_can_be_verified(self):
+        handler = PasswordHandler(self.__context, self.__settings)
+
+        hashed_password = handler.hash_password("password")
+
+        self.assertNotEqual(hashed_password, "password")
+        self.assertTrue(handler.verify_password("password", hashed_password))
+        self.assertFalse(handler.verify_password("wrong", hashed_password))
+
+    def test_verify_and_update_password_returns_new_hash_if_outdated(self):
+        old_context = CryptContext(
+            schemes=["sha256_crypt"], sha256_crypt__default_rounds=2000
+        )
+        hashed_password = old_context.hash("password")
+        self.__context.update(
+            sha256_crypt__min_rounds=1000, sha256_crypt__max_rounds=1000
+        )
+        handler = PasswordHandler(self.__context, self.__settings)
+
+        is_valid, new_hash = handler.verify_and_update_password(
+            "password", hashed_password
+        )
+
+        self.assertTrue(is_valid)
+        self.assertIsNotNone(new_hash)
+        self.assertEqual(
+            handler.verify_and_update_password("password", new_hash), (True, None)
+        )
+        self.assertEqual(
+            handler.verify_and_update_password("wrong", hashed_password),
+            (False, None),
+        )
+
+    async def test_async_hash_password_can_be_verified(self):
+        handler = PasswordHandler(self.__context, self.__settings)
+
+        hashed_password = await handler.hash_password_async("password")
+
+        self.assertTrue(await handler.verify_password_async("password", hashed_password))
+        self.assertFalse(await handler.verify_password_async("wrong", hashed_password))
+
+    async def test_raises_when_queue_is_full(self):
+        slow_context = CryptContext(
+            schemes=["sha256_crypt"], sha256_crypt__default_rounds=1000000
+        )
+        handler = PasswordHandler(slow_context, self.__settings)
+
+        running = asyncio.create_task(handler.hash_password_async("password"))
+        queued = asyncio.create_task(handler.hash_password_async("password"))
+        await asyncio.sleep(0)
+
+        with self.assertRaises(PasswordHashingOverloadedError):
+            handler.hash_password("password")
+        await asyncio.gather(running, queued)
+
+    def test_shutdown_stops_workers_until_next_operation(self):
+        handler = PasswordHandler(self.__context, self.__settings)
+        handler.shutdown()
+        hashed_password = handler.hash_password("password")
+
+        handler.shutdown()
+
+        self.assertTrue(handler.verify_password("password", hashed_password))
+        handler.shutdown()
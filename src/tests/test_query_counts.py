@@ -0,0 +1,276 @@
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import create_autospec
+
+from fastapi import status
+from fastapi.testclient import TestClient
+from fastapi_injector import request_scope
+from injector import singleton
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.authentication.async_authentication import AsyncAuthentication
+from src.authentication.async_token_revocations import AsyncTokenRevocations
+from src.authentication.authentication import Authentication
+from src.authentication.i_async_authentication import IAsyncAuthentication
+from src.authentication.i_async_token_revocations import IAsyncTokenRevocations
+from src.authentication.i_authentication import IAuthentication
+from src.authentication.i_password_handler import IPasswordHandler
+from src.authentication.i_token_revocations import ITokenRevocations
+from src.authentication.i_user_cache import IUserCache
+from src.authentication.token_revocations import TokenRevocations
+from src.authentication.user_cache import UserCache
+from src.common.i_jwt_encoder import IJwtEncoder
+from src.common.jwt_encoder import JwtEncoder
+from src.common.settings import Settings
+from src.database.async_database import AsyncDatabase
+from src.database.async_write_coalescer import AsyncWriteCoalescer
+from src.database.categories.category import Category
+from src.database.categories.category_database_handler import CategoryDatabaseHandler
+from src.database.categories.i_category_database_handler import (
+    ICategoryDatabaseHandler,
+)
+from src.database.i_async_database import IAsyncDatabase
+from src.database.i_async_write_coalescer import IAsyncWriteCoalescer
+from src.database.i_database import IDatabase
+from src.database.i_database_deleter import IDatabaseDeleter
+from src.database.i_unit_of_work import IUnitOfWork
+from src.database.transactions.balance_database_handler import (
+    BalanceDatabaseHandler,
+)
+from src.database.transactions.i_balance_database_handler import (
+    IBalanceDatabaseHandler,
+)
+from src.database.transactions.i_monthly_total_database_handler import (
+    IMonthlyTotalDatabaseHandler,
+)
+from src.database.transactions.i_transaction_database_handler import (
+    ITransactionDatabaseHandler,
+)
+from src.database.transactions.monthly_total_database_handler import (
+    MonthlyTotalDatabaseHandler,
+)
+from src.database.transactions.transaction import Transaction
+from src.database.transactions.transaction_database_handler import (
+    TransactionDatabaseHandler,
+)
+from src.database.unit_of_work import UnitOfWork
+from src.main import create_app
+from src.managers.async_category_manager import AsyncCategoryManager
+from src.managers.async_export_manager import AsyncExportManager
+from src.managers.async_transaction_manager import AsyncTransactionManager
+from src.managers.async_user_manager import AsyncUserManager
+from src.managers.category_manager import CategoryManager
+from src.managers.export_manager import ExportManager
+from src.managers.i_async_category_manager import IAsyncCategoryManager
+from src.managers.i_async_export_manager import IAsyncExportManager
+from src.managers.i_async_transaction_manager import IAsyncTransactionManager
+from src.managers.i_async_user_manager import IAsyncUserManager
+from src.managers.i_category_manager import ICategoryManager
+from src.managers.i_export_manager import IExportManager
+from src.managers.i_transaction_manager import ITransactionManager
+from src.managers.i_user_manager import IUserManager
+from src.managers.transaction_manager import TransactionManager
+from src.managers.user_manager import UserManager
+from src.tests.test_utils import create_injector_with_database
+
+
+class TestQueryCounts(TestCase):
+    async_database = False
+
+    def setUp(self):
+        self.__injector = create_injector_with_database()
+        settings = self.__injector.get(Settings)
+        settings.authentication_secret = "secret"
+        settings.user_cache_size = 0
+        settings.async_database = self.async_database
+
+        self.__password_handler = create_autospec(IPasswordHandler)
+        self.__password_handler.hash_password.return_value = "hash"
+        self.__password_handler.verify_password.return_value = True
+        self.__password_handler.verify_and_update_password.return_value = (True, None)
+        self.__password_handler.hash_password_async.return_value = "hash"
+        self.__password_handler.verify_password_async.return_value = True
+        self.__password_handler.verify_and_update_password_async.return_value = (
+            True,
+            None,
+        )
+
+        binder = self.__injector.binder
+        binder.bind(IPasswordHandler, to=self.__password_handler, scope=singleton)
+        binder.bind(IJwtEncoder, to=JwtEncoder, scope=singleton)
+        binder.bind(IUserCache, to=UserCache, scope=singleton)
+        binder.bind(ITokenRevocations, to=TokenRevocations, scope=singleton)
+        binder.bind(
+            IAsyncTokenRevocations, to=AsyncTokenRevocations, scope=singleton
+        )
+        binder.bind(IUnitOfWork, to=UnitOfWork, scope=request_scope)
+        binder.bind(IUserManager, to=UserManager, scope=request_scope)
+        binder.bind(IAuthentication, to=Authentication, scope=request_scope)
+        binder.bind(IAsyncDatabase, to=AsyncDatabase, scope=singleton)
+        binder.bind(IAsyncWriteCoalescer, to=AsyncWriteCoalescer, scope=singleton)
+        binder.bind(IAsyncUserManager, to=AsyncUserManager, scope=request_scope)
+        binder.bind(
+            IAsyncAuthentication, to=AsyncAuthentication, scope=request_scope
+        )
+        binder.bind(ICategoryDatabaseHandler, to=CategoryDatabaseHandler)
+        binder.bind(ITransactionDatabaseHandler, to=TransactionDatabaseHandler)
+        binder.bind(IMonthlyTotalDatabaseHandler, to=MonthlyTotalDatabaseHandler)
+        binder.bind(IBalanceDatabaseHandler, to=BalanceDatabaseHandler)
+        binder.bind(ICategoryManager, to=CategoryManager, scope=request_scope)
+        binder.bind(ITransactionManager, to=TransactionManager, scope=request_scope)
+        binder.bind(IExportManager, to=ExportManager)
+        binder.bind(
+            IAsyncCategoryManager, to=AsyncCategoryManager, scope=request_scope
+        )
+        binder.bind(
+            IAsyncTransactionManager, to=AsyncTransactionManager, scope=request_scope
+        )
+        binder.bind(IAsyncExportManager, to=AsyncExportManager)
+
+        self.__injector.get(IDatabase).create_database()
+        self.__client = TestClient(create_app(self.__injector))
+        self.__statements: list[str] = []
+        event.listen(Engine, "before_cursor_execute", self.__count_statement)
+
+        response = self.__client.post(
+            "/auth/create-user",
+            json={"email": "fredrik@omstedt.com", "password": "password"},
+        )
+        self.__user_id = response.json()["id"]
+        response = self.__client.post(
+            "/auth/token",
+            data={"username": "fredrik@omstedt.com", "password": "password"},
+        )
+        self.__headers = {
+            "Authorization": f"Bearer {response.json()['access_token']}"
+        }
+        with self.__injector.get(IDatabase).get_session() as session:
+            food = Category(name="Food", user_id=self.__user_id)
+            session.add(food)
+            session.add(Category(name="Car", user_id=self.__user_id))
+            session.flush()
+            for day in range(1, 4):
+                session.add(Transaction(
+                    amount=-100 * day,
+                    occurred_at=datetime(2026, 1, day),
+                    description="Grocery store",
+                    user_id=self.__user_id,
+                    category_id=food.id,
+                ))
+            session.commit()
+        self.__statements.clear()
+
+    def tearDown(self) -> None:
+        event.remove(Engine, "before_cursor_execute", self.__count_statement)
+        self.__injector.get(IDatabaseDeleter).delete_database()
+
+    def test_create_user_query_count(self):
+        response = self.__client.post(
+            "/auth/create-user",
+            json={"email": "tiburtius@omstedt.com", "password": "password"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertQueryCount(1)
+
+    def test_login_query_count(self):
+        response = self.__client.post(
+            "/auth/token",
+            data={"username": "fredrik@omstedt.com", "password": "password"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertQueryCount(1)
+
+    def test_get_user_query_count(self):
+        response = self.__client.get("/auth/get-user", headers=self.__headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertQueryCount(1)
+
+    def test_get_user_not_modified_query_count(self):
+        response = self.__client.get("/auth/get-user", headers=self.__headers)
+        headers = {**self.__headers, "If-None-Match": response.headers["ETag"]}
+        self.__statements.clear()
+
+        response = self.__client.get("/auth/get-user", headers=headers)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertQueryCount(0)
+
+    def test_update_user_query_count(self):
+        response = self.__client.patch(
+            "/auth/update-user", headers=self.__headers, json={"first_name": "F"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertQueryCount(3 if self.async_database else 2)
+
+    def test_update_user_password_query_count(self):
+        response = self.__client.patch(
+            "/auth/update-user-password",
+            headers=self.__headers,
+            json={"old_password": "password", "new_password": "new-password"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertQueryCount(4 if self.async_database else 3)
+
+    def test_delete_user_query_count(self):
+        response = self.__client.delete("/auth/delete-user", headers=self.__headers)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        # The user's categories are only loaded here, to cascade the delete.
+        self.assertQueryCount(7 if self.async_database else 6)
+
+    def test_get_categories_query_count(self):
+        response = self.__client.get("/categories", headers=self.__headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertQueryCount(2)
+
+    def test_export_categories_query_count(self):
+        response = self.__client.get("/categories/export", headers=self.__headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertQueryCount(2)
+
+    def test_get_transactions_query_count(self):
+        response = self.__client.get(
+            "/transactions", headers=self.__headers, params={"limit": 2}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["items"]), 2)
+        self.assertQueryCount(2)
+
+    def test_search_transactions_query_count(self):
+        response = self.__client.get(
+            "/transactions/search",
+            headers=self.__headers,
+            params={"query": "grocery", "limit": 2},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["items"]), 2)
+        # Candidates are ranked in Python before the page is loaded.
+        self.assertQueryCount(3)
+
+    def test_export_transactions_query_count(self):
+        response = self.__client.get("/transactions/export", headers=self.__headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertQueryCount(2)
+
+    def assertQueryCount(self, count: int) -> None:
+        self.assertEqual(len(self.__statements), count, self.__statements)
+
+    def __count_statement(self, _connection, _cursor, statement, *_) -> None:
+        self.__statements.append(statement)
+
+
+class TestAsyncQueryCounts(TestQueryCounts):
+    # Async managers open a session per call, so routes that authenticate and
+    # then write fetch the user twice.
+    async_database = True
@@ -0,0 +1,126 @@
+from datetime import date
+from unittest import TestCase
+
+import numpy as np
+
+from src.analytics.reports import (
+    compare_years,
+    slice_ledger,
+    summarize_category_spend,
+    summarize_daily_spend,
+    summarize_monthly_spend,
+    to_day_number,
+)
+from src.database.transactions.analytics import (
+    CategorySpendRead,
+    DailySpendFilter,
+    DailySpendRead,
+    Ledger,
+    MonthlySpendRead,
+    SpendFilter,
+    YearOverYearRead,
+)
+from src.database.transactions.monthly_total import MonthlyTotalFilter
+
+
+def create_ledger(rows: list[tuple[date, int, int]]) -> Ledger:
+    return Ledger(
+        np.array([to_day_number(day) for day, _, _ in rows], dtype=np.int32),
+        np.array([amount for _, amount, _ in rows], dtype=np.int64),
+        np.array([category_id for _, _, category_id in rows], dtype=np.int32),
+        {1: "Food", 2: "Car"},
+    )
+
+
+LEDGER = create_ledger(
+    [
+        (date(2025, 1, 10), -400, 1),
+        (date(2025, 3, 1), -100, 2),
+        (date(2026, 1, 1), -100, 1),
+        (date(2026, 1, 1), 5000, 0),
+        (date(2026, 1, 2), -300, 0),
+        (date(2026, 1, 4), -50, 1),
+        (date(2026, 1, 4), -50, 2),
+        (date(2026, 3, 15), -200, 2),
+    ]
+)
+
+
+class TestReports(TestCase):
+    def test_slice_ledger_returns_days_in_range(self):
+        ledger = slice_ledger(LEDGER, date(2026, 1, 1), date(2026, 1, 4))
+
+        self.assertEqual(ledger.amounts.tolist(), [-100, 5000, -300])
+
+    def test_summarize_category_spend_ignores_income(self):
+        spend = summarize_category_spend(
+            LEDGER, SpendFilter(start=date(2026, 1, 1), end=date(2026, 2, 1))
+        )
+
+        self.assertEqual(
+            spend,
+            [
+                CategorySpendRead(category=None, spend=300, count=1, share=0.6),
+                CategorySpendRead(category="Food", spend=150, count=2, share=0.3),
+                CategorySpendRead(category="Car", spend=50, count=1, share=0.1),
+            ],
+        )
+
+    def test_summarize_category_spend_without_spending(self):
+        spend = summarize_category_spend(LEDGER, SpendFilter(start=date(2027, 1, 1)))
+
+        self.assertEqual(spend, [])
+
+    def test_summarize_daily_spend_averages_trailing_window(self):
+        filters = DailySpendFilter(start=date(2026, 1, 2), end=date(2026, 1, 5))
+
+        spend = summarize_daily_spend(LEDGER, filters, window=2)
+
+        self.assertEqual(
+            spend,
+            [
+                DailySpendRead(day=date(2026, 1, 2), spend=300, average=200),
+                DailySpendRead(day=date(2026, 1, 3), spend=0, average=150),
+                DailySpendRead(day=date(2026, 1, 4), spend=100, average=50),
+            ],
+        )
+
+    def test_summarize_daily_spend_raises_on_invalid_range(self):
+        filters = DailySpendFilter(start=date(2026, 1, 2), end=date(2026, 1, 2))
+
+        with self.assertRaises(ValueError):
+            summarize_daily_spend(LEDGER, filters, window=2)
+
+    def test_summarize_monthly_spend_counts_months_without_spending(self):
+        spend = summarize_monthly_spend(
+            LEDGER, MonthlyTotalFilter(start=date(2026, 1, 1), end=date(2026, 5, 1))
+        )
+
+        self.assertEqual(
+            [spend.months, spend.mean, spend.p25, spend.p50, spend.p75],
+            [4, 175, 0, 100, 275],
+        )
+        self.assertAlmostEqual(spend.p90, 410)
+
+    def test_summarize_monthly_spend_defaults_to_whole_ledger(self):
+        spend = summarize_monthly_spend(LEDGER, MonthlyTotalFilter())
+        empty = summarize_monthly_spend(
+            LEDGER, MonthlyTotalFilter(start=date(2027, 1, 1))
+        )
+
+        self.assertEqual(spend.months, 15)
+        self.assertEqual(spend.mean, 1200 / 15)
+        self.assertEqual(empty, MonthlySpendRead(months=0))
+
+    def test_compare_years(self):
+        years = compare_years(LEDGER, 2026)
+
+        self.assertEqual(len(years), 12)
+        self.assertEqual(
+            years[:3],
+            [
+                YearOverYearRead(month=1, spend=500, previous_spend=400, change=0.25),
+                YearOverYearRead(month=2, spend=0, previous_spend=0),
+                YearOverYearRead(month=3, spend=200, previous_spend=100, change=1),
+            ],
+        )
@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+from src.common.etags import VersionedResource
+from src.common.resource_versions import ResourceVersions
+from src.common.settings import Settings
+
+
+class TestResourceVersions(TestCase):
+    def setUp(self):
+        self.__versions = ResourceVersions(Settings())
+
+    def test_get_version_keeps_version_until_invalidated(self):
+        version = self.__versions.get_version(VersionedResource.USER, "id")
+        unchanged = self.__versions.get_version(VersionedResource.USER, "id")
+        self.__versions.invalidate(VersionedResource.USER, "id")
+        changed = self.__versions.get_version(VersionedResource.USER, "id")
+
+        self.assertEqual(unchanged, version)
+        self.assertNotEqual(changed, version)
+
+    def test_invalidate_user_invalidates_every_resource_of_user(self):
+        versions = {
+            (resource, user_id): self.__versions.get_version(resource, user_id)
+            for resource in VersionedResource
+            for user_id in ["id", "other"]
+        }
+
+        self.__versions.invalidate_user("id")
+
+        for (resource, user_id), version in versions.items():
+            current = self.__versions.get_version(resource, user_id)
+            self.assertEqual(current == version, user_id == "other")
+
+    def test_versions_of_other_processes_never_match(self):
+        other = ResourceVersions(Settings())
+
+        self.assertNotEqual(
+            self.__versions.get_version(VersionedResource.CATEGORIES, "id"),
+            other.get_version(VersionedResource.CATEGORIES, "id"),
+        )
+
+    def test_get_version_changes_every_time_without_cache(self):
+        versions = ResourceVersions(Settings(resource_version_cache_size=0))
+
+        self.assertNotEqual(
+            versions.get_version(VersionedResource.USER, "id"),
+            versions.get_version(VersionedResource.USER, "id"),
+        )
@@ -0,0 +1,102 @@
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from sqlalchemy import text
+from sqlmodel import create_engine, select
+
+from src.common.settings import Settings
+from src.database.async_database import AsyncDatabase
+from src.database.database import Database
+from src.database.sqlite_profile import RoutingSession, uses_sqlite_profile
+from src.database.users.user import User
+
+
+class TestSqliteProfile(TestCase):
+    def setUp(self):
+        self.__database = Database(Settings(database_url="sqlite:///test_database.db"))
+        self.__database.create_database()
+
+    def tearDown(self) -> None:
+        self.__database.delete_database()
+
+    def test_connections_use_profile_pragmas(self):
+        with self.__database.get_session() as session:
+            self.assertEqual(session.exec(text("PRAGMA journal_mode")).scalar(), "wal")
+            self.assertEqual(session.exec(text("PRAGMA synchronous")).scalar(), 1)
+            self.assertEqual(session.exec(text("PRAGMA foreign_keys")).scalar(), 1)
+            self.assertEqual(session.exec(text("PRAGMA busy_timeout")).scalar(), 5000)
+
+    def test_session_reads_its_own_uncommitted_writes(self):
+        with self.__database.get_session() as session:
+            session.add(User(email="fredrik@omstedt.com"))
+            session.flush()
+
+            user = session.exec(
+                select(User).where(User.email == "fredrik@omstedt.com")).first()
+
+            self.assertIsNotNone(user)
+
+    def test_pool_statistics_include_writer_connection(self):
+        statistics = self.__database.pool_statistics()
+
+        self.assertEqual(statistics.pool_size, Settings().database_pool_size + 1)
+
+    def test_connections_enforce_foreign_keys_without_profile(self):
+        for database_url in ("sqlite:///test_database.db", "sqlite://"):
+            database = Database(Settings(
+                database_url=database_url, sqlite_performance_profile=False))
+
+            with database.get_session() as session:
+                self.assertEqual(session.exec(text("PRAGMA foreign_keys")).scalar(), 1)
+
+    def test_uses_sqlite_profile_only_for_sqlite_files(self):
+        self.assertTrue(uses_sqlite_profile(Settings(database_url="sqlite:///cash.db")))
+        self.assertFalse(uses_sqlite_profile(Settings(database_url="sqlite://")))
+        self.assertFalse(uses_sqlite_profile(
+            Settings(database_url="postgresql://localhost/cash")))
+        self.assertFalse(uses_sqlite_profile(Settings(
+            database_url="sqlite:///cash.db", sqlite_performance_profile=False)))
+
+
+class TestRoutingSession(TestCase):
+    def setUp(self):
+        self.__reader = create_engine("sqlite://")
+        self.__writer = create_engine("sqlite://")
+
+    def test_get_bind_returns_reader_for_reads(self):
+        session = RoutingSession(reader=self.__reader, writer=self.__writer)
+
+        self.assertIs(session.get_bind(clause=select(User)), self.__reader)
+
+    def test_get_bind_returns_writer_for_writes(self):
+        session = RoutingSession(reader=self.__reader, writer=self.__writer)
+
+        self.assertIs(session.get_bind(clause=User.__table__.delete()), self.__writer)
+
+    def test_get_bind_keeps_writer_until_transaction_ends(self):
+        User.metadata.create_all(self.__writer)
+        with RoutingSession(reader=self.__reader, writer=self.__writer) as session:
+            session.exec(User.__table__.delete())
+
+            self.assertIs(session.get_bind(clause=select(User)), self.__writer)
+
+            session.commit()
+
+            self.assertIs(session.get_bind(clause=select(User)), self.__reader)
+
+
+class TestAsyncSqliteProfile(IsolatedAsyncioTestCase):
+    async def test_connections_use_profile_pragmas(self):
+        database = AsyncDatabase(Settings(database_url="sqlite:///test_database.db"))
+
+        async with database.get_session() as session:
+            result = await session.exec(text("PRAGMA journal_mode"))
+            self.assertEqual(result.scalar(), "wal")
+            result = await session.exec(text("PRAGMA foreign_keys"))
+            self.assertEqual(result.scalar(), 1)
+
+    async def test_connections_enforce_foreign_keys_without_profile(self):
+        database = AsyncDatabase(Settings(database_url="sqlite://"))
+
+        async with database.get_session() as session:
+            result = await session.exec(text("PRAGMA foreign_keys"))
+            self.assertEqual(result.scalar(), 1)
@@ -0,0 +1,137 @@
+from datetime import datetime
+from io import BytesIO
+from unittest import TestCase
+
+from src.database.transactions.transaction import (
+    StatementFormat,
+    TransactionImportError,
+)
+from src.transactions.statements import (
+    StatementRow,
+    detect_statement_format,
+    parse_amount,
+    parse_statement,
+)
+
+CSV = b"""\xef\xbb\xbfDate,Amount,Description,Category
+2026-01-01,-45.50,Groceries,Food
+2026-01-01,-45.50,Groceries,Food
+2026-01-02T08:30:00+01:00,1200,Salary,
+
+not a date,1,Broken,
+2026-01-03,1.005,Broken,
+2026-01-03,-3
+"""
+
+OFX = b"""OFXHEADER:100
+DATA:OFXSGML
+CHARSET:1252
+
+<OFX>
+<BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>20260105120000.000[-5:EST]
+<TRNAMT>-12,34
+<FITID>A1
+<NAME>Caf\xe9
+</STMTTRN>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>20260106
+<TRNAMT>-1.00
+<FITID>A2
+<MEMO>Fee
+</STMTTRN>
+<STMTTRN>
+<DTPOSTED>yesterday
+<TRNAMT>1
+</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1>
+</OFX>
+"""
+
+
+def parse(content: bytes, format: StatementFormat) -> list:
+    return list(parse_statement(BytesIO(content), format))
+
+
+class TestStatements(TestCase):
+    def test_detect_statement_format(self):
+        self.assertEqual(detect_statement_format("bank.QFX"), StatementFormat.OFX)
+        self.assertEqual(detect_statement_format("bank.csv"), StatementFormat.CSV)
+        self.assertEqual(detect_statement_format(None), StatementFormat.CSV)
+
+    def test_parse_csv(self):
+        rows = parse(CSV, StatementFormat.CSV)
+
+        self.assertEqual(
+            [row[:5] for row in rows[:3]],
+            [
+                (2, datetime(2026, 1, 1), -4550, "Groceries", "Food"),
+                (3, datetime(2026, 1, 1), -4550, "Groceries", "Food"),
+                (4, datetime(2026, 1, 2, 7, 30), 120000, "Salary", None),
+            ],
+        )
+        self.assertEqual(
+            rows[3:],
+            [
+                TransactionImportError(row=6, message="Date is not an ISO 8601 date."),
+                TransactionImportError(
+                    row=7, message="Amount has more than two decimals."
+                ),
+                TransactionImportError(row=8, message="Row has too few columns."),
+            ],
+        )
+
+    def test_parse_csv_tells_identical_rows_apart(self):
+        first = parse(CSV, StatementFormat.CSV)
+        second = parse(CSV, StatementFormat.CSV)
+
+        hashes = [row.content_hash for row in first if isinstance(row, StatementRow)]
+        self.assertEqual(len(set(hashes)), 3)
+        self.assertEqual(
+            hashes,
+            [row.content_hash for row in second if isinstance(row, StatementRow)],
+        )
+
+    def test_parse_csv_tells_identical_rows_apart_across_interleaved_days(self):
+        rows = parse(
+            b"Date,Amount,Description\n"
+            b"2026-01-01,-45.50,Groceries\n"
+            b"2026-01-02,-10,Coffee\n"
+            b"2026-01-01,-45.50,Groceries\n",
+            StatementFormat.CSV,
+        )
+
+        hashes = [row.content_hash for row in rows]
+        self.assertEqual(len(set(hashes)), 3)
+
+    def test_parse_csv_without_amount_column_raises(self):
+        with self.assertRaises(ValueError):
+            parse(b"Date,Description\n2026-01-01,Groceries\n", StatementFormat.CSV)
+
+    def test_parse_ofx(self):
+        rows = parse(OFX, StatementFormat.OFX)
+
+        self.assertEqual(
+            [row[:5] for row in rows[:2]],
+            [
+                (1, datetime(2026, 1, 5, 17), -1234, "Café", None),
+                (2, datetime(2026, 1, 6), -100, "Fee", None),
+            ],
+        )
+        self.assertEqual(
+            rows[2], TransactionImportError(row=3, message="Date is not an OFX date.")
+        )
+
+    def test_parse_ofx_without_ofx_element_raises(self):
+        with self.assertRaises(ValueError):
+            parse(CSV, StatementFormat.OFX)
+
+    def test_parse_amount(self):
+        self.assertEqual(parse_amount(" -0.1 "), -10)
+        self.assertEqual(parse_amount("1e2"), 10000)
+        for text in ["", "ten", "NaN", "Infinity", "0.001", str(2**63)]:
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                parse_amount(text)
@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+from src.authentication.token_revocations import TokenRevocations
+from src.common.settings import Settings
+from src.database.i_database import IDatabase
+from src.database.i_database_deleter import IDatabaseDeleter
+from src.database.users.token_revocation import TokenRevocation
+from src.tests.test_utils import create_injector_with_database
+
+USER_ID = "0192a5d4-7c3e-7b21-9f4a-3d8e2c1b5a60"
+OTHER_USER_ID = "0192a5d4-7c3e-7b21-9f4a-3d8e2c1b5a61"
+
+
+class TestTokenRevocations(TestCase):
+    def setUp(self):
+        self.__injector = create_injector_with_database()
+        settings = self.__injector.get(Settings)
+        settings.token_revocation_refresh_seconds = 0
+        settings.access_token_expire_hours = 4
+
+        database = self.__injector.get(IDatabase)
+        database.create_database()
+
+    def tearDown(self) -> None:
+        database_deleter = self.__injector.get(IDatabaseDeleter)
+        database_deleter.delete_database()
+
+    def test_is_revoked_returns_false_without_revocations(self):
+        revocations = self.__injector.get(TokenRevocations)
+
+        self.assertFalse(revocations.is_revoked(USER_ID, 0))
+
+    def test_is_revoked_picks_up_committed_revocations(self):
+        revocations = self.__injector.get(TokenRevocations)
+        revocations.is_revoked(USER_ID, 0)
+        self.__add_to_database(TokenRevocation(user_id=USER_ID, token_version=2))
+
+        self.assertTrue(revocations.is_revoked(USER_ID, 1))
+        self.assertFalse(revocations.is_revoked(USER_ID, 2))
+        self.assertFalse(revocations.is_revoked(OTHER_USER_ID, 0))
+
+    def test_is_revoked_ignores_revocations_older_than_token_lifetime(self):
+        self.__add_to_database(
+            TokenRevocation(
+                user_id=USER_ID,
+                token_version=1,
+                revoked_at=datetime.utcnow() - timedelta(hours=5),
+            )
+        )
+        revocations = self.__injector.get(TokenRevocations)
+
+        self.assertFalse(revocations.is_revoked(USER_ID, 0))
+
+    def test_add_revocation_applies_immediately(self):
+        self.__injector.get(Settings).token_revocation_refresh_seconds = 60
+        revocations = self.__injector.get(TokenRevocations)
+        revocations.is_revoked(USER_ID, 0)
+
+        revocations.add_revocation(TokenRevocation(user_id=USER_ID, token_version=1))
+
+        self.assertTrue(revocations.is_revoked(USER_ID, 0))
+
+    def __add_to_database(self, revocation: TokenRevocation) -> None:
+        database = self.__injector.get(IDatabase)
+        with database.get_session() as session:
+            session.add(revocation)
+            session.commit()
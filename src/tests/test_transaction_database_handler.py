@@ -0,0 +1,395 @@
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+from sqlmodel import select
+
+from src.common.exceptions import ObjectNotFoundError
+from src.database.categories.category import Category
+from src.database.i_database import IDatabase
+from src.database.i_database_deleter import IDatabaseDeleter
+from src.database.transactions.transaction import (
+    MAX_SEARCH_CANDIDATES,
+    Transaction,
+    TransactionCreate,
+    TransactionFilter,
+    TransactionSearchFilter,
+)
+from src.database.transactions.transaction_database_handler import (
+    TransactionDatabaseHandler,
+)
+from src.database.users.user import User
+from src.tests.test_utils import create_injector_with_database
+
+START = datetime(2026, 1, 1)
+
+
+class TestTransactionDatabaseHandler(TestCase):
+    def setUp(self):
+        self.__injector = create_injector_with_database()
+
+        database = self.__injector.get(IDatabase)
+        database.create_database()
+        self.__user = User(email="fredrik@omstedt.com")
+        self.__other_user = User(email="tiburtius@omstedt.com")
+        with database.get_session() as session:
+            session.add(self.__user)
+            session.add(self.__other_user)
+            session.add(Category(name="Food", user_id=self.__user.id))
+            session.add(Category(name="Food", user_id=self.__other_user.id))
+            session.commit()
+            session.refresh(self.__user)
+            session.refresh(self.__other_user)
+
+    def tearDown(self) -> None:
+        database_deleter = self.__injector.get(IDatabaseDeleter)
+        database_deleter.delete_database()
+
+    def test_create_transaction_creates_transaction(self):
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+        data = TransactionCreate(
+            amount=-4550, occurred_at=START, description="Groceries", category="Food"
+        )
+        with database.get_session() as session:
+            transaction = handler.create_transaction(session, self.__user, data)
+            session.commit()
+            session.refresh(transaction)
+
+        with database.get_session() as session:
+            db_transaction = session.get(Transaction, transaction.id)
+            category = session.get(Category, db_transaction.category_id)
+            self.assertEqual(db_transaction.user_id, self.__user.id)
+            self.assertEqual(db_transaction.amount, -4550)
+            self.assertEqual(db_transaction.occurred_at, START)
+            self.assertEqual(db_transaction.description, "Groceries")
+            self.assertEqual(category.user_id, self.__user.id)
+
+    def test_create_transaction_raises_if_category_not_existing(self):
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+        data = TransactionCreate(amount=100, occurred_at=START, category="Car")
+        with database.get_session() as session:
+            with self.assertRaises(ObjectNotFoundError):
+                handler.create_transaction(session, self.__user, data)
+
+    def test_insert_transactions_skips_known_content_hashes(self):
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+        rows = [
+            {
+                "category_id": None,
+                "amount": index,
+                "occurred_at": START,
+                "description": "",
+                "content_hash": bytes([index]) * 16,
+            }
+            for index in range(3)
+        ]
+        with database.get_session() as session:
+            handler.insert_transactions(session, self.__other_user, rows)
+            first = handler.insert_transactions(session, self.__user, rows[:2])
+            second = handler.insert_transactions(session, self.__user, rows)
+            session.commit()
+
+        self.assertEqual((first, second), (2, 1))
+        with database.get_session() as session:
+            transactions = handler.get_transactions(
+                session, self.__user, TransactionFilter()
+            )
+            self.assertEqual(
+                sorted(transaction.amount for transaction, _ in transactions),
+                [0, 1, 2],
+            )
+
+    def test_get_transactions_returns_newest_first_with_category(self):
+        self.__add_transactions(self.__user, 3, category="Food")
+        self.__add_transactions(self.__other_user, 2, category="Food")
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+
+        with database.get_session() as session:
+            transactions = handler.get_transactions(
+                session, self.__user, TransactionFilter()
+            )
+
+        self.assertEqual(
+            [transaction.occurred_at for transaction, _ in transactions],
+            [START + timedelta(days=2), START + timedelta(days=1), START],
+        )
+        self.assertEqual({category for _, category in transactions}, {"Food"})
+
+    def test_get_transactions_continues_after_key(self):
+        self.__add_transactions(self.__user, 2)
+        self.__add_transactions(self.__user, 2)
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+
+        with database.get_session() as session:
+            first = handler.get_transactions(
+                session, self.__user, TransactionFilter(), limit=3
+            )
+            last = first[-1][0]
+            rest = handler.get_transactions(
+                session,
+                self.__user,
+                TransactionFilter(),
+                after=(last.occurred_at, last.id),
+            )
+
+        self.assertEqual(len(first), 3)
+        self.assertEqual(len(rest), 1)
+        ids = {transaction.id for transaction, _ in first + rest}
+        self.assertEqual(len(ids), 4)
+
+    def test_get_transactions_applies_filters(self):
+        self.__add_transactions(self.__user, 4)
+        self.__add_transactions(self.__user, 4, category="Food")
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+        filters = TransactionFilter(
+            category="Food",
+            start=START + timedelta(days=1),
+            end=START + timedelta(days=3),
+        )
+
+        with database.get_session() as session:
+            transactions = handler.get_transactions(session, self.__user, filters)
+
+        self.assertEqual(
+            [transaction.occurred_at for transaction, _ in transactions],
+            [START + timedelta(days=2), START + timedelta(days=1)],
+        )
+        self.assertEqual([category for _, category in transactions], ["Food"] * 2)
+
+    def test_search_transactions_ranks_whole_words_above_prefixes(self):
+        [prefix] = self.__add_transactions(self.__user, 1, description="Coffeeshop")
+        [word] = self.__add_transactions(self.__user, 1, description="Coffee beans")
+        self.__add_transactions(self.__user, 1, description="Tea")
+        self.__add_transactions(self.__other_user, 1, description="Coffee")
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+
+        with database.get_session() as session:
+            transactions = handler.search_transactions(
+                session, self.__user, TransactionSearchFilter(query="coffee")
+            )
+
+        self.assertEqual(
+            [transaction.id for transaction, _, _ in transactions], [word, prefix]
+        )
+        self.assertGreater(transactions[0][2], transactions[1][2])
+
+    def test_search_transactions_matches_starts_of_words_ignoring_diacritics(self):
+        [cafe] = self.__add_transactions(self.__user, 1, description="Café au lait")
+        [coffee] = self.__add_transactions(self.__user, 1, description="Coffee")
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+        expected = {
+            "cafe": [cafe],
+            "CAFÉ AU": [cafe],
+            "caf lai": [cafe],
+            "cof": [coffee],
+            "ee": [],
+            "offee": [],
+            "au coffee": [],
+        }
+
+        with database.get_session() as session:
+            for query, ids in expected.items():
+                transactions = handler.search_transactions(
+                    session, self.__user, TransactionSearchFilter(query=query)
+                )
+                self.assertEqual(
+                    [transaction.id for transaction, _, _ in transactions],
+                    ids,
+                    query,
+                )
+
+    def test_search_transactions_applies_filters(self):
+        self.__add_transactions(self.__user, 4, description="Lunch")
+        self.__add_transactions(self.__user, 4, category="Food", description="Lunch")
+        self.__add_transactions(self.__user, 4, category="Food", description="Rent")
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+        filters = TransactionSearchFilter(
+            query="lun",
+            category="Food",
+            start=START + timedelta(days=1),
+            end=START + timedelta(days=3),
+        )
+
+        with database.get_session() as session:
+            transactions = handler.search_transactions(session, self.__user, filters)
+
+        self.assertEqual(
+            sorted(transaction.occurred_at for transaction, _, _ in transactions),
+            [START + timedelta(days=1), START + timedelta(days=2)],
+        )
+        self.assertEqual([category for _, category, _ in transactions], ["Food"] * 2)
+
+    def test_search_transactions_continues_after_key(self):
+        self.__add_transactions(self.__user, 3, description="Bus ticket")
+        self.__add_transactions(self.__user, 2, description="Bus")
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+        filters = TransactionSearchFilter(query="bus")
+
+        with database.get_session() as session:
+            first = handler.search_transactions(
+                session, self.__user, filters, limit=3
+            )
+            _, _, key = first[-1]
+            rest = handler.search_transactions(
+                session, self.__user, filters, after=key
+            )
+
+        self.assertEqual(len(first), 3)
+        self.assertEqual(len(rest), 2)
+        ids = {transaction.id for transaction, _, _ in first + rest}
+        self.assertEqual(len(ids), 5)
+
+    def test_search_transactions_ranks_older_matches_in_later_windows(self):
+        older = self.__add_transactions(self.__user, 5, description="Bus ticket")
+        self.__add_transactions(
+            self.__user, MAX_SEARCH_CANDIDATES, description="Bus tickets"
+        )
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+        filters = TransactionSearchFilter(query="bus ticket")
+
+        with database.get_session() as session:
+            transactions = handler.search_transactions(session, self.__user, filters)
+
+        self.assertEqual(len(transactions), MAX_SEARCH_CANDIDATES + 5)
+        self.assertEqual(
+            [transaction.id for transaction, _, _ in transactions[-5:]],
+            older[::-1],
+        )
+
+    def test_search_transactions_continues_into_later_windows(self):
+        self.__add_transactions(self.__user, 5, description="Bus ticket")
+        self.__add_transactions(
+            self.__user, MAX_SEARCH_CANDIDATES, description="Bus tickets"
+        )
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+        filters = TransactionSearchFilter(query="bus ticket")
+
+        with database.get_session() as session:
+            first = handler.search_transactions(
+                session, self.__user, filters, limit=MAX_SEARCH_CANDIDATES - 2
+            )
+            _, _, key = first[-1]
+            second = handler.search_transactions(
+                session, self.__user, filters, after=key, limit=4
+            )
+            _, _, key = second[-1]
+            rest = handler.search_transactions(
+                session, self.__user, filters, after=key
+            )
+
+        self.assertEqual([len(first), len(second), len(rest)], [998, 4, 3])
+        ids = {transaction.id for transaction, _, _ in first + second + rest}
+        self.assertEqual(len(ids), MAX_SEARCH_CANDIDATES + 5)
+
+    def test_search_transactions_scores_do_not_depend_on_other_users(self):
+        self.__add_transactions(self.__user, 2, description="Bus ticket")
+        self.__add_transactions(self.__user, 2, description="Bus")
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+        filters = TransactionSearchFilter(query="bus ticket")
+
+        with database.get_session() as session:
+            before = handler.search_transactions(session, self.__user, filters)
+        self.__add_transactions(self.__other_user, 20, description="Ticket")
+        with database.get_session() as session:
+            after = handler.search_transactions(session, self.__user, filters)
+
+        self.assertEqual(
+            [(transaction.id, key) for transaction, _, key in after],
+            [(transaction.id, key) for transaction, _, key in before],
+        )
+
+    def test_search_transactions_skips_deleted_transactions(self):
+        [id, _] = self.__add_transactions(self.__user, 2, description="Gym")
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+
+        with database.get_session() as session:
+            handler.delete_transaction(session, self.__user, id)
+            session.commit()
+            transactions = handler.search_transactions(
+                session, self.__user, TransactionSearchFilter(query="gym")
+            )
+
+        self.assertEqual(len(transactions), 1)
+        self.assertNotEqual(transactions[0][0].id, id)
+
+    def test_stream_transactions_yields_batches_oldest_first(self):
+        ids = self.__add_transactions(self.__user, 3, category="Food")
+        self.__add_transactions(self.__other_user, 2)
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+
+        with database.get_session() as session:
+            batches = list(handler.stream_transactions(session, self.__user, 2))
+
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        self.assertEqual(
+            [tuple(row) for batch in batches for row in batch],
+            [
+                (id, START + timedelta(days=index), -100, "", "Food")
+                for index, id in enumerate(ids)
+            ],
+        )
+
+    def test_delete_transaction_deletes_transaction(self):
+        [id] = self.__add_transactions(self.__user, 1)
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+
+        with database.get_session() as session:
+            handler.delete_transaction(session, self.__user, id)
+            session.commit()
+
+        with database.get_session() as session:
+            self.assertIsNone(session.get(Transaction, id))
+
+    def test_delete_transaction_raises_if_transaction_of_other_user(self):
+        [id] = self.__add_transactions(self.__other_user, 1)
+        database = self.__injector.get(IDatabase)
+        handler = self.__injector.get(TransactionDatabaseHandler)
+
+        with database.get_session() as session:
+            with self.assertRaises(ObjectNotFoundError):
+                handler.delete_transaction(session, self.__user, id)
+
+    def __add_transactions(
+        self,
+        user: User,
+        count: int,
+        category: str | None = None,
+        description: str = "",
+    ) -> list[int]:
+        database = self.__injector.get(IDatabase)
+        with database.get_session() as session:
+            category_id = None
+            if category is not None:
+                category_id = session.exec(
+                    select(Category.id).where(
+                        Category.user_id == user.id, Category.name == category
+                    )
+                ).one()
+            transactions = [
+                Transaction(
+                    user_id=user.id,
+                    category_id=category_id,
+                    amount=-100,
+                    occurred_at=START + timedelta(days=index),
+                    description=description,
+                )
+                for index in range(count)
+            ]
+            session.add_all(transactions)
+            session.commit()
+            return [transaction.id for transaction in transactions]
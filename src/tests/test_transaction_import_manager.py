@@ -0,0 +1,113 @@
+from io import BytesIO
+from unittest import TestCase
+
+from injector import singleton
+from sqlmodel import select
+
+from src.common.settings import Settings
+from src.database.categories.category import Category
+from src.database.categories.category_database_handler import CategoryDatabaseHandler
+from src.database.categories.i_category_database_handler import ICategoryDatabaseHandler
+from src.database.i_database import IDatabase
+from src.database.i_database_deleter import IDatabaseDeleter
+from src.database.transactions.i_transaction_database_handler import (
+    ITransactionDatabaseHandler,
+)
+from src.database.transactions.transaction import (
+    StatementFormat,
+    Transaction,
+    TransactionImportError,
+)
+from src.database.transactions.transaction_database_handler import (
+    TransactionDatabaseHandler,
+)
+from src.database.users.user import User
+from src.managers.transaction_import_manager import TransactionImportManager
+from src.tests.test_utils import create_injector_with_database
+from src.transactions.statements import parse_statement
+
+CSV = b"""date,amount,description,category
+2026-01-01,-45.50,Groceries,Food
+2026-01-01,-45.50,Groceries,Food
+2026-01-02,-12,Fuel,Car
+2026-01-03,1200,Salary,
+2026-01-04,ten,Broken,
+"""
+
+
+class TestTransactionImportManager(TestCase):
+    def setUp(self):
+        self.__injector = create_injector_with_database()
+        self.__injector.binder.bind(
+            Settings,
+            to=Settings(
+                database_url="sqlite:///test_database.db",
+                transaction_import_batch_size=2,
+                transaction_import_max_errors=1,
+            ),
+            scope=singleton,
+        )
+        self.__injector.binder.bind(
+            ICategoryDatabaseHandler, to=CategoryDatabaseHandler, scope=singleton
+        )
+        self.__injector.binder.bind(
+            ITransactionDatabaseHandler,
+            to=TransactionDatabaseHandler,
+            scope=singleton,
+        )
+
+        database = self.__injector.get(IDatabase)
+        database.create_database()
+        self.__user = User(email="fredrik@omstedt.com")
+        with database.get_session() as session:
+            session.add(self.__user)
+            session.add(Category(name="Food", user_id=self.__user.id))
+            session.commit()
+            session.refresh(self.__user)
+
+    def tearDown(self) -> None:
+        database_deleter = self.__injector.get(IDatabaseDeleter)
+        database_deleter.delete_database()
+
+    def test_import_transactions_reports_progress_per_batch(self):
+        manager = self.__injector.get(TransactionImportManager)
+
+        progress = list(manager.import_transactions(self.__user, self.__parse()))
+
+        self.assertEqual(
+            [(update.processed, update.inserted, update.failed) for update in progress],
+            [(2, 2, 0), (4, 3, 1), (5, 3, 2), (5, 3, 2)],
+        )
+        self.assertEqual(
+            progress[1].errors,
+            [TransactionImportError(row=4, message="Category does not exist.")],
+        )
+        self.assertEqual(progress[2].errors, [])
+        self.assertEqual([update.done for update in progress], [False] * 3 + [True])
+
+    def test_import_transactions_records_transactions(self):
+        manager = self.__injector.get(TransactionImportManager)
+
+        list(manager.import_transactions(self.__user, self.__parse()))
+
+        database = self.__injector.get(IDatabase)
+        with database.get_session() as session:
+            rows = session.exec(
+                select(Transaction.amount, Category.name)
+                .outerjoin(Category)
+                .where(Transaction.user_id == self.__user.id)
+                .order_by(Transaction.id)
+            ).all()
+        self.assertEqual(rows, [(-4550, "Food"), (-4550, "Food"), (120000, None)])
+
+    def test_import_transactions_skips_imported_rows(self):
+        manager = self.__injector.get(TransactionImportManager)
+        list(manager.import_transactions(self.__user, self.__parse()))
+
+        progress = list(manager.import_transactions(self.__user, self.__parse()))
+
+        self.assertEqual(progress[-1].inserted, 0)
+        self.assertEqual(progress[-1].duplicates, 3)
+
+    def __parse(self):
+        return parse_statement(BytesIO(CSV), StatementFormat.CSV)
@@ -0,0 +1,221 @@
+from datetime import date, datetime
+from unittest import TestCase
+from unittest.mock import create_autospec
+
+from injector import singleton
+
+from src.analytics.i_ledger_cache import ILedgerCache
+from src.common.pagination import encode_cursor
+from src.database.i_unit_of_work import IUnitOfWork
+from src.database.transactions.balance import BalanceRead, BalanceSeriesFilter
+from src.database.transactions.i_balance_database_handler import (
+    IBalanceDatabaseHandler,
+)
+from src.database.transactions.i_monthly_total_database_handler import (
+    IMonthlyTotalDatabaseHandler,
+)
+from src.database.transactions.i_transaction_database_handler import (
+    ITransactionDatabaseHandler,
+)
+from src.database.transactions.monthly_total import (
+    MonthlyTotal,
+    MonthlyTotalFilter,
+    MonthlyTotalRead,
+)
+from src.database.transactions.transaction import (
+    Transaction,
+    TransactionCreate,
+    TransactionFilter,
+    TransactionSearchFilter,
+)
+from src.database.users.user import User
+from src.managers.transaction_manager import TransactionManager
+from src.multi_injector import MultiInjector
+
+OCCURRED_AT = datetime(2026, 1, 1, 12)
+
+
+class TestTransactionManager(TestCase):
+    def setUp(self):
+        self.__unit_of_work = create_autospec(IUnitOfWork)
+        self.__session = self.__unit_of_work.get_session.return_value
+        self.__transaction_handler = create_autospec(ITransactionDatabaseHandler)
+        self.__monthly_total_handler = create_autospec(IMonthlyTotalDatabaseHandler)
+        self.__balance_handler = create_autospec(IBalanceDatabaseHandler)
+        self.__ledger_cache = create_autospec(ILedgerCache)
+        self.__user = User(email="fredrik@omstedt.com")
+
+        self.__injector = MultiInjector()
+        self.__injector.binder.bind(
+            IUnitOfWork, to=self.__unit_of_work, scope=singleton
+        )
+        self.__injector.binder.bind(
+            ITransactionDatabaseHandler,
+            to=self.__transaction_handler,
+            scope=singleton,
+        )
+        self.__injector.binder.bind(
+            IMonthlyTotalDatabaseHandler,
+            to=self.__monthly_total_handler,
+            scope=singleton,
+        )
+        self.__injector.binder.bind(
+            IBalanceDatabaseHandler, to=self.__balance_handler, scope=singleton
+        )
+        self.__injector.binder.bind(
+            ILedgerCache, to=self.__ledger_cache, scope=singleton
+        )
+
+    def test_create_transaction(self):
+        manager = self.__injector.get(TransactionManager)
+        data = TransactionCreate(amount=-100, occurred_at=OCCURRED_AT, category="Food")
+        self.__transaction_handler.create_transaction.return_value = Transaction(
+            id=1, user_id=self.__user.id, amount=-100, occurred_at=OCCURRED_AT
+        )
+
+        transaction = manager.create_transaction(self.__user, data)
+
+        self.__transaction_handler.create_transaction.assert_called_once_with(
+            self.__session, self.__user, data
+        )
+        self.__session.flush.assert_called_once()
+        self.assertEqual(transaction.id, 1)
+        self.assertEqual(transaction.category, "Food")
+
+    def test_get_transactions_returns_cursor_if_more_transactions(self):
+        manager = self.__injector.get(TransactionManager)
+        filters = TransactionFilter(category="Food")
+        self.__transaction_handler.get_transactions.return_value = [
+            (Transaction(id=2, amount=-100, occurred_at=OCCURRED_AT), "Food"),
+            (Transaction(id=1, amount=-100, occurred_at=OCCURRED_AT), "Food"),
+        ]
+
+        page = manager.get_transactions(self.__user, filters, limit=1)
+        manager.get_transactions(self.__user, filters, page.next_cursor, limit=1)
+
+        self.assertEqual([transaction.id for transaction in page.items], [2])
+        self.assertEqual(page.items[0].category, "Food")
+        self.__transaction_handler.get_transactions.assert_called_with(
+            self.__session, self.__user, filters, (OCCURRED_AT, 2), 2
+        )
+
+    def test_get_transactions_returns_no_cursor_on_last_page(self):
+        manager = self.__injector.get(TransactionManager)
+        self.__transaction_handler.get_transactions.return_value = [
+            (Transaction(id=1, amount=-100, occurred_at=OCCURRED_AT), None)
+        ]
+
+        page = manager.get_transactions(self.__user, TransactionFilter(), limit=1)
+
+        self.assertIsNone(page.next_cursor)
+
+    def test_get_transactions_raises_on_malformed_cursor(self):
+        manager = self.__injector.get(TransactionManager)
+
+        for cursor in ["bla", encode_cursor(["bla", 1]), encode_cursor([1, "1"])]:
+            with self.assertRaises(ValueError):
+                manager.get_transactions(self.__user, TransactionFilter(), cursor)
+        self.__transaction_handler.get_transactions.assert_not_called()
+
+    def test_search_transactions_returns_score_cursor_if_more_transactions(self):
+        manager = self.__injector.get(TransactionManager)
+        filters = TransactionSearchFilter(query="food")
+        self.__transaction_handler.search_transactions.return_value = [
+            (
+                Transaction(id=1, amount=-100, occurred_at=OCCURRED_AT),
+                "Food",
+                (3, 2, 1),
+            ),
+            (Transaction(id=2, amount=-100, occurred_at=OCCURRED_AT), None, (3, 1, 2)),
+        ]
+
+        page = manager.search_transactions(self.__user, filters, limit=1)
+        manager.search_transactions(self.__user, filters, page.next_cursor, limit=1)
+
+        self.assertEqual([transaction.id for transaction in page.items], [1])
+        self.__transaction_handler.search_transactions.assert_called_with(
+            self.__session, self.__user, filters, (3, 2, 1), 2
+        )
+
+    def test_search_transactions_raises_on_malformed_cursor(self):
+        manager = self.__injector.get(TransactionManager)
+        filters = TransactionSearchFilter(query="food")
+
+        for cursor in [
+            "bla",
+            encode_cursor([1, 1]),
+            encode_cursor([1, "1", 1]),
+            encode_cursor([1, 1.5, 1]),
+        ]:
+            with self.assertRaises(ValueError):
+                manager.search_transactions(self.__user, filters, cursor)
+        self.__transaction_handler.search_transactions.assert_not_called()
+
+    def test_get_monthly_totals(self):
+        manager = self.__injector.get(TransactionManager)
+        filters = MonthlyTotalFilter(start=date(2026, 1, 15))
+        month = date(2026, 1, 1)
+        self.__monthly_total_handler.get_monthly_totals.return_value = [
+            (MonthlyTotal(month=month, category_id=0, total=300, count=1), None),
+            (MonthlyTotal(month=month, category_id=1, total=-150, count=2), "Food"),
+        ]
+
+        totals = manager.get_monthly_totals(self.__user, filters)
+
+        self.__monthly_total_handler.get_monthly_totals.assert_called_once_with(
+            self.__session, self.__user, MonthlyTotalFilter(start=month)
+        )
+        self.assertEqual(
+            totals,
+            [
+                MonthlyTotalRead(month=month, total=300, count=1),
+                MonthlyTotalRead(month=month, category="Food", total=-150, count=2),
+            ],
+        )
+
+    def test_get_balance_series_returns_balance_for_every_day(self):
+        manager = self.__injector.get(TransactionManager)
+        filters = BalanceSeriesFilter(start=date(2026, 1, 1), end=date(2026, 1, 4))
+        self.__balance_handler.get_balances.return_value = [1000, 900, 950]
+
+        series = manager.get_balance_series(self.__user, filters)
+
+        self.__balance_handler.get_balances.assert_called_once_with(
+            self.__session,
+            self.__user,
+            [date(2026, 1, 1), date(2026, 1, 2), date(2026, 1, 3)],
+        )
+        self.assertEqual(
+            series,
+            [
+                BalanceRead(day=date(2026, 1, 1), balance=1000),
+                BalanceRead(day=date(2026, 1, 2), balance=900),
+                BalanceRead(day=date(2026, 1, 3), balance=950),
+            ],
+        )
+
+    def test_get_balance_series_raises_on_invalid_range(self):
+        manager = self.__injector.get(TransactionManager)
+
+        for start, end in [
+            (date(2026, 1, 1), date(2026, 1, 1)),
+            (date(2026, 1, 1), date(2030, 1, 1)),
+        ]:
+            with self.assertRaises(ValueError):
+                manager.get_balance_series(
+                    self.__user, BalanceSeriesFilter(start=start, end=end)
+                )
+        self.__balance_handler.get_balances.assert_not_called()
+
+    def test_delete_transaction(self):
+        manager = self.__injector.get(TransactionManager)
+
+        manager.delete_transaction(self.__user, 1)
+
+        self.__transaction_handler.delete_transaction.assert_called_once_with(
+            self.__session, self.__user, 1
+        )
+        self.__ledger_cache.invalidate_user.assert_not_called()
+        [invalidate], _ = self.__unit_of_work.after_commit.call_args
+        invalidate()
+        self.__ledger_cache.invalidate_user.assert_called_once_with(self.__user)
@@ -0,0 +1,378 @@
+import json
+from datetime import date, datetime
+from unittest import TestCase
+from unittest.mock import create_autospec
+
+from fastapi import status
+from fastapi.testclient import TestClient
+from injector import Injector, singleton
+
+from src.authentication.i_authentication import IAuthentication
+from src.common.exceptions import ObjectNotFoundError
+from src.common.exports import ExportFormat
+from src.database.i_unit_of_work import IUnitOfWork
+from src.database.transactions.balance import BalanceRead, BalanceSeriesFilter
+from src.database.transactions.monthly_total import (
+    MonthlyTotalFilter,
+    MonthlyTotalRead,
+)
+from src.database.transactions.transaction import (
+    TransactionCreate,
+    TransactionFilter,
+    TransactionImportProgress,
+    TransactionPage,
+    TransactionRead,
+    TransactionSearchFilter,
+)
+from src.database.users.user import User
+from src.main import create_app
+from src.managers.i_export_manager import IExportManager
+from src.managers.i_transaction_import_manager import ITransactionImportManager
+from src.managers.i_transaction_manager import ITransactionManager
+
+OCCURRED_AT = datetime(2026, 1, 1, 12)
+OFX = b"<OFX><STMTTRN><DTPOSTED>20260101<TRNAMT>-1.00</STMTTRN></OFX>"
+
+
+class TestTransactionsApi(TestCase):
+    def setUp(self):
+        self.__user = User(email="fredrik@omstedt.com")
+        self.__authentication = create_autospec(IAuthentication)
+        self.__authentication.authenticate_user.return_value = self.__user
+        self.__transaction_manager = create_autospec(ITransactionManager)
+        self.__import_manager = create_autospec(ITransactionImportManager)
+        self.__export_manager = create_autospec(IExportManager)
+        self.__unit_of_work = create_autospec(IUnitOfWork)
+
+        self.__injector = Injector()
+        self.__injector.binder.bind(
+            IAuthentication, to=self.__authentication, scope=singleton
+        )
+        self.__injector.binder.bind(
+            ITransactionManager, to=self.__transaction_manager, scope=singleton
+        )
+        self.__injector.binder.bind(
+            ITransactionImportManager, to=self.__import_manager, scope=singleton
+        )
+        self.__injector.binder.bind(
+            IExportManager, to=self.__export_manager, scope=singleton
+        )
+        self.__injector.binder.bind(
+            IUnitOfWork, to=self.__unit_of_work, scope=singleton
+        )
+
+        app = create_app(self.__injector)
+        self.__client = TestClient(app)
+        self.__headers = {"Authorization": "Bearer blabla"}
+
+    def test_get_transactions_unauthorized(self):
+        response = self.__client.get("/transactions")
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_get_transactions_returns_page(self):
+        self.__transaction_manager.get_transactions.return_value = TransactionPage(
+            items=[
+                TransactionRead(
+                    id=1, amount=-100, occurred_at=OCCURRED_AT, category="Food"
+                )
+            ],
+            next_cursor="next",
+        )
+
+        response = self.__client.get(
+            "/transactions",
+            params={
+                "category": "Food",
+                "start": "2026-01-01T00:00:00+01:00",
+                "cursor": "cursor",
+                "limit": 1,
+            },
+            headers=self.__headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.__transaction_manager.get_transactions.assert_called_once_with(
+            self.__user,
+            TransactionFilter(category="Food", start=datetime(2025, 12, 31, 23)),
+            "cursor",
+            1,
+        )
+        self.assertEqual(
+            response.json(),
+            {
+                "items": [
+                    {
+                        "id": 1,
+                        "amount": -100,
+                        "occurred_at": "2026-01-01T12:00:00",
+                        "description": "",
+                        "category": "Food",
+                    }
+                ],
+                "next_cursor": "next",
+            },
+        )
+
+    def test_get_transactions_bad_request_on_malformed_cursor(self):
+        self.__transaction_manager.get_transactions.side_effect = ValueError()
+
+        response = self.__client.get(
+            "/transactions", params={"cursor": "bla"}, headers=self.__headers
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_search_transactions_returns_page(self):
+        self.__transaction_manager.search_transactions.return_value = TransactionPage(
+            items=[TransactionRead(id=1, amount=-100, occurred_at=OCCURRED_AT)],
+            next_cursor="next",
+        )
+
+        response = self.__client.get(
+            "/transactions/search",
+            params={"query": "coffee", "category": "Food", "limit": 1},
+            headers=self.__headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.__transaction_manager.search_transactions.assert_called_once_with(
+            self.__user,
+            TransactionSearchFilter(query="coffee", category="Food"),
+            None,
+            1,
+        )
+        self.assertEqual([item["id"] for item in response.json()["items"]], [1])
+        self.assertEqual(response.json()["next_cursor"], "next")
+
+    def test_search_transactions_rejects_query_without_words(self):
+        response = self.__client.get(
+            "/transactions/search", params={"query": "*-"}, headers=self.__headers
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.__transaction_manager.search_transactions.assert_not_called()
+
+    def test_search_transactions_bad_request_on_malformed_cursor(self):
+        self.__transaction_manager.search_transactions.side_effect = ValueError()
+
+        response = self.__client.get(
+            "/transactions/search",
+            params={"query": "coffee", "cursor": "bla"},
+            headers=self.__headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_create_transaction_bad_request_on_unknown_category(self):
+        self.__transaction_manager.create_transaction.side_effect = (
+            ObjectNotFoundError()
+        )
+
+        response = self.__client.post(
+            "/transactions",
+            json={"amount": -100, "occurred_at": "2026-01-01T12:00:00"},
+            headers=self.__headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.__unit_of_work.commit.assert_not_called()
+
+    def test_create_transaction_returns_transaction_read(self):
+        self.__transaction_manager.create_transaction.return_value = TransactionRead(
+            id=1, amount=-100, occurred_at=OCCURRED_AT, description="Groceries"
+        )
+
+        response = self.__client.post(
+            "/transactions",
+            json={
+                "amount": -100,
+                "occurred_at": "2026-01-01T12:00:00Z",
+                "description": "Groceries",
+            },
+            headers=self.__headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.__transaction_manager.create_transaction.assert_called_once_with(
+            self.__user,
+            TransactionCreate(
+                amount=-100, occurred_at=OCCURRED_AT, description="Groceries"
+            ),
+        )
+        self.__unit_of_work.commit.assert_called_once()
+        self.assertEqual(response.json()["id"], 1)
+
+    def test_create_transaction_rejects_fractional_amount(self):
+        response = self.__client.post(
+            "/transactions",
+            json={"amount": 1.5, "occurred_at": "2026-01-01T12:00:00"},
+            headers=self.__headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+    def test_import_transactions_streams_progress(self):
+        def import_transactions(user, rows):
+            rows = list(rows)
+            yield TransactionImportProgress(processed=len(rows), inserted=len(rows))
+            yield TransactionImportProgress(
+                processed=len(rows), inserted=len(rows), done=True
+            )
+
+        self.__import_manager.import_transactions.side_effect = import_transactions
+
+        response = self.__client.post(
+            "/transactions/import",
+            files={"file": ("bank.ofx", OFX)},
+            headers=self.__headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.headers["content-type"], "application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual([line["inserted"] for line in lines], [1, 1])
+        self.assertEqual([line["done"] for line in lines], [False, True])
+
+    def test_import_transactions_bad_request_on_unreadable_statement(self):
+        response = self.__client.post(
+            "/transactions/import",
+            params={"format": "csv"},
+            files={"file": ("bank.txt", b"date,description\n")},
+            headers=self.__headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.__import_manager.import_transactions.assert_not_called()
+
+    def test_export_transactions_streams_file(self):
+        self.__export_manager.export_transactions.return_value = iter(
+            [b"id,date,amount,description,category\r\n", b"1,2026-01-01,-1.00,,\r\n"]
+        )
+
+        response = self.__client.get(
+            "/transactions/export", params={"format": "csv"}, headers=self.__headers
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.headers["content-type"], "text/csv; charset=utf-8")
+        self.assertEqual(
+            response.headers["content-disposition"],
+            'attachment; filename="transactions.csv"',
+        )
+        self.assertEqual(response.text.splitlines()[1], "1,2026-01-01,-1.00,,")
+        self.__export_manager.export_transactions.assert_called_once_with(
+            self.__user, ExportFormat.CSV, False
+        )
+
+    def test_export_transactions_names_compressed_file(self):
+        self.__export_manager.export_transactions.return_value = iter([b"\x1f\x8b"])
+
+        response = self.__client.get(
+            "/transactions/export",
+            params={"format": "ndjson", "compress": True},
+            headers=self.__headers,
+        )
+
+        self.assertEqual(response.headers["content-type"], "application/gzip")
+        self.assertEqual(
+            response.headers["content-disposition"],
+            'attachment; filename="transactions.ndjson.gz"',
+        )
+        self.__export_manager.export_transactions.assert_called_once_with(
+            self.__user, ExportFormat.NDJSON, True
+        )
+
+    def test_get_monthly_totals_returns_totals(self):
+        self.__transaction_manager.get_monthly_totals.return_value = [
+            MonthlyTotalRead(
+                month=date(2026, 1, 1), category="Food", total=-150, count=2
+            )
+        ]
+
+        response = self.__client.get(
+            "/transactions/monthly-totals",
+            params={"start": "2026-01-15", "end": "2026-03-01"},
+            headers=self.__headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.__transaction_manager.get_monthly_totals.assert_called_once_with(
+            self.__user,
+            MonthlyTotalFilter(start=date(2026, 1, 1), end=date(2026, 3, 1)),
+        )
+        self.assertEqual(
+            response.json(),
+            [{"month": "2026-01-01", "category": "Food", "total": -150, "count": 2}],
+        )
+
+    def test_get_balance_returns_balance(self):
+        self.__transaction_manager.get_balance.return_value = BalanceRead(
+            day=date(2026, 1, 31), balance=-150
+        )
+
+        response = self.__client.get(
+            "/transactions/balance",
+            params={"day": "2026-01-31"},
+            headers=self.__headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.__transaction_manager.get_balance.assert_called_once_with(
+            self.__user, date(2026, 1, 31)
+        )
+        self.assertEqual(response.json(), {"day": "2026-01-31", "balance": -150})
+
+    def test_get_balance_series_returns_series(self):
+        self.__transaction_manager.get_balance_series.return_value = [
+            BalanceRead(day=date(2026, 1, 1), balance=100),
+            BalanceRead(day=date(2026, 1, 2), balance=50),
+        ]
+
+        response = self.__client.get(
+            "/transactions/balance-series",
+            params={"start": "2026-01-01", "end": "2026-01-03"},
+            headers=self.__headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.__transaction_manager.get_balance_series.assert_called_once_with(
+            self.__user,
+            BalanceSeriesFilter(start=date(2026, 1, 1), end=date(2026, 1, 3)),
+        )
+        self.assertEqual(
+            response.json(),
+            [
+                {"day": "2026-01-01", "balance": 100},
+                {"day": "2026-01-02", "balance": 50},
+            ],
+        )
+
+    def test_get_balance_series_invalid_range(self):
+        self.__transaction_manager.get_balance_series.side_effect = ValueError()
+
+        response = self.__client.get(
+            "/transactions/balance-series",
+            params={"start": "2026-01-03", "end": "2026-01-01"},
+            headers=self.__headers,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_delete_transaction_not_found(self):
+        self.__transaction_manager.delete_transaction.side_effect = (
+            ObjectNotFoundError()
+        )
+
+        response = self.__client.delete("/transactions/1", headers=self.__headers)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_delete_transaction_success(self):
+        response = self.__client.delete("/transactions/1", headers=self.__headers)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.__transaction_manager.delete_transaction.assert_called_once_with(
+            self.__user, 1
+        )
+        self.__unit_of_work.commit.assert_called_once()
@@ -0,0 +1,58 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, create_autospec
+
+from injector import singleton
+
+from src.database.i_database import IDatabase
+from src.database.unit_of_work import UnitOfWork
+from src.multi_injector import MultiInjector
+
+
+class TestUnitOfWork(TestCase):
+    def setUp(self):
+        self.__database = create_autospec(IDatabase)
+        self.__session = self.__database.get_session.return_value
+
+        self.__injector = MultiInjector()
+        self.__injector.binder.bind(IDatabase, to=self.__database, scope=singleton)
+
+    def test_get_session_opens_one_session(self):
+        unit_of_work = self.__injector.get(UnitOfWork)
+
+        first = unit_of_work.get_session()
+        second = unit_of_work.get_session()
+
+        self.assertIs(first, second)
+        self.__database.get_session.assert_called_once()
+
+    def test_commit_without_session_does_nothing(self):
+        unit_of_work = self.__injector.get(UnitOfWork)
+
+        unit_of_work.commit()
+
+        self.__database.get_session.assert_not_called()
+
+    def test_commit_runs_callbacks_after_commit(self):
+        unit_of_work = self.__injector.get(UnitOfWork)
+        callback = MagicMock(
+            side_effect=lambda: self.__session.commit.assert_called_once()
+        )
+        unit_of_work.get_session()
+        unit_of_work.after_commit(callback)
+
+        unit_of_work.commit()
+        unit_of_work.commit()
+
+        callback.assert_called_once()
+
+    def test_close_drops_callbacks(self):
+        unit_of_work = self.__injector.get(UnitOfWork)
+        callback = MagicMock()
+        unit_of_work.get_session()
+        unit_of_work.after_commit(callback)
+
+        unit_of_work.close()
+        unit_of_work.commit()
+
+        self.__session.close.assert_called_once()
+        callback.assert_not_called()
@@ -5,11 +5,16 @@ from injector import singleton
 from sqlmodel import select
 
 from src.authentication.i_password_handler import IPasswordHandler
+from src.authentication.i_token_revocations import ITokenRevocations
+from src.authentication.i_user_cache import IUserCache
 from src.common.exceptions import ObjectNotFoundError
+from src.common.i_resource_versions import IResourceVersions
 from src.database.i_database import IDatabase
 from src.database.i_database_deleter import IDatabaseDeleter
+from src.database.i_unit_of_work import IUnitOfWork
+from src.database.users.token_revocation import TokenRevocation
 from src.database.users.user import User, UserCreate, UserUpdate
-from src.managers.user_manager import UserManager
+from src.managers.user_manager import UserManager, create_token_revocation
 from src.tests.test_utils import create_injector_with_database
 
 
@@ -20,16 +25,29 @@ class TestUserManager(TestCase):
         self.__injector.binder.bind(
             IPasswordHandler, to=self.__password_handler, scope=singleton
         )
+        self.__user_cache = create_autospec(IUserCache)
+        self.__injector.binder.bind(IUserCache, to=self.__user_cache, scope=singleton)
+        self.__token_revocations = create_autospec(ITokenRevocations)
+        self.__injector.binder.bind(
+            ITokenRevocations, to=self.__token_revocations, scope=singleton
+        )
+        self.__resource_versions = create_autospec(IResourceVersions)
+        self.__injector.binder.bind(
+            IResourceVersions, to=self.__resource_versions, scope=singleton
+        )
 
         database = self.__injector.get(IDatabase)
         database.create_database()
+        self.__unit_of_work = self.__injector.get(IUnitOfWork)
 
     def tearDown(self) -> None:
+        self.__unit_of_work.close()
         database_deleter = self.__injector.get(IDatabaseDeleter)
         database_deleter.delete_database()
 
     def test_create_user_raises_if_user_with_email_exists(self):
         email = "fredrik@omstedt.com"
+        self.__password_handler.hash_password.return_value = "420password"
         database = self.__injector.get(IDatabase)
         with database.get_session() as session:
             user = User(email=email)
@@ -49,6 +67,7 @@ class TestUserManager(TestCase):
 
         manager = self.__injector.get(UserManager)
         user = manager.create_user(UserCreate(email=email, password=password))
+        self.__unit_of_work.commit()
 
         self.__password_handler.hash_password.assert_called_once_with(password)
 
@@ -115,6 +134,11 @@ class TestUserManager(TestCase):
 
         manager = self.__injector.get(UserManager)
         manager.update_user(user_id, UserUpdate(first_name=new_first_name))
+        self.__resource_versions.invalidate_user.assert_not_called()
+        self.__unit_of_work.commit()
+
+        self.__user_cache.invalidate_user.assert_called_once()
+        self.__resource_versions.invalidate_user.assert_called_once_with(user_id)
 
         with database.get_session() as session:
             statement = select(User).where(User.id == user_id)
@@ -144,14 +168,69 @@ class TestUserManager(TestCase):
         manager = self.__injector.get(UserManager)
         new_password = "password"
         manager.update_user_password(user_id, new_password)
+        self.__unit_of_work.commit()
 
         self.__password_handler.hash_password.assert_called_once_with(new_password)
+        self.__user_cache.invalidate_user.assert_called_once()
         with database.get_session() as session:
             statement = select(User).where(User.id == user_id)
             results = session.exec(statement)
             db_user = results.first()
             self.assertEqual(db_user.id, user_id)
             self.assertEqual(db_user.hashed_password, new_hashed_password)
+            self.assertEqual(db_user.token_version, 1)
+            revocation = session.exec(select(TokenRevocation)).one()
+            self.assertEqual(revocation.user_id, user_id)
+            self.assertEqual(revocation.token_version, 1)
+        self.__token_revocations.add_revocation.assert_called_once()
+
+    def test_create_token_revocation_bumps_version_of_stale_user(self):
+        database = self.__injector.get(IDatabase)
+        with database.get_session() as session:
+            user = User(email="fredrik@omstedt.com", hashed_password="blabla")
+            session.add(user)
+            session.commit()
+            session.refresh(user)
+            user_id = user.id
+
+        with database.get_session() as session:
+            stale_user = session.get(User, user_id)
+            with database.get_session() as other_session:
+                create_token_revocation(other_session, other_session.get(User, user_id))
+                other_session.commit()
+
+            revocation = create_token_revocation(session, stale_user)
+            session.commit()
+
+            self.assertEqual(revocation.token_version, 2)
+            self.assertEqual(stale_user.token_version, 2)
+
+    def test_update_user_hashed_password_raises_if_user_not_existing(self):
+        manager = self.__injector.get(UserManager)
+        with self.assertRaises(ObjectNotFoundError):
+            manager.update_user_hashed_password("invalid-id", "hash")
+
+    def test_update_user_hashed_password_stores_hash_as_is(self):
+        email = "fredrik@omstedt.com"
+        new_hashed_password = "blablabla"
+        database = self.__injector.get(IDatabase)
+        with database.get_session() as session:
+            user = User(email=email, hashed_password="blabla")
+            session.add(user)
+            session.commit()
+            session.refresh(user)
+            user_id = user.id
+
+        manager = self.__injector.get(UserManager)
+        manager.update_user_hashed_password(user_id, new_hashed_password)
+        self.__unit_of_work.commit()
+
+        self.__password_handler.hash_password.assert_not_called()
+        self.__token_revocations.add_revocation.assert_not_called()
+        with database.get_session() as session:
+            db_user = session.get(User, user_id)
+            self.assertEqual(db_user.hashed_password, new_hashed_password)
+            self.assertEqual(db_user.token_version, 0)
 
     def test_delete_user_raises_if_user_not_existing(self):
         manager = self.__injector.get(UserManager)
@@ -170,9 +249,43 @@ class TestUserManager(TestCase):
 
         manager = self.__injector.get(UserManager)
         manager.delete_user(user_id)
+        self.__unit_of_work.commit()
+
+        self.__user_cache.invalidate_user.assert_called_once()
+        self.__token_revocations.add_revocation.assert_called_once()
 
         with database.get_session() as session:
             statement = select(User).where(User.id == user_id)
             results = session.exec(statement)
             db_user = results.first()
             self.assertIsNone(db_user)
+
+    def test_update_user_is_discarded_if_not_committed(self):
+        database = self.__injector.get(IDatabase)
+        with database.get_session() as session:
+            user = User(email="fredrik@omstedt.com", first_name="Fredrik")
+            session.add(user)
+            session.commit()
+            user_id = user.id
+
+        manager = self.__injector.get(UserManager)
+        manager.update_user(user_id, UserUpdate(first_name="Tiburtius"))
+        self.__unit_of_work.close()
+
+        self.__user_cache.invalidate_user.assert_not_called()
+        with database.get_session() as session:
+            self.assertEqual(session.get(User, user_id).first_name, "Fredrik")
+
+    def test_operations_share_one_session(self):
+        database = self.__injector.get(IDatabase)
+        with database.get_session() as session:
+            user = User(email="fredrik@omstedt.com")
+            session.add(user)
+            session.commit()
+            user_id = user.id
+
+        manager = self.__injector.get(UserManager)
+        db_user = manager.get_user_with_email("fredrik@omstedt.com")
+        updated_user = manager.update_user(user_id, UserUpdate(first_name="Fredrik"))
+
+        self.assertIs(db_user, updated_user)
@@ -1,19 +1,42 @@
-from unittest.mock import MagicMock
-
 from injector import singleton
 
+from src.analytics.i_ledger_cache import ILedgerCache
+from src.analytics.ledger_cache import LedgerCache
+from src.common.i_resource_versions import IResourceVersions
+from src.common.resource_versions import ResourceVersions
 from src.common.settings import Settings
+from src.database.async_database import AsyncDatabase
+from src.database.async_write_coalescer import AsyncWriteCoalescer
 from src.database.database import Database
+from src.database.i_async_database import IAsyncDatabase
+from src.database.i_async_write_coalescer import IAsyncWriteCoalescer
 from src.database.i_database import IDatabase
 from src.database.i_database_deleter import IDatabaseDeleter
+from src.database.i_unit_of_work import IUnitOfWork
+from src.database.unit_of_work import UnitOfWork
 from src.multi_injector import MultiInjector
 
 
 def create_injector_with_database():
     injector = MultiInjector()
-    injector.binder.bind(Settings, to=MagicMock(), scope=singleton)
-    injector.get(Settings).database_url = "sqlite:///test_database.db"
+    injector.binder.bind(Settings, to=Settings(
+        database_url="sqlite:///test_database.db"), scope=singleton)
     injector.binder.bind_several(
         [IDatabase, IDatabaseDeleter], Database, scope=singleton)
+    injector.binder.bind(IUnitOfWork, to=UnitOfWork, scope=singleton)
+    injector.binder.bind(ILedgerCache, to=LedgerCache, scope=singleton)
+    injector.binder.bind(IResourceVersions, to=ResourceVersions, scope=singleton)
+
+    return injector
+
+
+def create_injector_with_async_database():
+    injector = MultiInjector()
+    injector.binder.bind(Settings, to=Settings(
+        database_url="sqlite:///test_database.db"), scope=singleton)
+    injector.binder.bind(IAsyncDatabase, AsyncDatabase, scope=singleton)
+    injector.binder.bind(IAsyncWriteCoalescer, AsyncWriteCoalescer, scope=singleton)
+    injector.binder.bind(ILedgerCache, LedgerCache, scope=singleton)
+    injector.binder.bind(IResourceVersions, ResourceVersions, scope=singleton)
 
     return injector
@@ -0,0 +1,227 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from fastapi_injector import Injected
+
+from src.authentication.current_user import get_current_user_async
+from src.categories.api import MALFORMED_CURSOR_RESPONSE
+from src.common.exceptions import ObjectNotFoundError
+from src.common.exports import (
+    EXPORT_RESPONSES,
+    NDJSON_MEDIA_TYPE,
+    ExportFormat,
+    create_export_response,
+)
+from src.common.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from src.database.transactions.balance import BalanceRead, BalanceSeriesFilter
+from src.database.transactions.monthly_total import (
+    MonthlyTotalFilter,
+    MonthlyTotalRead,
+)
+from src.database.transactions.transaction import (
+    StatementFormat,
+    TransactionCreate,
+    TransactionFilter,
+    TransactionPage,
+    TransactionRead,
+    TransactionSearchFilter,
+)
+from src.database.users.user import User
+from src.managers.i_async_export_manager import IAsyncExportManager
+from src.managers.i_async_transaction_import_manager import (
+    IAsyncTransactionImportManager,
+)
+from src.managers.i_async_transaction_manager import IAsyncTransactionManager
+from src.transactions.api import IMPORT_RESPONSES
+from src.transactions.statements import detect_statement_format, parse_statement
+
+router = APIRouter(
+    prefix="/transactions",
+    tags=["Transactions"],
+)
+
+
+@router.get("", response_model=TransactionPage, responses=MALFORMED_CURSOR_RESPONSE)
+async def get_transactions(
+    filters: TransactionFilter = Depends(),
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    transaction_manager: IAsyncTransactionManager = Injected(
+        IAsyncTransactionManager
+    ),
+    current_user: User = Depends(get_current_user_async),
+):
+    try:
+        return await transaction_manager.get_transactions(
+            current_user, filters, cursor, limit
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor is malformed.",
+        )
+
+
+@router.post(
+    "",
+    response_model=TransactionRead,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"description": "Category does not exist."}
+    },
+)
+async def create_transaction(
+    transaction: TransactionCreate,
+    transaction_manager: IAsyncTransactionManager = Injected(
+        IAsyncTransactionManager
+    ),
+    current_user: User = Depends(get_current_user_async),
+):
+    try:
+        return await transaction_manager.create_transaction(current_user, transaction)
+    except ObjectNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Category does not exist.",
+        )
+
+
+@router.post(
+    "/import", response_class=StreamingResponse, responses=IMPORT_RESPONSES
+)
+async def import_transactions(
+    file: UploadFile,
+    format: StatementFormat | None = None,
+    import_manager: IAsyncTransactionImportManager = Injected(
+        IAsyncTransactionImportManager
+    ),
+    current_user: User = Depends(get_current_user_async),
+):
+    try:
+        rows = await run_in_threadpool(
+            parse_statement, file.file, format or detect_statement_format(file.filename)
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Statement cannot be read.",
+        )
+    return StreamingResponse(
+        (
+            progress.json() + "\n"
+            async for progress in import_manager.import_transactions(
+                current_user, rows
+            )
+        ),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
+@router.get(
+    "/search", response_model=TransactionPage, responses=MALFORMED_CURSOR_RESPONSE
+)
+async def search_transactions(
+    filters: TransactionSearchFilter = Depends(),
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    transaction_manager: IAsyncTransactionManager = Injected(
+        IAsyncTransactionManager
+    ),
+    current_user: User = Depends(get_current_user_async),
+):
+    try:
+        return await transaction_manager.search_transactions(
+            current_user, filters, cursor, limit
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor is malformed.",
+        )
+
+
+@router.get(
+    "/export", response_class=StreamingResponse, responses=EXPORT_RESPONSES
+)
+async def export_transactions(
+    format: ExportFormat = ExportFormat.CSV,
+    compress: bool = False,
+    export_manager: IAsyncExportManager = Injected(IAsyncExportManager),
+    current_user: User = Depends(get_current_user_async),
+):
+    return create_export_response(
+        export_manager.export_transactions(current_user, format, compress),
+        "transactions",
+        format,
+        compress,
+    )
+
+
+@router.get("/monthly-totals", response_model=list[MonthlyTotalRead])
+async def get_monthly_totals(
+    filters: MonthlyTotalFilter = Depends(),
+    transaction_manager: IAsyncTransactionManager = Injected(
+        IAsyncTransactionManager
+    ),
+    current_user: User = Depends(get_current_user_async),
+):
+    return await transaction_manager.get_monthly_totals(current_user, filters)
+
+
+@router.get("/balance", response_model=BalanceRead)
+async def get_balance(
+    day: date,
+    transaction_manager: IAsyncTransactionManager = Injected(
+        IAsyncTransactionManager
+    ),
+    current_user: User = Depends(get_current_user_async),
+):
+    return await transaction_manager.get_balance(current_user, day)
+
+
+@router.get(
+    "/balance-series",
+    response_model=list[BalanceRead],
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"description": "Date range is invalid."}
+    },
+)
+async def get_balance_series(
+    filters: BalanceSeriesFilter = Depends(),
+    transaction_manager: IAsyncTransactionManager = Injected(
+        IAsyncTransactionManager
+    ),
+    current_user: User = Depends(get_current_user_async),
+):
+    try:
+        return await transaction_manager.get_balance_series(current_user, filters)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Date range is invalid.",
+        )
+
+
+@router.delete(
+    "/{id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={
+        status.HTTP_404_NOT_FOUND: {"description": "Transaction does not exist."}
+    },
+)
+async def delete_transaction(
+    id: int,
+    transaction_manager: IAsyncTransactionManager = Injected(
+        IAsyncTransactionManager
+    ),
+    current_user: User = Depends(get_current_user_async),
+):
+    try:
+        await transaction_manager.delete_transaction(current_user, id)
+    except ObjectNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Transaction does not exist.",
+        )
@@ -0,0 +1,231 @@
+import csv
+import hashlib
+import io
+import re
+from datetime import datetime, timedelta
+from decimal import Decimal, InvalidOperation
+from typing import BinaryIO, Iterator, NamedTuple
+
+from src.database.transactions.transaction import (
+    DESCRIPTION_MAX_LENGTH,
+    StatementFormat,
+    TransactionImportError,
+    to_naive_utc,
+)
+
+MAX_AMOUNT = 2**63 - 1
+OFX_SUFFIXES = (".ofx", ".qfx")
+
+_CSV_COLUMNS = {"date", "amount", "description", "category"}
+_OFX_DATE = re.compile(
+    r"(\d{8})(\d{6})?(?:\.\d+)?(?:\[([+-]?\d+(?:\.\d+)?)(?::[^\]]*)?\])?$"
+)
+_READ_SIZE = 65536
+
+
+class StatementRow(NamedTuple):
+    row: int
+    occurred_at: datetime
+    amount: int
+    description: str
+    category: str | None
+    content_hash: bytes
+
+
+def detect_statement_format(filename: str | None) -> StatementFormat:
+    if filename and filename.lower().endswith(OFX_SUFFIXES):
+        return StatementFormat.OFX
+    return StatementFormat.CSV
+
+
+def parse_statement(
+    file: BinaryIO, format: StatementFormat
+) -> Iterator[StatementRow | TransactionImportError]:
+    if format == StatementFormat.OFX:
+        return parse_ofx(file)
+    return parse_csv(file)
+
+
+def parse_csv(file: BinaryIO) -> Iterator[StatementRow | TransactionImportError]:
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", errors="replace", newline="")
+    reader = csv.reader(text)
+    try:
+        header = [column.strip().lower() for column in next(reader, [])]
+    except csv.Error:
+        header = []
+    if "date" not in header or "amount" not in header:
+        raise ValueError("The CSV header needs date and amount columns.")
+    columns = {name: header.index(name) for name in _CSV_COLUMNS if name in header}
+    return _parse_csv_rows(reader, columns, len(header))
+
+
+def _parse_csv_rows(
+    reader, columns: dict[str, int], width: int
+) -> Iterator[StatementRow | TransactionImportError]:
+    hasher = _ContentHasher()
+    while True:
+        try:
+            values = next(reader, None)
+        except csv.Error as exc:
+            yield TransactionImportError(row=reader.line_num, message=str(exc))
+            return
+        if values is None:
+            return
+        row = reader.line_num
+        if not values:
+            continue
+        if len(values) < width:
+            yield TransactionImportError(row=row, message="Row has too few columns.")
+            continue
+        try:
+            occurred_at = parse_date(values[columns["date"]])
+            amount = parse_amount(values[columns["amount"]])
+            description = ""
+            if "description" in columns:
+                description = check_description(values[columns["description"]])
+        except ValueError as exc:
+            yield TransactionImportError(row=row, message=str(exc))
+            continue
+        category = None
+        if "category" in columns:
+            category = values[columns["category"]].strip() or None
+        yield StatementRow(
+            row,
+            occurred_at,
+            amount,
+            description,
+            category,
+            hasher.hash(occurred_at, amount, description),
+        )
+
+
+def parse_ofx(file: BinaryIO) -> Iterator[StatementRow | TransactionImportError]:
+    # OFX 1 is SGML that leaves most elements unclosed, so elements are read
+    # as a flat sequence of tags with the text up to the next tag. That also
+    # covers the XML of OFX 2.
+    encoding = "utf-8"
+    if file.seekable():
+        if b"CHARSET:1252" in file.read(1024).upper():
+            encoding = "cp1252"
+        file.seek(0)
+    text = io.TextIOWrapper(file, encoding=encoding, errors="replace")
+    elements = _read_ofx_elements(text)
+    for tag, _ in elements:
+        if tag == "OFX":
+            return _parse_ofx_transactions(elements)
+    raise ValueError("The file is not an OFX statement.")
+
+
+def _parse_ofx_transactions(
+    elements: Iterator[tuple[str, str]]
+) -> Iterator[StatementRow | TransactionImportError]:
+    hasher = _ContentHasher()
+    row = 0
+    fields: dict[str, str] | None = None
+    for tag, value in elements:
+        if tag == "STMTTRN":
+            row += 1
+            fields = {}
+        elif tag == "/STMTTRN" and fields is not None:
+            yield _create_ofx_row(row, fields, hasher)
+            fields = None
+        elif fields is not None and value:
+            fields[tag] = value
+
+
+def _create_ofx_row(
+    row: int, fields: dict[str, str], hasher: "_ContentHasher"
+) -> StatementRow | TransactionImportError:
+    try:
+        occurred_at = parse_ofx_date(fields.get("DTPOSTED", ""))
+        amount = parse_amount(fields.get("TRNAMT", "").replace(",", "."))
+        description = check_description(fields.get("NAME") or fields.get("MEMO", ""))
+    except ValueError as exc:
+        return TransactionImportError(row=row, message=str(exc))
+    return StatementRow(
+        row,
+        occurred_at,
+        amount,
+        description,
+        None,
+        hasher.hash(occurred_at, amount, description, fields.get("FITID")),
+    )
+
+
+def _read_ofx_elements(text: io.TextIOBase) -> Iterator[tuple[str, str]]:
+    buffer = ""
+    while chunk := text.read(_READ_SIZE):
+        parts = (buffer + chunk).split("<")
+        buffer = parts.pop()
+        for part in parts:
+            tag, _, value = part.partition(">")
+            yield tag.strip().upper(), value.strip()
+    tag, _, value = buffer.partition(">")
+    yield tag.strip().upper(), value.strip()
+
+
+def parse_date(text: str) -> datetime:
+    try:
+        return to_naive_utc(datetime.fromisoformat(text.strip()))
+    except ValueError:
+        raise ValueError("Date is not an ISO 8601 date.") from None
+
+
+def parse_ofx_date(text: str) -> datetime:
+    match = _OFX_DATE.match(text)
+    if not match:
+        raise ValueError("Date is not an OFX date.")
+    day, time, offset = match.groups()
+    try:
+        occurred_at = datetime.strptime(day + (time or "000000"), "%Y%m%d%H%M%S")
+    except ValueError:
+        raise ValueError("Date is not an OFX date.") from None
+    return occurred_at - timedelta(hours=float(offset or 0))
+
+
+def parse_amount(text: str) -> int:
+    try:
+        minor_units = Decimal(text.strip()) * 100
+    except InvalidOperation:
+        raise ValueError("Amount is not a number.") from None
+    if not minor_units.is_finite() or minor_units != minor_units.to_integral_value():
+        raise ValueError("Amount has more than two decimals.")
+    if abs(minor_units) > MAX_AMOUNT:
+        raise ValueError("Amount is out of range.")
+    return int(minor_units)
+
+
+def check_description(text: str) -> str:
+    description = text.strip()
+    if len(description) > DESCRIPTION_MAX_LENGTH:
+        raise ValueError(
+            f"Description is longer than {DESCRIPTION_MAX_LENGTH} characters."
+        )
+    return description
+
+
+class _ContentHasher:
+    # Rows are identified by their content, so that importing a statement
+    # again finds the same hashes. Identical rows are told apart by their
+    # order, which keeps genuine repeats such as two equal purchases. The
+    # counts cover the whole statement, as its days need not be in order,
+    # and are keyed by an 8-byte digest of the content, so that a long
+    # statement only keeps a small fixed-size key per distinct row.
+    def __init__(self):
+        self.__counts: dict[bytes, int] = {}
+
+    def hash(
+        self,
+        occurred_at: datetime,
+        amount: int,
+        description: str,
+        reference: str | None = None,
+    ) -> bytes:
+        content = "\x1f".join((occurred_at.isoformat(), str(amount), description))
+        if reference is None:
+            key = hashlib.blake2b(content.encode(), digest_size=8).digest()
+            count = self.__counts.get(key, 0)
+            self.__counts[key] = count + 1
+            reference = str(count)
+        content = f"{content}\x1f{reference}"
+        return hashlib.blake2b(content.encode(), digest_size=16).digest()